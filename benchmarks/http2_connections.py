@@ -0,0 +1,237 @@
+"""Compare connections, file descriptors and throughput of HTTP/1.1 and HTTP/2.
+
+Sends concurrent JSON POSTs through ``RESTClientObject.request_async``, the
+way the asyncio upload engine (``asyncUpload``) creates datapoints, against a
+local server running in a separate process, once per protocol. Reports how many connections the server
+accepted (in production each one is a TLS handshake), the peak number of file
+descriptors the client process held, and requests per second. The server waits
+``--latency`` seconds before answering, so requests overlap like they do
+against the real API.
+
+Locally there is no TLS to negotiate HTTP/2 through ALPN, so the HTTP/2 run
+uses cleartext HTTP/2 with prior knowledge; the client is otherwise configured
+exactly as with ``rapidata_config.upload.http2 = True``. Needs the ``h2``
+package (``pip install rapidata[http2]``). File descriptors are read from
+``/proc`` and only reported on Linux.
+
+Usage: python benchmarks/http2_connections.py [--requests 5000] [--concurrency 100] [--latency 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+import httpx
+from authlib.oauth2.rfc6749 import OAuth2Token
+
+from rapidata.api_client.rest import RESTClientObject
+
+
+class _Configuration:
+    ssl_ca_cert = None
+    verify_ssl = True
+    proxy = None
+    proxy_headers = None
+    retries = None
+
+    def __init__(self, http2: bool) -> None:
+        self.http2 = http2
+
+
+class _Session:
+    """Stands in for the OAuth2 session; only its token is read."""
+
+    token = OAuth2Token(
+        {"access_token": "bench", "token_type": "Bearer", "expires_at": 2**31}
+    )
+
+
+def _serve_http1(port_queue, stop_event, result_queue, latency: float) -> None:
+    accepted = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        nonlocal accepted
+        accepted += 1
+        try:
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                await asyncio.sleep(latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: 2\r\n\r\n{}"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        await asyncio.to_thread(stop_event.wait)
+        server.close()
+
+    asyncio.run(main())
+    result_queue.put(accepted)
+
+
+def _serve_http2(port_queue, stop_event, result_queue, latency: float) -> None:
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    accepted = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        nonlocal accepted
+        accepted += 1
+        connection = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False)
+        )
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(latency)
+            connection.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "application/json")],
+            )
+            connection.send_data(stream_id, b"{}", end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while data := await reader.read(65536):
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    connection.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    asyncio.ensure_future(respond(event.stream_id))
+            writer.write(connection.data_to_send())
+        writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        await asyncio.to_thread(stop_event.wait)
+        server.close()
+
+    asyncio.run(main())
+    result_queue.put(accepted)
+
+
+def _open_fds() -> int | None:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def _run(http2: bool, requests: int, concurrency: int, latency: float) -> dict:
+    context = multiprocessing.get_context("spawn")
+    port_queue, result_queue, stop_event = context.Queue(), context.Queue(), context.Event()
+    target = _serve_http2 if http2 else _serve_http1
+    server = context.Process(
+        target=target, args=(port_queue, stop_event, result_queue, latency)
+    )
+    server.start()
+    port = port_queue.get(timeout=30)
+
+    client = RESTClientObject(_Configuration(http2))
+    client.session = _Session()  # type: ignore[assignment]
+    session_kwargs = client._get_session_defaults(asynchronous=True)
+    if http2:
+        # Cleartext stand-in for the ALPN negotiation that happens over TLS.
+        session_kwargs["http1"] = False
+
+    baseline_fds = _open_fds()
+    peak_fds = baseline_fds
+    sampling = True
+
+    def sample() -> None:
+        nonlocal peak_fds
+        while sampling:
+            fds = _open_fds()
+            if fds is not None and peak_fds is not None:
+                peak_fds = max(peak_fds, fds)
+            time.sleep(0.005)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+
+    url = f"http://127.0.0.1:{port}/dataset/datapoint"
+    body = {"asset": {"_t": "TextAsset", "text": "benchmark"}, "sortIndex": 0}
+
+    async def post_all() -> float:
+        async with httpx.AsyncClient(**session_kwargs) as session:
+            client._get_async_session = lambda: session  # type: ignore[method-assign]
+            limit = asyncio.Semaphore(concurrency)
+
+            async def post() -> None:
+                async with limit:
+                    await client.request_async(
+                        "POST",
+                        url,
+                        headers={"Content-Type": "application/json"},
+                        body=body,
+                    )
+
+            started = time.perf_counter()
+            await asyncio.gather(*(post() for _ in range(requests)))
+            return time.perf_counter() - started
+
+    elapsed = asyncio.run(post_all())
+
+    sampling = False
+    sampler.join()
+    stop_event.set()
+    connections = result_queue.get(timeout=30)
+    server.join()
+
+    return {
+        "connections": connections,
+        "fds": (
+            peak_fds - baseline_fds
+            if peak_fds is not None and baseline_fds is not None
+            else None
+        ),
+        "rps": requests / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests} POSTs, {args.concurrency} in flight, "
+        f"{args.latency * 1000:.0f} ms server latency"
+    )
+    print(f"{'protocol':<10}{'connections':>13}{'extra fds':>11}{'req/s':>10}")
+    for http2 in (False, True):
+        result = _run(http2, args.requests, args.concurrency, args.latency)
+        fds = "n/a" if result["fds"] is None else str(result["fds"])
+        print(
+            f"{'HTTP/2' if http2 else 'HTTP/1.1':<10}"
+            f"{result['connections']:>13}{fds:>11}{result['rps']:>10.0f}"
+        )
+    print(json.dumps({"note": "connections = TLS handshakes in production"}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time ``import rapidata`` with ``python -X importtime``.
+
+Imports the package in ``--repeat`` fresh interpreters, then resolves
+``rapidata.RapidataClient``, which loads the client, the generated API and
+their dependencies, and reports the best cumulative time of each step along
+with the modules that cost the most on their own (self time, not including
+their imports). Lists the heavy optional dependencies that the import still
+pulled in; none should appear before they are used.
+
+Usage: python benchmarks/import_time.py [--repeat 5] [--top 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+# Deferred until first use: progress bars, the OpenTelemetry SDK and exporters,
+# and the HTTP client of the browser login and version check.
+_DEFERRED = ("tqdm", "opentelemetry.sdk", "opentelemetry.exporter", "requests")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def _profile(statement: str) -> tuple[int, dict[str, int], list[str]]:
+    """Return the cumulative time, self times and deferred modules loaded."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-W",
+            "ignore",
+            "-c",
+            f"import sys\n{statement}\nprint(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_times: dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        self_times[module] = int(self_us)
+        if not indent and module.split(".")[0] == "rapidata":
+            total += int(cumulative_us)
+    loaded = result.stdout.split()
+    deferred = [
+        name for name in _DEFERRED if any(m == name or m.startswith(name + ".") for m in loaded)
+    ]
+    return total, self_times, deferred
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"best of {args.repeat} fresh interpreters")
+    print(f"{'statement':<50}{'ms':>9}  deferred dependencies loaded")
+    for statement in ("import rapidata", "import rapidata; rapidata.RapidataClient"):
+        runs = [_profile(statement) for _ in range(args.repeat)]
+        total, self_times, deferred = min(runs, key=lambda run: run[0])
+        print(f"{statement:<50}{total / 1000:>9.1f}  {', '.join(deferred) or '-'}")
+
+    print("\nslowest modules for rapidata.RapidataClient (self time)")
+    for module, self_us in sorted(self_times.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{self_us / 1000:>8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
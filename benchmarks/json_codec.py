@@ -0,0 +1,146 @@
+"""Compare the standard-library and orjson codecs on representative API payloads.
+
+Times three things per payload, once with each codec: encoding a request body
+(``rest.json_dumps``), parsing the raw JSON (``rest.json_loads``) and the full
+``ApiClient.response_deserialize`` path that turns a response into generated
+models. The payloads are built from generated models: a finished batch upload
+with thousands of URL results, a page of job listings and a batch status
+poll, plus a job results file, which is parsed without models.
+
+Needs the ``orjson`` package (``pip install rapidata[json]``).
+
+Usage: python benchmarks/json_codec.py [--items 5000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+import httpx
+import orjson
+
+from rapidata.api_client import rest
+from rapidata.api_client.api_client import ApiClient
+
+
+def _payloads(items: int) -> dict[str, tuple[object, str | None]]:
+    batch_result = {
+        "batchUploadId": "batch-0",
+        "status": "Completed",
+        "totalCount": items,
+        "completedCount": items,
+        "failedCount": 0,
+        "items": [
+            {
+                "url": f"https://cdn.example.com/images/{i:08d}.jpg",
+                "fileName": f"{i:08d}-3f9a1c.jpg",
+                "warnings": [],
+                "status": "Completed",
+            }
+            for i in range(items)
+        ],
+    }
+    jobs_page = {
+        "total": 100_000,
+        "page": 1,
+        "pageSize": 100,
+        "totalPages": 1000,
+        "items": [
+            {
+                "jobId": f"job-{i}",
+                "name": f"Which image fits the prompt better? #{i}",
+                "jobDefinitionId": f"definition-{i}",
+                "audienceId": "audience-1",
+                "revisionNumber": 3,
+                "pipelineId": f"pipeline-{i}",
+                "state": "Completed",
+                "ownerMail": "owner@example.com",
+                "organizationId": "organization-1",
+                "createdAt": datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat(),
+                "progress": 1.0,
+            }
+            for i in range(100)
+        ],
+    }
+    batch_status = {
+        "status": "Processing",
+        "totalCount": items * 10,
+        "completedCount": items * 5,
+        "failedCount": 12,
+        "completedBatches": [f"batch-{i}" for i in range(items // 100)],
+    }
+    results_file = {
+        "info": {"createdAt": "2026-01-01T00:00:00Z", "version": "3.0.0"},
+        "results": [
+            {
+                "context": f"prompt {i}",
+                "A_B": [f"https://cdn.example.com/a/{i}.jpg", f"https://cdn.example.com/b/{i}.jpg"],
+                "aggregatedResults": {"A": 12, "B": 8},
+                "aggregatedResultsRatios": {"A": 0.6, "B": 0.4},
+                "summedUserScores": {"A": 7.42, "B": 4.91},
+                "detailedResults": [
+                    {"selectedCategory": "A", "userDetails": {"country": "CH", "userScore": 0.62}}
+                    for _ in range(20)
+                ],
+            }
+            for i in range(items // 10)
+        ],
+    }
+    return {
+        "batch upload result": (batch_result, "GetBatchUploadResultEndpointOutput"),
+        "jobs page": (jobs_page, "QueryJobsEndpointPagedResultOfOutput"),
+        "batch status": (batch_status, "GetBatchUploadStatusEndpointOutput"),
+        "results file": (results_file, None),
+    }
+
+
+def _best(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _measure(body: object, model: str | None, repeat: int) -> tuple[float, float, float | None]:
+    raw = orjson.dumps(body)
+    encode = _best(repeat, lambda: rest.json_dumps(body))
+    parse = _best(repeat, lambda: rest.json_loads(raw))
+    if model is None:
+        return encode, parse, None
+
+    client = ApiClient()
+
+    def deserialize() -> None:
+        response = rest.RESTResponse(
+            httpx.Response(200, content=raw, headers={"Content-Type": "application/json"})
+        )
+        response.read()
+        client.response_deserialize(response, {"200": model})
+
+    return encode, parse, _best(repeat, deserialize)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.items)
+    print(f"best of {args.repeat}, milliseconds")
+    print(f"{'payload':<22}{'KiB':>7}{'codec':>8}{'encode':>9}{'parse':>9}{'models':>9}")
+    for name, (body, model) in payloads.items():
+        size = len(orjson.dumps(body)) / 1024
+        for codec in ("json", "orjson"):
+            rest.orjson = orjson if codec == "orjson" else None
+            encode, parse, models = _measure(body, model, args.repeat)
+            shown = "-" if models is None else f"{models:.2f}"
+            print(f"{name:<22}{size:>7.0f}{codec:>8}{encode:>9.2f}{parse:>9.2f}{shown:>9}")
+
+
+if __name__ == "__main__":
+    main()
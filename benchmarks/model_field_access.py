@@ -0,0 +1,106 @@
+"""Time reading fields from generated models through the lazy-validation guard.
+
+Builds ``--instances`` ``QueryJobsEndpointOutput`` models, the rows of a job
+listing, and reads four fields from each, the way a loop over results or
+prompt pages does. Compares the guard as it was (a ``model_fields`` lookup and
+an error-map read on every field access, on every model) with the current
+one, for a class whose instances all validated (no guard is installed) and for
+a class that has had a lazily validated instance (the guard checks the names
+of the fields that failed), the latter reading only fields that validated.
+
+Usage: python benchmarks/model_field_access.py [--instances 1000000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import patch
+
+from rapidata.api_client.lazy_model import LazyValidatedModel, _guarded_getattribute
+from rapidata.api_client.models.query_jobs_endpoint_output import QueryJobsEndpointOutput
+
+
+def _previous_guard(self: Any, name: str) -> Any:
+    """The guard before the per-class cache, minus the error reporting."""
+    model_fields = getattr(type(self), "model_fields", None)
+    if model_fields is not None and name in model_fields:
+        try:
+            errors = object.__getattribute__(self, "_field_validation_errors")
+        except AttributeError:
+            errors = None
+        if errors and name in errors:
+            raise TypeError(name)
+    return super(LazyValidatedModel, self).__getattribute__(name)
+
+
+def _instances(count: int) -> list[QueryJobsEndpointOutput]:
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        QueryJobsEndpointOutput.model_construct(
+            job_id=f"job-{i}",
+            name=f"job {i}",
+            job_definition_id="definition",
+            audience_id="audience",
+            revision_number=1,
+            pipeline_id="pipeline",
+            state="Completed",
+            owner_mail="owner@example.com",
+            organization_id="organization",
+            created_at=created_at,
+            progress=1.0,
+        )
+        for i in range(count)
+    ]
+
+
+def _read_all(models: list[QueryJobsEndpointOutput]) -> None:
+    for model in models:
+        model.job_id
+        model.name
+        model.state
+        model.progress
+
+
+def _best(repeat: int, models: list[QueryJobsEndpointOutput]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _read_all(models)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    models = _instances(args.instances)
+    reads = args.instances * 4
+
+    with patch.object(LazyValidatedModel, "__getattribute__", _previous_guard, create=True):
+        previous = _best(args.repeat, models)
+    clean = _best(args.repeat, models)
+    with patch.object(
+        QueryJobsEndpointOutput, "__getattribute__", _guarded_getattribute, create=True
+    ), patch.object(
+        QueryJobsEndpointOutput, "__lazy_error_fields__", frozenset({"owner_mail"})
+    ):
+        guarded = _best(args.repeat, models)
+
+    print(f"{args.instances} instances, {reads} field reads, best of {args.repeat}")
+    print(f"{'model':<18}{'seconds':>9}{'ns/read':>9}")
+    for name, elapsed in (
+        ("previous", previous),
+        ("clean class", clean),
+        ("guarded class", guarded),
+    ):
+        print(f"{name:<18}{elapsed:>9.2f}{elapsed / reads * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Time deserializing benchmark prompt pages with and without `_t` dispatch.
+
+Builds ``GetPromptsByBenchmarkEndpointPagedResultOfOutput`` pages whose prompts
+carry a multi-asset of image files with metadata, the way prompt listings of
+image benchmarks look, and deserializes them with ``from_dict``. Every asset
+and metadata entry is a oneOf union, nested up to three levels deep. The
+"trial" run disables the discriminator lookup, so each union is resolved by
+deserializing it into every variant as before.
+
+Usage: python benchmarks/oneof_dispatch.py [--prompts 100] [--repeat 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from unittest.mock import patch
+
+from rapidata.api_client import oneof_dispatch
+from rapidata.api_client.models.get_prompts_by_benchmark_endpoint_paged_result_of_output import (
+    GetPromptsByBenchmarkEndpointPagedResultOfOutput,
+)
+
+
+def _file_asset(name: str) -> dict:
+    return {
+        "_t": "FileAsset",
+        "fileName": name,
+        "identifier": name,
+        "metadata": {
+            "fileType": {"_t": "FileTypeMetadata", "fileType": "Image"},
+            "dimensions": {"_t": "ImageDimensionMetadata", "width": 1024, "height": 768},
+            "originalFilename": {
+                "_t": "OriginalFilenameMetadata",
+                "originalFilename": f"original-{name}",
+            },
+        },
+    }
+
+
+def _page(prompts: int) -> dict:
+    return {
+        "total": prompts,
+        "page": 1,
+        "pageSize": prompts,
+        "totalPages": 1,
+        "items": [
+            {
+                "id": f"prompt-{i}",
+                "englishPrompt": f"A watercolor painting of lighthouse number {i}",
+                "identifier": f"prompt-{i}",
+                "createdAt": "2026-01-01T00:00:00Z",
+                "tags": [{"value": "landscape", "category": "style"}],
+                "origin": {"source": "benchmark"},
+                "promptAsset": {
+                    "_t": "MultiAsset",
+                    "identifier": f"prompt-{i}",
+                    "metadata": {},
+                    "assets": [_file_asset(f"{i}-a.jpg"), _file_asset(f"{i}-b.jpg")],
+                },
+            }
+            for i in range(prompts)
+        ],
+    }
+
+
+def _best(repeat: int, page: dict) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        GetPromptsByBenchmarkEndpointPagedResultOfOutput.from_dict(page)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    page = _page(args.prompts)
+    parsed = GetPromptsByBenchmarkEndpointPagedResultOfOutput.from_dict(page)
+    assert parsed.to_dict()["items"][0]["promptAsset"] == page["items"][0]["promptAsset"]
+
+    dispatch = _best(args.repeat, page)
+    with patch.object(oneof_dispatch, "_resolve", lambda wrapper, value: None), patch.object(
+        oneof_dispatch, "_variants_by_discriminator", {}
+    ):
+        trial = _best(args.repeat, page)
+
+    print(f"{args.prompts} prompts per page, best of {args.repeat}")
+    print(f"{'strategy':<12}{'ms/page':>10}{'prompts/s':>12}")
+    for name, elapsed in (("trial", trial), ("dispatch", dispatch)):
+        print(f"{name:<12}{elapsed:>10.1f}{args.prompts / elapsed * 1000:>12.0f}")
+    print(f"speedup: {trial / dispatch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
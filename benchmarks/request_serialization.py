@@ -0,0 +1,101 @@
+"""Time serializing datapoint-creation request bodies.
+
+Builds ``--datapoints`` ``CreateDatapointEndpointInput`` bodies the way the
+datapoint uploader does (a multi-asset of two uploaded files with metadata, a
+context and private metadata, explicit ``None`` for unset nullable fields) and
+turns each into the JSON bytes sent to the API: through
+``ApiClient.sanitize_for_serialization`` and the JSON encoder, as every body
+used to be, and through ``param_serialize``'s direct path for model bodies.
+The time spent in the models' ``to_dict()`` is reported on its own.
+
+Usage: python benchmarks/request_serialization.py [--datapoints 5000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from rapidata.api_client import rest
+from rapidata.api_client.api_client import ApiClient
+from rapidata.api_client.models.create_datapoint_endpoint_input import (
+    CreateDatapointEndpointInput,
+)
+from rapidata.api_client.models.i_asset_input import IAssetInput
+
+_HEADERS = {"Content-Type": "application/json"}
+
+
+def _body(index: int) -> CreateDatapointEndpointInput:
+    asset = IAssetInput.from_dict(
+        {
+            "_t": "MultiAssetInput",
+            "assets": [
+                {"_t": "ExistingAssetInput", "name": f"{index}-left.jpg"},
+                {"_t": "ExistingAssetInput", "name": f"{index}-right.jpg"},
+            ],
+            "metadata": {
+                "prompt": {
+                    "_t": "TextMetadataInput",
+                    "text": f"A red bicycle {index}",
+                    "visibilities": ["Users"],
+                }
+            },
+        }
+    )
+    return CreateDatapointEndpointInput(
+        asset=asset,
+        context=f"Which image matches prompt {index} better?",
+        contextAsset=None,
+        transcription=None,
+        sortIndex=index,
+        group=None,
+        privateMetadata={"source": "benchmark", "row": str(index)},
+    )
+
+
+def _best(repeat: int, bodies: list, serialize: Callable) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            serialize(body)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datapoints", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = ApiClient()
+    bodies = [_body(i) for i in range(args.datapoints)]
+    assert client._serialize_body(bodies[0], _HEADERS) == rest.json_dumps(
+        client.sanitize_for_serialization(bodies[0])
+    )
+
+    results = {
+        "to_dict": _best(args.repeat, bodies, lambda body: body.to_dict()),
+        "sanitize + encode": _best(
+            args.repeat,
+            bodies,
+            lambda body: rest.json_dumps(client.sanitize_for_serialization(body)),
+        ),
+        "direct": _best(
+            args.repeat, bodies, lambda body: client._serialize_body(body, _HEADERS)
+        ),
+    }
+
+    codec = "orjson" if rest.orjson is not None else "json"
+    print(f"{args.datapoints} datapoint bodies, {codec}, best of {args.repeat}")
+    print(f"{'path':<20}{'us/body':>10}{'bodies/s':>12}")
+    for name, elapsed in results.items():
+        per_body = elapsed / args.datapoints
+        print(f"{name:<20}{per_body * 1e6:>10.1f}{1 / per_body:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Measure peak memory and time of fetching a large job's results.
+
+Writes a synthetic Compare results file of ``--datapoints`` rows with
+``--responses`` detailed results each, serves it in chunks from disk through
+an in-process transport, and fetches it with ``RapidataJob.get_results`` (the
+whole body downloaded and parsed into one dict) and with
+``RapidataJob.download_results`` followed by iterating every row of the
+returned file. Each path runs in a fresh child process and reports the growth
+of its peak resident memory.
+
+No network access or credentials are needed.
+
+Usage: python benchmarks/results_download.py [--datapoints 20000] [--responses 25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import httpx
+
+from rapidata.api_client.api.job_api import JobApi
+from rapidata.api_client.models.audience_job_state import AudienceJobState
+from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.job.rapidata_job import RapidataJob
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _write_results(path: str, datapoints: int, responses: int) -> None:
+    with open(path, "w") as file:
+        file.write('{"info": {"type": "Compare", "version": "4.1.0"}, "results": [')
+        for index in range(datapoints):
+            left, right = f"{index}-left.jpg", f"{index}-right.jpg"
+            row = {
+                "context": f"Which image matches prompt {index} better?",
+                "winner": left,
+                "assetUrls": {
+                    left: f"https://assets.rapidata.ai/{index:032x}.jpg",
+                    right: f"https://assets.rapidata.ai/{index + 1:032x}.jpg",
+                },
+                "aggregatedResults": {left: responses, right: 0},
+                "aggregatedResultsRatios": {left: 1.0, right: 0.0},
+                "detailedResults": [
+                    {
+                        "votedFor": left,
+                        "userDetails": {
+                            "country": "CH",
+                            "language": "en",
+                            "userScores": {"global": 0.8},
+                            "demographics": {"age": "18-29", "gender": "Other"},
+                        },
+                    }
+                    for _ in range(responses)
+                ],
+            }
+            if index:
+                file.write(",")
+            file.write(json.dumps(row))
+        file.write('], "summary": {"A_wins_total": %d, "B_wins_total": 0}}' % datapoints)
+
+
+def _job(results_path: str) -> RapidataJob:
+    def body():
+        with open(results_path, "rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    api_client = RapidataApiClient()
+    api_client.rest_client.session = httpx.Client(  # type: ignore[assignment]
+        transport=httpx.MockTransport(handler)
+    )
+    openapi_service = MagicMock()
+    openapi_service.order.job_api = JobApi(api_client)
+    openapi_service.order.job_api.job_job_id_get = MagicMock(
+        return_value=MagicMock(state=AudienceJobState.COMPLETED)
+    )
+    openapi_service.audience.audience_api.audience_audience_id_user_metrics_get.return_value.users_per_state = {
+        "Graduated": 1
+    }
+    return RapidataJob(
+        job_id="job-1",
+        name="benchmark",
+        audience_id="aud-1",
+        created_at=MagicMock(),
+        definition_id="def-1",
+        openapi_service=openapi_service,
+    )
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _run(mode: str, results_path: str, directory: str, queue) -> None:
+    job = _job(results_path)
+    baseline = _peak_rss_mb()
+    started = time.perf_counter()
+    if mode == "get_results":
+        rows = len(job.get_results()["results"])
+    else:
+        results_file = job.download_results(os.path.join(directory, "download.json"))
+        rows = sum(1 for _ in results_file)
+    queue.put((rows, _peak_rss_mb() - baseline, time.perf_counter() - started))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datapoints", type=int, default=20_000)
+    parser.add_argument("--responses", type=int, default=25)
+    args = parser.parse_args()
+    rapidata_config.logging.enable_otlp = False
+
+    context = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory() as directory:
+        results_path = os.path.join(directory, "results.json")
+        _write_results(results_path, args.datapoints, args.responses)
+        size_mb = os.path.getsize(results_path) / 1024 / 1024
+        print(
+            f"{args.datapoints} datapoints x {args.responses} responses, "
+            f"{size_mb:.0f} MB results file"
+        )
+        print(f"{'path':<22}{'rows':>8}{'peak memory':>14}{'time':>9}")
+        for mode in ("get_results", "download_results"):
+            queue = context.Queue()
+            child = context.Process(
+                target=_run, args=(mode, results_path, directory, queue)
+            )
+            child.start()
+            rows, peak_mb, elapsed = queue.get()
+            child.join()
+            print(f"{mode:<22}{rows:>8}{peak_mb:>11.0f} MB{elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure time and peak memory of writing job results to Parquet.
+
+Builds synthetic Compare results of ``--datapoints`` rows with ``--responses``
+detailed results each and writes them split by detailed results, once through
+``to_pandas`` and ``DataFrame.to_parquet`` and once with ``to_parquet``, which
+converts and writes one row group at a time without a pandas frame. Each path
+runs in a fresh child process and reports the growth of its peak resident
+memory.
+
+Needs pyarrow (``pip install rapidata[arrow]``).
+
+Usage: python benchmarks/results_export.py [--datapoints 20000] [--responses 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from results_to_pandas import compare
+
+from rapidata.rapidata_client.results.rapidata_results import RapidataResults
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _run(mode: str, results: RapidataResults, path: str, queue) -> None:
+    baseline = _peak_rss_mb()
+    started = time.perf_counter()
+    if mode == "to_pandas().to_parquet":
+        results.to_pandas(split_details=True).to_parquet(path)
+    else:
+        results.to_parquet(path, split_details=True)
+    queue.put((_peak_rss_mb() - baseline, time.perf_counter() - started))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datapoints", type=int, default=20_000)
+    parser.add_argument("--responses", type=int, default=50)
+    args = parser.parse_args()
+
+    results = compare(args.datapoints, args.responses)
+    context = multiprocessing.get_context("fork")
+    print(f"{args.datapoints} datapoints x {args.responses} responses, split by details")
+    print(f"{'path':<26}{'peak memory':>14}{'time':>9}{'file':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("to_pandas().to_parquet", "to_parquet"):
+            path = os.path.join(directory, f"{mode}.parquet")
+            queue = context.Queue()
+            child = context.Process(target=_run, args=(mode, results, path, queue))
+            child.start()
+            peak_mb, elapsed = queue.get()
+            child.join()
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            print(f"{mode:<26}{peak_mb:>11.0f} MB{elapsed:>8.2f}s{size_mb:>7.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
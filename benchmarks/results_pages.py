@@ -0,0 +1,101 @@
+"""Time ``RapidataJob.iter_results`` over paged results with a simulated round trip.
+
+Serves ``--items`` ranking datapoints through an in-process transport that
+waits ``--latency`` seconds per request, and iterates them with
+``max_concurrent_pages`` of 1 (one page after the other) and with larger
+prefetch windows.
+
+No network access or credentials are needed.
+
+Usage: python benchmarks/results_pages.py [--items 5000] [--page-size 100] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs
+
+import httpx
+
+from rapidata.api_client.api.job_api import JobApi
+from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.job.rapidata_job import RapidataJob
+
+
+def _job(items: int, latency: float) -> RapidataJob:
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(request.url.query.decode())
+        page, page_size = int(query["page"][0]), int(query["page_size"][0])
+        first = (page - 1) * page_size
+        time.sleep(latency)
+        body = {
+            "_t": "RankingResults",
+            "total": items,
+            "page": page,
+            "pageSize": page_size,
+            "totalVotes": 0,
+            "items": [
+                {
+                    "datapointId": f"dp-{i}",
+                    "asset": {
+                        "_t": "TextAsset",
+                        "text": f"prompt {i}",
+                        "metadata": {},
+                        "identifier": str(i),
+                    },
+                    "elo": 1000 + i,
+                }
+                for i in range(first, min(first + page_size, items))
+            ],
+        }
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    api_client = RapidataApiClient()
+    api_client.rest_client.session = httpx.Client(  # type: ignore[assignment]
+        transport=httpx.MockTransport(handler)
+    )
+    openapi_service = MagicMock()
+    openapi_service.order.job_api = JobApi(api_client)
+    return RapidataJob(
+        job_id="job-1",
+        name="benchmark",
+        audience_id="aud-1",
+        created_at=MagicMock(),
+        definition_id="def-1",
+        openapi_service=openapi_service,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    rapidata_config.logging.enable_otlp = False
+
+    job = _job(args.items, args.latency)
+    pages = -(-args.items // args.page_size)
+    print(
+        f"{args.items} items, {pages} pages, "
+        f"{args.latency * 1000:.0f} ms per request"
+    )
+    print(f"{'max_concurrent_pages':>22}{'time':>9}{'items/s':>10}")
+    for window in (1, 4, 8, 16):
+        started = time.perf_counter()
+        count = sum(
+            1
+            for _ in job.iter_results(
+                page_size=args.page_size, max_concurrent_pages=window
+            )
+        )
+        elapsed = time.perf_counter() - started
+        print(f"{window:>22}{elapsed:>8.2f}s{count / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
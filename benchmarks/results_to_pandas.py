@@ -0,0 +1,120 @@
+"""Time ``RapidataResults.to_pandas`` on synthetic Classify, Compare and Ranking results.
+
+Builds results shaped like the aggregator's output: ``--datapoints`` rows
+with ``--responses`` detailed results each, answered by labelers with user
+details and demographics; Ranking rows rank ``--ranking-assets`` assets.
+Each payload is converted with ``split_details=False`` (one row per
+datapoint) and ``split_details=True`` (one row per response).
+
+Usage: python benchmarks/results_to_pandas.py [--datapoints 20000] [--responses 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any
+
+from rapidata.rapidata_client.results.rapidata_results import RapidataResults
+
+_COUNTRIES = ["CH", "DE", "US", "BR", "IN", "JP"]
+_AGES = ["0-17", "18-29", "30-39", "40-49", "50-64", "65+"]
+
+
+def _details(rng: random.Random, answer: Any) -> dict[str, Any]:
+    return {
+        "votedFor": answer,
+        "userDetails": {
+            "country": rng.choice(_COUNTRIES),
+            "language": "en",
+            "userScores": {"global": round(rng.random(), 4)},
+            "demographics": {"age": rng.choice(_AGES), "gender": "Other"},
+        },
+    }
+
+
+def classify(datapoints: int, responses: int, seed: int = 0) -> RapidataResults:
+    rng = random.Random(seed)
+    categories = ["cat", "dog", "bird"]
+    results = []
+    for index in range(datapoints):
+        votes = [rng.choice(categories) for _ in range(responses)]
+        counts = {c: votes.count(c) for c in categories}
+        results.append(
+            {
+                "originalFileName": f"{index}.jpg",
+                "context": f"prompt {index}",
+                "aggregatedResults": counts,
+                "aggregatedResultsRatios": {c: n / responses for c, n in counts.items()},
+                "summedUserScores": {c: float(n) for c, n in counts.items()},
+                "detailedResults": [_details(rng, vote) for vote in votes],
+            }
+        )
+    return RapidataResults({"info": {"type": "Classify"}, "results": results})
+
+
+def _ranked(rng: random.Random, kind: str, assets: list[str], responses: int, index: int):
+    votes = [rng.choice(assets) for _ in range(responses)]
+    counts = {a: votes.count(a) for a in assets}
+    winner = max(assets, key=counts.__getitem__)
+    return {
+        "context": f"prompt {index}",
+        "winner": winner,
+        "winnerIndex": assets.index(winner),
+        "assetUrls": {a: f"https://assets.rapidata.ai/{a}" for a in assets},
+        "aggregatedResults": counts,
+        "aggregatedResultsRatios": {a: n / responses for a, n in counts.items()},
+        "summedUserScores": {a: float(n) for a, n in counts.items()},
+        "privateMetadata": {"source": kind, "row": str(index)},
+        "detailedResults": [_details(rng, vote) for vote in votes],
+    }
+
+
+def compare(datapoints: int, responses: int, seed: int = 0) -> RapidataResults:
+    rng = random.Random(seed)
+    results = [
+        _ranked(rng, "compare", [f"{i}-a.jpg", f"{i}-b.jpg"], responses, i)
+        for i in range(datapoints)
+    ]
+    return RapidataResults({"info": {"type": "Compare"}, "results": results})
+
+
+def ranking(
+    datapoints: int, responses: int, assets: int = 4, seed: int = 0
+) -> RapidataResults:
+    rng = random.Random(seed)
+    models = [f"model-{m}.jpg" for m in range(assets)]
+    results = [
+        _ranked(rng, "ranking", models, responses, i) for i in range(datapoints)
+    ]
+    return RapidataResults({"info": {"type": "Ranking"}, "results": results})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datapoints", type=int, default=20_000)
+    parser.add_argument("--responses", type=int, default=50)
+    parser.add_argument("--ranking-assets", type=int, default=4)
+    args = parser.parse_args()
+
+    payloads = {
+        "Classify": classify(args.datapoints, args.responses),
+        "Compare": compare(args.datapoints, args.responses),
+        "Ranking": ranking(args.datapoints, args.responses, args.ranking_assets),
+    }
+    print(f"{args.datapoints} datapoints x {args.responses} responses")
+    print(f"{'task':<10}{'split_details':>15}{'rows':>10}{'columns':>9}{'time':>9}")
+    for name, results in payloads.items():
+        for split_details in (False, True):
+            started = time.perf_counter()
+            frame = results.to_pandas(split_details=split_details)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{name:<10}{str(split_details):>15}{len(frame):>10}"
+                f"{len(frame.columns):>9}{elapsed:>8.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Time the per-request tracing overhead of ``RapidataApiClient`` at each tracing level.
+
+Opens the tracing context that ``call_api`` wraps every request in,
+``--requests`` times inside one recording stage span (the way an upload of
+many datapoints runs), with the SDK tracer backed by a real ``TracerProvider``
+and batch processor whose exporter only counts spans. Reports the cost per
+request and the spans exported per 1,000 requests for OTLP disabled and for
+the ``"full"``, ``"sampled"`` and ``"stage"`` values of
+``rapidata_config.logging.tracing_level``.
+
+Usage: python benchmarks/tracing_overhead.py [--requests 20000] [--sample-rate 0.01]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+
+from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
+from rapidata.rapidata_client.config import rapidata_config, tracer
+
+
+class _CountingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.exported = 0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.exported += len(spans)
+        return SpanExportResult.SUCCESS
+
+
+def _run(client: RapidataApiClient, provider: TracerProvider, requests: int) -> float:
+    started = time.perf_counter()
+    with tracer.start_as_current_span("RapidataDataset.add_datapoints"):
+        for _ in range(requests):
+            with client._backend_trace("POST", "/dataset/datapoint", None):
+                pass
+    elapsed = time.perf_counter() - started
+    provider.force_flush()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--sample-rate", type=float, default=0.01)
+    args = parser.parse_args()
+
+    exporter = _CountingExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(BatchSpanProcessor(exporter, max_queue_size=100_000))
+    tracer._real_tracer = provider.get_tracer("benchmark")
+    tracer._otlp_initialized = True
+    client = RapidataApiClient()
+    rapidata_config.logging.tracing_sample_rate = args.sample_rate
+
+    print(f"{args.requests} requests in one stage span")
+    print(f"{'level':<16}{'us/request':>12}{'spans/1k requests':>20}")
+    for name, enabled, level in (
+        ("otlp disabled", False, "full"),
+        ("full", True, "full"),
+        ("sampled", True, "sampled"),
+        ("stage", True, "stage"),
+    ):
+        rapidata_config.logging.enable_otlp = enabled
+        rapidata_config.logging.tracing_level = level
+        _run(client, provider, min(args.requests, 1000))  # warm up
+        exporter.exported = 0
+        elapsed = _run(client, provider, args.requests)
+        spans = exporter.exported / args.requests * 1000
+        print(f"{name:<16}{elapsed / args.requests * 1e6:>12.1f}{spans:>20.0f}")
+
+    provider.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure peak memory of multipart file uploads as the file size grows.
+
+Posts local files of increasing size through ``RESTClientObject.request`` —
+the path ``AssetUploader`` takes for ``/asset/file`` — against an in-process
+transport that drains the request body chunk by chunk, and reports the peak
+traced allocation for each. With files streamed from disk the peak stays flat
+regardless of file size; ``--buffered`` replays the previous behaviour of
+reading every file into memory first, for comparison.
+
+No network access or credentials are needed.
+
+Usage: python benchmarks/upload_memory.py [--sizes-mb 16 64 256] [--buffered]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import httpx
+
+from rapidata.api_client.api_client import ApiClient
+from rapidata.api_client.rest import RESTClientObject
+
+
+class _Configuration:
+    ssl_ca_cert = None
+    verify_ssl = True
+    proxy = None
+    proxy_headers = None
+    retries = None
+
+
+class _DrainingTransport(httpx.BaseTransport):
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in request.stream:
+            pass
+        return httpx.Response(200, json={})
+
+
+def _write_file(directory: str, size_mb: int) -> str:
+    path = os.path.join(directory, f"asset_{size_mb}mb.bin")
+    block = os.urandom(1024 * 1024)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+    return path
+
+
+def _measure(path: str, buffered: bool) -> tuple[int, float]:
+    client = RESTClientObject(_Configuration())
+    client.session = httpx.Client(transport=_DrainingTransport())  # type: ignore[assignment]
+    api_client = ApiClient.__new__(ApiClient)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    if buffered:
+        with open(path, "rb") as f:
+            post_params = api_client.files_parameters(
+                {"file": (os.path.basename(path), f.read())}
+            )
+    else:
+        post_params = api_client.files_parameters({"file": path})
+    client.request(
+        "POST",
+        "https://bench.invalid/asset/file",
+        headers={"Content-Type": "multipart/form-data"},
+        post_params=post_params,
+    )
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument(
+        "--buffered",
+        action="store_true",
+        help="read each file into memory first, as uploads used to",
+    )
+    args = parser.parse_args()
+
+    mode = "buffered" if args.buffered else "streamed"
+    print(f"{'file size':>10}  {'peak memory':>12}  {'time':>8}  ({mode})")
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mb in args.sizes_mb:
+            path = _write_file(directory, size_mb)
+            peak, elapsed = _measure(path, args.buffered)
+            print(f"{size_mb:>7} MB  {peak / 1024 / 1024:>9.2f} MB  {elapsed:>7.2f}s")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
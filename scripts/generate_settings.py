@@ -301,22 +301,42 @@ def generate_rapidata_settings(settings: list[dict[str, Any]]) -> str:
 def generate_rapidata_client_init_block(settings: list[dict[str, Any]]) -> str:
     """Generate the settings import block for rapidata_client/__init__.py"""
     lines: list[str] = []
-    lines.append("from .settings import (")
-    lines.append("    RapidataSettings,")
-    lines.append("    CustomSetting,")
+    lines.append("    from .settings import (")
+    lines.append("        RapidataSettings,")
+    lines.append("        CustomSetting,")
     for s in settings:
-        lines.append(f"    {s['class_name']},")
-    lines.append(")")
+        lines.append(f"        {s['class_name']},")
+    lines.append("    )")
+    return "\n".join(lines)
+
+
+def generate_rapidata_client_lazy_block(settings: list[dict[str, Any]]) -> str:
+    """Generate the settings entries of the lazy import map in rapidata_client/__init__.py"""
+    lines: list[str] = []
+    lines.append('    "RapidataSettings": ".settings",')
+    lines.append('    "CustomSetting": ".settings",')
+    for s in settings:
+        lines.append(f'    "{s["class_name"]}": ".settings",')
     return "\n".join(lines)
 
 
 def generate_rapidata_init_block(settings: list[dict[str, Any]]) -> str:
     """Generate the settings import block for rapidata/__init__.py"""
     lines: list[str] = []
-    lines.append("    RapidataSettings,")
-    lines.append("    CustomSetting,")
+    lines.append("        RapidataSettings,")
+    lines.append("        CustomSetting,")
+    for s in settings:
+        lines.append(f"        {s['class_name']},")
+    return "\n".join(lines)
+
+
+def generate_rapidata_all_block(settings: list[dict[str, Any]]) -> str:
+    """Generate the settings __all__ block for rapidata/__init__.py and rapidata_client/__init__.py"""
+    lines: list[str] = []
+    lines.append('    "RapidataSettings",')
+    lines.append('    "CustomSetting",')
     for s in settings:
-        lines.append(f"    {s['class_name']},")
+        lines.append(f'    "{s["class_name"]}",')
     return "\n".join(lines)
 
 
@@ -365,7 +385,8 @@ def replace_between_markers(
         sys.exit(1)
 
     before = text[: start_idx + len(start_marker)]
-    after = text[end_idx:]
+    # Keep the indentation of the end marker line
+    after = text[text.rfind("\n", 0, end_idx) + 1 :]
     new_text = before + "\n" + new_content + "\n" + after
 
     if new_text == text:
@@ -454,6 +475,8 @@ def main():
     IMPORTS_END = "# --- GENERATED SETTINGS IMPORTS END ---"
     ALL_START = "# --- GENERATED SETTINGS ALL START ---"
     ALL_END = "# --- GENERATED SETTINGS ALL END ---"
+    LAZY_START = "# --- GENERATED SETTINGS LAZY START ---"
+    LAZY_END = "# --- GENERATED SETTINGS LAZY END ---"
 
     # rapidata_client/__init__.py
     rc_init = REPO_ROOT / "src" / "rapidata" / "rapidata_client" / "__init__.py"
@@ -463,6 +486,18 @@ def main():
     else:
         unchanged_files.append(str(rc_init.relative_to(REPO_ROOT)))
 
+    # rapidata_client/__init__.py — __all__ section
+    block = generate_rapidata_all_block(settings)
+    if replace_between_markers(rc_init, ALL_START, ALL_END, block, check_mode):
+        if str(rc_init.relative_to(REPO_ROOT)) not in changed_files:
+            changed_files.append(str(rc_init.relative_to(REPO_ROOT)))
+
+    # rapidata_client/__init__.py — lazy import map
+    block = generate_rapidata_client_lazy_block(settings)
+    if replace_between_markers(rc_init, LAZY_START, LAZY_END, block, check_mode):
+        if str(rc_init.relative_to(REPO_ROOT)) not in changed_files:
+            changed_files.append(str(rc_init.relative_to(REPO_ROOT)))
+
     # rapidata/__init__.py
     r_init = REPO_ROOT / "src" / "rapidata" / "__init__.py"
     block = generate_rapidata_init_block(settings)
@@ -471,6 +506,12 @@ def main():
     else:
         unchanged_files.append(str(r_init.relative_to(REPO_ROOT)))
 
+    # rapidata/__init__.py — __all__ section
+    block = generate_rapidata_all_block(settings)
+    if replace_between_markers(r_init, ALL_START, ALL_END, block, check_mode):
+        if str(r_init.relative_to(REPO_ROOT)) not in changed_files:
+            changed_files.append(str(r_init.relative_to(REPO_ROOT)))
+
     # types/__init__.py — imports section
     types_init = REPO_ROOT / "src" / "rapidata" / "types" / "__init__.py"
     block = generate_types_imports_block(settings)
@@ -1,81 +1,184 @@
 __version__ = "3.21.0"
 
-from .rapidata_client import (
-    RapidataClient,
-    RapidataAudience,
-    RapidataAudienceBase,
-    RapidataAudienceManager,
-    RapidataFilteredAudience,
-    RecruitingMetrics,
-    RapidataJob,
-    RapidataJobDefinition,
-    RapidataJobManager,
-    CostEstimate,
-    JobProgress,
-    RapidataSignal,
-    RapidataSignalManager,
-    BillingPeriod,
-    RapidataBillingManager,
-    ValidationSetManager,
-    RapidataValidationSet,
-    Box,
-    RapidataResults,
-    DemographicSelection,
-    LabelingSelection,
-    EffortSelection,
-    RapidataRetrievalMode,
-    ValidationSelection,
-    ConditionalValidationSelection,
-    CappedSelection,
-    ShufflingSelection,
-    # --- GENERATED SETTINGS IMPORTS START ---
-    RapidataSettings,
-    CustomSetting,
-    NoShuffleSetting,
-    MuteVideoSetting,
-    FreeTextMinimumCharactersSetting,
-    FreeTextMaxCharactersSetting,
-    SwapContextInstructionSetting,
-    PlayPercentageVideoSetting,
-    MarkdownSetting,
-    AllowNeitherBothSetting,
-    OriginalLanguageOnlySetting,
-    NoMistakeOptionSetting,
-    DisableAutoloopSetting,
-    NoInstructionDisplaySetting,
-    KeyboardNumericSetting,
-    LocateMaxPointsSetting,
-    LocateMinPointsSetting,
-    ComparePanoramaSetting,
-    CompareEquirectangularSetting,
-    ClassifyEquirectangularSetting,
-    # --- GENERATED SETTINGS IMPORTS END ---
-    CountryFilter,
-    LanguageFilter,
-    NotFilter,
-    OrFilter,
-    AndFilter,
-    UserScoreFilter,
-    CampaignFilter,
-    AgeFilter,
-    GenderFilter,
-    CustomFilter,
-    AgeGroup,
-    Gender,
-    DeviceFilter,
-    DeviceType,
-    Tag,
-    Origin,
-    VoteAggregation,
-    Datapoint,
-    ContextManager,
-    FailedUploadException,
-    FailedUpload,
-    SampleUpload,
-    rapidata_config,
-    logger,
-    managed_print,
-    CompressionConfig,
-)
+# Everything below is imported from rapidata.rapidata_client on first access
+# (PEP 562), so `import rapidata` stays cheap for processes that only need a
+# small part of the SDK.
+import importlib as _importlib
+from typing import TYPE_CHECKING
 
-from . import types
+__all__ = [
+    "RapidataClient",
+    "RapidataAudience",
+    "RapidataAudienceBase",
+    "RapidataAudienceManager",
+    "RapidataFilteredAudience",
+    "RecruitingMetrics",
+    "RapidataJob",
+    "RapidataJobDefinition",
+    "RapidataJobManager",
+    "CostEstimate",
+    "JobProgress",
+    "RapidataSignal",
+    "RapidataSignalManager",
+    "BillingPeriod",
+    "RapidataBillingManager",
+    "ValidationSetManager",
+    "RapidataValidationSet",
+    "Box",
+    "RapidataResults",
+    "RapidataResultsFile",
+    "DemographicSelection",
+    "LabelingSelection",
+    "EffortSelection",
+    "RapidataRetrievalMode",
+    "ValidationSelection",
+    "ConditionalValidationSelection",
+    "CappedSelection",
+    "ShufflingSelection",
+    # --- GENERATED SETTINGS ALL START ---
+    "RapidataSettings",
+    "CustomSetting",
+    "NoShuffleSetting",
+    "MuteVideoSetting",
+    "FreeTextMinimumCharactersSetting",
+    "FreeTextMaxCharactersSetting",
+    "SwapContextInstructionSetting",
+    "PlayPercentageVideoSetting",
+    "MarkdownSetting",
+    "AllowNeitherBothSetting",
+    "OriginalLanguageOnlySetting",
+    "NoMistakeOptionSetting",
+    "DisableAutoloopSetting",
+    "NoInstructionDisplaySetting",
+    "KeyboardNumericSetting",
+    "LocateMaxPointsSetting",
+    "LocateMinPointsSetting",
+    "ComparePanoramaSetting",
+    "CompareEquirectangularSetting",
+    "ClassifyEquirectangularSetting",
+    # --- GENERATED SETTINGS ALL END ---
+    "CountryFilter",
+    "LanguageFilter",
+    "NotFilter",
+    "OrFilter",
+    "AndFilter",
+    "UserScoreFilter",
+    "CampaignFilter",
+    "AgeFilter",
+    "GenderFilter",
+    "CustomFilter",
+    "AgeGroup",
+    "Gender",
+    "DeviceFilter",
+    "DeviceType",
+    "Tag",
+    "Origin",
+    "VoteAggregation",
+    "Datapoint",
+    "ContextManager",
+    "FailedUploadException",
+    "FailedUpload",
+    "SampleUpload",
+    "rapidata_config",
+    "logger",
+    "managed_print",
+    "CompressionConfig",
+]
+
+_PUBLIC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name == "types":
+        return _importlib.import_module(".types", __name__)
+    if name not in _PUBLIC_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(".rapidata_client", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _PUBLIC_NAMES | {"types"})
+
+
+if TYPE_CHECKING:
+    from . import types
+    from .rapidata_client import (
+        RapidataClient,
+        RapidataAudience,
+        RapidataAudienceBase,
+        RapidataAudienceManager,
+        RapidataFilteredAudience,
+        RecruitingMetrics,
+        RapidataJob,
+        RapidataJobDefinition,
+        RapidataJobManager,
+        CostEstimate,
+        JobProgress,
+        RapidataSignal,
+        RapidataSignalManager,
+        BillingPeriod,
+        RapidataBillingManager,
+        ValidationSetManager,
+        RapidataValidationSet,
+        Box,
+        RapidataResults,
+        RapidataResultsFile,
+        DemographicSelection,
+        LabelingSelection,
+        EffortSelection,
+        RapidataRetrievalMode,
+        ValidationSelection,
+        ConditionalValidationSelection,
+        CappedSelection,
+        ShufflingSelection,
+        # --- GENERATED SETTINGS IMPORTS START ---
+        RapidataSettings,
+        CustomSetting,
+        NoShuffleSetting,
+        MuteVideoSetting,
+        FreeTextMinimumCharactersSetting,
+        FreeTextMaxCharactersSetting,
+        SwapContextInstructionSetting,
+        PlayPercentageVideoSetting,
+        MarkdownSetting,
+        AllowNeitherBothSetting,
+        OriginalLanguageOnlySetting,
+        NoMistakeOptionSetting,
+        DisableAutoloopSetting,
+        NoInstructionDisplaySetting,
+        KeyboardNumericSetting,
+        LocateMaxPointsSetting,
+        LocateMinPointsSetting,
+        ComparePanoramaSetting,
+        CompareEquirectangularSetting,
+        ClassifyEquirectangularSetting,
+        # --- GENERATED SETTINGS IMPORTS END ---
+        CountryFilter,
+        LanguageFilter,
+        NotFilter,
+        OrFilter,
+        AndFilter,
+        UserScoreFilter,
+        CampaignFilter,
+        AgeFilter,
+        GenderFilter,
+        CustomFilter,
+        AgeGroup,
+        Gender,
+        DeviceFilter,
+        DeviceType,
+        Tag,
+        Origin,
+        VoteAggregation,
+        Datapoint,
+        ContextManager,
+        FailedUploadException,
+        FailedUpload,
+        SampleUpload,
+        rapidata_config,
+        logger,
+        managed_print,
+        CompressionConfig,
+    )
@@ -11,10 +11,12 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import contextlib
 import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
@@ -22,8 +24,8 @@ import re
 import tempfile
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr
 
 from rapidata.api_client.configuration import Configuration
 from rapidata.api_client.api_response import ApiResponse, T as ApiResponseT
@@ -41,6 +43,30 @@ from rapidata.api_client.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+_JSON_CONTENT_TYPE = re.compile(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+_TEXT_CONTENT_TYPE = re.compile(r'^text\/[a-z.+-]+\s*(;|$)', re.IGNORECASE)
+_CHARSET = re.compile(r"charset=([a-zA-Z\-\d]+)[\s;]?")
+_UTF8_CHARSETS = frozenset({"utf-8", "utf8"})
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_content_type(content_type: Optional[str]) -> Tuple[Optional[str], str]:
+    """Return the kind ("json", "text" or None) and charset of a content type.
+
+    A client sees a handful of distinct content-type headers, so the regex
+    matching happens once per header value rather than once per response.
+    """
+    if content_type is None:
+        return None, "utf-8"
+    match = _CHARSET.search(content_type)
+    encoding = match.group(1) if match else "utf-8"
+    if _JSON_CONTENT_TYPE.match(content_type):
+        return "json", encoding
+    if _TEXT_CONTENT_TYPE.match(content_type):
+        return "text", encoding
+    return None, encoding
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -96,7 +122,10 @@ class ApiClient:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
+
+    def close(self):
+        self.rest_client.close()
 
     @property
     def user_agent(self):
@@ -225,7 +254,7 @@ class ApiClient:
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            body = self._serialize_body(body, header_params)
 
         # request url
         if _host is None or self.configuration.ignore_operation_servers:
@@ -281,6 +310,99 @@ class ApiClient:
 
         return response_data
 
+    async def call_api_async(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Makes the HTTP request on the running event loop.
+
+        Takes the output of ``param_serialize`` just like ``call_api``; the
+        response is fully read, so ``response_deserialize`` can be used as is.
+        :return: RESTResponse
+        """
+        return await self.rest_client.request_async(
+            method, url,
+            headers=header_params,
+            body=body, post_params=post_params,
+            _request_timeout=_request_timeout
+        )
+
+    def call_endpoint(
+        self,
+        serialized: RequestSerialized,
+        response_types_map: Dict[str, Optional[str]],
+        _request_timeout=None
+    ) -> Any:
+        """Blocking twin of :meth:`call_endpoint_async`.
+
+        For requests a generated method cannot build, e.g. a multipart file
+        part whose name differs from the file's on disk.
+        """
+        response_data = self.call_api(
+            *serialized, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    async def call_endpoint_async(
+        self,
+        serialized: RequestSerialized,
+        response_types_map: Dict[str, Optional[str]],
+        _request_timeout=None
+    ) -> Any:
+        """Sends a request built by a generated ``_<operation>_serialize`` method.
+
+        The generated API classes only expose blocking methods; this is their
+        non-blocking counterpart, returning the same deserialized ``.data``.
+        """
+        response_data = await self.call_api_async(
+            *serialized, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    @contextlib.contextmanager
+    def call_api_stream(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Makes the HTTP request and yields the response before its body is read.
+
+        Takes the output of ``param_serialize`` just like ``call_api``, for
+        requests without a body. The body of a successful response is consumed
+        with ``iter_bytes()`` inside the ``with`` block; error responses are
+        read and raised as ``response_deserialize`` raises them.
+        :return: RESTResponse
+        """
+        if body is not None or post_params:
+            raise ApiValueError("Streamed requests cannot send a body.")
+
+        with self.rest_client.stream(
+            method, url,
+            headers=header_params,
+            _request_timeout=_request_timeout
+        ) as response_data:
+            if not 200 <= response_data.status <= 299:
+                response_data.read()
+                self.response_deserialize(response_data, {})
+            yield response_data
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -311,13 +433,19 @@ class ApiClient:
             elif response_type == "file":
                 return_data = self.__deserialize_file(response_data)
             elif response_type is not None:
-                match = None
                 content_type = response_data.getheader('content-type')
-                if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-                encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                kind, encoding = _parse_content_type(content_type)
+                if (
+                    kind == "json"
+                    and encoding.lower() in _UTF8_CHARSETS
+                    and 200 <= response_data.status <= 299
+                ):
+                    # JSON is parsed straight from the bytes; error bodies are
+                    # still decoded below because ApiException reports the text.
+                    return_data = self.deserialize(response_data.data, response_type, content_type)
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -333,6 +461,21 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def _serialize_body(self, body, header_params):
+        """Serialize a request body, encoding JSON model bodies straight to bytes.
+
+        A model's ``to_dict()`` already has the wire form, apart from values
+        the JSON encoder converts itself, so it is encoded directly instead of
+        being walked again by ``sanitize_for_serialization``.
+        """
+        content_type = header_params.get('Content-Type') if header_params else None
+        if isinstance(body, BaseModel) and hasattr(body, 'to_dict') and rest.is_json_body(content_type):
+            try:
+                return rest.json_dumps(body.to_dict())
+            except TypeError:
+                pass
+        return self.sanitize_for_serialization(body)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -388,10 +531,10 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body, as text or as UTF-8 bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -400,17 +543,20 @@ class ApiClient:
         """
 
         # fetch data from response object
+        kind, _ = _parse_content_type(content_type)
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = rest.json_loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
+        elif kind == "json":
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
-        elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
+                data = rest.json_loads(response_text)
+        elif kind == "text":
+            if isinstance(response_text, bytes):
+                response_text = response_text.decode("utf-8")
             data = response_text
         else:
             raise ApiException(
@@ -557,9 +703,10 @@ class ApiClient:
         params = []
         for k, v in files.items():
             if isinstance(v, str):
-                with open(v, 'rb') as f:
-                    filename = os.path.basename(f.name)
-                    filedata = f.read()
+                # Streamed from disk by the REST client at send time, so the
+                # file is never held in memory as a whole.
+                filename = os.path.basename(v)
+                filedata = rest.LocalFile(v)
             elif isinstance(v, bytes):
                 filename = k
                 filedata = v
@@ -171,6 +171,17 @@ class Configuration:
            cpu_count * 5 is used as default value to increase performance.
         """
 
+        self.http2 = False
+        """Negotiate HTTP/2 for asyncio requests, so concurrent requests share
+           a few multiplexed connections instead of opening one connection
+           each. Blocking requests stay on HTTP/1.1. Needs the ``h2`` package
+           (``pip install rapidata[http2]``).
+        """
+        self.bulk_pool_maxsize = 200
+        """Connections kept for bulk uploads (asset files, URLs and samples).
+           They use a pool of their own, so status polls and job creation are
+           not queued behind uploads.
+        """
         self.proxy: Optional[str] = None
         """Proxy URL
         """
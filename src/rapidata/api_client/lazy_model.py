@@ -13,12 +13,15 @@ read.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import threading
+from typing import Any, ClassVar, Dict, FrozenSet, Optional
 
 from pydantic import BaseModel, ConfigDict, ValidationError
 
 from rapidata.rapidata_client.config import logger, tracer
 
+_lazy_error_fields_lock = threading.Lock()
+
 
 class LazyValidatedModel(BaseModel):
     """BaseModel subclass with deferred per-field validation."""
@@ -29,13 +32,18 @@ class LazyValidatedModel(BaseModel):
         protected_namespaces=(),
     )
 
+    # Names of the fields that failed validation on at least one instance of
+    # the class; only those are guarded (see _guarded_getattribute). Empty for
+    # every class whose instances all validated, which is nearly all of them.
+    # A dunder, so Pydantic leaves it alone instead of making it private.
+    __lazy_error_fields__: ClassVar[FrozenSet[str]] = frozenset()
+
     # ------------------------------------------------------------------
     # Normal construction path – mark the instance as error-free
     # ------------------------------------------------------------------
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
-        # Fast-path flag so __getattribute__ can skip the dict lookup
-        # for the vast majority of instances that validated cleanly.
+        # An instance that validated has no field errors to report.
         object.__setattr__(self, "_field_validation_errors", {})
 
     # ------------------------------------------------------------------
@@ -117,50 +125,53 @@ class LazyValidatedModel(BaseModel):
         # --- construct without validation ---
         instance = cls.model_construct(**construct_kwargs)
         object.__setattr__(instance, "_field_validation_errors", field_errors)
+        with _lazy_error_fields_lock:
+            cls.__lazy_error_fields__ = cls.__lazy_error_fields__ | frozenset(field_errors)
+            if cls.__getattribute__ is not _guarded_getattribute:
+                cls.__getattribute__ = _guarded_getattribute  # type: ignore[method-assign]
         return instance
 
-    # ------------------------------------------------------------------
-    # Access-time guard – raise only when a bad field is actually read
-    # ------------------------------------------------------------------
-    # Guarded against TYPE_CHECKING for the same reason Pydantic guards its own
-    # __getattr__/__setattr__ (pydantic/main.py): a class-visible __getattribute__
-    # returning Any makes type checkers treat *every* attribute access as a valid
-    # Any, which silently hides renamed/removed backend fields (e.g. .status after
-    # it became .state). Hiding it from pyright restores per-field access checking
-    # against the declared model annotations while leaving runtime behaviour intact.
-    if not TYPE_CHECKING:
-
-        def __getattribute__(self, name: str) -> Any:
-            # Only intercept known model fields; everything else takes the
-            # fast super() path (Pydantic internals, dunder attrs, methods).
-            # Use getattr (MRO-aware) rather than type(self).__dict__.get():
-            # in Pydantic v2, fields are exposed via the `model_fields`
-            # class-property and are NOT present in the class's own __dict__,
-            # so a __dict__ lookup always misses and the guard never fires.
-            model_fields = getattr(type(self), "model_fields", None)
-            if model_fields is not None and name in model_fields:
-                # model_construct() bypasses __init__, so `_field_validation_errors`
-                # may not be set on every instance. Treat missing as "no errors".
-                errors: Optional[Dict[str, dict]]
-                try:
-                    errors = object.__getattribute__(self, "_field_validation_errors")
-                except AttributeError:
-                    errors = None
-                if errors and name in errors:
-                    err = errors[name]
-                    message = (
-                        f"Field '{name}' on {type(self).__name__} has an unexpected "
-                        f"type from the backend: {err.get('msg', err)}"
-                    )
-                    # Imported lazily to avoid pulling the higher SDK layer at
-                    # module import time (this base class is imported by every
-                    # generated model).
-                    from rapidata.rapidata_client.api.rapidata_api_client import (
-                        format_outdated_sdk_note,
-                    )
-
-                    note = format_outdated_sdk_note()
-                    if note:
-                        message = f"{message}\n{note}"
-                    raise TypeError(message)
-            return super().__getattribute__(name)
+
+# ----------------------------------------------------------------------
+# Access-time guard – raise only when a bad field is actually read
+# ----------------------------------------------------------------------
+# Installed as ``__getattribute__`` by ``_lazy_construct``, only on classes that
+# have produced an instance with validation errors. Every other model keeps
+# CPython's native attribute lookup, so field reads in tight loops over results
+# or prompt pages cost nothing extra. Keeping it out of the class body also
+# keeps it from type checkers, for the same reason Pydantic hides its own
+# __getattr__/__setattr__ (pydantic/main.py): a class-visible __getattribute__
+# returning Any makes them treat *every* attribute access as a valid Any, which
+# silently hides renamed/removed backend fields (e.g. .status after it became
+# .state).
+def _guarded_getattribute(self: LazyValidatedModel, name: str) -> Any:
+    # Only fields that have failed validation somewhere in this class are
+    # checked; everything else goes straight to object.__getattribute__.
+    # BaseModel defines no __getattribute__ of its own, and its __getattr__
+    # fallback still runs when that raises AttributeError.
+    if name in type(self).__lazy_error_fields__:
+        # model_construct() bypasses __init__, so `_field_validation_errors`
+        # may not be set on every instance. Treat missing as "no errors".
+        errors: Optional[Dict[str, dict]]
+        try:
+            errors = object.__getattribute__(self, "_field_validation_errors")
+        except AttributeError:
+            errors = None
+        if errors and name in errors:
+            err = errors[name]
+            message = (
+                f"Field '{name}' on {type(self).__name__} has an unexpected "
+                f"type from the backend: {err.get('msg', err)}"
+            )
+            # Imported lazily to avoid pulling the higher SDK layer at
+            # module import time (this base class is imported by every
+            # generated model).
+            from rapidata.rapidata_client.api.rapidata_api_client import (
+                format_outdated_sdk_note,
+            )
+
+            note = format_outdated_sdk_note()
+            if note:
+                message = f"{message}\n{note}"
+            raise TypeError(message)
+    return object.__getattribute__(self, name)
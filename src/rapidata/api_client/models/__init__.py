@@ -12,12 +12,1789 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib as _importlib
 import os as _os
 import re as _re
 
-# Dynamically discover all model modules in this package
+# Class name -> module of every generated model, written at codegen time so
+# that importing this package does not have to read the model files.
+_MODEL_IMPORTS: dict[str, str] = {
+    "AbTestSelection": "rapidata.api_client.models.ab_test_selection",
+    "AbTestSelectionAInner": "rapidata.api_client.models.ab_test_selection_a_inner",
+    "AcceptOrgInvitationEndpointInput": "rapidata.api_client.models.accept_org_invitation_endpoint_input",
+    "AcceptOrgInvitationEndpointOutput": "rapidata.api_client.models.accept_org_invitation_endpoint_output",
+    "AddCampaignArtifactResult": "rapidata.api_client.models.add_campaign_artifact_result",
+    "AddCampaignModel": "rapidata.api_client.models.add_campaign_model",
+    "AddCampaignModelUserFiltersInner": "rapidata.api_client.models.add_campaign_model_user_filters_inner",
+    "AddExampleToAudienceEndpointInput": "rapidata.api_client.models.add_example_to_audience_endpoint_input",
+    "AddExampleToAudienceEndpointOutput": "rapidata.api_client.models.add_example_to_audience_endpoint_output",
+    "AddRapidToAudienceModel": "rapidata.api_client.models.add_rapid_to_audience_model",
+    "AddUserResponseEndpointInput": "rapidata.api_client.models.add_user_response_endpoint_input",
+    "AddUserResponseEndpointOutput": "rapidata.api_client.models.add_user_response_endpoint_output",
+    "AddUserResponseResult": "rapidata.api_client.models.add_user_response_result",
+    "AddUserResponseResultValidationTruth": "rapidata.api_client.models.add_user_response_result_validation_truth",
+    "AddValidationRapidEndpointInput": "rapidata.api_client.models.add_validation_rapid_endpoint_input",
+    "AddValidationRapidModel": "rapidata.api_client.models.add_validation_rapid_model",
+    "AddValidationRapidModelAsset": "rapidata.api_client.models.add_validation_rapid_model_asset",
+    "AddValidationRapidModelContextAsset": "rapidata.api_client.models.add_validation_rapid_model_context_asset",
+    "AddValidationRapidModelMetadataInner": "rapidata.api_client.models.add_validation_rapid_model_metadata_inner",
+    "AddValidationRapidModelPayload": "rapidata.api_client.models.add_validation_rapid_model_payload",
+    "AddValidationRapidModelTruth": "rapidata.api_client.models.add_validation_rapid_model_truth",
+    "AddValidationRapidNewModel": "rapidata.api_client.models.add_validation_rapid_new_model",
+    "AddValidationRapidNewModelAsset": "rapidata.api_client.models.add_validation_rapid_new_model_asset",
+    "AddValidationRapidNewModelTruth": "rapidata.api_client.models.add_validation_rapid_new_model_truth",
+    "AddValidationRapidResult": "rapidata.api_client.models.add_validation_rapid_result",
+    "AddValidationTextRapidModel": "rapidata.api_client.models.add_validation_text_rapid_model",
+    "AdminOrderModel": "rapidata.api_client.models.admin_order_model",
+    "AdminOrderModelPagedResult": "rapidata.api_client.models.admin_order_model_paged_result",
+    "AgeGroup": "rapidata.api_client.models.age_group",
+    "AgeUserFilterAgeGroup": "rapidata.api_client.models.age_user_filter_age_group",
+    "AgeUserFilterModel": "rapidata.api_client.models.age_user_filter_model",
+    "AgeUserFilterModelAgeGroup": "rapidata.api_client.models.age_user_filter_model_age_group",
+    "AggregatedOrdersModel": "rapidata.api_client.models.aggregated_orders_model",
+    "AggregatorType": "rapidata.api_client.models.aggregator_type",
+    "AndFilter": "rapidata.api_client.models.and_filter",
+    "AndFilterFiltersInner": "rapidata.api_client.models.and_filter_filters_inner",
+    "AndUserFilterModel": "rapidata.api_client.models.and_user_filter_model",
+    "AndUserFilterModelFiltersInner": "rapidata.api_client.models.and_user_filter_model_filters_inner",
+    "AreRapidsActiveResult": "rapidata.api_client.models.are_rapids_active_result",
+    "AssetMetadata": "rapidata.api_client.models.asset_metadata",
+    "AssetMetadataAsset": "rapidata.api_client.models.asset_metadata_asset",
+    "AssetMetadataModel": "rapidata.api_client.models.asset_metadata_model",
+    "AssetMetadataModelAsset": "rapidata.api_client.models.asset_metadata_model_asset",
+    "AssetType": "rapidata.api_client.models.asset_type",
+    "AttachCategoryRapidBlueprint": "rapidata.api_client.models.attach_category_rapid_blueprint",
+    "AttachCategoryRapidBlueprintCategory": "rapidata.api_client.models.attach_category_rapid_blueprint_category",
+    "AttachCategoryRapidCategory": "rapidata.api_client.models.attach_category_rapid_category",
+    "AttachCategoryRapidModelCategory": "rapidata.api_client.models.attach_category_rapid_model_category",
+    "AttachCategoryResult": "rapidata.api_client.models.attach_category_result",
+    "AttachCategoryTruth": "rapidata.api_client.models.attach_category_truth",
+    "AttachCategoryWorkflowRapidBlueprintModelCategory": "rapidata.api_client.models.attach_category_workflow_rapid_blueprint_model_category",
+    "AudienceAudienceIdJobsGetJobIdParameter": "rapidata.api_client.models.audience_audience_id_jobs_get_job_id_parameter",
+    "AudienceBoost": "rapidata.api_client.models.audience_boost",
+    "AudienceBoost2": "rapidata.api_client.models.audience_boost2",
+    "AudienceBoostModel": "rapidata.api_client.models.audience_boost_model",
+    "AudienceBoostModel2": "rapidata.api_client.models.audience_boost_model2",
+    "AudienceInactivitySyncPhase": "rapidata.api_client.models.audience_inactivity_sync_phase",
+    "AudienceInactivitySyncState": "rapidata.api_client.models.audience_inactivity_sync_state",
+    "AudienceJobState": "rapidata.api_client.models.audience_job_state",
+    "AudienceJobStatus": "rapidata.api_client.models.audience_job_status",
+    "AudienceStateRecalculationPhase": "rapidata.api_client.models.audience_state_recalculation_phase",
+    "AudienceStateRecalculationState": "rapidata.api_client.models.audience_state_recalculation_state",
+    "AudienceStatus": "rapidata.api_client.models.audience_status",
+    "AudiencesGetNameParameter": "rapidata.api_client.models.audiences_get_name_parameter",
+    "AuthorizationRelationsBidder": "rapidata.api_client.models.authorization_relations_bidder",
+    "AuthorizationRelationsExternalApp": "rapidata.api_client.models.authorization_relations_external_app",
+    "AuthorizationRelationsPlatform": "rapidata.api_client.models.authorization_relations_platform",
+    "AuthorizationScope": "rapidata.api_client.models.authorization_scope",
+    "BaseError": "rapidata.api_client.models.base_error",
+    "BatchUploadStatus": "rapidata.api_client.models.batch_upload_status",
+    "BatchUploadUrlStatus": "rapidata.api_client.models.batch_upload_url_status",
+    "BenchmarkDemographicDimension": "rapidata.api_client.models.benchmark_demographic_dimension",
+    "BenchmarkQueryResult": "rapidata.api_client.models.benchmark_query_result",
+    "BenchmarkQueryResultPagedResult": "rapidata.api_client.models.benchmark_query_result_paged_result",
+    "BillingPeriodStatus": "rapidata.api_client.models.billing_period_status",
+    "BillingPeriodStatusModel": "rapidata.api_client.models.billing_period_status_model",
+    "BillingSummaryMode": "rapidata.api_client.models.billing_summary_mode",
+    "BoostLeaderboardEndpointInput": "rapidata.api_client.models.boost_leaderboard_endpoint_input",
+    "BoostLeaderboardModel": "rapidata.api_client.models.boost_leaderboard_model",
+    "BoostLevel": "rapidata.api_client.models.boost_level",
+    "BoostMode": "rapidata.api_client.models.boost_mode",
+    "BoostModeModel": "rapidata.api_client.models.boost_mode_model",
+    "BoostQueryResult": "rapidata.api_client.models.boost_query_result",
+    "BoostQueryResultBoostMode": "rapidata.api_client.models.boost_query_result_boost_mode",
+    "BoostQueryResultBoostStatus": "rapidata.api_client.models.boost_query_result_boost_status",
+    "BoostStatus": "rapidata.api_client.models.boost_status",
+    "BoostStatusModel": "rapidata.api_client.models.boost_status_model",
+    "BoostingControlMode": "rapidata.api_client.models.boosting_control_mode",
+    "BoostingProfile": "rapidata.api_client.models.boosting_profile",
+    "BoostingProfileModel": "rapidata.api_client.models.boosting_profile_model",
+    "BoundingBoxPayload": "rapidata.api_client.models.bounding_box_payload",
+    "BoundingBoxRapidBlueprint": "rapidata.api_client.models.bounding_box_rapid_blueprint",
+    "BoundingBoxResult": "rapidata.api_client.models.bounding_box_result",
+    "BoundingBoxResultBox": "rapidata.api_client.models.bounding_box_result_box",
+    "BoundingBoxResultModelBox": "rapidata.api_client.models.bounding_box_result_model_box",
+    "BoundingBoxTruth": "rapidata.api_client.models.bounding_box_truth",
+    "BoxShape": "rapidata.api_client.models.box_shape",
+    "BulkBillingPeriodCloseState": "rapidata.api_client.models.bulk_billing_period_close_state",
+    "BulkCloseBillingPeriodsEndpointInput": "rapidata.api_client.models.bulk_close_billing_periods_endpoint_input",
+    "BulkCloseBillingPeriodsEndpointOutput": "rapidata.api_client.models.bulk_close_billing_periods_endpoint_output",
+    "BulkReconciliationDispatchState": "rapidata.api_client.models.bulk_reconciliation_dispatch_state",
+    "CampaignArtifactModel": "rapidata.api_client.models.campaign_artifact_model",
+    "CampaignFilter": "rapidata.api_client.models.campaign_filter",
+    "CampaignQueryModel": "rapidata.api_client.models.campaign_query_model",
+    "CampaignQueryModelPagedResult": "rapidata.api_client.models.campaign_query_model_paged_result",
+    "CampaignQueryResult": "rapidata.api_client.models.campaign_query_result",
+    "CampaignQueryResultPagedResult": "rapidata.api_client.models.campaign_query_result_paged_result",
+    "CampaignStatus": "rapidata.api_client.models.campaign_status",
+    "CampaignStatusModel": "rapidata.api_client.models.campaign_status_model",
+    "CampaignUserFilterModel": "rapidata.api_client.models.campaign_user_filter_model",
+    "CampaignsGetIdParameter": "rapidata.api_client.models.campaigns_get_id_parameter",
+    "Capability": "rapidata.api_client.models.capability",
+    "CappedSelection": "rapidata.api_client.models.capped_selection",
+    "CappedSelectionSelectionsInner": "rapidata.api_client.models.capped_selection_selections_inner",
+    "Category": "rapidata.api_client.models.category",
+    "ChangeAudienceOwnerEndpointInput": "rapidata.api_client.models.change_audience_owner_endpoint_input",
+    "ChangeBoostEndpointInput": "rapidata.api_client.models.change_boost_endpoint_input",
+    "ChangeBoostModel": "rapidata.api_client.models.change_boost_model",
+    "ChangeOrgMemberRoleEndpointInput": "rapidata.api_client.models.change_org_member_role_endpoint_input",
+    "ClassificationMetadata": "rapidata.api_client.models.classification_metadata",
+    "ClassificationMetadataFilterConfig": "rapidata.api_client.models.classification_metadata_filter_config",
+    "ClassificationMetadataModel": "rapidata.api_client.models.classification_metadata_model",
+    "ClassifyCategory": "rapidata.api_client.models.classify_category",
+    "ClassifyPayload": "rapidata.api_client.models.classify_payload",
+    "ClassifyPayloadCategory": "rapidata.api_client.models.classify_payload_category",
+    "ClassifyPayloadModel": "rapidata.api_client.models.classify_payload_model",
+    "ClassifyPayloadModelCategory": "rapidata.api_client.models.classify_payload_model_category",
+    "Client": "rapidata.api_client.models.client",
+    "ClientModel": "rapidata.api_client.models.client_model",
+    "ClientsQueryResult": "rapidata.api_client.models.clients_query_result",
+    "ClientsQueryResultPagedResult": "rapidata.api_client.models.clients_query_result_paged_result",
+    "CloneDatasetModel": "rapidata.api_client.models.clone_dataset_model",
+    "CloneJobDefinitionEndpointInput": "rapidata.api_client.models.clone_job_definition_endpoint_input",
+    "CloneJobDefinitionEndpointOutput": "rapidata.api_client.models.clone_job_definition_endpoint_output",
+    "CloneOrderEndpointInput": "rapidata.api_client.models.clone_order_endpoint_input",
+    "CloneOrderEndpointOutput": "rapidata.api_client.models.clone_order_endpoint_output",
+    "CloneOrderModel": "rapidata.api_client.models.clone_order_model",
+    "CloneOrderResult": "rapidata.api_client.models.clone_order_result",
+    "CloseBillingPeriodEndpointInput": "rapidata.api_client.models.close_billing_period_endpoint_input",
+    "CloseBillingPeriodEndpointOutput": "rapidata.api_client.models.close_billing_period_endpoint_output",
+    "CompareMatchStatus": "rapidata.api_client.models.compare_match_status",
+    "ComparePayload": "rapidata.api_client.models.compare_payload",
+    "CompareRapidBlueprint": "rapidata.api_client.models.compare_rapid_blueprint",
+    "CompareRapidBlueprint1": "rapidata.api_client.models.compare_rapid_blueprint1",
+    "CompareResult": "rapidata.api_client.models.compare_result",
+    "CompareTruth": "rapidata.api_client.models.compare_truth",
+    "CompareWorkflowConfig": "rapidata.api_client.models.compare_workflow_config",
+    "CompareWorkflowConfigContextAsset": "rapidata.api_client.models.compare_workflow_config_context_asset",
+    "CompareWorkflowConfigMetadataValue": "rapidata.api_client.models.compare_workflow_config_metadata_value",
+    "CompareWorkflowConfigModel": "rapidata.api_client.models.compare_workflow_config_model",
+    "CompareWorkflowConfigModelPairMakerConfig": "rapidata.api_client.models.compare_workflow_config_model_pair_maker_config",
+    "CompareWorkflowConfigPairMakerConfig": "rapidata.api_client.models.compare_workflow_config_pair_maker_config",
+    "CompareWorkflowConfigRapidSelectionConfigsInner": "rapidata.api_client.models.compare_workflow_config_rapid_selection_configs_inner",
+    "CompareWorkflowConfigReferee": "rapidata.api_client.models.compare_workflow_config_referee",
+    "CompareWorkflowGetResultOverviewGet200Response": "rapidata.api_client.models.compare_workflow_get_result_overview_get200_response",
+    "CompareWorkflowModel": "rapidata.api_client.models.compare_workflow_model",
+    "CompareWorkflowModel1": "rapidata.api_client.models.compare_workflow_model1",
+    "CompareWorkflowModel1PairMakerInformation": "rapidata.api_client.models.compare_workflow_model1_pair_maker_information",
+    "CompareWorkflowModel1Referee": "rapidata.api_client.models.compare_workflow_model1_referee",
+    "CompareWorkflowModelContextAsset": "rapidata.api_client.models.compare_workflow_model_context_asset",
+    "CompareWorkflowModelMetadataInner": "rapidata.api_client.models.compare_workflow_model_metadata_inner",
+    "CompareWorkflowModelPairMakerConfig": "rapidata.api_client.models.compare_workflow_model_pair_maker_config",
+    "ComparisonOperator": "rapidata.api_client.models.comparison_operator",
+    "CompletedRapidModel": "rapidata.api_client.models.completed_rapid_model",
+    "CompletedRapidModelAsset": "rapidata.api_client.models.completed_rapid_model_asset",
+    "CompressionLibrary": "rapidata.api_client.models.compression_library",
+    "CompressionOverride": "rapidata.api_client.models.compression_override",
+    "ConditionalValidationRapidSelectionConfig": "rapidata.api_client.models.conditional_validation_rapid_selection_config",
+    "ConditionalValidationSelection": "rapidata.api_client.models.conditional_validation_selection",
+    "ConditionalValidationSelectionValidationChance": "rapidata.api_client.models.conditional_validation_selection_validation_chance",
+    "ConfidenceInterval": "rapidata.api_client.models.confidence_interval",
+    "Coordinate": "rapidata.api_client.models.coordinate",
+    "CorrelatedRapidSelectionConfig": "rapidata.api_client.models.correlated_rapid_selection_config",
+    "CountClassificationMetadataFilterConfig": "rapidata.api_client.models.count_classification_metadata_filter_config",
+    "CountMetadata": "rapidata.api_client.models.count_metadata",
+    "CountMetadataModel": "rapidata.api_client.models.count_metadata_model",
+    "CountryFilter": "rapidata.api_client.models.country_filter",
+    "CountryUserFilterModel": "rapidata.api_client.models.country_user_filter_model",
+    "CreateAudienceEndpointInput": "rapidata.api_client.models.create_audience_endpoint_input",
+    "CreateAudienceEndpointOutput": "rapidata.api_client.models.create_audience_endpoint_output",
+    "CreateAudienceRequest": "rapidata.api_client.models.create_audience_request",
+    "CreateAudienceResult": "rapidata.api_client.models.create_audience_result",
+    "CreateBatchUploadEndpointInput": "rapidata.api_client.models.create_batch_upload_endpoint_input",
+    "CreateBatchUploadEndpointOutput": "rapidata.api_client.models.create_batch_upload_endpoint_output",
+    "CreateBenchmarkEndpointInput": "rapidata.api_client.models.create_benchmark_endpoint_input",
+    "CreateBenchmarkEndpointOutput": "rapidata.api_client.models.create_benchmark_endpoint_output",
+    "CreateBenchmarkModel": "rapidata.api_client.models.create_benchmark_model",
+    "CreateBenchmarkParticipantEndpointInput": "rapidata.api_client.models.create_benchmark_participant_endpoint_input",
+    "CreateBenchmarkParticipantEndpointOutput": "rapidata.api_client.models.create_benchmark_participant_endpoint_output",
+    "CreateBenchmarkParticipantModel": "rapidata.api_client.models.create_benchmark_participant_model",
+    "CreateBenchmarkParticipantResult": "rapidata.api_client.models.create_benchmark_participant_result",
+    "CreateBenchmarkPromptResult": "rapidata.api_client.models.create_benchmark_prompt_result",
+    "CreateBenchmarkResult": "rapidata.api_client.models.create_benchmark_result",
+    "CreateBillingItemBillingSettingEndpointInput": "rapidata.api_client.models.create_billing_item_billing_setting_endpoint_input",
+    "CreateBridgeTokenEndpointOutput": "rapidata.api_client.models.create_bridge_token_endpoint_output",
+    "CreateBridgeTokenResult": "rapidata.api_client.models.create_bridge_token_result",
+    "CreateCheckoutEndpointOutput": "rapidata.api_client.models.create_checkout_endpoint_output",
+    "CreateClientEndpointInput": "rapidata.api_client.models.create_client_endpoint_input",
+    "CreateClientEndpointOutput": "rapidata.api_client.models.create_client_endpoint_output",
+    "CreateClientModel": "rapidata.api_client.models.create_client_model",
+    "CreateClientResult": "rapidata.api_client.models.create_client_result",
+    "CreateComplexOrderEndpointInput": "rapidata.api_client.models.create_complex_order_endpoint_input",
+    "CreateComplexOrderEndpointOutput": "rapidata.api_client.models.create_complex_order_endpoint_output",
+    "CreateComplexOrderModel": "rapidata.api_client.models.create_complex_order_model",
+    "CreateComplexOrderModelPipeline": "rapidata.api_client.models.create_complex_order_model_pipeline",
+    "CreateComplexOrderResult": "rapidata.api_client.models.create_complex_order_result",
+    "CreateCustomerBillingSettingEndpointInput": "rapidata.api_client.models.create_customer_billing_setting_endpoint_input",
+    "CreateCustomerClientResult": "rapidata.api_client.models.create_customer_client_result",
+    "CreateDatapointEndpointInput": "rapidata.api_client.models.create_datapoint_endpoint_input",
+    "CreateDatapointEndpointOutput": "rapidata.api_client.models.create_datapoint_endpoint_output",
+    "CreateDatapointFromFilesModel": "rapidata.api_client.models.create_datapoint_from_files_model",
+    "CreateDatapointFromFilesModelMetadataInner": "rapidata.api_client.models.create_datapoint_from_files_model_metadata_inner",
+    "CreateDatapointFromTextSourcesModel": "rapidata.api_client.models.create_datapoint_from_text_sources_model",
+    "CreateDatapointFromUrlsModel": "rapidata.api_client.models.create_datapoint_from_urls_model",
+    "CreateDatapointFromUrlsModelMetadataInner": "rapidata.api_client.models.create_datapoint_from_urls_model_metadata_inner",
+    "CreateDatapointModel": "rapidata.api_client.models.create_datapoint_model",
+    "CreateDatapointModelAsset": "rapidata.api_client.models.create_datapoint_model_asset",
+    "CreateDatapointModelContextAsset": "rapidata.api_client.models.create_datapoint_model_context_asset",
+    "CreateDatapointModelMetadataInner": "rapidata.api_client.models.create_datapoint_model_metadata_inner",
+    "CreateDatapointResult": "rapidata.api_client.models.create_datapoint_result",
+    "CreateDatapointsFromS3BucketModel": "rapidata.api_client.models.create_datapoints_from_s3_bucket_model",
+    "CreateDatasetArtifactModel": "rapidata.api_client.models.create_dataset_artifact_model",
+    "CreateDatasetArtifactModelDataset": "rapidata.api_client.models.create_dataset_artifact_model_dataset",
+    "CreateDatasetEndpointInput": "rapidata.api_client.models.create_dataset_endpoint_input",
+    "CreateDatasetEndpointOutput": "rapidata.api_client.models.create_dataset_endpoint_output",
+    "CreateDatasetGroupEndpointInput": "rapidata.api_client.models.create_dataset_group_endpoint_input",
+    "CreateDefaultOrderModel": "rapidata.api_client.models.create_default_order_model",
+    "CreateDefaultOrderModelWorkflowConfig": "rapidata.api_client.models.create_default_order_model_workflow_config",
+    "CreateDemographicRapidEndpointInput": "rapidata.api_client.models.create_demographic_rapid_endpoint_input",
+    "CreateDemographicRapidEndpointOutput": "rapidata.api_client.models.create_demographic_rapid_endpoint_output",
+    "CreateDemographicRapidModel": "rapidata.api_client.models.create_demographic_rapid_model",
+    "CreateDemographicRapidModelAsset": "rapidata.api_client.models.create_demographic_rapid_model_asset",
+    "CreateDemographicRapidModelContextAsset": "rapidata.api_client.models.create_demographic_rapid_model_context_asset",
+    "CreateDemographicRapidModelNew": "rapidata.api_client.models.create_demographic_rapid_model_new",
+    "CreateEmptyValidationSetResult": "rapidata.api_client.models.create_empty_validation_set_result",
+    "CreateExternalServicePriceEndpointInput": "rapidata.api_client.models.create_external_service_price_endpoint_input",
+    "CreateFilteredAudienceEndpointInput": "rapidata.api_client.models.create_filtered_audience_endpoint_input",
+    "CreateFilteredAudienceEndpointOutput": "rapidata.api_client.models.create_filtered_audience_endpoint_output",
+    "CreateFlowEndpointAudienceBoostInput": "rapidata.api_client.models.create_flow_endpoint_audience_boost_input",
+    "CreateFlowEndpointInput": "rapidata.api_client.models.create_flow_endpoint_input",
+    "CreateFlowEndpointOutput": "rapidata.api_client.models.create_flow_endpoint_output",
+    "CreateFlowItemEndpointInput": "rapidata.api_client.models.create_flow_item_endpoint_input",
+    "CreateFlowItemEndpointOutput": "rapidata.api_client.models.create_flow_item_endpoint_output",
+    "CreateGlobalBillingSettingEndpointInput": "rapidata.api_client.models.create_global_billing_setting_endpoint_input",
+    "CreateGlobalTextEndpointInput": "rapidata.api_client.models.create_global_text_endpoint_input",
+    "CreateGlobalTextEndpointOutput": "rapidata.api_client.models.create_global_text_endpoint_output",
+    "CreateIndependentWorkflowModel": "rapidata.api_client.models.create_independent_workflow_model",
+    "CreateIndependentWorkflowModelWorkflowConfig": "rapidata.api_client.models.create_independent_workflow_model_workflow_config",
+    "CreateIndependentWorkflowResult": "rapidata.api_client.models.create_independent_workflow_result",
+    "CreateInvoiceEndpointInput": "rapidata.api_client.models.create_invoice_endpoint_input",
+    "CreateInvoiceEndpointOutput": "rapidata.api_client.models.create_invoice_endpoint_output",
+    "CreateJobDefinitionEndpointInput": "rapidata.api_client.models.create_job_definition_endpoint_input",
+    "CreateJobDefinitionEndpointOutput": "rapidata.api_client.models.create_job_definition_endpoint_output",
+    "CreateJobEndpointCostWarning": "rapidata.api_client.models.create_job_endpoint_cost_warning",
+    "CreateJobEndpointCostWarningModel": "rapidata.api_client.models.create_job_endpoint_cost_warning_model",
+    "CreateJobEndpointInput": "rapidata.api_client.models.create_job_endpoint_input",
+    "CreateJobEndpointOutput": "rapidata.api_client.models.create_job_endpoint_output",
+    "CreateJobRevisionEndpointInput": "rapidata.api_client.models.create_job_revision_endpoint_input",
+    "CreateJobRevisionEndpointOutput": "rapidata.api_client.models.create_job_revision_endpoint_output",
+    "CreateJobShareEndpointInput": "rapidata.api_client.models.create_job_share_endpoint_input",
+    "CreateLeaderboardEndpointInput": "rapidata.api_client.models.create_leaderboard_endpoint_input",
+    "CreateLeaderboardEndpointOutput": "rapidata.api_client.models.create_leaderboard_endpoint_output",
+    "CreateLeaderboardModel": "rapidata.api_client.models.create_leaderboard_model",
+    "CreateLeaderboardParticipantEndpointInput": "rapidata.api_client.models.create_leaderboard_participant_endpoint_input",
+    "CreateLeaderboardParticipantEndpointOutput": "rapidata.api_client.models.create_leaderboard_participant_endpoint_output",
+    "CreateLeaderboardParticipantModel": "rapidata.api_client.models.create_leaderboard_participant_model",
+    "CreateLeaderboardParticipantResult": "rapidata.api_client.models.create_leaderboard_participant_result",
+    "CreateLeaderboardResult": "rapidata.api_client.models.create_leaderboard_result",
+    "CreateLegacyClientModel": "rapidata.api_client.models.create_legacy_client_model",
+    "CreateLegacyOrderResult": "rapidata.api_client.models.create_legacy_order_result",
+    "CreateManualChargeEndpointInput": "rapidata.api_client.models.create_manual_charge_endpoint_input",
+    "CreateManualChargeEndpointOutput": "rapidata.api_client.models.create_manual_charge_endpoint_output",
+    "CreateOrder": "rapidata.api_client.models.create_order",
+    "CreateOrderDefinitionModel": "rapidata.api_client.models.create_order_definition_model",
+    "CreateOrderDefinitionResult": "rapidata.api_client.models.create_order_definition_result",
+    "CreateOrderDefinitionRevisionModel": "rapidata.api_client.models.create_order_definition_revision_model",
+    "CreateOrderDefinitionRevisionResult": "rapidata.api_client.models.create_order_definition_revision_result",
+    "CreateOrderEndpointOutput": "rapidata.api_client.models.create_order_endpoint_output",
+    "CreateOrderModel": "rapidata.api_client.models.create_order_model",
+    "CreateOrderModelReferee": "rapidata.api_client.models.create_order_model_referee",
+    "CreateOrderModelSelectionsInner": "rapidata.api_client.models.create_order_model_selections_inner",
+    "CreateOrderModelUserFiltersInner": "rapidata.api_client.models.create_order_model_user_filters_inner",
+    "CreateOrderModelWorkflow": "rapidata.api_client.models.create_order_model_workflow",
+    "CreateOrderResult": "rapidata.api_client.models.create_order_result",
+    "CreateOrganizationBillingSettingEndpointInput": "rapidata.api_client.models.create_organization_billing_setting_endpoint_input",
+    "CreateOrganizationEndpointInput": "rapidata.api_client.models.create_organization_endpoint_input",
+    "CreateOrganizationEndpointOutput": "rapidata.api_client.models.create_organization_endpoint_output",
+    "CreateOwnerTierOverrideEndpointInput": "rapidata.api_client.models.create_owner_tier_override_endpoint_input",
+    "CreateOwnerTierOverrideEndpointOutput": "rapidata.api_client.models.create_owner_tier_override_endpoint_output",
+    "CreateProgramCampaignEndpointInput": "rapidata.api_client.models.create_program_campaign_endpoint_input",
+    "CreateProgramCampaignEndpointOutput": "rapidata.api_client.models.create_program_campaign_endpoint_output",
+    "CreatePromptEmbeddingMapEndpointOutput": "rapidata.api_client.models.create_prompt_embedding_map_endpoint_output",
+    "CreatePromptForBenchmarkEndpointInput": "rapidata.api_client.models.create_prompt_for_benchmark_endpoint_input",
+    "CreatePromptForBenchmarkEndpointOutput": "rapidata.api_client.models.create_prompt_for_benchmark_endpoint_output",
+    "CreatePromptForLeaderboardEndpointOutput": "rapidata.api_client.models.create_prompt_for_leaderboard_endpoint_output",
+    "CreateRapidResult": "rapidata.api_client.models.create_rapid_result",
+    "CreateSampleEndpointInput": "rapidata.api_client.models.create_sample_endpoint_input",
+    "CreateSampleEndpointOutput": "rapidata.api_client.models.create_sample_endpoint_output",
+    "CreateSampleGenerationEndpointInput": "rapidata.api_client.models.create_sample_generation_endpoint_input",
+    "CreateSampleGenerationEndpointOutput": "rapidata.api_client.models.create_sample_generation_endpoint_output",
+    "CreateSampleModel": "rapidata.api_client.models.create_sample_model",
+    "CreateSampleModelAsset": "rapidata.api_client.models.create_sample_model_asset",
+    "CreateSampleModelObsolete": "rapidata.api_client.models.create_sample_model_obsolete",
+    "CreateSampleNewEndpointInput": "rapidata.api_client.models.create_sample_new_endpoint_input",
+    "CreateSampleNewEndpointOutput": "rapidata.api_client.models.create_sample_new_endpoint_output",
+    "CreateSignalEndpointInput": "rapidata.api_client.models.create_signal_endpoint_input",
+    "CreateSignalEndpointOutput": "rapidata.api_client.models.create_signal_endpoint_output",
+    "CreateSimplePipelineModel": "rapidata.api_client.models.create_simple_pipeline_model",
+    "CreateSimplePipelineModelArtifactsInner": "rapidata.api_client.models.create_simple_pipeline_model_artifacts_inner",
+    "CreateSimplePipelineModelPipelineStepsInner": "rapidata.api_client.models.create_simple_pipeline_model_pipeline_steps_inner",
+    "CreateTopUpEndpointInput": "rapidata.api_client.models.create_top_up_endpoint_input",
+    "CreateTopUpEndpointOutput": "rapidata.api_client.models.create_top_up_endpoint_output",
+    "CreateUnsupportedOrderEndpointInput": "rapidata.api_client.models.create_unsupported_order_endpoint_input",
+    "CreateUnsupportedOrderModel": "rapidata.api_client.models.create_unsupported_order_model",
+    "CreateValidationFeedbackEndpointInput": "rapidata.api_client.models.create_validation_feedback_endpoint_input",
+    "CreateValidationSetEndpointInput": "rapidata.api_client.models.create_validation_set_endpoint_input",
+    "CreateValidationSetEndpointOutput": "rapidata.api_client.models.create_validation_set_endpoint_output",
+    "CreateValidationSetModel": "rapidata.api_client.models.create_validation_set_model",
+    "CreateVolumeDiscountEndpointInput": "rapidata.api_client.models.create_volume_discount_endpoint_input",
+    "CreateVolumeDiscountEndpointOutput": "rapidata.api_client.models.create_volume_discount_endpoint_output",
+    "CustomUserFilterModel": "rapidata.api_client.models.custom_user_filter_model",
+    "CustomerOrderModel": "rapidata.api_client.models.customer_order_model",
+    "CustomerOrderModelPagedResult": "rapidata.api_client.models.customer_order_model_paged_result",
+    "Datapoint": "rapidata.api_client.models.datapoint",
+    "DatapointAsset": "rapidata.api_client.models.datapoint_asset",
+    "DatapointGetByIdGet200Response": "rapidata.api_client.models.datapoint_get_by_id_get200_response",
+    "DatapointMetadataModel": "rapidata.api_client.models.datapoint_metadata_model",
+    "DatapointMetadataModelMetadataInner": "rapidata.api_client.models.datapoint_metadata_model_metadata_inner",
+    "DatapointModel": "rapidata.api_client.models.datapoint_model",
+    "DatapointModelAsset": "rapidata.api_client.models.datapoint_model_asset",
+    "DatapointModelPagedResult": "rapidata.api_client.models.datapoint_model_paged_result",
+    "DatapointState": "rapidata.api_client.models.datapoint_state",
+    "DatasetArtifactModel": "rapidata.api_client.models.dataset_artifact_model",
+    "DatasetDatasetIdDatapointsPostRequestMetadataInner": "rapidata.api_client.models.dataset_dataset_id_datapoints_post_request_metadata_inner",
+    "DatasetEvaluationStepModel": "rapidata.api_client.models.dataset_evaluation_step_model",
+    "DefinitionType": "rapidata.api_client.models.definition_type",
+    "DeleteAudienceExampleEndpointOutput": "rapidata.api_client.models.delete_audience_example_endpoint_output",
+    "Demographic": "rapidata.api_client.models.demographic",
+    "DemographicFilter": "rapidata.api_client.models.demographic_filter",
+    "DemographicMetadataModel": "rapidata.api_client.models.demographic_metadata_model",
+    "DemographicRapidSelectionConfig": "rapidata.api_client.models.demographic_rapid_selection_config",
+    "DemographicSelection": "rapidata.api_client.models.demographic_selection",
+    "DeviceType": "rapidata.api_client.models.device_type",
+    "DistillingRetrievalMode": "rapidata.api_client.models.distilling_retrieval_mode",
+    "DynamicClientRegistrationRequest": "rapidata.api_client.models.dynamic_client_registration_request",
+    "EarlyStoppingRefereeModel": "rapidata.api_client.models.early_stopping_referee_model",
+    "EffortCappedSelection": "rapidata.api_client.models.effort_capped_selection",
+    "EloConfig": "rapidata.api_client.models.elo_config",
+    "EloConfigModel": "rapidata.api_client.models.elo_config_model",
+    "EloRankingConfig": "rapidata.api_client.models.elo_ranking_config",
+    "EmptyValidationTruth": "rapidata.api_client.models.empty_validation_truth",
+    "EnsureEnglishEndpointInput": "rapidata.api_client.models.ensure_english_endpoint_input",
+    "EnsureEnglishEndpointOutput": "rapidata.api_client.models.ensure_english_endpoint_output",
+    "EntityTagHeaderValue": "rapidata.api_client.models.entity_tag_header_value",
+    "ErrorType": "rapidata.api_client.models.error_type",
+    "EvaluationWorkflowConfig": "rapidata.api_client.models.evaluation_workflow_config",
+    "EvaluationWorkflowModel": "rapidata.api_client.models.evaluation_workflow_model",
+    "EvaluationWorkflowModel1": "rapidata.api_client.models.evaluation_workflow_model1",
+    "ExampleBoxShape": "rapidata.api_client.models.example_box_shape",
+    "ExampleCategory": "rapidata.api_client.models.example_category",
+    "ExampleScrubRange": "rapidata.api_client.models.example_scrub_range",
+    "ExampleTranscriptionWord": "rapidata.api_client.models.example_transcription_word",
+    "ExampleVisibility": "rapidata.api_client.models.example_visibility",
+    "ExistingAssetInput": "rapidata.api_client.models.existing_asset_input",
+    "ExistingAssetInputMetadataValue": "rapidata.api_client.models.existing_asset_input_metadata_value",
+    "ExternalAppId": "rapidata.api_client.models.external_app_id",
+    "ExternalServiceKind": "rapidata.api_client.models.external_service_kind",
+    "FeatureFlag": "rapidata.api_client.models.feature_flag",
+    "FeatureFlagModel": "rapidata.api_client.models.feature_flag_model",
+    "FeedbackModel": "rapidata.api_client.models.feedback_model",
+    "FileArtifactModel": "rapidata.api_client.models.file_artifact_model",
+    "FileAsset": "rapidata.api_client.models.file_asset",
+    "FileAssetInput": "rapidata.api_client.models.file_asset_input",
+    "FileAssetInput1": "rapidata.api_client.models.file_asset_input1",
+    "FileAssetInput1File": "rapidata.api_client.models.file_asset_input1_file",
+    "FileAssetInput2": "rapidata.api_client.models.file_asset_input2",
+    "FileAssetInput3": "rapidata.api_client.models.file_asset_input3",
+    "FileAssetInputFile": "rapidata.api_client.models.file_asset_input_file",
+    "FileAssetMetadataInner": "rapidata.api_client.models.file_asset_metadata_inner",
+    "FileAssetMetadataValue": "rapidata.api_client.models.file_asset_metadata_value",
+    "FileAssetModel": "rapidata.api_client.models.file_asset_model",
+    "FileAssetModel1": "rapidata.api_client.models.file_asset_model1",
+    "FileAssetModel1MetadataInner": "rapidata.api_client.models.file_asset_model1_metadata_inner",
+    "FileAssetModel2": "rapidata.api_client.models.file_asset_model2",
+    "FileAssetModelMetadataInner": "rapidata.api_client.models.file_asset_model_metadata_inner",
+    "FileAssetModelMetadataValue": "rapidata.api_client.models.file_asset_model_metadata_value",
+    "FileStreamResult": "rapidata.api_client.models.file_stream_result",
+    "FileType": "rapidata.api_client.models.file_type",
+    "FileTypeMetadata": "rapidata.api_client.models.file_type_metadata",
+    "FileTypeMetadataModel": "rapidata.api_client.models.file_type_metadata_model",
+    "FlowGetNameParameter": "rapidata.api_client.models.flow_get_name_parameter",
+    "FlowItemState": "rapidata.api_client.models.flow_item_state",
+    "FlowType": "rapidata.api_client.models.flow_type",
+    "ForkBenchmarkEndpointOutput": "rapidata.api_client.models.fork_benchmark_endpoint_output",
+    "ForkBenchmarkResult": "rapidata.api_client.models.fork_benchmark_result",
+    "FormFileWrapper": "rapidata.api_client.models.form_file_wrapper",
+    "FreeTextPayload": "rapidata.api_client.models.free_text_payload",
+    "FreeTextRapidBlueprint": "rapidata.api_client.models.free_text_rapid_blueprint",
+    "FreeTextResult": "rapidata.api_client.models.free_text_result",
+    "Gender": "rapidata.api_client.models.gender",
+    "GenderUserFilterGender": "rapidata.api_client.models.gender_user_filter_gender",
+    "GenderUserFilterModel": "rapidata.api_client.models.gender_user_filter_model",
+    "GenderUserFilterModelGender": "rapidata.api_client.models.gender_user_filter_model_gender",
+    "GetActiveBillingPeriodOverviewEndpointOutput": "rapidata.api_client.models.get_active_billing_period_overview_endpoint_output",
+    "GetAllGlobalTextsEndpointOutput": "rapidata.api_client.models.get_all_global_texts_endpoint_output",
+    "GetAllGlobalTextsEndpointOutputItem": "rapidata.api_client.models.get_all_global_texts_endpoint_output_item",
+    "GetAssetMetadataResult": "rapidata.api_client.models.get_asset_metadata_result",
+    "GetAttachCategoryWorkflowResultOverviewResult": "rapidata.api_client.models.get_attach_category_workflow_result_overview_result",
+    "GetAudienceByIdEndpointOutput": "rapidata.api_client.models.get_audience_by_id_endpoint_output",
+    "GetAudienceByIdResult": "rapidata.api_client.models.get_audience_by_id_result",
+    "GetAudienceInactivitySyncByIdEndpointOutput": "rapidata.api_client.models.get_audience_inactivity_sync_by_id_endpoint_output",
+    "GetAudienceStateRecalculationByIdEndpointOutput": "rapidata.api_client.models.get_audience_state_recalculation_by_id_endpoint_output",
+    "GetAudienceUserStateMetricsResult": "rapidata.api_client.models.get_audience_user_state_metrics_result",
+    "GetAvailableValidationSetsEndpointOutput": "rapidata.api_client.models.get_available_validation_sets_endpoint_output",
+    "GetAvailableValidationSetsEndpointValidationSetOverviewOutput": "rapidata.api_client.models.get_available_validation_sets_endpoint_validation_set_overview_output",
+    "GetAvailableValidationSetsEndpointValidationSetOverviewOutputModel": "rapidata.api_client.models.get_available_validation_sets_endpoint_validation_set_overview_output_model",
+    "GetAvailableValidationSetsResult": "rapidata.api_client.models.get_available_validation_sets_result",
+    "GetBatchUploadResultEndpointOutput": "rapidata.api_client.models.get_batch_upload_result_endpoint_output",
+    "GetBatchUploadResultEndpointUrlOutput": "rapidata.api_client.models.get_batch_upload_result_endpoint_url_output",
+    "GetBatchUploadStatusEndpointOutput": "rapidata.api_client.models.get_batch_upload_status_endpoint_output",
+    "GetBenchmarkByIdEndpointOutput": "rapidata.api_client.models.get_benchmark_by_id_endpoint_output",
+    "GetBenchmarkByIdQuery": "rapidata.api_client.models.get_benchmark_by_id_query",
+    "GetBenchmarkByIdQueryResult": "rapidata.api_client.models.get_benchmark_by_id_query_result",
+    "GetBenchmarkByIdQueryResultPagedResult": "rapidata.api_client.models.get_benchmark_by_id_query_result_paged_result",
+    "GetBenchmarkByIdResult": "rapidata.api_client.models.get_benchmark_by_id_result",
+    "GetBenchmarkDemographicsEndpointOutput": "rapidata.api_client.models.get_benchmark_demographics_endpoint_output",
+    "GetBenchmarkDemographicsEndpointOutputBucket": "rapidata.api_client.models.get_benchmark_demographics_endpoint_output_bucket",
+    "GetBenchmarkDemographicsEndpointOutputDimensionSet": "rapidata.api_client.models.get_benchmark_demographics_endpoint_output_dimension_set",
+    "GetBenchmarkHuggingFaceSyncEndpointOutput": "rapidata.api_client.models.get_benchmark_hugging_face_sync_endpoint_output",
+    "GetBenchmarkHuggingFaceSyncHistoryEndpointOutput": "rapidata.api_client.models.get_benchmark_hugging_face_sync_history_endpoint_output",
+    "GetBenchmarkHuggingFaceSyncHistoryEndpointPagedResultOfOutput": "rapidata.api_client.models.get_benchmark_hugging_face_sync_history_endpoint_paged_result_of_output",
+    "GetBenchmarkMatchupBreakdownEndpointOutput": "rapidata.api_client.models.get_benchmark_matchup_breakdown_endpoint_output",
+    "GetBenchmarkMatchupBreakdownEndpointPagedResultOfOutput": "rapidata.api_client.models.get_benchmark_matchup_breakdown_endpoint_paged_result_of_output",
+    "GetBenchmarkStandingsBreakdownEndpointOutput": "rapidata.api_client.models.get_benchmark_standings_breakdown_endpoint_output",
+    "GetBenchmarkStandingsBreakdownEndpointOutputOutputItem": "rapidata.api_client.models.get_benchmark_standings_breakdown_endpoint_output_output_item",
+    "GetBenchmarkStandingsBreakdownEndpointOutputSegment": "rapidata.api_client.models.get_benchmark_standings_breakdown_endpoint_output_segment",
+    "GetBenchmarkStandingsByTagEndpointOutput": "rapidata.api_client.models.get_benchmark_standings_by_tag_endpoint_output",
+    "GetBenchmarkStandingsByTagEndpointOutputOutputItem": "rapidata.api_client.models.get_benchmark_standings_by_tag_endpoint_output_output_item",
+    "GetBenchmarkStandingsByTagEndpointOutputSegment": "rapidata.api_client.models.get_benchmark_standings_by_tag_endpoint_output_segment",
+    "GetBenchmarkStandingsByTagEndpointOutputSegmentItem": "rapidata.api_client.models.get_benchmark_standings_by_tag_endpoint_output_segment_item",
+    "GetBidderRelationMembersEndpointCursorPagedResultOfOutput": "rapidata.api_client.models.get_bidder_relation_members_endpoint_cursor_paged_result_of_output",
+    "GetBidderRelationMembersEndpointOutput": "rapidata.api_client.models.get_bidder_relation_members_endpoint_output",
+    "GetBillingPeriodOverviewEndpointOutput": "rapidata.api_client.models.get_billing_period_overview_endpoint_output",
+    "GetBillingSettingsTimelineEndpointOutput": "rapidata.api_client.models.get_billing_settings_timeline_endpoint_output",
+    "GetBillingSettingsTimelineEndpointOutputInterval": "rapidata.api_client.models.get_billing_settings_timeline_endpoint_output_interval",
+    "GetBillingSummaryEndpointOutput": "rapidata.api_client.models.get_billing_summary_endpoint_output",
+    "GetBoostInsightsEndpointAudienceOutput": "rapidata.api_client.models.get_boost_insights_endpoint_audience_output",
+    "GetBoostInsightsEndpointContributorOutput": "rapidata.api_client.models.get_boost_insights_endpoint_contributor_output",
+    "GetBoostInsightsEndpointGlobalBoostOutput": "rapidata.api_client.models.get_boost_insights_endpoint_global_boost_output",
+    "GetBoostInsightsEndpointLanguageBoostOutput": "rapidata.api_client.models.get_boost_insights_endpoint_language_boost_output",
+    "GetBoostInsightsEndpointLevelContributorOutput": "rapidata.api_client.models.get_boost_insights_endpoint_level_contributor_output",
+    "GetBoostInsightsEndpointLeveledAudienceOutput": "rapidata.api_client.models.get_boost_insights_endpoint_leveled_audience_output",
+    "GetBoostInsightsEndpointOutput": "rapidata.api_client.models.get_boost_insights_endpoint_output",
+    "GetBoostResult": "rapidata.api_client.models.get_boost_result",
+    "GetBoostResultBoostMode": "rapidata.api_client.models.get_boost_result_boost_mode",
+    "GetBoostResultBoostStatus": "rapidata.api_client.models.get_boost_result_boost_status",
+    "GetBoostStatusEndpointOutput": "rapidata.api_client.models.get_boost_status_endpoint_output",
+    "GetBulkCloseBillingPeriodsStatusEndpointOutput": "rapidata.api_client.models.get_bulk_close_billing_periods_status_endpoint_output",
+    "GetBulkCloseBillingPeriodsStatusEndpointOutputPeriod": "rapidata.api_client.models.get_bulk_close_billing_periods_status_endpoint_output_period",
+    "GetBulkReconciliationStatusEndpointOutput": "rapidata.api_client.models.get_bulk_reconciliation_status_endpoint_output",
+    "GetCampaignByIdEndpointICampaignDetails": "rapidata.api_client.models.get_campaign_by_id_endpoint_i_campaign_details",
+    "GetCampaignByIdEndpointICampaignDetailsGetCampaignByIdEndpointProgramCampaignDetails": "rapidata.api_client.models.get_campaign_by_id_endpoint_i_campaign_details_get_campaign_by_id_endpoint_program_campaign_details",
+    "GetCampaignByIdEndpointICampaignDetailsGetCampaignByIdEndpointRoutedCampaignDetails": "rapidata.api_client.models.get_campaign_by_id_endpoint_i_campaign_details_get_campaign_by_id_endpoint_routed_campaign_details",
+    "GetCampaignByIdEndpointOutput": "rapidata.api_client.models.get_campaign_by_id_endpoint_output",
+    "GetCampaignCacheEndpointCampaignEntry": "rapidata.api_client.models.get_campaign_cache_endpoint_campaign_entry",
+    "GetCampaignCacheEndpointOutput": "rapidata.api_client.models.get_campaign_cache_endpoint_output",
+    "GetCapabilityGranteesEndpointCursorPagedResultOfOutput": "rapidata.api_client.models.get_capability_grantees_endpoint_cursor_paged_result_of_output",
+    "GetCapabilityGranteesEndpointOutput": "rapidata.api_client.models.get_capability_grantees_endpoint_output",
+    "GetCheckoutSessionEndpointOutput": "rapidata.api_client.models.get_checkout_session_endpoint_output",
+    "GetClassifyWorkflowResultOverviewResult": "rapidata.api_client.models.get_classify_workflow_result_overview_result",
+    "GetCombinedBenchmarkMatrixEndpointOutput": "rapidata.api_client.models.get_combined_benchmark_matrix_endpoint_output",
+    "GetCombinedBenchmarkStandingsEndpointOutput": "rapidata.api_client.models.get_combined_benchmark_standings_endpoint_output",
+    "GetCombinedBenchmarkStandingsEndpointOutputItem": "rapidata.api_client.models.get_combined_benchmark_standings_endpoint_output_item",
+    "GetCombinedLeaderboardMatrixEndpointOutput": "rapidata.api_client.models.get_combined_leaderboard_matrix_endpoint_output",
+    "GetCombinedLeaderboardStandingsEndpointOutput": "rapidata.api_client.models.get_combined_leaderboard_standings_endpoint_output",
+    "GetCombinedLeaderboardStandingsEndpointOutputItem": "rapidata.api_client.models.get_combined_leaderboard_standings_endpoint_output_item",
+    "GetCompareAbSummaryEndpointOutput": "rapidata.api_client.models.get_compare_ab_summary_endpoint_output",
+    "GetCompareAbSummaryResult": "rapidata.api_client.models.get_compare_ab_summary_result",
+    "GetCompareWorkflowResultOverviewResult": "rapidata.api_client.models.get_compare_workflow_result_overview_result",
+    "GetCompareWorkflowResultOverviewSmallResult": "rapidata.api_client.models.get_compare_workflow_result_overview_small_result",
+    "GetCompareWorkflowResultsResultAsset": "rapidata.api_client.models.get_compare_workflow_results_result_asset",
+    "GetCompareWorkflowResultsResultPagedResult": "rapidata.api_client.models.get_compare_workflow_results_result_paged_result",
+    "GetCompatibleValidationSetsEndpointOutput": "rapidata.api_client.models.get_compatible_validation_sets_endpoint_output",
+    "GetCompatibleValidationSetsEndpointValidationSetOutput": "rapidata.api_client.models.get_compatible_validation_sets_endpoint_validation_set_output",
+    "GetCompatibleValidationSetsEndpointValidationSetOutputModel": "rapidata.api_client.models.get_compatible_validation_sets_endpoint_validation_set_output_model",
+    "GetCompletionTimeHistogramEndpointOutput": "rapidata.api_client.models.get_completion_time_histogram_endpoint_output",
+    "GetCompletionTimeHistogramEndpointOutputBucket": "rapidata.api_client.models.get_completion_time_histogram_endpoint_output_bucket",
+    "GetCostTimeSeriesEndpointCostDataPoint": "rapidata.api_client.models.get_cost_time_series_endpoint_cost_data_point",
+    "GetCostTimeSeriesEndpointOutput": "rapidata.api_client.models.get_cost_time_series_endpoint_output",
+    "GetCustomerCapabilitiesEndpointOutput": "rapidata.api_client.models.get_customer_capabilities_endpoint_output",
+    "GetDatapointByIdResult": "rapidata.api_client.models.get_datapoint_by_id_result",
+    "GetDatapointByIdResultAsset": "rapidata.api_client.models.get_datapoint_by_id_result_asset",
+    "GetDatapointEndpointOutput": "rapidata.api_client.models.get_datapoint_endpoint_output",
+    "GetDatapointsByDatasetIdResult": "rapidata.api_client.models.get_datapoints_by_dataset_id_result",
+    "GetDatasetByIdEndpointOutput": "rapidata.api_client.models.get_dataset_by_id_endpoint_output",
+    "GetDatasetByIdResult": "rapidata.api_client.models.get_dataset_by_id_result",
+    "GetDatasetProgressEndpointOutput": "rapidata.api_client.models.get_dataset_progress_endpoint_output",
+    "GetDatasetProgressResult": "rapidata.api_client.models.get_dataset_progress_result",
+    "GetExternalAppRelationMembersEndpointCursorPagedResultOfOutput": "rapidata.api_client.models.get_external_app_relation_members_endpoint_cursor_paged_result_of_output",
+    "GetExternalAppRelationMembersEndpointOutput": "rapidata.api_client.models.get_external_app_relation_members_endpoint_output",
+    "GetFailedDatapointsEndpointDatapoint": "rapidata.api_client.models.get_failed_datapoints_endpoint_datapoint",
+    "GetFailedDatapointsEndpointOutput": "rapidata.api_client.models.get_failed_datapoints_endpoint_output",
+    "GetFailedDatapointsResult": "rapidata.api_client.models.get_failed_datapoints_result",
+    "GetFailedDatapointsResultDatapoint": "rapidata.api_client.models.get_failed_datapoints_result_datapoint",
+    "GetFastBidMultiplierEndpointOutput": "rapidata.api_client.models.get_fast_bid_multiplier_endpoint_output",
+    "GetFileMetadataResult": "rapidata.api_client.models.get_file_metadata_result",
+    "GetFlowByIdEndpointOutput": "rapidata.api_client.models.get_flow_by_id_endpoint_output",
+    "GetFlowItemByIdEndpointOutput": "rapidata.api_client.models.get_flow_item_by_id_endpoint_output",
+    "GetFlowItemCreationTimeseriesEndpointOutput": "rapidata.api_client.models.get_flow_item_creation_timeseries_endpoint_output",
+    "GetFlowItemCreationTimeseriesEndpointOutputDataPoint": "rapidata.api_client.models.get_flow_item_creation_timeseries_endpoint_output_data_point",
+    "GetGlobalResponsesEndpointOutput": "rapidata.api_client.models.get_global_responses_endpoint_output",
+    "GetGlobalResponsesEndpointOutputResponse": "rapidata.api_client.models.get_global_responses_endpoint_output_response",
+    "GetGlobalResponsesEndpointResponse": "rapidata.api_client.models.get_global_responses_endpoint_response",
+    "GetGroupedRankingWorkflowResultsEndpointOutput": "rapidata.api_client.models.get_grouped_ranking_workflow_results_endpoint_output",
+    "GetGroupedRankingWorkflowResultsEndpointPagedResultOfOutput": "rapidata.api_client.models.get_grouped_ranking_workflow_results_endpoint_paged_result_of_output",
+    "GetGroupedRankingWorkflowResultsModel": "rapidata.api_client.models.get_grouped_ranking_workflow_results_model",
+    "GetGroupedRankingWorkflowResultsResultPagedResult": "rapidata.api_client.models.get_grouped_ranking_workflow_results_result_paged_result",
+    "GetInvoiceEndpointOutput": "rapidata.api_client.models.get_invoice_endpoint_output",
+    "GetJobAbSummaryEndpointOutput": "rapidata.api_client.models.get_job_ab_summary_endpoint_output",
+    "GetJobByIdEndpointOutput": "rapidata.api_client.models.get_job_by_id_endpoint_output",
+    "GetJobCostEstimateEndpointOutput": "rapidata.api_client.models.get_job_cost_estimate_endpoint_output",
+    "GetJobDatapointsEndpointOutput": "rapidata.api_client.models.get_job_datapoints_endpoint_output",
+    "GetJobDatapointsEndpointPagedResultOfOutput": "rapidata.api_client.models.get_job_datapoints_endpoint_paged_result_of_output",
+    "GetJobDefinitionByIdEndpointOutput": "rapidata.api_client.models.get_job_definition_by_id_endpoint_output",
+    "GetJobDefinitionCostEstimateEndpointOutput": "rapidata.api_client.models.get_job_definition_cost_estimate_endpoint_output",
+    "GetJobProgressEndpointOutput": "rapidata.api_client.models.get_job_progress_endpoint_output",
+    "GetJobResponsesEndpointOutput": "rapidata.api_client.models.get_job_responses_endpoint_output",
+    "GetJobResponsesEndpointOutputResponse": "rapidata.api_client.models.get_job_responses_endpoint_output_response",
+    "GetJobResultNavigationEndpointOutput": "rapidata.api_client.models.get_job_result_navigation_endpoint_output",
+    "GetJobRevisionEndpointOutput": "rapidata.api_client.models.get_job_revision_endpoint_output",
+    "GetJobSharesEndpointOutput": "rapidata.api_client.models.get_job_shares_endpoint_output",
+    "GetLatestAudienceInactivitySyncEndpointOutput": "rapidata.api_client.models.get_latest_audience_inactivity_sync_endpoint_output",
+    "GetLatestAudienceStateRecalculationEndpointOutput": "rapidata.api_client.models.get_latest_audience_state_recalculation_endpoint_output",
+    "GetLeaderboardByIdEndpointOutput": "rapidata.api_client.models.get_leaderboard_by_id_endpoint_output",
+    "GetLeaderboardByIdResult": "rapidata.api_client.models.get_leaderboard_by_id_result",
+    "GetMyOrganizationEndpointOutput": "rapidata.api_client.models.get_my_organization_endpoint_output",
+    "GetOrderByIdEndpointOutput": "rapidata.api_client.models.get_order_by_id_endpoint_output",
+    "GetOrderByIdResult": "rapidata.api_client.models.get_order_by_id_result",
+    "GetOrderResultsResult": "rapidata.api_client.models.get_order_results_result",
+    "GetOrganizationCapabilitiesEndpointOutput": "rapidata.api_client.models.get_organization_capabilities_endpoint_output",
+    "GetOrganizationEndpointOutput": "rapidata.api_client.models.get_organization_endpoint_output",
+    "GetOrganizationOwnerTierEndpointOutput": "rapidata.api_client.models.get_organization_owner_tier_endpoint_output",
+    "GetParticipantByIdEndpointOutput": "rapidata.api_client.models.get_participant_by_id_endpoint_output",
+    "GetParticipantByIdObsoleteEndpointOutput": "rapidata.api_client.models.get_participant_by_id_obsolete_endpoint_output",
+    "GetParticipantByIdResult": "rapidata.api_client.models.get_participant_by_id_result",
+    "GetPipelineByIdResult": "rapidata.api_client.models.get_pipeline_by_id_result",
+    "GetPipelineByIdResultArtifactsValue": "rapidata.api_client.models.get_pipeline_by_id_result_artifacts_value",
+    "GetPlatformRelationMembersEndpointCursorPagedResultOfOutput": "rapidata.api_client.models.get_platform_relation_members_endpoint_cursor_paged_result_of_output",
+    "GetPlatformRelationMembersEndpointOutput": "rapidata.api_client.models.get_platform_relation_members_endpoint_output",
+    "GetPromptEmbeddingMapEndpointOutput": "rapidata.api_client.models.get_prompt_embedding_map_endpoint_output",
+    "GetPromptEmbeddingMapEndpointOutputPoint": "rapidata.api_client.models.get_prompt_embedding_map_endpoint_output_point",
+    "GetPromptEmbeddingMapStatusEndpointOutput": "rapidata.api_client.models.get_prompt_embedding_map_status_endpoint_output",
+    "GetPromptsByBenchmarkEndpointOutput": "rapidata.api_client.models.get_prompts_by_benchmark_endpoint_output",
+    "GetPromptsByBenchmarkEndpointPagedResultOfOutput": "rapidata.api_client.models.get_prompts_by_benchmark_endpoint_paged_result_of_output",
+    "GetPublicOrdersEndpointOrderOutput": "rapidata.api_client.models.get_public_orders_endpoint_order_output",
+    "GetPublicOrdersEndpointOutput": "rapidata.api_client.models.get_public_orders_endpoint_output",
+    "GetPublicOrdersResult": "rapidata.api_client.models.get_public_orders_result",
+    "GetPublicResponsesResult": "rapidata.api_client.models.get_public_responses_result",
+    "GetPublicResponsesResultResponse": "rapidata.api_client.models.get_public_responses_result_response",
+    "GetRankingFlowItemResultsEndpointOutput": "rapidata.api_client.models.get_ranking_flow_item_results_endpoint_output",
+    "GetRankingFlowItemResultsEndpointOutputDatapoint": "rapidata.api_client.models.get_ranking_flow_item_results_endpoint_output_datapoint",
+    "GetRankingFlowItemVoteMatrixEndpointOutput": "rapidata.api_client.models.get_ranking_flow_item_vote_matrix_endpoint_output",
+    "GetRankingWorkflowResultsEndpointDatapoint": "rapidata.api_client.models.get_ranking_workflow_results_endpoint_datapoint",
+    "GetRankingWorkflowResultsEndpointOutput": "rapidata.api_client.models.get_ranking_workflow_results_endpoint_output",
+    "GetRapidNavigationEndpointCard": "rapidata.api_client.models.get_rapid_navigation_endpoint_card",
+    "GetRapidNavigationEndpointCardResponse": "rapidata.api_client.models.get_rapid_navigation_endpoint_card_response",
+    "GetRapidNavigationEndpointItem": "rapidata.api_client.models.get_rapid_navigation_endpoint_item",
+    "GetRapidNavigationEndpointOutput": "rapidata.api_client.models.get_rapid_navigation_endpoint_output",
+    "GetRapidResponsesResult": "rapidata.api_client.models.get_rapid_responses_result",
+    "GetRecommendedValidationSetEndpointOutput": "rapidata.api_client.models.get_recommended_validation_set_endpoint_output",
+    "GetRecommendedValidationSetEndpointValidationSetOutput": "rapidata.api_client.models.get_recommended_validation_set_endpoint_validation_set_output",
+    "GetRecommendedValidationSetEndpointValidationSetOutputModel": "rapidata.api_client.models.get_recommended_validation_set_endpoint_validation_set_output_model",
+    "GetRecommendedValidationSetResult": "rapidata.api_client.models.get_recommended_validation_set_result",
+    "GetReconciliationStatusEndpointOutput": "rapidata.api_client.models.get_reconciliation_status_endpoint_output",
+    "GetReplicateModelEndpointOutput": "rapidata.api_client.models.get_replicate_model_endpoint_output",
+    "GetReplicateModelEndpointParameter": "rapidata.api_client.models.get_replicate_model_endpoint_parameter",
+    "GetResponseCountHistogramEndpointOutput": "rapidata.api_client.models.get_response_count_histogram_endpoint_output",
+    "GetResponseCountHistogramEndpointOutputBucket": "rapidata.api_client.models.get_response_count_histogram_endpoint_output_bucket",
+    "GetResponseCountTimeseriesEndpointOutput": "rapidata.api_client.models.get_response_count_timeseries_endpoint_output",
+    "GetResponseCountTimeseriesEndpointOutputDataPoint": "rapidata.api_client.models.get_response_count_timeseries_endpoint_output_data_point",
+    "GetResponsesForRapidEndpointOutput": "rapidata.api_client.models.get_responses_for_rapid_endpoint_output",
+    "GetResponsesForRapidEndpointOutputResponse": "rapidata.api_client.models.get_responses_for_rapid_endpoint_output_response",
+    "GetResponsesForRapidResult": "rapidata.api_client.models.get_responses_for_rapid_result",
+    "GetResponsesForRapidResultResponse": "rapidata.api_client.models.get_responses_for_rapid_result_response",
+    "GetResponsesForRapidResultResponseResult": "rapidata.api_client.models.get_responses_for_rapid_result_response_result",
+    "GetResponsesResult": "rapidata.api_client.models.get_responses_result",
+    "GetResponsesResultResponse": "rapidata.api_client.models.get_responses_result_response",
+    "GetSampleByIdEndpointOutput": "rapidata.api_client.models.get_sample_by_id_endpoint_output",
+    "GetSampleByIdResult": "rapidata.api_client.models.get_sample_by_id_result",
+    "GetSampleGenerationEndpointOutput": "rapidata.api_client.models.get_sample_generation_endpoint_output",
+    "GetSampleGenerationEndpointOutputParticipant": "rapidata.api_client.models.get_sample_generation_endpoint_output_participant",
+    "GetSampleGenerationItemsEndpointOutput": "rapidata.api_client.models.get_sample_generation_items_endpoint_output",
+    "GetSampleGenerationItemsEndpointPagedResultOfOutput": "rapidata.api_client.models.get_sample_generation_items_endpoint_paged_result_of_output",
+    "GetSampleNavigationEndpointOutput": "rapidata.api_client.models.get_sample_navigation_endpoint_output",
+    "GetSampleNavigationEndpointSample": "rapidata.api_client.models.get_sample_navigation_endpoint_sample",
+    "GetSampleNavigationEndpointSampleModel": "rapidata.api_client.models.get_sample_navigation_endpoint_sample_model",
+    "GetSamplesByIdentifierEndpointOutput": "rapidata.api_client.models.get_samples_by_identifier_endpoint_output",
+    "GetSamplesByIdentifierEndpointPagedResultOfOutput": "rapidata.api_client.models.get_samples_by_identifier_endpoint_paged_result_of_output",
+    "GetSamplesByParticipantEndpointISampleOutput": "rapidata.api_client.models.get_samples_by_participant_endpoint_i_sample_output",
+    "GetSamplesByParticipantEndpointISampleOutputGetSamplesByParticipantEndpointPlaceholderSampleOutput": "rapidata.api_client.models.get_samples_by_participant_endpoint_i_sample_output_get_samples_by_participant_endpoint_placeholder_sample_output",
+    "GetSamplesByParticipantEndpointISampleOutputGetSamplesByParticipantEndpointSampleOutput": "rapidata.api_client.models.get_samples_by_participant_endpoint_i_sample_output_get_samples_by_participant_endpoint_sample_output",
+    "GetSamplesByParticipantEndpointPagedResultOfISampleOutput": "rapidata.api_client.models.get_samples_by_participant_endpoint_paged_result_of_i_sample_output",
+    "GetSignalByIdEndpointOutput": "rapidata.api_client.models.get_signal_by_id_endpoint_output",
+    "GetSignalRunByIdEndpointOutput": "rapidata.api_client.models.get_signal_run_by_id_endpoint_output",
+    "GetSimpleWorkflowResultOverviewResult": "rapidata.api_client.models.get_simple_workflow_result_overview_result",
+    "GetSimpleWorkflowResultsModel": "rapidata.api_client.models.get_simple_workflow_results_model",
+    "GetSimpleWorkflowResultsResult": "rapidata.api_client.models.get_simple_workflow_results_result",
+    "GetSimpleWorkflowResultsResultPagedResult": "rapidata.api_client.models.get_simple_workflow_results_result_paged_result",
+    "GetStandingByIdEndpointOutput": "rapidata.api_client.models.get_standing_by_id_endpoint_output",
+    "GetStandingByIdResult": "rapidata.api_client.models.get_standing_by_id_result",
+    "GetUserScoreCacheEndpointOutput": "rapidata.api_client.models.get_user_score_cache_endpoint_output",
+    "GetValidationRapidsEndpointOutput": "rapidata.api_client.models.get_validation_rapids_endpoint_output",
+    "GetValidationRapidsEndpointPagedResultOfOutput": "rapidata.api_client.models.get_validation_rapids_endpoint_paged_result_of_output",
+    "GetValidationRapidsQuery": "rapidata.api_client.models.get_validation_rapids_query",
+    "GetValidationRapidsQueryPagedResult": "rapidata.api_client.models.get_validation_rapids_query_paged_result",
+    "GetValidationRapidsResult": "rapidata.api_client.models.get_validation_rapids_result",
+    "GetValidationRapidsResultAsset": "rapidata.api_client.models.get_validation_rapids_result_asset",
+    "GetValidationRapidsResultPagedResult": "rapidata.api_client.models.get_validation_rapids_result_paged_result",
+    "GetValidationRapidsResultPayload": "rapidata.api_client.models.get_validation_rapids_result_payload",
+    "GetValidationRapidsResultTruth": "rapidata.api_client.models.get_validation_rapids_result_truth",
+    "GetValidationSetByIdEndpointOutput": "rapidata.api_client.models.get_validation_set_by_id_endpoint_output",
+    "GetValidationSetByIdResult": "rapidata.api_client.models.get_validation_set_by_id_result",
+    "GetVolumeDiscountsEndpointOutput": "rapidata.api_client.models.get_volume_discounts_endpoint_output",
+    "GetVolumeDiscountsEndpointOutputVolumeDiscountItem": "rapidata.api_client.models.get_volume_discounts_endpoint_output_volume_discount_item",
+    "GetWorkflowByIdEndpointOutput": "rapidata.api_client.models.get_workflow_by_id_endpoint_output",
+    "GetWorkflowByIdResult": "rapidata.api_client.models.get_workflow_by_id_result",
+    "GetWorkflowByIdResultWorkflow": "rapidata.api_client.models.get_workflow_by_id_result_workflow",
+    "GetWorkflowConfigResult": "rapidata.api_client.models.get_workflow_config_result",
+    "GetWorkflowConfigResultWorkflowConfig": "rapidata.api_client.models.get_workflow_config_result_workflow_config",
+    "GetWorkflowProgressResult": "rapidata.api_client.models.get_workflow_progress_result",
+    "GetWorkflowResponsesEndpointOutput": "rapidata.api_client.models.get_workflow_responses_endpoint_output",
+    "GetWorkflowResponsesEndpointResponse": "rapidata.api_client.models.get_workflow_responses_endpoint_response",
+    "GetWorkflowResultOverviewResult": "rapidata.api_client.models.get_workflow_result_overview_result",
+    "GetWorkflowResultsEndpointOutput": "rapidata.api_client.models.get_workflow_results_endpoint_output",
+    "GetWorkflowResultsEndpointPagedResultOfOutput": "rapidata.api_client.models.get_workflow_results_endpoint_paged_result_of_output",
+    "GetWorkflowResultsEndpointResponseOutput": "rapidata.api_client.models.get_workflow_results_endpoint_response_output",
+    "GetWorkflowResultsResultPagedResult": "rapidata.api_client.models.get_workflow_results_result_paged_result",
+    "GoogleOneTapLoginEndpointInput": "rapidata.api_client.models.google_one_tap_login_endpoint_input",
+    "GoogleOneTapLoginEndpointOutput": "rapidata.api_client.models.google_one_tap_login_endpoint_output",
+    "GoogleOneTapLoginModel": "rapidata.api_client.models.google_one_tap_login_model",
+    "GrantBidderRelationEndpointInput": "rapidata.api_client.models.grant_bidder_relation_endpoint_input",
+    "GrantExternalAppRelationEndpointInput": "rapidata.api_client.models.grant_external_app_relation_endpoint_input",
+    "GrantPlatformRelationEndpointInput": "rapidata.api_client.models.grant_platform_relation_endpoint_input",
+    "GrantVoucherEndpointInput": "rapidata.api_client.models.grant_voucher_endpoint_input",
+    "GrantVoucherEndpointOutput": "rapidata.api_client.models.grant_voucher_endpoint_output",
+    "GroupedRankingGroup": "rapidata.api_client.models.grouped_ranking_group",
+    "GroupedRankingWorkflowConfig": "rapidata.api_client.models.grouped_ranking_workflow_config",
+    "GroupedRankingWorkflowConfigContextAssetsValue": "rapidata.api_client.models.grouped_ranking_workflow_config_context_assets_value",
+    "GroupedRankingWorkflowModel": "rapidata.api_client.models.grouped_ranking_workflow_model",
+    "GroupedRankingWorkflowModel1": "rapidata.api_client.models.grouped_ranking_workflow_model1",
+    "HuggingFaceSyncOutcome": "rapidata.api_client.models.hugging_face_sync_outcome",
+    "HuggingFaceSyncStatus": "rapidata.api_client.models.hugging_face_sync_status",
+    "IArtifactModel": "rapidata.api_client.models.i_artifact_model",
+    "IArtifactModelCampaignArtifactModel": "rapidata.api_client.models.i_artifact_model_campaign_artifact_model",
+    "IArtifactModelDatasetArtifactModel": "rapidata.api_client.models.i_artifact_model_dataset_artifact_model",
+    "IArtifactModelFileArtifactModel": "rapidata.api_client.models.i_artifact_model_file_artifact_model",
+    "IArtifactModelWorkflowArtifactModel": "rapidata.api_client.models.i_artifact_model_workflow_artifact_model",
+    "IArtifactModelWorkflowConfigArtifactModel": "rapidata.api_client.models.i_artifact_model_workflow_config_artifact_model",
+    "IAsset": "rapidata.api_client.models.i_asset",
+    "IAssetFileAsset": "rapidata.api_client.models.i_asset_file_asset",
+    "IAssetInput": "rapidata.api_client.models.i_asset_input",
+    "IAssetInputExistingAssetInput": "rapidata.api_client.models.i_asset_input_existing_asset_input",
+    "IAssetInputMultiAssetInput": "rapidata.api_client.models.i_asset_input_multi_asset_input",
+    "IAssetInputTextAssetInput": "rapidata.api_client.models.i_asset_input_text_asset_input",
+    "IAssetModel": "rapidata.api_client.models.i_asset_model",
+    "IAssetModelFileAssetModel": "rapidata.api_client.models.i_asset_model_file_asset_model",
+    "IAssetModelMultiAssetModel": "rapidata.api_client.models.i_asset_model_multi_asset_model",
+    "IAssetModelNullAssetModel": "rapidata.api_client.models.i_asset_model_null_asset_model",
+    "IAssetModelTextAssetModel": "rapidata.api_client.models.i_asset_model_text_asset_model",
+    "IAssetMultiAsset": "rapidata.api_client.models.i_asset_multi_asset",
+    "IAssetNullAsset": "rapidata.api_client.models.i_asset_null_asset",
+    "IAssetTextAsset": "rapidata.api_client.models.i_asset_text_asset",
+    "IAudienceFilter": "rapidata.api_client.models.i_audience_filter",
+    "IAudienceFilterAndAudienceFilter": "rapidata.api_client.models.i_audience_filter_and_audience_filter",
+    "IAudienceFilterCountryAudienceFilter": "rapidata.api_client.models.i_audience_filter_country_audience_filter",
+    "IAudienceFilterCountryFilter": "rapidata.api_client.models.i_audience_filter_country_filter",
+    "IAudienceFilterDemographicAudienceFilter": "rapidata.api_client.models.i_audience_filter_demographic_audience_filter",
+    "IAudienceFilterDeviceAudienceFilter": "rapidata.api_client.models.i_audience_filter_device_audience_filter",
+    "IAudienceFilterLanguageAudienceFilter": "rapidata.api_client.models.i_audience_filter_language_audience_filter",
+    "IAudienceFilterLanguageFilter": "rapidata.api_client.models.i_audience_filter_language_filter",
+    "IAudienceFilterNotAudienceFilter": "rapidata.api_client.models.i_audience_filter_not_audience_filter",
+    "IAudienceFilterOrAudienceFilter": "rapidata.api_client.models.i_audience_filter_or_audience_filter",
+    "IBillingGroup": "rapidata.api_client.models.i_billing_group",
+    "IBillingGroupAudienceDistillationBillingGroup": "rapidata.api_client.models.i_billing_group_audience_distillation_billing_group",
+    "IBillingGroupAudienceJobBillingGroup": "rapidata.api_client.models.i_billing_group_audience_job_billing_group",
+    "IBillingGroupBenchmarkBillingGroup": "rapidata.api_client.models.i_billing_group_benchmark_billing_group",
+    "IBillingGroupModel": "rapidata.api_client.models.i_billing_group_model",
+    "IBillingGroupModelAudienceDistillationBillingGroupModel": "rapidata.api_client.models.i_billing_group_model_audience_distillation_billing_group_model",
+    "IBillingGroupModelAudienceJobBillingGroupModel": "rapidata.api_client.models.i_billing_group_model_audience_job_billing_group_model",
+    "IBillingGroupModelBenchmarkBillingGroupModel": "rapidata.api_client.models.i_billing_group_model_benchmark_billing_group_model",
+    "IBillingGroupModelOrderBillingGroupModel": "rapidata.api_client.models.i_billing_group_model_order_billing_group_model",
+    "IBillingGroupModelRankingFlowBillingGroupModel": "rapidata.api_client.models.i_billing_group_model_ranking_flow_billing_group_model",
+    "IBillingGroupModelValidationSetBillingGroupModel": "rapidata.api_client.models.i_billing_group_model_validation_set_billing_group_model",
+    "IBillingGroupOrderBillingGroup": "rapidata.api_client.models.i_billing_group_order_billing_group",
+    "IBillingGroupRankingFlowBillingGroup": "rapidata.api_client.models.i_billing_group_ranking_flow_billing_group",
+    "IBillingGroupValidationSetBillingGroup": "rapidata.api_client.models.i_billing_group_validation_set_billing_group",
+    "ICampaignDetails": "rapidata.api_client.models.i_campaign_details",
+    "ICampaignDetailsProgramCampaignDetails": "rapidata.api_client.models.i_campaign_details_program_campaign_details",
+    "ICampaignDetailsRoutedCampaignDetails": "rapidata.api_client.models.i_campaign_details_routed_campaign_details",
+    "ICampaignFilter": "rapidata.api_client.models.i_campaign_filter",
+    "ICampaignFilterAndFilter": "rapidata.api_client.models.i_campaign_filter_and_filter",
+    "ICampaignFilterAudienceStateFilter": "rapidata.api_client.models.i_campaign_filter_audience_state_filter",
+    "ICampaignFilterCampaignCooldownFilter": "rapidata.api_client.models.i_campaign_filter_campaign_cooldown_filter",
+    "ICampaignFilterCampaignFilter": "rapidata.api_client.models.i_campaign_filter_campaign_filter",
+    "ICampaignFilterCampaignIdFilter": "rapidata.api_client.models.i_campaign_filter_campaign_id_filter",
+    "ICampaignFilterCampaignSessionCountFilter": "rapidata.api_client.models.i_campaign_filter_campaign_session_count_filter",
+    "ICampaignFilterCountryFilter": "rapidata.api_client.models.i_campaign_filter_country_filter",
+    "ICampaignFilterDemographicFilter": "rapidata.api_client.models.i_campaign_filter_demographic_filter",
+    "ICampaignFilterDeviceFilter": "rapidata.api_client.models.i_campaign_filter_device_filter",
+    "ICampaignFilterDspFilter": "rapidata.api_client.models.i_campaign_filter_dsp_filter",
+    "ICampaignFilterLanguageFilter": "rapidata.api_client.models.i_campaign_filter_language_filter",
+    "ICampaignFilterModel": "rapidata.api_client.models.i_campaign_filter_model",
+    "ICampaignFilterModelAndFilterModel": "rapidata.api_client.models.i_campaign_filter_model_and_filter_model",
+    "ICampaignFilterModelAudienceStateFilterModel": "rapidata.api_client.models.i_campaign_filter_model_audience_state_filter_model",
+    "ICampaignFilterModelCampaignCooldownFilterModel": "rapidata.api_client.models.i_campaign_filter_model_campaign_cooldown_filter_model",
+    "ICampaignFilterModelCampaignIdFilterModel": "rapidata.api_client.models.i_campaign_filter_model_campaign_id_filter_model",
+    "ICampaignFilterModelCampaignSessionCountFilterModel": "rapidata.api_client.models.i_campaign_filter_model_campaign_session_count_filter_model",
+    "ICampaignFilterModelCountryFilterModel": "rapidata.api_client.models.i_campaign_filter_model_country_filter_model",
+    "ICampaignFilterModelDemographicFilterModel": "rapidata.api_client.models.i_campaign_filter_model_demographic_filter_model",
+    "ICampaignFilterModelDeviceFilterModel": "rapidata.api_client.models.i_campaign_filter_model_device_filter_model",
+    "ICampaignFilterModelLanguageFilterModel": "rapidata.api_client.models.i_campaign_filter_model_language_filter_model",
+    "ICampaignFilterModelNewUserFilterModel": "rapidata.api_client.models.i_campaign_filter_model_new_user_filter_model",
+    "ICampaignFilterModelNotFilterModel": "rapidata.api_client.models.i_campaign_filter_model_not_filter_model",
+    "ICampaignFilterModelOrFilterModel": "rapidata.api_client.models.i_campaign_filter_model_or_filter_model",
+    "ICampaignFilterModelResponseCountFilterModel": "rapidata.api_client.models.i_campaign_filter_model_response_count_filter_model",
+    "ICampaignFilterModelUserActionRestrictionFilterModel": "rapidata.api_client.models.i_campaign_filter_model_user_action_restriction_filter_model",
+    "ICampaignFilterModelUserScoreFilterModel": "rapidata.api_client.models.i_campaign_filter_model_user_score_filter_model",
+    "ICampaignFilterNewUserFilter": "rapidata.api_client.models.i_campaign_filter_new_user_filter",
+    "ICampaignFilterNotFilter": "rapidata.api_client.models.i_campaign_filter_not_filter",
+    "ICampaignFilterOrFilter": "rapidata.api_client.models.i_campaign_filter_or_filter",
+    "ICampaignFilterResponseCountFilter": "rapidata.api_client.models.i_campaign_filter_response_count_filter",
+    "ICampaignFilterUserActionRestrictionFilter": "rapidata.api_client.models.i_campaign_filter_user_action_restriction_filter",
+    "ICampaignFilterUserScoreFilter": "rapidata.api_client.models.i_campaign_filter_user_score_filter",
+    "ICampaignFilterUserStateFilter": "rapidata.api_client.models.i_campaign_filter_user_state_filter",
+    "ICampaignSelection": "rapidata.api_client.models.i_campaign_selection",
+    "ICampaignSelectionAbTestSelection": "rapidata.api_client.models.i_campaign_selection_ab_test_selection",
+    "ICampaignSelectionAudienceSelection": "rapidata.api_client.models.i_campaign_selection_audience_selection",
+    "ICampaignSelectionCappedSelection": "rapidata.api_client.models.i_campaign_selection_capped_selection",
+    "ICampaignSelectionConditionalValidationSelection": "rapidata.api_client.models.i_campaign_selection_conditional_validation_selection",
+    "ICampaignSelectionDemographicSelection": "rapidata.api_client.models.i_campaign_selection_demographic_selection",
+    "ICampaignSelectionEnforcingSelection": "rapidata.api_client.models.i_campaign_selection_enforcing_selection",
+    "ICampaignSelectionLabelingSelection": "rapidata.api_client.models.i_campaign_selection_labeling_selection",
+    "ICampaignSelectionModel": "rapidata.api_client.models.i_campaign_selection_model",
+    "ICampaignSelectionModelAbTestSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_ab_test_selection_model",
+    "ICampaignSelectionModelAudienceSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_audience_selection_model",
+    "ICampaignSelectionModelCappedSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_capped_selection_model",
+    "ICampaignSelectionModelConditionalValidationSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_conditional_validation_selection_model",
+    "ICampaignSelectionModelDemographicSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_demographic_selection_model",
+    "ICampaignSelectionModelEnforcingSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_enforcing_selection_model",
+    "ICampaignSelectionModelLabelingSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_labeling_selection_model",
+    "ICampaignSelectionModelShufflingSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_shuffling_selection_model",
+    "ICampaignSelectionModelStaticSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_static_selection_model",
+    "ICampaignSelectionModelValidationSelectionModel": "rapidata.api_client.models.i_campaign_selection_model_validation_selection_model",
+    "ICampaignSelectionShufflingSelection": "rapidata.api_client.models.i_campaign_selection_shuffling_selection",
+    "ICampaignSelectionStaticSelection": "rapidata.api_client.models.i_campaign_selection_static_selection",
+    "ICampaignSelectionValidationSelection": "rapidata.api_client.models.i_campaign_selection_validation_selection",
+    "ICooldownDuration": "rapidata.api_client.models.i_cooldown_duration",
+    "ICooldownDurationFixedCooldownDuration": "rapidata.api_client.models.i_cooldown_duration_fixed_cooldown_duration",
+    "ICooldownDurationModel": "rapidata.api_client.models.i_cooldown_duration_model",
+    "ICooldownDurationModelFixedCooldownDurationModel": "rapidata.api_client.models.i_cooldown_duration_model_fixed_cooldown_duration_model",
+    "ICooldownDurationModelRandomCooldownDurationModel": "rapidata.api_client.models.i_cooldown_duration_model_random_cooldown_duration_model",
+    "ICooldownDurationRandomCooldownDuration": "rapidata.api_client.models.i_cooldown_duration_random_cooldown_duration",
+    "IDatasetCloneDataset": "rapidata.api_client.models.i_dataset_clone_dataset",
+    "IDatasetMetadataInput": "rapidata.api_client.models.i_dataset_metadata_input",
+    "IDatasetMetadataInputPromptAssetMetadataInput": "rapidata.api_client.models.i_dataset_metadata_input_prompt_asset_metadata_input",
+    "IDatasetMetadataInputPromptMetadataInput": "rapidata.api_client.models.i_dataset_metadata_input_prompt_metadata_input",
+    "IDatasetMetadataInputTranscriptionMetadataInput": "rapidata.api_client.models.i_dataset_metadata_input_transcription_metadata_input",
+    "IDatasetModel": "rapidata.api_client.models.i_dataset_model",
+    "IDatasetModelCloneDatasetModel": "rapidata.api_client.models.i_dataset_model_clone_dataset_model",
+    "IExamplePayload": "rapidata.api_client.models.i_example_payload",
+    "IExamplePayloadClassifyExamplePayload": "rapidata.api_client.models.i_example_payload_classify_example_payload",
+    "IExamplePayloadCompareExamplePayload": "rapidata.api_client.models.i_example_payload_compare_example_payload",
+    "IExamplePayloadLineExamplePayload": "rapidata.api_client.models.i_example_payload_line_example_payload",
+    "IExamplePayloadLocateExamplePayload": "rapidata.api_client.models.i_example_payload_locate_example_payload",
+    "IExamplePayloadScrubExamplePayload": "rapidata.api_client.models.i_example_payload_scrub_example_payload",
+    "IExamplePayloadTranscriptionExamplePayload": "rapidata.api_client.models.i_example_payload_transcription_example_payload",
+    "IExampleTruth": "rapidata.api_client.models.i_example_truth",
+    "IExampleTruthClassifyExampleTruth": "rapidata.api_client.models.i_example_truth_classify_example_truth",
+    "IExampleTruthCompareExampleTruth": "rapidata.api_client.models.i_example_truth_compare_example_truth",
+    "IExampleTruthLineExampleTruth": "rapidata.api_client.models.i_example_truth_line_example_truth",
+    "IExampleTruthLocateExampleTruth": "rapidata.api_client.models.i_example_truth_locate_example_truth",
+    "IExampleTruthScrubExampleTruth": "rapidata.api_client.models.i_example_truth_scrub_example_truth",
+    "IExampleTruthTranscriptionExampleTruth": "rapidata.api_client.models.i_example_truth_transcription_example_truth",
+    "IFaucetInput": "rapidata.api_client.models.i_faucet_input",
+    "IFaucetInputReplicateFaucetInput": "rapidata.api_client.models.i_faucet_input_replicate_faucet_input",
+    "IFaucetOutput": "rapidata.api_client.models.i_faucet_output",
+    "IFaucetOutputManagedFaucetOutput": "rapidata.api_client.models.i_faucet_output_managed_faucet_output",
+    "IFaucetOutputReplicateFaucetOutput": "rapidata.api_client.models.i_faucet_output_replicate_faucet_output",
+    "IFlow": "rapidata.api_client.models.i_flow",
+    "IFlowModel": "rapidata.api_client.models.i_flow_model",
+    "IFlowModelRankingFlowModel": "rapidata.api_client.models.i_flow_model_ranking_flow_model",
+    "IFlowRankingFlow": "rapidata.api_client.models.i_flow_ranking_flow",
+    "IGraduationRule": "rapidata.api_client.models.i_graduation_rule",
+    "IGraduationRuleAcceptedFreeTextRule": "rapidata.api_client.models.i_graduation_rule_accepted_free_text_rule",
+    "IGraduationRuleScoreThresholdRule": "rapidata.api_client.models.i_graduation_rule_score_threshold_rule",
+    "IGraduationRuleTaskAccuracyRule": "rapidata.api_client.models.i_graduation_rule_task_accuracy_rule",
+    "IJobResults": "rapidata.api_client.models.i_job_results",
+    "IJobResultsGroupedRankingResults": "rapidata.api_client.models.i_job_results_grouped_ranking_results",
+    "IJobResultsRankingResults": "rapidata.api_client.models.i_job_results_ranking_results",
+    "IJobResultsRapidResults": "rapidata.api_client.models.i_job_results_rapid_results",
+    "ILineItem": "rapidata.api_client.models.i_line_item",
+    "ILineItemMinimumSpendCommitment": "rapidata.api_client.models.i_line_item_minimum_spend_commitment",
+    "ILineItemModel": "rapidata.api_client.models.i_line_item_model",
+    "ILineItemModelMinimumSpendCommitmentModel": "rapidata.api_client.models.i_line_item_model_minimum_spend_commitment_model",
+    "ILineItemModelOtherChargeModel": "rapidata.api_client.models.i_line_item_model_other_charge_model",
+    "ILineItemModelPlatformFeeModel": "rapidata.api_client.models.i_line_item_model_platform_fee_model",
+    "ILineItemModelRefundModel": "rapidata.api_client.models.i_line_item_model_refund_model",
+    "ILineItemModelRunningCostModel": "rapidata.api_client.models.i_line_item_model_running_cost_model",
+    "ILineItemModelVolumeDiscountModel": "rapidata.api_client.models.i_line_item_model_volume_discount_model",
+    "ILineItemOtherCharge": "rapidata.api_client.models.i_line_item_other_charge",
+    "ILineItemPlatformFee": "rapidata.api_client.models.i_line_item_platform_fee",
+    "ILineItemRefund": "rapidata.api_client.models.i_line_item_refund",
+    "ILineItemRunningCost": "rapidata.api_client.models.i_line_item_running_cost",
+    "ILineItemVolumeDiscount": "rapidata.api_client.models.i_line_item_volume_discount",
+    "IMetadata": "rapidata.api_client.models.i_metadata",
+    "IMetadataClassificationMetadata": "rapidata.api_client.models.i_metadata_classification_metadata",
+    "IMetadataCountMetadata": "rapidata.api_client.models.i_metadata_count_metadata",
+    "IMetadataDurationMetadata": "rapidata.api_client.models.i_metadata_duration_metadata",
+    "IMetadataFileTypeMetadata": "rapidata.api_client.models.i_metadata_file_type_metadata",
+    "IMetadataImageDimensionMetadata": "rapidata.api_client.models.i_metadata_image_dimension_metadata",
+    "IMetadataInput": "rapidata.api_client.models.i_metadata_input",
+    "IMetadataInputTextMetadataInput": "rapidata.api_client.models.i_metadata_input_text_metadata_input",
+    "IMetadataLocationMetadata": "rapidata.api_client.models.i_metadata_location_metadata",
+    "IMetadataModel": "rapidata.api_client.models.i_metadata_model",
+    "IMetadataModelClassificationMetadataModel": "rapidata.api_client.models.i_metadata_model_classification_metadata_model",
+    "IMetadataModelCountMetadataModel": "rapidata.api_client.models.i_metadata_model_count_metadata_model",
+    "IMetadataModelFileTypeMetadataModel": "rapidata.api_client.models.i_metadata_model_file_type_metadata_model",
+    "IMetadataModelImageDimensionMetadataModel": "rapidata.api_client.models.i_metadata_model_image_dimension_metadata_model",
+    "IMetadataModelLocationMetadataModel": "rapidata.api_client.models.i_metadata_model_location_metadata_model",
+    "IMetadataModelOriginalFilenameMetadataModel": "rapidata.api_client.models.i_metadata_model_original_filename_metadata_model",
+    "IMetadataModelSourceUrlMetadataModel": "rapidata.api_client.models.i_metadata_model_source_url_metadata_model",
+    "IMetadataModelStreamsMetadataModel": "rapidata.api_client.models.i_metadata_model_streams_metadata_model",
+    "IMetadataModelTextMetadataModel": "rapidata.api_client.models.i_metadata_model_text_metadata_model",
+    "IMetadataModelVideoDurationMetadataModel": "rapidata.api_client.models.i_metadata_model_video_duration_metadata_model",
+    "IMetadataOriginalFilenameMetadata": "rapidata.api_client.models.i_metadata_original_filename_metadata",
+    "IMetadataSourceUrlMetadata": "rapidata.api_client.models.i_metadata_source_url_metadata",
+    "IMetadataStreamsMetadata": "rapidata.api_client.models.i_metadata_streams_metadata",
+    "IMetadataTextMetadata": "rapidata.api_client.models.i_metadata_text_metadata",
+    "IMetadataVideoDurationMetadata": "rapidata.api_client.models.i_metadata_video_duration_metadata",
+    "IOrderWorkflowInput": "rapidata.api_client.models.i_order_workflow_input",
+    "IOrderWorkflowInputEvaluationWorkflowInput": "rapidata.api_client.models.i_order_workflow_input_evaluation_workflow_input",
+    "IOrderWorkflowInputGroupedRankingWorkflowInput": "rapidata.api_client.models.i_order_workflow_input_grouped_ranking_workflow_input",
+    "IOrderWorkflowInputModel": "rapidata.api_client.models.i_order_workflow_input_model",
+    "IOrderWorkflowInputModelEvaluationWorkflowInputModel": "rapidata.api_client.models.i_order_workflow_input_model_evaluation_workflow_input_model",
+    "IOrderWorkflowInputModelGroupedRankingWorkflowInputModel": "rapidata.api_client.models.i_order_workflow_input_model_grouped_ranking_workflow_input_model",
+    "IOrderWorkflowInputModelSimpleWorkflowInputModel": "rapidata.api_client.models.i_order_workflow_input_model_simple_workflow_input_model",
+    "IOrderWorkflowInputSimpleWorkflowInput": "rapidata.api_client.models.i_order_workflow_input_simple_workflow_input",
+    "IOrderWorkflowModel": "rapidata.api_client.models.i_order_workflow_model",
+    "IOrderWorkflowModelCompareWorkflowModel": "rapidata.api_client.models.i_order_workflow_model_compare_workflow_model",
+    "IOrderWorkflowModelEvaluationWorkflowModel": "rapidata.api_client.models.i_order_workflow_model_evaluation_workflow_model",
+    "IOrderWorkflowModelGroupedRankingWorkflowModel": "rapidata.api_client.models.i_order_workflow_model_grouped_ranking_workflow_model",
+    "IOrderWorkflowModelRankingWorkflowModel": "rapidata.api_client.models.i_order_workflow_model_ranking_workflow_model",
+    "IOrderWorkflowModelSimpleWorkflowModel": "rapidata.api_client.models.i_order_workflow_model_simple_workflow_model",
+    "IPairMakerConfig": "rapidata.api_client.models.i_pair_maker_config",
+    "IPairMakerConfigFullPermutationPairMakerConfig": "rapidata.api_client.models.i_pair_maker_config_full_permutation_pair_maker_config",
+    "IPairMakerConfigModel": "rapidata.api_client.models.i_pair_maker_config_model",
+    "IPairMakerConfigModelFullPermutationPairMakerConfigModel": "rapidata.api_client.models.i_pair_maker_config_model_full_permutation_pair_maker_config_model",
+    "IPairMakerConfigModelOnlinePairMakerConfigModel": "rapidata.api_client.models.i_pair_maker_config_model_online_pair_maker_config_model",
+    "IPairMakerConfigOnlinePairMakerConfig": "rapidata.api_client.models.i_pair_maker_config_online_pair_maker_config",
+    "IPairMakerInformation": "rapidata.api_client.models.i_pair_maker_information",
+    "IPairMakerInformationFullPermutationPairMakerInformation": "rapidata.api_client.models.i_pair_maker_information_full_permutation_pair_maker_information",
+    "IPairMakerInformationModel": "rapidata.api_client.models.i_pair_maker_information_model",
+    "IPairMakerInformationModelFullPermutationPairMakerInformationModel": "rapidata.api_client.models.i_pair_maker_information_model_full_permutation_pair_maker_information_model",
+    "IPairMakerInformationModelOnlinePairMakerInformationModel": "rapidata.api_client.models.i_pair_maker_information_model_online_pair_maker_information_model",
+    "IPairMakerInformationOnlinePairMakerInformation": "rapidata.api_client.models.i_pair_maker_information_online_pair_maker_information",
+    "IPipelineArtifactCreateDatasetArtifact": "rapidata.api_client.models.i_pipeline_artifact_create_dataset_artifact",
+    "IPipelineArtifactModel": "rapidata.api_client.models.i_pipeline_artifact_model",
+    "IPipelineArtifactModelCreateDatasetArtifactModel": "rapidata.api_client.models.i_pipeline_artifact_model_create_dataset_artifact_model",
+    "IPipelineCreateSimplePipeline": "rapidata.api_client.models.i_pipeline_create_simple_pipeline",
+    "IPipelineModel": "rapidata.api_client.models.i_pipeline_model",
+    "IPipelineModelCreateSimplePipelineModel": "rapidata.api_client.models.i_pipeline_model_create_simple_pipeline_model",
+    "IPipelineStep": "rapidata.api_client.models.i_pipeline_step",
+    "IPipelineStepDatasetEvaluationStep": "rapidata.api_client.models.i_pipeline_step_dataset_evaluation_step",
+    "IPipelineStepModel": "rapidata.api_client.models.i_pipeline_step_model",
+    "IPipelineStepModelDatasetEvaluationStepModel": "rapidata.api_client.models.i_pipeline_step_model_dataset_evaluation_step_model",
+    "IPipelineStepModelSendCompletionMailStepModel": "rapidata.api_client.models.i_pipeline_step_model_send_completion_mail_step_model",
+    "IPipelineStepModelWorkflowAggregationStepModel": "rapidata.api_client.models.i_pipeline_step_model_workflow_aggregation_step_model",
+    "IPipelineStepModelWorkflowLabelingStepModel": "rapidata.api_client.models.i_pipeline_step_model_workflow_labeling_step_model",
+    "IPipelineStepSendCompletionMailStep": "rapidata.api_client.models.i_pipeline_step_send_completion_mail_step",
+    "IPipelineStepWorkflowAggregationStep": "rapidata.api_client.models.i_pipeline_step_workflow_aggregation_step",
+    "IPipelineStepWorkflowLabelingStep": "rapidata.api_client.models.i_pipeline_step_workflow_labeling_step",
+    "IProgramAction": "rapidata.api_client.models.i_program_action",
+    "IProgramActionCompleteAction": "rapidata.api_client.models.i_program_action_complete_action",
+    "IProgramActionModel": "rapidata.api_client.models.i_program_action_model",
+    "IProgramActionModelCompleteActionModel": "rapidata.api_client.models.i_program_action_model_complete_action_model",
+    "IProgramActionModelServeRapidActionModel": "rapidata.api_client.models.i_program_action_model_serve_rapid_action_model",
+    "IProgramActionServeRapidAction": "rapidata.api_client.models.i_program_action_serve_rapid_action",
+    "IProgramNode": "rapidata.api_client.models.i_program_node",
+    "IProgramNodeActionNode": "rapidata.api_client.models.i_program_node_action_node",
+    "IProgramNodeCasesNode": "rapidata.api_client.models.i_program_node_cases_node",
+    "IProgramNodeModel": "rapidata.api_client.models.i_program_node_model",
+    "IProgramNodeModelActionNodeModel": "rapidata.api_client.models.i_program_node_model_action_node_model",
+    "IProgramNodeModelCasesNodeModel": "rapidata.api_client.models.i_program_node_model_cases_node_model",
+    "IProgramNodeWeightedSplitNode": "rapidata.api_client.models.i_program_node_weighted_split_node",
+    "IProgramPredicate": "rapidata.api_client.models.i_program_predicate",
+    "IProgramPredicateAccuracyPredicate": "rapidata.api_client.models.i_program_predicate_accuracy_predicate",
+    "IProgramPredicateAnsweredCountPredicate": "rapidata.api_client.models.i_program_predicate_answered_count_predicate",
+    "IProgramPredicateConsecutiveCorrectPredicate": "rapidata.api_client.models.i_program_predicate_consecutive_correct_predicate",
+    "IProgramPredicateConsecutiveIncorrectPredicate": "rapidata.api_client.models.i_program_predicate_consecutive_incorrect_predicate",
+    "IProgramPredicateCorrectCountPredicate": "rapidata.api_client.models.i_program_predicate_correct_count_predicate",
+    "IProgramPredicateModel": "rapidata.api_client.models.i_program_predicate_model",
+    "IProgramPredicateModelAnsweredCountPredicateModel": "rapidata.api_client.models.i_program_predicate_model_answered_count_predicate_model",
+    "IProgramPredicateModelCorrectCountPredicateModel": "rapidata.api_client.models.i_program_predicate_model_correct_count_predicate_model",
+    "IProgramPredicateTimeElapsedPredicate": "rapidata.api_client.models.i_program_predicate_time_elapsed_predicate",
+    "IProgramPredicateUserAttributePredicate": "rapidata.api_client.models.i_program_predicate_user_attribute_predicate",
+    "IProgramPredicateUserScorePredicate": "rapidata.api_client.models.i_program_predicate_user_score_predicate",
+    "IRankingConfig": "rapidata.api_client.models.i_ranking_config",
+    "IRankingConfigBradleyTerryRankingConfig": "rapidata.api_client.models.i_ranking_config_bradley_terry_ranking_config",
+    "IRankingConfigEloConfig": "rapidata.api_client.models.i_ranking_config_elo_config",
+    "IRankingConfigEloRankingConfig": "rapidata.api_client.models.i_ranking_config_elo_ranking_config",
+    "IRankingConfigModel": "rapidata.api_client.models.i_ranking_config_model",
+    "IRankingConfigModelBradleyTerryRankingConfigModel": "rapidata.api_client.models.i_ranking_config_model_bradley_terry_ranking_config_model",
+    "IRankingConfigModelEloConfigModel": "rapidata.api_client.models.i_ranking_config_model_elo_config_model",
+    "IRapid": "rapidata.api_client.models.i_rapid",
+    "IRapidAttachCategoryRapid": "rapidata.api_client.models.i_rapid_attach_category_rapid",
+    "IRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint",
+    "IRapidBlueprintAttachCategoryRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_attach_category_rapid_blueprint",
+    "IRapidBlueprintBoundingBoxRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_bounding_box_rapid_blueprint",
+    "IRapidBlueprintCompareRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_compare_rapid_blueprint",
+    "IRapidBlueprintFreeTextRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_free_text_rapid_blueprint",
+    "IRapidBlueprintLineRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_line_rapid_blueprint",
+    "IRapidBlueprintLocateRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_locate_rapid_blueprint",
+    "IRapidBlueprintNamedEntityRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_named_entity_rapid_blueprint",
+    "IRapidBlueprintPolygonRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_polygon_rapid_blueprint",
+    "IRapidBlueprintScrubRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_scrub_rapid_blueprint",
+    "IRapidBlueprintTranscriptionRapidBlueprint": "rapidata.api_client.models.i_rapid_blueprint_transcription_rapid_blueprint",
+    "IRapidBoundingBoxRapid": "rapidata.api_client.models.i_rapid_bounding_box_rapid",
+    "IRapidCompareRapid": "rapidata.api_client.models.i_rapid_compare_rapid",
+    "IRapidFreeTextRapid": "rapidata.api_client.models.i_rapid_free_text_rapid",
+    "IRapidLineRapid": "rapidata.api_client.models.i_rapid_line_rapid",
+    "IRapidLocateRapid": "rapidata.api_client.models.i_rapid_locate_rapid",
+    "IRapidModel": "rapidata.api_client.models.i_rapid_model",
+    "IRapidModelAttachCategoryRapidModel": "rapidata.api_client.models.i_rapid_model_attach_category_rapid_model",
+    "IRapidModelBoundingBoxRapidModel": "rapidata.api_client.models.i_rapid_model_bounding_box_rapid_model",
+    "IRapidModelCompareRapidModel": "rapidata.api_client.models.i_rapid_model_compare_rapid_model",
+    "IRapidModelFreeTextRapidModel": "rapidata.api_client.models.i_rapid_model_free_text_rapid_model",
+    "IRapidModelLineRapidModel": "rapidata.api_client.models.i_rapid_model_line_rapid_model",
+    "IRapidModelLocateRapidModel": "rapidata.api_client.models.i_rapid_model_locate_rapid_model",
+    "IRapidModelNamedEntityRapidModel": "rapidata.api_client.models.i_rapid_model_named_entity_rapid_model",
+    "IRapidModelPolygonRapidModel": "rapidata.api_client.models.i_rapid_model_polygon_rapid_model",
+    "IRapidModelScrubRapidModel": "rapidata.api_client.models.i_rapid_model_scrub_rapid_model",
+    "IRapidModelTranscriptionRapidModel": "rapidata.api_client.models.i_rapid_model_transcription_rapid_model",
+    "IRapidNamedEntityRapid": "rapidata.api_client.models.i_rapid_named_entity_rapid",
+    "IRapidPayload": "rapidata.api_client.models.i_rapid_payload",
+    "IRapidPayloadBoundingBoxPayload": "rapidata.api_client.models.i_rapid_payload_bounding_box_payload",
+    "IRapidPayloadClassifyPayload": "rapidata.api_client.models.i_rapid_payload_classify_payload",
+    "IRapidPayloadComparePayload": "rapidata.api_client.models.i_rapid_payload_compare_payload",
+    "IRapidPayloadFreeTextPayload": "rapidata.api_client.models.i_rapid_payload_free_text_payload",
+    "IRapidPayloadLinePayload": "rapidata.api_client.models.i_rapid_payload_line_payload",
+    "IRapidPayloadLocatePayload": "rapidata.api_client.models.i_rapid_payload_locate_payload",
+    "IRapidPayloadModel": "rapidata.api_client.models.i_rapid_payload_model",
+    "IRapidPayloadModelBoundingBoxPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_bounding_box_payload_model",
+    "IRapidPayloadModelClassifyPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_classify_payload_model",
+    "IRapidPayloadModelComparePayloadModel": "rapidata.api_client.models.i_rapid_payload_model_compare_payload_model",
+    "IRapidPayloadModelFreeTextPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_free_text_payload_model",
+    "IRapidPayloadModelLinePayloadModel": "rapidata.api_client.models.i_rapid_payload_model_line_payload_model",
+    "IRapidPayloadModelLocatePayloadModel": "rapidata.api_client.models.i_rapid_payload_model_locate_payload_model",
+    "IRapidPayloadModelNamedEntityPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_named_entity_payload_model",
+    "IRapidPayloadModelPolygonPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_polygon_payload_model",
+    "IRapidPayloadModelScrubPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_scrub_payload_model",
+    "IRapidPayloadModelTranscriptionPayloadModel": "rapidata.api_client.models.i_rapid_payload_model_transcription_payload_model",
+    "IRapidPayloadNamedEntityPayload": "rapidata.api_client.models.i_rapid_payload_named_entity_payload",
+    "IRapidPayloadPolygonPayload": "rapidata.api_client.models.i_rapid_payload_polygon_payload",
+    "IRapidPayloadScrubPayload": "rapidata.api_client.models.i_rapid_payload_scrub_payload",
+    "IRapidPayloadTranscriptionPayload": "rapidata.api_client.models.i_rapid_payload_transcription_payload",
+    "IRapidPolygonRapid": "rapidata.api_client.models.i_rapid_polygon_rapid",
+    "IRapidResult": "rapidata.api_client.models.i_rapid_result",
+    "IRapidResultAttachCategoryResult": "rapidata.api_client.models.i_rapid_result_attach_category_result",
+    "IRapidResultBoundingBoxResult": "rapidata.api_client.models.i_rapid_result_bounding_box_result",
+    "IRapidResultCompareResult": "rapidata.api_client.models.i_rapid_result_compare_result",
+    "IRapidResultFreeTextResult": "rapidata.api_client.models.i_rapid_result_free_text_result",
+    "IRapidResultLineResult": "rapidata.api_client.models.i_rapid_result_line_result",
+    "IRapidResultLocateResult": "rapidata.api_client.models.i_rapid_result_locate_result",
+    "IRapidResultModel": "rapidata.api_client.models.i_rapid_result_model",
+    "IRapidResultModelAttachCategoryResultModel": "rapidata.api_client.models.i_rapid_result_model_attach_category_result_model",
+    "IRapidResultModelBoundingBoxResultModel": "rapidata.api_client.models.i_rapid_result_model_bounding_box_result_model",
+    "IRapidResultModelCompareResultModel": "rapidata.api_client.models.i_rapid_result_model_compare_result_model",
+    "IRapidResultModelFreeTextResultModel": "rapidata.api_client.models.i_rapid_result_model_free_text_result_model",
+    "IRapidResultModelLineResultModel": "rapidata.api_client.models.i_rapid_result_model_line_result_model",
+    "IRapidResultModelLocateResultModel": "rapidata.api_client.models.i_rapid_result_model_locate_result_model",
+    "IRapidResultModelNamedEntityResultModel": "rapidata.api_client.models.i_rapid_result_model_named_entity_result_model",
+    "IRapidResultModelPolygonResultModel": "rapidata.api_client.models.i_rapid_result_model_polygon_result_model",
+    "IRapidResultModelScrubResultModel": "rapidata.api_client.models.i_rapid_result_model_scrub_result_model",
+    "IRapidResultModelSkipResultModel": "rapidata.api_client.models.i_rapid_result_model_skip_result_model",
+    "IRapidResultModelTranscriptionResultModel": "rapidata.api_client.models.i_rapid_result_model_transcription_result_model",
+    "IRapidResultNamedEntityResult": "rapidata.api_client.models.i_rapid_result_named_entity_result",
+    "IRapidResultPolygonResult": "rapidata.api_client.models.i_rapid_result_polygon_result",
+    "IRapidResultScrubResult": "rapidata.api_client.models.i_rapid_result_scrub_result",
+    "IRapidResultSkipResult": "rapidata.api_client.models.i_rapid_result_skip_result",
+    "IRapidResultTranscriptionResult": "rapidata.api_client.models.i_rapid_result_transcription_result",
+    "IRapidScrubRapid": "rapidata.api_client.models.i_rapid_scrub_rapid",
+    "IRapidTranscriptionRapid": "rapidata.api_client.models.i_rapid_transcription_rapid",
+    "IReferee": "rapidata.api_client.models.i_referee",
+    "IRefereeBudgetReferee": "rapidata.api_client.models.i_referee_budget_referee",
+    "IRefereeConfigModel": "rapidata.api_client.models.i_referee_config_model",
+    "IRefereeConfigModelBudgetRefereeConfigModel": "rapidata.api_client.models.i_referee_config_model_budget_referee_config_model",
+    "IRefereeConfigModelNaiveRefereeConfigModel": "rapidata.api_client.models.i_referee_config_model_naive_referee_config_model",
+    "IRefereeConfigModelNeverEndingRefereeConfigModel": "rapidata.api_client.models.i_referee_config_model_never_ending_referee_config_model",
+    "IRefereeConfigModelProbabilisticAttachCategoryRefereeConfigModel": "rapidata.api_client.models.i_referee_config_model_probabilistic_attach_category_referee_config_model",
+    "IRefereeConfigModelQuorumRefereeConfigModel": "rapidata.api_client.models.i_referee_config_model_quorum_referee_config_model",
+    "IRefereeEarlyStoppingReferee": "rapidata.api_client.models.i_referee_early_stopping_referee",
+    "IRefereeInfo": "rapidata.api_client.models.i_referee_info",
+    "IRefereeInfoModel": "rapidata.api_client.models.i_referee_info_model",
+    "IRefereeInfoModelNaiveRefereeInfoModel": "rapidata.api_client.models.i_referee_info_model_naive_referee_info_model",
+    "IRefereeInfoModelNeverEndingRefereeInfoModel": "rapidata.api_client.models.i_referee_info_model_never_ending_referee_info_model",
+    "IRefereeInfoModelProbabilisticAttachCategoryRefereeInfoModel": "rapidata.api_client.models.i_referee_info_model_probabilistic_attach_category_referee_info_model",
+    "IRefereeInfoModelQuorumRefereeInfoModel": "rapidata.api_client.models.i_referee_info_model_quorum_referee_info_model",
+    "IRefereeInfoNaiveRefereeInfo": "rapidata.api_client.models.i_referee_info_naive_referee_info",
+    "IRefereeInfoNeverEndingRefereeInfo": "rapidata.api_client.models.i_referee_info_never_ending_referee_info",
+    "IRefereeInfoProbabilisticAttachCategoryRefereeInfo": "rapidata.api_client.models.i_referee_info_probabilistic_attach_category_referee_info",
+    "IRefereeInfoQuorumRefereeInfo": "rapidata.api_client.models.i_referee_info_quorum_referee_info",
+    "IRefereeModel": "rapidata.api_client.models.i_referee_model",
+    "IRefereeModelBudgetRefereeModel": "rapidata.api_client.models.i_referee_model_budget_referee_model",
+    "IRefereeModelEarlyStoppingRefereeModel": "rapidata.api_client.models.i_referee_model_early_stopping_referee_model",
+    "IRefereeModelNaiveRefereeModel": "rapidata.api_client.models.i_referee_model_naive_referee_model",
+    "IRefereeModelQuorumRefereeModel": "rapidata.api_client.models.i_referee_model_quorum_referee_model",
+    "IRefereeNaiveReferee": "rapidata.api_client.models.i_referee_naive_referee",
+    "IRefereeQuorumReferee": "rapidata.api_client.models.i_referee_quorum_referee",
+    "IResponseAggregation": "rapidata.api_client.models.i_response_aggregation",
+    "IResponseAggregationClassifyAggregation": "rapidata.api_client.models.i_response_aggregation_classify_aggregation",
+    "IResponseAggregationCompareAggregation": "rapidata.api_client.models.i_response_aggregation_compare_aggregation",
+    "IResponseAggregationModel": "rapidata.api_client.models.i_response_aggregation_model",
+    "IResponseAggregationModelClassifyAggregationModel": "rapidata.api_client.models.i_response_aggregation_model_classify_aggregation_model",
+    "IResponseAggregationModelCompareAggregationModel": "rapidata.api_client.models.i_response_aggregation_model_compare_aggregation_model",
+    "ISampleByParticipant": "rapidata.api_client.models.i_sample_by_participant",
+    "ISampleByParticipantPlaceholderSampleByParticipant": "rapidata.api_client.models.i_sample_by_participant_placeholder_sample_by_participant",
+    "ISampleByParticipantSampleByParticipant": "rapidata.api_client.models.i_sample_by_participant_sample_by_participant",
+    "ISelection": "rapidata.api_client.models.i_selection",
+    "ISelectionAbTestSelection": "rapidata.api_client.models.i_selection_ab_test_selection",
+    "ISelectionCappedSelection": "rapidata.api_client.models.i_selection_capped_selection",
+    "ISelectionConditionalValidationSelection": "rapidata.api_client.models.i_selection_conditional_validation_selection",
+    "ISelectionDemographicSelection": "rapidata.api_client.models.i_selection_demographic_selection",
+    "ISelectionEffortCappedSelection": "rapidata.api_client.models.i_selection_effort_capped_selection",
+    "ISelectionLabelingSelection": "rapidata.api_client.models.i_selection_labeling_selection",
+    "ISelectionShufflingSelection": "rapidata.api_client.models.i_selection_shuffling_selection",
+    "ISelectionStaticSelection": "rapidata.api_client.models.i_selection_static_selection",
+    "ISelectionValidationSelection": "rapidata.api_client.models.i_selection_validation_selection",
+    "IUserFilter": "rapidata.api_client.models.i_user_filter",
+    "IUserFilterAgeUserFilter": "rapidata.api_client.models.i_user_filter_age_user_filter",
+    "IUserFilterAndUserFilter": "rapidata.api_client.models.i_user_filter_and_user_filter",
+    "IUserFilterCampaignUserFilter": "rapidata.api_client.models.i_user_filter_campaign_user_filter",
+    "IUserFilterCountryUserFilter": "rapidata.api_client.models.i_user_filter_country_user_filter",
+    "IUserFilterCustomUserFilter": "rapidata.api_client.models.i_user_filter_custom_user_filter",
+    "IUserFilterDeviceUserFilter": "rapidata.api_client.models.i_user_filter_device_user_filter",
+    "IUserFilterGenderUserFilter": "rapidata.api_client.models.i_user_filter_gender_user_filter",
+    "IUserFilterLanguageUserFilter": "rapidata.api_client.models.i_user_filter_language_user_filter",
+    "IUserFilterModel": "rapidata.api_client.models.i_user_filter_model",
+    "IUserFilterModelAgeUserFilterModel": "rapidata.api_client.models.i_user_filter_model_age_user_filter_model",
+    "IUserFilterModelAndUserFilterModel": "rapidata.api_client.models.i_user_filter_model_and_user_filter_model",
+    "IUserFilterModelCampaignUserFilterModel": "rapidata.api_client.models.i_user_filter_model_campaign_user_filter_model",
+    "IUserFilterModelCountryUserFilterModel": "rapidata.api_client.models.i_user_filter_model_country_user_filter_model",
+    "IUserFilterModelCustomUserFilterModel": "rapidata.api_client.models.i_user_filter_model_custom_user_filter_model",
+    "IUserFilterModelDeviceUserFilterModel": "rapidata.api_client.models.i_user_filter_model_device_user_filter_model",
+    "IUserFilterModelGenderUserFilterModel": "rapidata.api_client.models.i_user_filter_model_gender_user_filter_model",
+    "IUserFilterModelLanguageUserFilterModel": "rapidata.api_client.models.i_user_filter_model_language_user_filter_model",
+    "IUserFilterModelNewUserFilterModel": "rapidata.api_client.models.i_user_filter_model_new_user_filter_model",
+    "IUserFilterModelNotUserFilterModel": "rapidata.api_client.models.i_user_filter_model_not_user_filter_model",
+    "IUserFilterModelOrUserFilterModel": "rapidata.api_client.models.i_user_filter_model_or_user_filter_model",
+    "IUserFilterModelResponseCountUserFilterModel": "rapidata.api_client.models.i_user_filter_model_response_count_user_filter_model",
+    "IUserFilterModelUserScoreUserFilterModel": "rapidata.api_client.models.i_user_filter_model_user_score_user_filter_model",
+    "IUserFilterNewUserFilter": "rapidata.api_client.models.i_user_filter_new_user_filter",
+    "IUserFilterNotUserFilter": "rapidata.api_client.models.i_user_filter_not_user_filter",
+    "IUserFilterOrUserFilter": "rapidata.api_client.models.i_user_filter_or_user_filter",
+    "IUserFilterResponseCountUserFilter": "rapidata.api_client.models.i_user_filter_response_count_user_filter",
+    "IUserFilterUserScoreUserFilter": "rapidata.api_client.models.i_user_filter_user_score_user_filter",
+    "IValidationMetadataInput": "rapidata.api_client.models.i_validation_metadata_input",
+    "IValidationMetadataInputPromptAssetMetadataInput": "rapidata.api_client.models.i_validation_metadata_input_prompt_asset_metadata_input",
+    "IValidationMetadataInputPromptMetadataInput": "rapidata.api_client.models.i_validation_metadata_input_prompt_metadata_input",
+    "IValidationTruth": "rapidata.api_client.models.i_validation_truth",
+    "IValidationTruthAttachCategoryTruth": "rapidata.api_client.models.i_validation_truth_attach_category_truth",
+    "IValidationTruthBoundingBoxTruth": "rapidata.api_client.models.i_validation_truth_bounding_box_truth",
+    "IValidationTruthClassifyTruth": "rapidata.api_client.models.i_validation_truth_classify_truth",
+    "IValidationTruthCompareTruth": "rapidata.api_client.models.i_validation_truth_compare_truth",
+    "IValidationTruthEmptyValidationTruth": "rapidata.api_client.models.i_validation_truth_empty_validation_truth",
+    "IValidationTruthLineTruth": "rapidata.api_client.models.i_validation_truth_line_truth",
+    "IValidationTruthLocateBoxTruth": "rapidata.api_client.models.i_validation_truth_locate_box_truth",
+    "IValidationTruthModel": "rapidata.api_client.models.i_validation_truth_model",
+    "IValidationTruthModelAttachCategoryTruthModel": "rapidata.api_client.models.i_validation_truth_model_attach_category_truth_model",
+    "IValidationTruthModelBoundingBoxTruthModel": "rapidata.api_client.models.i_validation_truth_model_bounding_box_truth_model",
+    "IValidationTruthModelClassifyTruthModel": "rapidata.api_client.models.i_validation_truth_model_classify_truth_model",
+    "IValidationTruthModelCompareTruthModel": "rapidata.api_client.models.i_validation_truth_model_compare_truth_model",
+    "IValidationTruthModelEmptyValidationTruthModel": "rapidata.api_client.models.i_validation_truth_model_empty_validation_truth_model",
+    "IValidationTruthModelLineTruthModel": "rapidata.api_client.models.i_validation_truth_model_line_truth_model",
+    "IValidationTruthModelLocateBoxTruthModel": "rapidata.api_client.models.i_validation_truth_model_locate_box_truth_model",
+    "IValidationTruthModelMultiCompareTruthModel": "rapidata.api_client.models.i_validation_truth_model_multi_compare_truth_model",
+    "IValidationTruthModelNamedEntityTruthModel": "rapidata.api_client.models.i_validation_truth_model_named_entity_truth_model",
+    "IValidationTruthModelPolygonTruthModel": "rapidata.api_client.models.i_validation_truth_model_polygon_truth_model",
+    "IValidationTruthModelScrubTruthModel": "rapidata.api_client.models.i_validation_truth_model_scrub_truth_model",
+    "IValidationTruthModelSkipTruthModel": "rapidata.api_client.models.i_validation_truth_model_skip_truth_model",
+    "IValidationTruthModelTranscriptionTruthModel": "rapidata.api_client.models.i_validation_truth_model_transcription_truth_model",
+    "IValidationTruthMultiCompareTruth": "rapidata.api_client.models.i_validation_truth_multi_compare_truth",
+    "IValidationTruthNamedEntityTruth": "rapidata.api_client.models.i_validation_truth_named_entity_truth",
+    "IValidationTruthPolygonTruth": "rapidata.api_client.models.i_validation_truth_polygon_truth",
+    "IValidationTruthScrubTruth": "rapidata.api_client.models.i_validation_truth_scrub_truth",
+    "IValidationTruthSkipTruth": "rapidata.api_client.models.i_validation_truth_skip_truth",
+    "IValidationTruthTranscriptionTruth": "rapidata.api_client.models.i_validation_truth_transcription_truth",
+    "IWorkflowConfigCompareWorkflowConfig": "rapidata.api_client.models.i_workflow_config_compare_workflow_config",
+    "IWorkflowModel": "rapidata.api_client.models.i_workflow_model",
+    "IWorkflowModelCompareWorkflowModel": "rapidata.api_client.models.i_workflow_model_compare_workflow_model",
+    "IWorkflowModelEvaluationWorkflowModel": "rapidata.api_client.models.i_workflow_model_evaluation_workflow_model",
+    "IWorkflowModelGroupedRankingWorkflowModel": "rapidata.api_client.models.i_workflow_model_grouped_ranking_workflow_model",
+    "IWorkflowModelPagedResult": "rapidata.api_client.models.i_workflow_model_paged_result",
+    "IWorkflowModelRankingWorkflowModel": "rapidata.api_client.models.i_workflow_model_ranking_workflow_model",
+    "IWorkflowModelSimpleWorkflowModel": "rapidata.api_client.models.i_workflow_model_simple_workflow_model",
+    "IWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelAttachCategoryWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_attach_category_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelBoundingBoxWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_bounding_box_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelCompareWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_compare_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelFreeTextWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_free_text_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelLineWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_line_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelLocateWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_locate_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelNamedEntityWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_named_entity_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelPolygonWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_polygon_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelScrubWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_scrub_workflow_rapid_blueprint_model",
+    "IWorkflowRapidBlueprintModelTranscriptionWorkflowRapidBlueprintModel": "rapidata.api_client.models.i_workflow_rapid_blueprint_model_transcription_workflow_rapid_blueprint_model",
+    "IdentityReadBridgeTokenGet202Response": "rapidata.api_client.models.identity_read_bridge_token_get202_response",
+    "ImageDimensionMetadata": "rapidata.api_client.models.image_dimension_metadata",
+    "ImageDimensionMetadataModel": "rapidata.api_client.models.image_dimension_metadata_model",
+    "ImportFromFileResult": "rapidata.api_client.models.import_from_file_result",
+    "ImportValidationSetFromFileResult": "rapidata.api_client.models.import_validation_set_from_file_result",
+    "InProgressRapidModel": "rapidata.api_client.models.in_progress_rapid_model",
+    "InquireFileMetadataResult": "rapidata.api_client.models.inquire_file_metadata_result",
+    "InspectReportEndpointOutput": "rapidata.api_client.models.inspect_report_endpoint_output",
+    "InspectReportResult": "rapidata.api_client.models.inspect_report_result",
+    "InviteOrgMemberEndpointInput": "rapidata.api_client.models.invite_org_member_endpoint_input",
+    "InviteOrgMemberEndpointOutput": "rapidata.api_client.models.invite_org_member_endpoint_output",
+    "InvoiceStatus": "rapidata.api_client.models.invoice_status",
+    "IsRapidBagValidEndpointOutput": "rapidata.api_client.models.is_rapid_bag_valid_endpoint_output",
+    "IssueAuthTokenResult": "rapidata.api_client.models.issue_auth_token_result",
+    "IssueClientAuthTokenResult": "rapidata.api_client.models.issue_client_auth_token_result",
+    "JobDefinitionRevisionState": "rapidata.api_client.models.job_definition_revision_state",
+    "JobNavigationItem": "rapidata.api_client.models.job_navigation_item",
+    "JobRapidResult": "rapidata.api_client.models.job_rapid_result",
+    "JobResponse": "rapidata.api_client.models.job_response",
+    "JobShareLevel": "rapidata.api_client.models.job_share_level",
+    "JsonWebKey": "rapidata.api_client.models.json_web_key",
+    "JsonWebKeySet": "rapidata.api_client.models.json_web_key_set",
+    "LabelingSelection": "rapidata.api_client.models.labeling_selection",
+    "LabelingState": "rapidata.api_client.models.labeling_state",
+    "LanguageFilter": "rapidata.api_client.models.language_filter",
+    "LanguageUserFilterModel": "rapidata.api_client.models.language_user_filter_model",
+    "LeaderboardQueryResult": "rapidata.api_client.models.leaderboard_query_result",
+    "LeaderboardQueryResultPagedResult": "rapidata.api_client.models.leaderboard_query_result_paged_result",
+    "LeaderboardsQueryResult": "rapidata.api_client.models.leaderboards_query_result",
+    "LegacyIssueClientAuthTokenResult": "rapidata.api_client.models.legacy_issue_client_auth_token_result",
+    "LegacyRequestPasswordResetCommand": "rapidata.api_client.models.legacy_request_password_reset_command",
+    "LegacySubmitPasswordResetCommand": "rapidata.api_client.models.legacy_submit_password_reset_command",
+    "Line": "rapidata.api_client.models.line",
+    "LinePayload": "rapidata.api_client.models.line_payload",
+    "LinePoint": "rapidata.api_client.models.line_point",
+    "LineRapidBlueprint": "rapidata.api_client.models.line_rapid_blueprint",
+    "LineResult": "rapidata.api_client.models.line_result",
+    "LineResultLine": "rapidata.api_client.models.line_result_line",
+    "LineResultLinePoint": "rapidata.api_client.models.line_result_line_point",
+    "LineResultModelLine": "rapidata.api_client.models.line_result_model_line",
+    "LineResultModelLinePoint": "rapidata.api_client.models.line_result_model_line_point",
+    "LineTruth": "rapidata.api_client.models.line_truth",
+    "ListOrgInvitationsEndpointOutput": "rapidata.api_client.models.list_org_invitations_endpoint_output",
+    "ListOrgInvitationsEndpointOutputInvitation": "rapidata.api_client.models.list_org_invitations_endpoint_output_invitation",
+    "ListOrgMembersEndpointOutput": "rapidata.api_client.models.list_org_members_endpoint_output",
+    "ListOrgMembersEndpointOutputMember": "rapidata.api_client.models.list_org_members_endpoint_output_member",
+    "LocalFileWrapper": "rapidata.api_client.models.local_file_wrapper",
+    "LocateBoxTruth": "rapidata.api_client.models.locate_box_truth",
+    "LocateBoxTruthBox": "rapidata.api_client.models.locate_box_truth_box",
+    "LocateBoxTruthModelBox": "rapidata.api_client.models.locate_box_truth_model_box",
+    "LocateCoordinate": "rapidata.api_client.models.locate_coordinate",
+    "LocateCoordinateModel": "rapidata.api_client.models.locate_coordinate_model",
+    "LocatePayload": "rapidata.api_client.models.locate_payload",
+    "LocateRapidBlueprint": "rapidata.api_client.models.locate_rapid_blueprint",
+    "LocateResult": "rapidata.api_client.models.locate_result",
+    "LocationMetadata": "rapidata.api_client.models.location_metadata",
+    "LocationMetadataExistsFilterConfig": "rapidata.api_client.models.location_metadata_exists_filter_config",
+    "LocationMetadataModel": "rapidata.api_client.models.location_metadata_model",
+    "LoginModel": "rapidata.api_client.models.login_model",
+    "ManualChargeReason": "rapidata.api_client.models.manual_charge_reason",
+    "MatchupZone": "rapidata.api_client.models.matchup_zone",
+    "MembershipStatus": "rapidata.api_client.models.membership_status",
+    "MetadataIOrderMetadataInput": "rapidata.api_client.models.metadata_i_order_metadata_input",
+    "MetadataIOrderMetadataInputMetadataPromptAssetMetadataInput": "rapidata.api_client.models.metadata_i_order_metadata_input_metadata_prompt_asset_metadata_input",
+    "MetadataIOrderMetadataInputMetadataPromptMetadataInput": "rapidata.api_client.models.metadata_i_order_metadata_input_metadata_prompt_metadata_input",
+    "MetadataIOrderMetadataInputMetadataTranscriptionMetadataInput": "rapidata.api_client.models.metadata_i_order_metadata_input_metadata_transcription_metadata_input",
+    "MetadataPromptAssetMetadataInput": "rapidata.api_client.models.metadata_prompt_asset_metadata_input",
+    "MetadataPromptMetadataInput": "rapidata.api_client.models.metadata_prompt_metadata_input",
+    "MetadataTranscriptionMetadataInput": "rapidata.api_client.models.metadata_transcription_metadata_input",
+    "MetadataVisibilities": "rapidata.api_client.models.metadata_visibilities",
+    "ModelLicenseType": "rapidata.api_client.models.model_license_type",
+    "MultiAsset": "rapidata.api_client.models.multi_asset",
+    "MultiAssetAssetsInner": "rapidata.api_client.models.multi_asset_assets_inner",
+    "MultiAssetInput": "rapidata.api_client.models.multi_asset_input",
+    "MultiAssetInput1": "rapidata.api_client.models.multi_asset_input1",
+    "MultiAssetInput1AssetsInner": "rapidata.api_client.models.multi_asset_input1_assets_inner",
+    "MultiAssetInput2": "rapidata.api_client.models.multi_asset_input2",
+    "MultiAssetInput3": "rapidata.api_client.models.multi_asset_input3",
+    "MultiAssetInput3AssetsInner": "rapidata.api_client.models.multi_asset_input3_assets_inner",
+    "MultiAssetInputAssetsInner": "rapidata.api_client.models.multi_asset_input_assets_inner",
+    "MultiAssetModel": "rapidata.api_client.models.multi_asset_model",
+    "MultiAssetModel1": "rapidata.api_client.models.multi_asset_model1",
+    "MultiAssetModel1AssetsInner": "rapidata.api_client.models.multi_asset_model1_assets_inner",
+    "MultiAssetModel2": "rapidata.api_client.models.multi_asset_model2",
+    "MultiCompareTruth": "rapidata.api_client.models.multi_compare_truth",
+    "NaiveRefereeConfig": "rapidata.api_client.models.naive_referee_config",
+    "NaiveRefereeInfo": "rapidata.api_client.models.naive_referee_info",
+    "NaiveRefereeModel": "rapidata.api_client.models.naive_referee_model",
+    "NamedClassification": "rapidata.api_client.models.named_classification",
+    "NamedEntityPayload": "rapidata.api_client.models.named_entity_payload",
+    "NamedEntityRapidBlueprint": "rapidata.api_client.models.named_entity_rapid_blueprint",
+    "NamedEntityResult": "rapidata.api_client.models.named_entity_result",
+    "NamedEntityResultModelNamedClassification": "rapidata.api_client.models.named_entity_result_model_named_classification",
+    "NamedEntityResultNamedClassification": "rapidata.api_client.models.named_entity_result_named_classification",
+    "NamedEntityTruth": "rapidata.api_client.models.named_entity_truth",
+    "NamedEntityTruthModelNamedClassification": "rapidata.api_client.models.named_entity_truth_model_named_classification",
+    "NamedEntityTruthNamedClassification": "rapidata.api_client.models.named_entity_truth_named_classification",
+    "NeverEndingRefereeConfig": "rapidata.api_client.models.never_ending_referee_config",
+    "NeverEndingRefereeInfo": "rapidata.api_client.models.never_ending_referee_info",
+    "NewUserFilter": "rapidata.api_client.models.new_user_filter",
+    "NewUserFilterModel": "rapidata.api_client.models.new_user_filter_model",
+    "NewUserFilterModel1": "rapidata.api_client.models.new_user_filter_model1",
+    "NewsletterModel": "rapidata.api_client.models.newsletter_model",
+    "NoValidationWorkflowRapidSelectionConfig": "rapidata.api_client.models.no_validation_workflow_rapid_selection_config",
+    "NotAvailableYetResult": "rapidata.api_client.models.not_available_yet_result",
+    "NotFilter": "rapidata.api_client.models.not_filter",
+    "NotStartedRapidModel": "rapidata.api_client.models.not_started_rapid_model",
+    "NotUserFilterModel": "rapidata.api_client.models.not_user_filter_model",
+    "NullAsset": "rapidata.api_client.models.null_asset",
+    "NullAssetModel": "rapidata.api_client.models.null_asset_model",
+    "NullAssetModel1": "rapidata.api_client.models.null_asset_model1",
+    "NullAssetModel2": "rapidata.api_client.models.null_asset_model2",
+    "OnlinePairMakerConfig": "rapidata.api_client.models.online_pair_maker_config",
+    "OnlinePairMakerConfigModel": "rapidata.api_client.models.online_pair_maker_config_model",
+    "OnlinePairMakerInformation": "rapidata.api_client.models.online_pair_maker_information",
+    "OnlyValidationWorkflowRapidSelectionConfig": "rapidata.api_client.models.only_validation_workflow_rapid_selection_config",
+    "OptionOfAggregatorType": "rapidata.api_client.models.option_of_aggregator_type",
+    "OrFilter": "rapidata.api_client.models.or_filter",
+    "OrUserFilterModel": "rapidata.api_client.models.or_user_filter_model",
+    "OrderModel": "rapidata.api_client.models.order_model",
+    "OrderModelPagedResult": "rapidata.api_client.models.order_model_paged_result",
+    "OrderQueryGet200Response": "rapidata.api_client.models.order_query_get200_response",
+    "OrderState": "rapidata.api_client.models.order_state",
+    "OrgRole": "rapidata.api_client.models.org_role",
+    "Origin": "rapidata.api_client.models.origin",
+    "OriginalFilenameMetadata": "rapidata.api_client.models.original_filename_metadata",
+    "OriginalFilenameMetadataModel": "rapidata.api_client.models.original_filename_metadata_model",
+    "OutputBucket": "rapidata.api_client.models.output_bucket",
+    "OutputDataPoint": "rapidata.api_client.models.output_data_point",
+    "OutputDatapoint": "rapidata.api_client.models.output_datapoint",
+    "PagedResultAggregatedOrdersModel": "rapidata.api_client.models.paged_result_aggregated_orders_model",
+    "PagedResultBenchmarkQueryResult": "rapidata.api_client.models.paged_result_benchmark_query_result",
+    "PagedResultCampaignQueryResult": "rapidata.api_client.models.paged_result_campaign_query_result",
+    "PagedResultClientsQueryResult": "rapidata.api_client.models.paged_result_clients_query_result",
+    "PagedResultDatapointModel": "rapidata.api_client.models.paged_result_datapoint_model",
+    "PagedResultGetCompareWorkflowResultsResult": "rapidata.api_client.models.paged_result_get_compare_workflow_results_result",
+    "PagedResultGetGroupedRankingWorkflowResultsResult": "rapidata.api_client.models.paged_result_get_grouped_ranking_workflow_results_result",
+    "PagedResultGetValidationRapidsResult": "rapidata.api_client.models.paged_result_get_validation_rapids_result",
+    "PagedResultGetWorkflowResultsResult": "rapidata.api_client.models.paged_result_get_workflow_results_result",
+    "PagedResultIWorkflowModel": "rapidata.api_client.models.paged_result_i_workflow_model",
+    "PagedResultLeaderboardQueryResult": "rapidata.api_client.models.paged_result_leaderboard_query_result",
+    "PagedResultLeaderboardsQueryResult": "rapidata.api_client.models.paged_result_leaderboards_query_result",
+    "PagedResultOfAggregatedOrdersModel": "rapidata.api_client.models.paged_result_of_aggregated_orders_model",
+    "PagedResultOfBenchmarkQueryResult": "rapidata.api_client.models.paged_result_of_benchmark_query_result",
+    "PagedResultOfCampaignQueryResult": "rapidata.api_client.models.paged_result_of_campaign_query_result",
+    "PagedResultOfClientsQueryResult": "rapidata.api_client.models.paged_result_of_clients_query_result",
+    "PagedResultOfGetCompareWorkflowResultsResult": "rapidata.api_client.models.paged_result_of_get_compare_workflow_results_result",
+    "PagedResultOfGetValidationRapidsResult": "rapidata.api_client.models.paged_result_of_get_validation_rapids_result",
+    "PagedResultOfIBillingGroup": "rapidata.api_client.models.paged_result_of_i_billing_group",
+    "PagedResultOfIBillingGroupModel": "rapidata.api_client.models.paged_result_of_i_billing_group_model",
+    "PagedResultOfISampleByParticipant": "rapidata.api_client.models.paged_result_of_i_sample_by_participant",
+    "PagedResultOfIWorkflowModel": "rapidata.api_client.models.paged_result_of_i_workflow_model",
+    "PagedResultOfLeaderboardsQueryResult": "rapidata.api_client.models.paged_result_of_leaderboards_query_result",
+    "PagedResultOfOrderModel": "rapidata.api_client.models.paged_result_of_order_model",
+    "PagedResultOfParticipantByBenchmark": "rapidata.api_client.models.paged_result_of_participant_by_benchmark",
+    "PagedResultOfPromptByBenchmarkResult": "rapidata.api_client.models.paged_result_of_prompt_by_benchmark_result",
+    "PagedResultOfQueryAudiencesResult": "rapidata.api_client.models.paged_result_of_query_audiences_result",
+    "PagedResultOfQueryDatapointsByDatasetIdResult": "rapidata.api_client.models.paged_result_of_query_datapoints_by_dataset_id_result",
+    "PagedResultOfQueryJobDefinitionsResult": "rapidata.api_client.models.paged_result_of_query_job_definitions_result",
+    "PagedResultOfQueryJobRevisionsResult": "rapidata.api_client.models.paged_result_of_query_job_revisions_result",
+    "PagedResultOfQueryJobsResult": "rapidata.api_client.models.paged_result_of_query_jobs_result",
+    "PagedResultOfQueryRapidsForAudienceResult": "rapidata.api_client.models.paged_result_of_query_rapids_for_audience_result",
+    "PagedResultOfQueryRapidsOutput": "rapidata.api_client.models.paged_result_of_query_rapids_output",
+    "PagedResultOfQueryValidationRapidEligibilityResult": "rapidata.api_client.models.paged_result_of_query_validation_rapid_eligibility_result",
+    "PagedResultOfRapidModel": "rapidata.api_client.models.paged_result_of_rapid_model",
+    "PagedResultOfRunsByLeaderboardResult": "rapidata.api_client.models.paged_result_of_runs_by_leaderboard_result",
+    "PagedResultOfSampleByIdentifier": "rapidata.api_client.models.paged_result_of_sample_by_identifier",
+    "PagedResultOfSampleByParticipant": "rapidata.api_client.models.paged_result_of_sample_by_participant",
+    "PagedResultOfSimpleWorkflowResultOutput": "rapidata.api_client.models.paged_result_of_simple_workflow_result_output",
+    "PagedResultOfStandingByLeaderboard": "rapidata.api_client.models.paged_result_of_standing_by_leaderboard",
+    "PagedResultOfValidationSetModel": "rapidata.api_client.models.paged_result_of_validation_set_model",
+    "PagedResultOrderModel": "rapidata.api_client.models.paged_result_order_model",
+    "PagedResultParticipantByBenchmark": "rapidata.api_client.models.paged_result_participant_by_benchmark",
+    "PagedResultPotentialValidationRapid": "rapidata.api_client.models.paged_result_potential_validation_rapid",
+    "PagedResultPromptByBenchmarkResult": "rapidata.api_client.models.paged_result_prompt_by_benchmark_result",
+    "PagedResultQueryAudiencesResult": "rapidata.api_client.models.paged_result_query_audiences_result",
+    "PagedResultQueryDatapointsByDatasetIdResult": "rapidata.api_client.models.paged_result_query_datapoints_by_dataset_id_result",
+    "PagedResultQueryValidationRapidEligibilityResult": "rapidata.api_client.models.paged_result_query_validation_rapid_eligibility_result",
+    "PagedResultRapidModel": "rapidata.api_client.models.paged_result_rapid_model",
+    "PagedResultRunsByLeaderboardResult": "rapidata.api_client.models.paged_result_runs_by_leaderboard_result",
+    "PagedResultSampleByIdentifier": "rapidata.api_client.models.paged_result_sample_by_identifier",
+    "PagedResultSampleByParticipant": "rapidata.api_client.models.paged_result_sample_by_participant",
+    "PagedResultStandingByLeaderboard": "rapidata.api_client.models.paged_result_standing_by_leaderboard",
+    "PagedResultValidationSetModel": "rapidata.api_client.models.paged_result_validation_set_model",
+    "ParticipantByBenchmark": "rapidata.api_client.models.participant_by_benchmark",
+    "ParticipantByBenchmarkPagedResult": "rapidata.api_client.models.participant_by_benchmark_paged_result",
+    "ParticipantByLeaderboard": "rapidata.api_client.models.participant_by_leaderboard",
+    "ParticipantByLeaderboardPagedResult": "rapidata.api_client.models.participant_by_leaderboard_paged_result",
+    "ParticipantStatus": "rapidata.api_client.models.participant_status",
+    "PidBatchMode": "rapidata.api_client.models.pid_batch_mode",
+    "PipelineEloRankingConfig": "rapidata.api_client.models.pipeline_elo_ranking_config",
+    "PipelineIdWorkflowArtifactIdPutRequest": "rapidata.api_client.models.pipeline_id_workflow_artifact_id_put_request",
+    "PipelineIdWorkflowConfigPutRequest": "rapidata.api_client.models.pipeline_id_workflow_config_put_request",
+    "PipelineIdWorkflowPutRequest": "rapidata.api_client.models.pipeline_id_workflow_put_request",
+    "PolygonCoordinate": "rapidata.api_client.models.polygon_coordinate",
+    "PolygonPayload": "rapidata.api_client.models.polygon_payload",
+    "PolygonRapidBlueprint": "rapidata.api_client.models.polygon_rapid_blueprint",
+    "PolygonResult": "rapidata.api_client.models.polygon_result",
+    "PolygonResultCoordinate": "rapidata.api_client.models.polygon_result_coordinate",
+    "PolygonResultModelCoordinate": "rapidata.api_client.models.polygon_result_model_coordinate",
+    "PolygonResultModelShape": "rapidata.api_client.models.polygon_result_model_shape",
+    "PolygonResultShape": "rapidata.api_client.models.polygon_result_shape",
+    "PolygonShape": "rapidata.api_client.models.polygon_shape",
+    "PolygonTruth": "rapidata.api_client.models.polygon_truth",
+    "PotentialValidationRapid": "rapidata.api_client.models.potential_validation_rapid",
+    "PotentialValidationRapidPagedResult": "rapidata.api_client.models.potential_validation_rapid_paged_result",
+    "PotentialValidationRapidTruth": "rapidata.api_client.models.potential_validation_rapid_truth",
+    "PreArrangedPairMakerConfig": "rapidata.api_client.models.pre_arranged_pair_maker_config",
+    "PreArrangedPairMakerConfigModel": "rapidata.api_client.models.pre_arranged_pair_maker_config_model",
+    "PreArrangedPairMakerInformation": "rapidata.api_client.models.pre_arranged_pair_maker_information",
+    "PreliminaryDownloadModel": "rapidata.api_client.models.preliminary_download_model",
+    "PreliminaryDownloadResult": "rapidata.api_client.models.preliminary_download_result",
+    "PreviewOrderEndpointInput": "rapidata.api_client.models.preview_order_endpoint_input",
+    "PreviewOrderModel": "rapidata.api_client.models.preview_order_model",
+    "PrivateTextMetadataInput": "rapidata.api_client.models.private_text_metadata_input",
+    "ProbabilisticAttachCategoryRefereeConfig": "rapidata.api_client.models.probabilistic_attach_category_referee_config",
+    "ProbabilisticAttachCategoryRefereeInfo": "rapidata.api_client.models.probabilistic_attach_category_referee_info",
+    "ProblemDetails": "rapidata.api_client.models.problem_details",
+    "ProgramCase": "rapidata.api_client.models.program_case",
+    "ProgramCaseModel": "rapidata.api_client.models.program_case_model",
+    "ProgramComparison": "rapidata.api_client.models.program_comparison",
+    "ProgramComparisonModel": "rapidata.api_client.models.program_comparison_model",
+    "PromptAssetMetadataInput": "rapidata.api_client.models.prompt_asset_metadata_input",
+    "PromptAssetMetadataInputAsset": "rapidata.api_client.models.prompt_asset_metadata_input_asset",
+    "PromptByBenchmarkResult": "rapidata.api_client.models.prompt_by_benchmark_result",
+    "PromptByBenchmarkResultPagedResult": "rapidata.api_client.models.prompt_by_benchmark_result_paged_result",
+    "PromptByLeaderboardResult": "rapidata.api_client.models.prompt_by_leaderboard_result",
+    "PromptByLeaderboardResultPagedResult": "rapidata.api_client.models.prompt_by_leaderboard_result_paged_result",
+    "PromptEmbeddingMapStatus": "rapidata.api_client.models.prompt_embedding_map_status",
+    "PromptMetadata": "rapidata.api_client.models.prompt_metadata",
+    "PromptMetadataInput": "rapidata.api_client.models.prompt_metadata_input",
+    "PromptMetadataModel": "rapidata.api_client.models.prompt_metadata_model",
+    "PromptType": "rapidata.api_client.models.prompt_type",
+    "ProxyFileWrapper": "rapidata.api_client.models.proxy_file_wrapper",
+    "PublicOrderModel": "rapidata.api_client.models.public_order_model",
+    "PublicRapidResponse": "rapidata.api_client.models.public_rapid_response",
+    "PublicTextMetadataInput": "rapidata.api_client.models.public_text_metadata_input",
+    "QueryAggregatedJobsEndpointOutput": "rapidata.api_client.models.query_aggregated_jobs_endpoint_output",
+    "QueryAggregatedJobsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_aggregated_jobs_endpoint_paged_result_of_output",
+    "QueryAggregatedOrdersEndpointOutput": "rapidata.api_client.models.query_aggregated_orders_endpoint_output",
+    "QueryAggregatedOrdersEndpointPagedResultOfOutput": "rapidata.api_client.models.query_aggregated_orders_endpoint_paged_result_of_output",
+    "QueryAllOrganizationsEndpointOutput": "rapidata.api_client.models.query_all_organizations_endpoint_output",
+    "QueryAllOrganizationsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_all_organizations_endpoint_paged_result_of_output",
+    "QueryAudienceJobsEndpointOutput": "rapidata.api_client.models.query_audience_jobs_endpoint_output",
+    "QueryAudienceJobsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_audience_jobs_endpoint_paged_result_of_output",
+    "QueryAudiencesEndpointOutput": "rapidata.api_client.models.query_audiences_endpoint_output",
+    "QueryAudiencesEndpointPagedResultOfOutput": "rapidata.api_client.models.query_audiences_endpoint_paged_result_of_output",
+    "QueryAudiencesResult": "rapidata.api_client.models.query_audiences_result",
+    "QueryBenchmarkStandingsEndpointOutput": "rapidata.api_client.models.query_benchmark_standings_endpoint_output",
+    "QueryBenchmarkStandingsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_benchmark_standings_endpoint_paged_result_of_output",
+    "QueryBenchmarksEndpointOutput": "rapidata.api_client.models.query_benchmarks_endpoint_output",
+    "QueryBenchmarksEndpointPagedResultOfOutput": "rapidata.api_client.models.query_benchmarks_endpoint_paged_result_of_output",
+    "QueryBillingPeriodsEndpointOutput": "rapidata.api_client.models.query_billing_periods_endpoint_output",
+    "QueryBillingPeriodsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_billing_periods_endpoint_paged_result_of_output",
+    "QueryCampaignsEndpointOutput": "rapidata.api_client.models.query_campaigns_endpoint_output",
+    "QueryCampaignsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_campaigns_endpoint_paged_result_of_output",
+    "QueryCampaignsModel": "rapidata.api_client.models.query_campaigns_model",
+    "QueryClientsEndpointOutput": "rapidata.api_client.models.query_clients_endpoint_output",
+    "QueryClientsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_clients_endpoint_paged_result_of_output",
+    "QueryCombinedMatrixByBenchmarksEndpointOutput": "rapidata.api_client.models.query_combined_matrix_by_benchmarks_endpoint_output",
+    "QueryCombinedMatrixByLeaderboardsEndpointOutput": "rapidata.api_client.models.query_combined_matrix_by_leaderboards_endpoint_output",
+    "QueryCombinedStandingsByBenchmarksEndpointOutput": "rapidata.api_client.models.query_combined_standings_by_benchmarks_endpoint_output",
+    "QueryCombinedStandingsByBenchmarksEndpointOutputItem": "rapidata.api_client.models.query_combined_standings_by_benchmarks_endpoint_output_item",
+    "QueryCombinedStandingsByLeaderboardsEndpointOutput": "rapidata.api_client.models.query_combined_standings_by_leaderboards_endpoint_output",
+    "QueryCombinedStandingsByLeaderboardsEndpointOutputItem": "rapidata.api_client.models.query_combined_standings_by_leaderboards_endpoint_output_item",
+    "QueryCostsByCustomerEndpointOutput": "rapidata.api_client.models.query_costs_by_customer_endpoint_output",
+    "QueryCostsByCustomerEndpointPagedResultOfOutput": "rapidata.api_client.models.query_costs_by_customer_endpoint_paged_result_of_output",
+    "QueryCostsByOrganizationEndpointOutput": "rapidata.api_client.models.query_costs_by_organization_endpoint_output",
+    "QueryCostsByOrganizationEndpointPagedResultOfOutput": "rapidata.api_client.models.query_costs_by_organization_endpoint_paged_result_of_output",
+    "QueryCustomersEndpointOutput": "rapidata.api_client.models.query_customers_endpoint_output",
+    "QueryCustomersEndpointPagedResultOfOutput": "rapidata.api_client.models.query_customers_endpoint_paged_result_of_output",
+    "QueryDatapointsByDatasetIdEndpointOutput": "rapidata.api_client.models.query_datapoints_by_dataset_id_endpoint_output",
+    "QueryDatapointsByDatasetIdEndpointPagedResultOfOutput": "rapidata.api_client.models.query_datapoints_by_dataset_id_endpoint_paged_result_of_output",
+    "QueryDatapointsByDatasetIdResult": "rapidata.api_client.models.query_datapoints_by_dataset_id_result",
+    "QueryExamplesForAudienceEndpointOutput": "rapidata.api_client.models.query_examples_for_audience_endpoint_output",
+    "QueryExamplesForAudienceEndpointPagedResultOfOutput": "rapidata.api_client.models.query_examples_for_audience_endpoint_paged_result_of_output",
+    "QueryExternalAudiencesEndpointOutput": "rapidata.api_client.models.query_external_audiences_endpoint_output",
+    "QueryExternalAudiencesEndpointPagedResultOfOutput": "rapidata.api_client.models.query_external_audiences_endpoint_paged_result_of_output",
+    "QueryFlaggedRapidsEndpointOutput": "rapidata.api_client.models.query_flagged_rapids_endpoint_output",
+    "QueryFlaggedRapidsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_flagged_rapids_endpoint_paged_result_of_output",
+    "QueryFlowItemsEndpointOutput": "rapidata.api_client.models.query_flow_items_endpoint_output",
+    "QueryFlowItemsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_flow_items_endpoint_paged_result_of_output",
+    "QueryFlowsEndpointOutput": "rapidata.api_client.models.query_flows_endpoint_output",
+    "QueryFlowsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_flows_endpoint_paged_result_of_output",
+    "QueryImagesByBenchmarkEndpointOutput": "rapidata.api_client.models.query_images_by_benchmark_endpoint_output",
+    "QueryImagesByBenchmarkEndpointOutputImage": "rapidata.api_client.models.query_images_by_benchmark_endpoint_output_image",
+    "QueryImagesByBenchmarkEndpointOutputPrompt": "rapidata.api_client.models.query_images_by_benchmark_endpoint_output_prompt",
+    "QueryInvoicesEndpointOutput": "rapidata.api_client.models.query_invoices_endpoint_output",
+    "QueryInvoicesEndpointPagedResultOfOutput": "rapidata.api_client.models.query_invoices_endpoint_paged_result_of_output",
+    "QueryJobDefinitionsEndpointOutput": "rapidata.api_client.models.query_job_definitions_endpoint_output",
+    "QueryJobDefinitionsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_job_definitions_endpoint_paged_result_of_output",
+    "QueryJobDefinitionsResult": "rapidata.api_client.models.query_job_definitions_result",
+    "QueryJobRevisionsEndpointOutput": "rapidata.api_client.models.query_job_revisions_endpoint_output",
+    "QueryJobRevisionsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_job_revisions_endpoint_paged_result_of_output",
+    "QueryJobRevisionsResult": "rapidata.api_client.models.query_job_revisions_result",
+    "QueryJobsEndpointOutput": "rapidata.api_client.models.query_jobs_endpoint_output",
+    "QueryJobsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_jobs_endpoint_paged_result_of_output",
+    "QueryJobsResult": "rapidata.api_client.models.query_jobs_result",
+    "QueryLeaderboardRunsEndpointOutput": "rapidata.api_client.models.query_leaderboard_runs_endpoint_output",
+    "QueryLeaderboardRunsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_leaderboard_runs_endpoint_paged_result_of_output",
+    "QueryLeaderboardsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_leaderboards_by_benchmark_endpoint_output",
+    "QueryLeaderboardsByBenchmarkEndpointPagedResultOfOutput": "rapidata.api_client.models.query_leaderboards_by_benchmark_endpoint_paged_result_of_output",
+    "QueryLeaderboardsEndpointOutput": "rapidata.api_client.models.query_leaderboards_endpoint_output",
+    "QueryLeaderboardsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_leaderboards_endpoint_paged_result_of_output",
+    "QueryManagedBenchmarksEndpointOutput": "rapidata.api_client.models.query_managed_benchmarks_endpoint_output",
+    "QueryManagedBenchmarksEndpointPagedResultOfOutput": "rapidata.api_client.models.query_managed_benchmarks_endpoint_paged_result_of_output",
+    "QueryMatchupsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_matchups_by_benchmark_endpoint_output",
+    "QueryMatchupsByBenchmarkEndpointOutputCorpus": "rapidata.api_client.models.query_matchups_by_benchmark_endpoint_output_corpus",
+    "QueryMatchupsByBenchmarkEndpointOutputLeaderboard": "rapidata.api_client.models.query_matchups_by_benchmark_endpoint_output_leaderboard",
+    "QueryMatchupsByBenchmarkEndpointOutputMatchup": "rapidata.api_client.models.query_matchups_by_benchmark_endpoint_output_matchup",
+    "QueryMatchupsByBenchmarkEndpointOutputPromptDetails": "rapidata.api_client.models.query_matchups_by_benchmark_endpoint_output_prompt_details",
+    "QueryMatchupsByBenchmarkEndpointOutputSide": "rapidata.api_client.models.query_matchups_by_benchmark_endpoint_output_side",
+    "QueryMatrixByBenchmarkEndpointOutput": "rapidata.api_client.models.query_matrix_by_benchmark_endpoint_output",
+    "QueryMatrixByLeaderboardEndpointOutput": "rapidata.api_client.models.query_matrix_by_leaderboard_endpoint_output",
+    "QueryOrdersEndpointOutput": "rapidata.api_client.models.query_orders_endpoint_output",
+    "QueryOrdersEndpointPagedResultOfOutput": "rapidata.api_client.models.query_orders_endpoint_paged_result_of_output",
+    "QueryOrdersModel": "rapidata.api_client.models.query_orders_model",
+    "QueryOrganizationsEndpointOutput": "rapidata.api_client.models.query_organizations_endpoint_output",
+    "QueryOrganizationsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_organizations_endpoint_paged_result_of_output",
+    "QueryOwnerTierOverridesEndpointOutput": "rapidata.api_client.models.query_owner_tier_overrides_endpoint_output",
+    "QueryParticipantsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_participants_by_benchmark_endpoint_output",
+    "QueryParticipantsByBenchmarkEndpointPagedResultOfOutput": "rapidata.api_client.models.query_participants_by_benchmark_endpoint_paged_result_of_output",
+    "QueryParticipantsObsoleteEndpointOutput": "rapidata.api_client.models.query_participants_obsolete_endpoint_output",
+    "QueryParticipantsObsoleteEndpointOutputItem": "rapidata.api_client.models.query_participants_obsolete_endpoint_output_item",
+    "QueryPromptRatingsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output",
+    "QueryPromptRatingsByBenchmarkEndpointOutputCorpus": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output_corpus",
+    "QueryPromptRatingsByBenchmarkEndpointOutputEntry": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output_entry",
+    "QueryPromptRatingsByBenchmarkEndpointOutputEntryImage": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output_entry_image",
+    "QueryPromptRatingsByBenchmarkEndpointOutputMatrix": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output_matrix",
+    "QueryPromptRatingsByBenchmarkEndpointOutputPrompt": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output_prompt",
+    "QueryPromptRatingsByBenchmarkEndpointOutputPromptDetails": "rapidata.api_client.models.query_prompt_ratings_by_benchmark_endpoint_output_prompt_details",
+    "QueryPublicJobDefinitionsEndpointOutput": "rapidata.api_client.models.query_public_job_definitions_endpoint_output",
+    "QueryPublicJobDefinitionsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_public_job_definitions_endpoint_paged_result_of_output",
+    "QueryPublishedBenchmarksEndpointOutput": "rapidata.api_client.models.query_published_benchmarks_endpoint_output",
+    "QueryPublishedBenchmarksEndpointPagedResultOfOutput": "rapidata.api_client.models.query_published_benchmarks_endpoint_paged_result_of_output",
+    "QueryRapidsForAudienceResult": "rapidata.api_client.models.query_rapids_for_audience_result",
+    "QueryRapidsOutput": "rapidata.api_client.models.query_rapids_output",
+    "QuerySampleGenerationsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_sample_generations_by_benchmark_endpoint_output",
+    "QuerySampleGenerationsByBenchmarkEndpointPagedResultOfOutput": "rapidata.api_client.models.query_sample_generations_by_benchmark_endpoint_paged_result_of_output",
+    "QuerySharedJobsEndpointOutput": "rapidata.api_client.models.query_shared_jobs_endpoint_output",
+    "QuerySharedJobsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_shared_jobs_endpoint_paged_result_of_output",
+    "QuerySignalRunsEndpointOutput": "rapidata.api_client.models.query_signal_runs_endpoint_output",
+    "QuerySignalRunsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_signal_runs_endpoint_paged_result_of_output",
+    "QuerySignalsEndpointOutput": "rapidata.api_client.models.query_signals_endpoint_output",
+    "QuerySignalsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_signals_endpoint_paged_result_of_output",
+    "QueryStandingsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_standings_by_benchmark_endpoint_output",
+    "QueryStandingsByBenchmarkEndpointOutputItem": "rapidata.api_client.models.query_standings_by_benchmark_endpoint_output_item",
+    "QueryStandingsByLeaderboardEndpointOutput": "rapidata.api_client.models.query_standings_by_leaderboard_endpoint_output",
+    "QueryStandingsByLeaderboardEndpointOutputItem": "rapidata.api_client.models.query_standings_by_leaderboard_endpoint_output_item",
+    "QueryStandingsEndpointOutput": "rapidata.api_client.models.query_standings_endpoint_output",
+    "QueryStandingsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_standings_endpoint_paged_result_of_output",
+    "QueryTagsByBenchmarkEndpointOutput": "rapidata.api_client.models.query_tags_by_benchmark_endpoint_output",
+    "QueryValidationFeedbacksEndpointOutput": "rapidata.api_client.models.query_validation_feedbacks_endpoint_output",
+    "QueryValidationFeedbacksEndpointPagedResultOfOutput": "rapidata.api_client.models.query_validation_feedbacks_endpoint_paged_result_of_output",
+    "QueryValidationModel": "rapidata.api_client.models.query_validation_model",
+    "QueryValidationRapidEligibilityEndpointOutput": "rapidata.api_client.models.query_validation_rapid_eligibility_endpoint_output",
+    "QueryValidationRapidEligibilityEndpointPagedResultOfOutput": "rapidata.api_client.models.query_validation_rapid_eligibility_endpoint_paged_result_of_output",
+    "QueryValidationRapidEligibilityModelQueryValidationModel": "rapidata.api_client.models.query_validation_rapid_eligibility_model_query_validation_model",
+    "QueryValidationRapidEligibilityResult": "rapidata.api_client.models.query_validation_rapid_eligibility_result",
+    "QueryValidationRapidEligibilityResultTruth": "rapidata.api_client.models.query_validation_rapid_eligibility_result_truth",
+    "QueryValidationRapidsResult": "rapidata.api_client.models.query_validation_rapids_result",
+    "QueryValidationRapidsResultAsset": "rapidata.api_client.models.query_validation_rapids_result_asset",
+    "QueryValidationRapidsResultPagedResult": "rapidata.api_client.models.query_validation_rapids_result_paged_result",
+    "QueryValidationRapidsResultPayload": "rapidata.api_client.models.query_validation_rapids_result_payload",
+    "QueryValidationRapidsResultTruth": "rapidata.api_client.models.query_validation_rapids_result_truth",
+    "QueryValidationSetModel": "rapidata.api_client.models.query_validation_set_model",
+    "QueryValidationSetsEndpointOutput": "rapidata.api_client.models.query_validation_sets_endpoint_output",
+    "QueryValidationSetsEndpointPagedResultOfOutput": "rapidata.api_client.models.query_validation_sets_endpoint_paged_result_of_output",
+    "QueryVouchersEndpointOutput": "rapidata.api_client.models.query_vouchers_endpoint_output",
+    "QueryVouchersEndpointPagedResultOfOutput": "rapidata.api_client.models.query_vouchers_endpoint_paged_result_of_output",
+    "QueryWorkflowsModel": "rapidata.api_client.models.query_workflows_model",
+    "RankedDatapointModel": "rapidata.api_client.models.ranked_datapoint_model",
+    "RankingDatapoint": "rapidata.api_client.models.ranking_datapoint",
+    "RapidAnswer": "rapidata.api_client.models.rapid_answer",
+    "RapidAnswerResult": "rapidata.api_client.models.rapid_answer_result",
+    "RapidIssue": "rapidata.api_client.models.rapid_issue",
+    "RapidIssueModel": "rapidata.api_client.models.rapid_issue_model",
+    "RapidModality": "rapidata.api_client.models.rapid_modality",
+    "RapidModel": "rapidata.api_client.models.rapid_model",
+    "RapidModelPagedResult": "rapidata.api_client.models.rapid_model_paged_result",
+    "RapidModelReferee": "rapidata.api_client.models.rapid_model_referee",
+    "RapidResponse": "rapidata.api_client.models.rapid_response",
+    "RapidResponseResult": "rapidata.api_client.models.rapid_response_result",
+    "RapidResultModel": "rapidata.api_client.models.rapid_result_model",
+    "RapidResultModelResult": "rapidata.api_client.models.rapid_result_model_result",
+    "RapidSkippedModel": "rapidata.api_client.models.rapid_skipped_model",
+    "RapidState": "rapidata.api_client.models.rapid_state",
+    "RapidStateModel": "rapidata.api_client.models.rapid_state_model",
+    "RatingGrouping": "rapidata.api_client.models.rating_grouping",
+    "ReadBridgeTokenEndpointKeysOutput": "rapidata.api_client.models.read_bridge_token_endpoint_keys_output",
+    "ReadBridgeTokenEndpointNotAvailableOutput": "rapidata.api_client.models.read_bridge_token_endpoint_not_available_output",
+    "ReadBridgeTokenKeysResult": "rapidata.api_client.models.read_bridge_token_keys_result",
+    "RebalanceLeaderboardEndpointInput": "rapidata.api_client.models.rebalance_leaderboard_endpoint_input",
+    "ReconciliationJobState": "rapidata.api_client.models.reconciliation_job_state",
+    "ReconciliationTimestampMode": "rapidata.api_client.models.reconciliation_timestamp_mode",
+    "RecreateExternalAudiencesEndpointInput": "rapidata.api_client.models.recreate_external_audiences_endpoint_input",
+    "ReferenceAssetInput": "rapidata.api_client.models.reference_asset_input",
+    "RegisterTemporaryCustomerModel": "rapidata.api_client.models.register_temporary_customer_model",
+    "RegisterTemporaryCustomerResult": "rapidata.api_client.models.register_temporary_customer_result",
+    "ReplicateModelParameterType": "rapidata.api_client.models.replicate_model_parameter_type",
+    "ReportModel": "rapidata.api_client.models.report_model",
+    "ReportRapidEndpointInput": "rapidata.api_client.models.report_rapid_endpoint_input",
+    "RequestPasswordResetCommand": "rapidata.api_client.models.request_password_reset_command",
+    "ResettleBillingPeriodEndpointInput": "rapidata.api_client.models.resettle_billing_period_endpoint_input",
+    "ResettleBillingPeriodEndpointOutput": "rapidata.api_client.models.resettle_billing_period_endpoint_output",
+    "ResponseCountFilter": "rapidata.api_client.models.response_count_filter",
+    "ResponseCountUserFilterModel": "rapidata.api_client.models.response_count_user_filter_model",
+    "ResponseTally": "rapidata.api_client.models.response_tally",
+    "ResponseTallyModel": "rapidata.api_client.models.response_tally_model",
+    "RestartRapidsEndpointInput": "rapidata.api_client.models.restart_rapids_endpoint_input",
+    "RetrievalMode": "rapidata.api_client.models.retrieval_mode",
+    "RetrySampleGenerationEndpointInput": "rapidata.api_client.models.retry_sample_generation_endpoint_input",
+    "RetrySampleGenerationEndpointOutput": "rapidata.api_client.models.retry_sample_generation_endpoint_output",
+    "ReviewReason": "rapidata.api_client.models.review_reason",
+    "ReviewReasonModel": "rapidata.api_client.models.review_reason_model",
+    "RevokeBidderRelationEndpointInput": "rapidata.api_client.models.revoke_bidder_relation_endpoint_input",
+    "RevokeExternalAppRelationEndpointInput": "rapidata.api_client.models.revoke_external_app_relation_endpoint_input",
+    "RevokePlatformRelationEndpointInput": "rapidata.api_client.models.revoke_platform_relation_endpoint_input",
+    "RunStatus": "rapidata.api_client.models.run_status",
+    "RunsByLeaderboardResult": "rapidata.api_client.models.runs_by_leaderboard_result",
+    "RunsByLeaderboardResultPagedResult": "rapidata.api_client.models.runs_by_leaderboard_result_paged_result",
+    "SampleByIdentifier": "rapidata.api_client.models.sample_by_identifier",
+    "SampleByIdentifierPagedResult": "rapidata.api_client.models.sample_by_identifier_paged_result",
+    "SampleByParticipant": "rapidata.api_client.models.sample_by_participant",
+    "SampleByParticipantPagedResult": "rapidata.api_client.models.sample_by_participant_paged_result",
+    "SampleGenerationItemStatus": "rapidata.api_client.models.sample_generation_item_status",
+    "SampleGenerationStatus": "rapidata.api_client.models.sample_generation_status",
+    "ScrubPayload": "rapidata.api_client.models.scrub_payload",
+    "ScrubRange": "rapidata.api_client.models.scrub_range",
+    "ScrubRapidBlueprint": "rapidata.api_client.models.scrub_rapid_blueprint",
+    "ScrubResult": "rapidata.api_client.models.scrub_result",
+    "ScrubTruth": "rapidata.api_client.models.scrub_truth",
+    "ScrubTruthModelScrubRange": "rapidata.api_client.models.scrub_truth_model_scrub_range",
+    "ScrubTruthScrubRange": "rapidata.api_client.models.scrub_truth_scrub_range",
+    "SearchReplicateModelsEndpointModel": "rapidata.api_client.models.search_replicate_models_endpoint_model",
+    "SearchReplicateModelsEndpointOutput": "rapidata.api_client.models.search_replicate_models_endpoint_output",
+    "SendCompletionMailStepModel": "rapidata.api_client.models.send_completion_mail_step_model",
+    "SendSurveyEndpointInput": "rapidata.api_client.models.send_survey_endpoint_input",
+    "SendSurveyModel": "rapidata.api_client.models.send_survey_model",
+    "SetCreditLineEndpointInput": "rapidata.api_client.models.set_credit_line_endpoint_input",
+    "SetFastBidMultiplierEndpointInput": "rapidata.api_client.models.set_fast_bid_multiplier_endpoint_input",
+    "SetFastBidMultiplierEndpointOutput": "rapidata.api_client.models.set_fast_bid_multiplier_endpoint_output",
+    "SetManualGlobalBoostLevelEndpointInput": "rapidata.api_client.models.set_manual_global_boost_level_endpoint_input",
+    "SetMinimumSpendCommitmentEndpointInput": "rapidata.api_client.models.set_minimum_spend_commitment_endpoint_input",
+    "SetOrganizationCreditLineEndpointInput": "rapidata.api_client.models.set_organization_credit_line_endpoint_input",
+    "SetOrganizationSupportSlackChannelEndpointInput": "rapidata.api_client.models.set_organization_support_slack_channel_endpoint_input",
+    "SetPlatformFeeEndpointInput": "rapidata.api_client.models.set_platform_fee_endpoint_input",
+    "Shape": "rapidata.api_client.models.shape",
+    "ShortenContextEndpointInput": "rapidata.api_client.models.shorten_context_endpoint_input",
+    "ShortenContextEndpointInputItem": "rapidata.api_client.models.shorten_context_endpoint_input_item",
+    "ShortenContextEndpointOutput": "rapidata.api_client.models.shorten_context_endpoint_output",
+    "ShortenContextEndpointOutputItem": "rapidata.api_client.models.shorten_context_endpoint_output_item",
+    "ShufflingSelection": "rapidata.api_client.models.shuffling_selection",
+    "SignalRunStatus": "rapidata.api_client.models.signal_run_status",
+    "SignalRunTriggerSource": "rapidata.api_client.models.signal_run_trigger_source",
+    "SignupCustomerModel": "rapidata.api_client.models.signup_customer_model",
+    "SignupShadowCustomerModel": "rapidata.api_client.models.signup_shadow_customer_model",
+    "SimpleWorkflowConfig": "rapidata.api_client.models.simple_workflow_config",
+    "SimpleWorkflowConfigBlueprint": "rapidata.api_client.models.simple_workflow_config_blueprint",
+    "SimpleWorkflowConfigModel": "rapidata.api_client.models.simple_workflow_config_model",
+    "SimpleWorkflowConfigModelBlueprint": "rapidata.api_client.models.simple_workflow_config_model_blueprint",
+    "SimpleWorkflowGetResultOverviewGet200Response": "rapidata.api_client.models.simple_workflow_get_result_overview_get200_response",
+    "SimpleWorkflowModel": "rapidata.api_client.models.simple_workflow_model",
+    "SimpleWorkflowModel1": "rapidata.api_client.models.simple_workflow_model1",
+    "SimpleWorkflowModel1Blueprint": "rapidata.api_client.models.simple_workflow_model1_blueprint",
+    "SimpleWorkflowModelBlueprint": "rapidata.api_client.models.simple_workflow_model_blueprint",
+    "SimpleWorkflowResultOutput": "rapidata.api_client.models.simple_workflow_result_output",
+    "SimplifiedAudienceUserState": "rapidata.api_client.models.simplified_audience_user_state",
+    "SkipRapidEndpointInput": "rapidata.api_client.models.skip_rapid_endpoint_input",
+    "SkipRapidEndpointOutput": "rapidata.api_client.models.skip_rapid_endpoint_output",
+    "SkipResult": "rapidata.api_client.models.skip_result",
+    "SkipTruth": "rapidata.api_client.models.skip_truth",
+    "SortDirection": "rapidata.api_client.models.sort_direction",
+    "SourceUrlMetadata": "rapidata.api_client.models.source_url_metadata",
+    "SourceUrlMetadataModel": "rapidata.api_client.models.source_url_metadata_model",
+    "StandingByBenchmark": "rapidata.api_client.models.standing_by_benchmark",
+    "StandingByLeaderboard": "rapidata.api_client.models.standing_by_leaderboard",
+    "StandingByLeaderboardPagedResult": "rapidata.api_client.models.standing_by_leaderboard_paged_result",
+    "StandingStatus": "rapidata.api_client.models.standing_status",
+    "StandingsByBenchmarkResult": "rapidata.api_client.models.standings_by_benchmark_result",
+    "StandingsByLeaderboardResult": "rapidata.api_client.models.standings_by_leaderboard_result",
+    "StartAudienceInactivitySyncEndpointOutput": "rapidata.api_client.models.start_audience_inactivity_sync_endpoint_output",
+    "StartAudienceStateRecalculationEndpointOutput": "rapidata.api_client.models.start_audience_state_recalculation_endpoint_output",
+    "StartBenchmarkHuggingFaceSyncEndpointInput": "rapidata.api_client.models.start_benchmark_hugging_face_sync_endpoint_input",
+    "StartBenchmarkHuggingFaceSyncEndpointOutput": "rapidata.api_client.models.start_benchmark_hugging_face_sync_endpoint_output",
+    "StartBulkReconciliationEndpointInput": "rapidata.api_client.models.start_bulk_reconciliation_endpoint_input",
+    "StartBulkReconciliationEndpointOutput": "rapidata.api_client.models.start_bulk_reconciliation_endpoint_output",
+    "StartPreliminaryDownloadResult": "rapidata.api_client.models.start_preliminary_download_result",
+    "StaticRapidSelectionConfig": "rapidata.api_client.models.static_rapid_selection_config",
+    "StaticSelection": "rapidata.api_client.models.static_selection",
+    "StickyConfig": "rapidata.api_client.models.sticky_config",
+    "StickyConfigModel": "rapidata.api_client.models.sticky_config_model",
+    "StickyState": "rapidata.api_client.models.sticky_state",
+    "StreamFileWrapper": "rapidata.api_client.models.stream_file_wrapper",
+    "StreamsMetadata": "rapidata.api_client.models.streams_metadata",
+    "StreamsMetadataModel": "rapidata.api_client.models.streams_metadata_model",
+    "StringSegment": "rapidata.api_client.models.string_segment",
+    "SubmitCocoModel": "rapidata.api_client.models.submit_coco_model",
+    "SubmitCocoResult": "rapidata.api_client.models.submit_coco_result",
+    "SubmitFeedbackEndpointInput": "rapidata.api_client.models.submit_feedback_endpoint_input",
+    "SubmitOrderEndpointInput": "rapidata.api_client.models.submit_order_endpoint_input",
+    "SubmitOrderModel": "rapidata.api_client.models.submit_order_model",
+    "SubmitParticipantByBenchmarkEndpointOutput": "rapidata.api_client.models.submit_participant_by_benchmark_endpoint_output",
+    "SubmitParticipantEndpointOutput": "rapidata.api_client.models.submit_participant_endpoint_output",
+    "SubmitParticipantResult": "rapidata.api_client.models.submit_participant_result",
+    "SubmitPasswordResetCommand": "rapidata.api_client.models.submit_password_reset_command",
+    "SubmitPromptModel": "rapidata.api_client.models.submit_prompt_model",
+    "SubmitPromptModelPromptAsset": "rapidata.api_client.models.submit_prompt_model_prompt_asset",
+    "SubscribeToNewsletterEndpointInput": "rapidata.api_client.models.subscribe_to_newsletter_endpoint_input",
+    "SwitchActiveOrganizationEndpointInput": "rapidata.api_client.models.switch_active_organization_endpoint_input",
+    "Tag": "rapidata.api_client.models.tag",
+    "TagSummary": "rapidata.api_client.models.tag_summary",
+    "TagsByBenchmarkResult": "rapidata.api_client.models.tags_by_benchmark_result",
+    "TextAsset": "rapidata.api_client.models.text_asset",
+    "TextAssetInput": "rapidata.api_client.models.text_asset_input",
+    "TextAssetModel": "rapidata.api_client.models.text_asset_model",
+    "TextAssetModel1": "rapidata.api_client.models.text_asset_model1",
+    "TextAssetModel2": "rapidata.api_client.models.text_asset_model2",
+    "TextMetadata": "rapidata.api_client.models.text_metadata",
+    "TextMetadataInput": "rapidata.api_client.models.text_metadata_input",
+    "TextMetadataModel": "rapidata.api_client.models.text_metadata_model",
+    "TimeGrouping": "rapidata.api_client.models.time_grouping",
+    "TranscriptionMetadata": "rapidata.api_client.models.transcription_metadata",
+    "TranscriptionMetadataInput": "rapidata.api_client.models.transcription_metadata_input",
+    "TranscriptionMetadataModel": "rapidata.api_client.models.transcription_metadata_model",
+    "TranscriptionPayload": "rapidata.api_client.models.transcription_payload",
+    "TranscriptionPayloadModelTranscriptionWord": "rapidata.api_client.models.transcription_payload_model_transcription_word",
+    "TranscriptionPayloadTranscriptionWord": "rapidata.api_client.models.transcription_payload_transcription_word",
+    "TranscriptionRapidBlueprint": "rapidata.api_client.models.transcription_rapid_blueprint",
+    "TranscriptionRapidModelTranscriptionWord": "rapidata.api_client.models.transcription_rapid_model_transcription_word",
+    "TranscriptionRapidTranscriptionWord": "rapidata.api_client.models.transcription_rapid_transcription_word",
+    "TranscriptionResult": "rapidata.api_client.models.transcription_result",
+    "TranscriptionResultModelTranscriptionWord": "rapidata.api_client.models.transcription_result_model_transcription_word",
+    "TranscriptionResultTranscriptionWord": "rapidata.api_client.models.transcription_result_transcription_word",
+    "TranscriptionTruth": "rapidata.api_client.models.transcription_truth",
+    "TranscriptionTruthModelTranscriptionWord": "rapidata.api_client.models.transcription_truth_model_transcription_word",
+    "TranscriptionTruthTranscriptionWord": "rapidata.api_client.models.transcription_truth_transcription_word",
+    "TranscriptionWord": "rapidata.api_client.models.transcription_word",
+    "TranslateEndpointInput": "rapidata.api_client.models.translate_endpoint_input",
+    "TranslateEndpointOutput": "rapidata.api_client.models.translate_endpoint_output",
+    "TranslatedPromptMetadataModel": "rapidata.api_client.models.translated_prompt_metadata_model",
+    "TranslatedString": "rapidata.api_client.models.translated_string",
+    "TranslatorType": "rapidata.api_client.models.translator_type",
+    "TriggerSignalEndpointOutput": "rapidata.api_client.models.trigger_signal_endpoint_output",
+    "UnlockOrderEndpointOutput": "rapidata.api_client.models.unlock_order_endpoint_output",
+    "UnlockOrderResult": "rapidata.api_client.models.unlock_order_result",
+    "UnsubscribeEndpointInput": "rapidata.api_client.models.unsubscribe_endpoint_input",
+    "UnsubscribeFromNewsletterEndpointInput": "rapidata.api_client.models.unsubscribe_from_newsletter_endpoint_input",
+    "UpdateAccessModel": "rapidata.api_client.models.update_access_model",
+    "UpdateAudienceEndpointInput": "rapidata.api_client.models.update_audience_endpoint_input",
+    "UpdateAudienceEndpointOutput": "rapidata.api_client.models.update_audience_endpoint_output",
+    "UpdateAudienceExampleEndpointInput": "rapidata.api_client.models.update_audience_example_endpoint_input",
+    "UpdateAudienceRapidEndpointInput": "rapidata.api_client.models.update_audience_rapid_endpoint_input",
+    "UpdateAudienceRequest": "rapidata.api_client.models.update_audience_request",
+    "UpdateBenchmarkEndpointInput": "rapidata.api_client.models.update_benchmark_endpoint_input",
+    "UpdateBenchmarkModel": "rapidata.api_client.models.update_benchmark_model",
+    "UpdateBenchmarkNameEndpointInput": "rapidata.api_client.models.update_benchmark_name_endpoint_input",
+    "UpdateBenchmarkNameModel": "rapidata.api_client.models.update_benchmark_name_model",
+    "UpdateBoostConfigEndpointInput": "rapidata.api_client.models.update_boost_config_endpoint_input",
+    "UpdateBoostConfigEndpointOutput": "rapidata.api_client.models.update_boost_config_endpoint_output",
+    "UpdateCampaignEndpointInput": "rapidata.api_client.models.update_campaign_endpoint_input",
+    "UpdateCampaignModel": "rapidata.api_client.models.update_campaign_model",
+    "UpdateConfigEndpointAudienceBoostInput": "rapidata.api_client.models.update_config_endpoint_audience_boost_input",
+    "UpdateConfigEndpointInput": "rapidata.api_client.models.update_config_endpoint_input",
+    "UpdateDatasetNameEndpointInput": "rapidata.api_client.models.update_dataset_name_endpoint_input",
+    "UpdateDatasetNameModel": "rapidata.api_client.models.update_dataset_name_model",
+    "UpdateDimensionsModel": "rapidata.api_client.models.update_dimensions_model",
+    "UpdateGlobalTextEndpointInput": "rapidata.api_client.models.update_global_text_endpoint_input",
+    "UpdateJobDefinitionEndpointInput": "rapidata.api_client.models.update_job_definition_endpoint_input",
+    "UpdateJobEndpointInput": "rapidata.api_client.models.update_job_endpoint_input",
+    "UpdateLeaderboardEndpointInput": "rapidata.api_client.models.update_leaderboard_endpoint_input",
+    "UpdateLeaderboardModel": "rapidata.api_client.models.update_leaderboard_model",
+    "UpdateLeaderboardNameEndpointInput": "rapidata.api_client.models.update_leaderboard_name_endpoint_input",
+    "UpdateLeaderboardNameModel": "rapidata.api_client.models.update_leaderboard_name_model",
+    "UpdateLeaderboardResponseConfigEndpointInput": "rapidata.api_client.models.update_leaderboard_response_config_endpoint_input",
+    "UpdateLeaderboardResponseConfigModel": "rapidata.api_client.models.update_leaderboard_response_config_model",
+    "UpdateOrderEndpointInput": "rapidata.api_client.models.update_order_endpoint_input",
+    "UpdateOrderModel": "rapidata.api_client.models.update_order_model",
+    "UpdateOrderNameModel": "rapidata.api_client.models.update_order_name_model",
+    "UpdateOrganizationEndpointInput": "rapidata.api_client.models.update_organization_endpoint_input",
+    "UpdateOwnerTierOverrideEndpointInput": "rapidata.api_client.models.update_owner_tier_override_endpoint_input",
+    "UpdateParticipantEndpointInput": "rapidata.api_client.models.update_participant_endpoint_input",
+    "UpdateParticipantModel": "rapidata.api_client.models.update_participant_model",
+    "UpdateParticipantNameEndpointInput": "rapidata.api_client.models.update_participant_name_endpoint_input",
+    "UpdateParticipantNameModel": "rapidata.api_client.models.update_participant_name_model",
+    "UpdatePriorityModel": "rapidata.api_client.models.update_priority_model",
+    "UpdatePromptTagsEndpointInput": "rapidata.api_client.models.update_prompt_tags_endpoint_input",
+    "UpdatePromptTagsModel": "rapidata.api_client.models.update_prompt_tags_model",
+    "UpdateShouldAlertModel": "rapidata.api_client.models.update_should_alert_model",
+    "UpdateSignalEndpointInput": "rapidata.api_client.models.update_signal_endpoint_input",
+    "UpdateStreamProgramEndpointInput": "rapidata.api_client.models.update_stream_program_endpoint_input",
+    "UpdateValidationRapidEndpointInput": "rapidata.api_client.models.update_validation_rapid_endpoint_input",
+    "UpdateValidationRapidModel": "rapidata.api_client.models.update_validation_rapid_model",
+    "UpdateValidationRapidModelContextAsset": "rapidata.api_client.models.update_validation_rapid_model_context_asset",
+    "UpdateValidationRapidModelTruth": "rapidata.api_client.models.update_validation_rapid_model_truth",
+    "UpdateValidationSetDimensionsEndpointInput": "rapidata.api_client.models.update_validation_set_dimensions_endpoint_input",
+    "UpdateValidationSetEndpointInput": "rapidata.api_client.models.update_validation_set_endpoint_input",
+    "UpdateValidationSetModel": "rapidata.api_client.models.update_validation_set_model",
+    "UpdateValidationSetShouldAlertEndpointInput": "rapidata.api_client.models.update_validation_set_should_alert_endpoint_input",
+    "UpdateWorkflowConfigModel": "rapidata.api_client.models.update_workflow_config_model",
+    "UpdateWorkflowConfigModelWorkflowConfig": "rapidata.api_client.models.update_workflow_config_model_workflow_config",
+    "UpdateWorkflowConfigRequest": "rapidata.api_client.models.update_workflow_config_request",
+    "UpdateWorkflowConfigRequestConfig": "rapidata.api_client.models.update_workflow_config_request_config",
+    "UploadAssetResult": "rapidata.api_client.models.upload_asset_result",
+    "UploadCocoResult": "rapidata.api_client.models.upload_coco_result",
+    "UploadDatapointsResult": "rapidata.api_client.models.upload_datapoints_result",
+    "UploadFileEndpointOutput": "rapidata.api_client.models.upload_file_endpoint_output",
+    "UploadFileFromUrlEndpointOutput": "rapidata.api_client.models.upload_file_from_url_endpoint_output",
+    "UploadFileFromUrlResult": "rapidata.api_client.models.upload_file_from_url_result",
+    "UploadFileResult": "rapidata.api_client.models.upload_file_result",
+    "UploadFilesFromS3BucketModel": "rapidata.api_client.models.upload_files_from_s3_bucket_model",
+    "UploadFromS3Result": "rapidata.api_client.models.upload_from_s3_result",
+    "UploadTextSourcesToDatasetModel": "rapidata.api_client.models.upload_text_sources_to_dataset_model",
+    "UrlAssetInput": "rapidata.api_client.models.url_asset_input",
+    "UserActionRestriction": "rapidata.api_client.models.user_action_restriction",
+    "UserActionRestrictionFilter": "rapidata.api_client.models.user_action_restriction_filter",
+    "UserAttribute": "rapidata.api_client.models.user_attribute",
+    "UserScoreFilter": "rapidata.api_client.models.user_score_filter",
+    "UserScoreUserFilterModel": "rapidata.api_client.models.user_score_user_filter_model",
+    "UserState": "rapidata.api_client.models.user_state",
+    "UserStateFilter": "rapidata.api_client.models.user_state_filter",
+    "ValidationChance": "rapidata.api_client.models.validation_chance",
+    "ValidationChanceModel": "rapidata.api_client.models.validation_chance_model",
+    "ValidationImportPostRequestBlueprint": "rapidata.api_client.models.validation_import_post_request_blueprint",
+    "ValidationProblemDetails": "rapidata.api_client.models.validation_problem_details",
+    "ValidationRapidSelectionConfig": "rapidata.api_client.models.validation_rapid_selection_config",
+    "ValidationSelection": "rapidata.api_client.models.validation_selection",
+    "ValidationSet": "rapidata.api_client.models.validation_set",
+    "ValidationSetModel": "rapidata.api_client.models.validation_set_model",
+    "ValidationSetModelPagedResult": "rapidata.api_client.models.validation_set_model_paged_result",
+    "ValidationSetOverviewModel": "rapidata.api_client.models.validation_set_overview_model",
+    "ValidationSetPagedResult": "rapidata.api_client.models.validation_set_paged_result",
+    "ValidationSetValidationSetIdRapidPostPayloadParameter": "rapidata.api_client.models.validation_set_validation_set_id_rapid_post_payload_parameter",
+    "ValidationSetValidationSetIdRapidPostTruthParameter": "rapidata.api_client.models.validation_set_validation_set_id_rapid_post_truth_parameter",
+    "ValidationSetZipPostRequestBlueprint": "rapidata.api_client.models.validation_set_zip_post_request_blueprint",
+    "VideoDurationMetadata": "rapidata.api_client.models.video_duration_metadata",
+    "VideoDurationMetadataModel": "rapidata.api_client.models.video_duration_metadata_model",
+    "VoteAggregation": "rapidata.api_client.models.vote_aggregation",
+    "VoteMatrixResult": "rapidata.api_client.models.vote_matrix_result",
+    "VoucherSource": "rapidata.api_client.models.voucher_source",
+    "VoucherStatus": "rapidata.api_client.models.voucher_status",
+    "WeightedBranch": "rapidata.api_client.models.weighted_branch",
+    "WorkflowAggregationStepModel": "rapidata.api_client.models.workflow_aggregation_step_model",
+    "WorkflowArtifactModel": "rapidata.api_client.models.workflow_artifact_model",
+    "WorkflowConfigArtifactModel": "rapidata.api_client.models.workflow_config_artifact_model",
+    "WorkflowConfigArtifactModelWorkflowConfig": "rapidata.api_client.models.workflow_config_artifact_model_workflow_config",
+    "WorkflowLabelingStepModel": "rapidata.api_client.models.workflow_labeling_step_model",
+    "WorkflowSplitModel": "rapidata.api_client.models.workflow_split_model",
+    "WorkflowSplitModelFilterConfigsInner": "rapidata.api_client.models.workflow_split_model_filter_configs_inner",
+    "WorkflowState": "rapidata.api_client.models.workflow_state",
+    "WorkflowStateModel": "rapidata.api_client.models.workflow_state_model",
+    "ZipEntryFileWrapper": "rapidata.api_client.models.zip_entry_file_wrapper",
+}
+
+
 def _discover_models() -> dict[str, str]:
-    """Discover all model classes from .py files in this package directory."""
+    """Discover all model classes from .py files in this package directory.
+
+    Only used for names missing from ``_MODEL_IMPORTS``, e.g. model files
+    added by hand or left over from an earlier generation.
+    """
     models = {}
     package_dir = _os.path.dirname(_os.path.abspath(__file__))
     package_name = __name__
@@ -45,8 +1822,8 @@ def _discover_models() -> dict[str, str]:
     return models
 
 
-# Lazy loading for models - models are imported only when accessed
-_MODEL_IMPORTS = _discover_models()
+# Filled in by _discover_models() on the first lookup the index cannot answer
+_DISCOVERED: dict[str, str] | None = None
 
 # Cache for imported models
 _IMPORTED: dict[str, type] = {}
@@ -54,13 +1831,19 @@ _IMPORTED: dict[str, type] = {}
 
 def __getattr__(name: str):
     """Lazy import handler for models."""
+    global _DISCOVERED
+
     if name in _IMPORTED:
         return _IMPORTED[name]
 
-    if name in _MODEL_IMPORTS:
-        module_path = _MODEL_IMPORTS[name]
-        import importlib
-        module = importlib.import_module(module_path)
+    module_path = _MODEL_IMPORTS.get(name)
+    if module_path is None and not name.startswith('__'):
+        if _DISCOVERED is None:
+            _DISCOVERED = _discover_models()
+        module_path = _DISCOVERED.get(name)
+
+    if module_path is not None:
+        module = _importlib.import_module(module_path)
         attr = getattr(module, name)
         _IMPORTED[name] = attr
         return attr
@@ -92,6 +92,9 @@ class AddCampaignModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "user_filters",
+            "selections",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -101,21 +104,21 @@ class AddCampaignModel(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in user_filters (list)
         _items = []
-        if self.user_filters:
+        if self.user_filters is not None:
             for _item_user_filters in self.user_filters:
                 if _item_user_filters:
                     _items.append(_item_user_filters.to_dict())
             _dict['userFilters'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in selections (list)
         _items = []
-        if self.selections:
+        if self.selections is not None:
             for _item_selections in self.selections:
                 if _item_selections:
                     _items.append(_item_selections.to_dict())
             _dict['selections'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
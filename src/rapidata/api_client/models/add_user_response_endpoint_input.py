@@ -60,6 +60,7 @@ class AddUserResponseEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "result",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class AddUserResponseEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of result
-        if self.result:
+        if self.result is not None:
             _dict['result'] = self.result.to_dict()
         return _dict
 
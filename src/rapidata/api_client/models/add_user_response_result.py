@@ -64,6 +64,8 @@ class AddUserResponseResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "validation_truth",
+            "explanation",
         ])
 
         _dict = self.model_dump(
@@ -72,10 +74,10 @@ class AddUserResponseResult(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of validation_truth
-        if self.validation_truth:
+        if self.validation_truth is not None:
             _dict['validationTruth'] = self.validation_truth.to_dict()
         # override the default output from pydantic by calling `to_dict()` of explanation
-        if self.explanation:
+        if self.explanation is not None:
             _dict['explanation'] = self.explanation.to_dict()
         # set to None if validation_truth (nullable) is None
         # and model_fields_set contains the field
@@ -72,6 +72,11 @@ class AddValidationRapidNewModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "payload",
+            "metadata",
+            "truth",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -80,24 +85,24 @@ class AddValidationRapidNewModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in metadata (list)
         _items = []
-        if self.metadata:
+        if self.metadata is not None:
             for _item_metadata in self.metadata:
                 if _item_metadata:
                     _items.append(_item_metadata.to_dict())
             _dict['metadata'] = _items
         # override the default output from pydantic by calling `to_dict()` of truth
-        if self.truth:
+        if self.truth is not None:
             _dict['truth'] = self.truth.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
@@ -69,6 +69,9 @@ class AddValidationTextRapidModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "payload",
+            "metadata",
+            "truth",
         ])
 
         _dict = self.model_dump(
@@ -77,17 +80,17 @@ class AddValidationTextRapidModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in metadata (list)
         _items = []
-        if self.metadata:
+        if self.metadata is not None:
             for _item_metadata in self.metadata:
                 if _item_metadata:
                     _items.append(_item_metadata.to_dict())
             _dict['metadata'] = _items
         # override the default output from pydantic by calling `to_dict()` of truth
-        if self.truth:
+        if self.truth is not None:
             _dict['truth'] = self.truth.to_dict()
         # set to None if random_correct_probability (nullable) is None
         # and model_fields_set contains the field
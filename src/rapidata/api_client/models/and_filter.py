@@ -75,6 +75,7 @@ class AndFilter(BaseModel):
         excluded_fields: Set[str] = set([
             "execution_order",
             "inner_filters",
+            "filters",
         ])
 
         _dict = self.model_dump(
@@ -84,14 +85,14 @@ class AndFilter(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
             _dict['filters'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in inner_filters (list)
         _items = []
-        if self.inner_filters:
+        if self.inner_filters is not None:
             for _item_inner_filters in self.inner_filters:
                 if _item_inner_filters:
                     _items.append(_item_inner_filters.to_dict())
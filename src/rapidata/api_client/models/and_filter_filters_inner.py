@@ -27,6 +27,7 @@ from rapidata.api_client.models.user_action_restriction_filter import UserAction
 from rapidata.api_client.models.user_score_filter import UserScoreFilter
 from rapidata.api_client.models.user_state_filter import UserStateFilter
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
@@ -158,6 +159,13 @@ class AndFilterFiltersInner(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
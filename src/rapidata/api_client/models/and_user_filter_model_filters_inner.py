@@ -27,6 +27,7 @@ from rapidata.api_client.models.new_user_filter_model import NewUserFilterModel
 from rapidata.api_client.models.response_count_user_filter_model import ResponseCountUserFilterModel
 from rapidata.api_client.models.user_score_user_filter_model import UserScoreUserFilterModel
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
@@ -158,6 +159,13 @@ class AndUserFilterModelFiltersInner(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
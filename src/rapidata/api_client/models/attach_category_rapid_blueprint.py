@@ -72,6 +72,7 @@ class AttachCategoryRapidBlueprint(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "categories",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class AttachCategoryRapidBlueprint(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in categories (list)
         _items = []
-        if self.categories:
+        if self.categories is not None:
             for _item_categories in self.categories:
                 if _item_categories:
                     _items.append(_item_categories.to_dict())
@@ -60,6 +60,7 @@ class AttachCategoryRapidModelCategory(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "label",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class AttachCategoryRapidModelCategory(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of label
-        if self.label:
+        if self.label is not None:
             _dict['label'] = self.label.to_dict()
         return _dict
 
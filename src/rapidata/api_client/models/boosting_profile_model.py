@@ -64,6 +64,8 @@ class BoostingProfileModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "distilling_boosts",
+            "labeling_boosts",
         ])
 
         _dict = self.model_dump(
@@ -73,14 +75,14 @@ class BoostingProfileModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in distilling_boosts (list)
         _items = []
-        if self.distilling_boosts:
+        if self.distilling_boosts is not None:
             for _item_distilling_boosts in self.distilling_boosts:
                 if _item_distilling_boosts:
                     _items.append(_item_distilling_boosts.to_dict())
             _dict['distillingBoosts'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in labeling_boosts (list)
         _items = []
-        if self.labeling_boosts:
+        if self.labeling_boosts is not None:
             for _item_labeling_boosts in self.labeling_boosts:
                 if _item_labeling_boosts:
                     _items.append(_item_labeling_boosts.to_dict())
@@ -71,6 +71,7 @@ class BoundingBoxResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "bounding_boxes",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class BoundingBoxResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in bounding_boxes (list)
         _items = []
-        if self.bounding_boxes:
+        if self.bounding_boxes is not None:
             for _item_bounding_boxes in self.bounding_boxes:
                 if _item_bounding_boxes:
                     _items.append(_item_bounding_boxes.to_dict())
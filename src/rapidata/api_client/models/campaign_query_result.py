@@ -71,6 +71,7 @@ class CampaignQueryResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "boosting_profile",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class CampaignQueryResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of boosting_profile
-        if self.boosting_profile:
+        if self.boosting_profile is not None:
             _dict['boostingProfile'] = self.boosting_profile.to_dict()
         return _dict
 
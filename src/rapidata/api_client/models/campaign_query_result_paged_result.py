@@ -68,6 +68,7 @@ class CampaignQueryResultPagedResult(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "total_pages",
+            "items",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class CampaignQueryResultPagedResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in items (list)
         _items = []
-        if self.items:
+        if self.items is not None:
             for _item_items in self.items:
                 if _item_items:
                     _items.append(_item_items.to_dict())
@@ -74,6 +74,7 @@ class ClientModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "jwks",
         ])
 
         _dict = self.model_dump(
@@ -82,7 +83,7 @@ class ClientModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of jwks
-        if self.jwks:
+        if self.jwks is not None:
             _dict['jwks'] = self.jwks.to_dict()
         # set to None if client_secret (nullable) is None
         # and model_fields_set contains the field
@@ -80,6 +80,11 @@ class CompareWorkflowConfigModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "pair_maker_config",
+            "referee",
+            "elo_config",
+            "metadata",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -88,24 +93,24 @@ class CompareWorkflowConfigModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of pair_maker_config
-        if self.pair_maker_config:
+        if self.pair_maker_config is not None:
             _dict['pairMakerConfig'] = self.pair_maker_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of elo_config
-        if self.elo_config:
+        if self.elo_config is not None:
             _dict['eloConfig'] = self.elo_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each value in metadata (dict)
         _field_dict = {}
-        if self.metadata:
+        if self.metadata is not None:
             for _key_metadata in self.metadata:
                 if self.metadata[_key_metadata]:
                     _field_dict[_key_metadata] = self.metadata[_key_metadata].to_dict()
             _dict['metadata'] = _field_dict
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
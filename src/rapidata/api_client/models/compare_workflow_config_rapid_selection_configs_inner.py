@@ -25,6 +25,7 @@ from rapidata.api_client.models.only_validation_workflow_rapid_selection_config
 from rapidata.api_client.models.static_rapid_selection_config import StaticRapidSelectionConfig
 from rapidata.api_client.models.validation_rapid_selection_config import ValidationRapidSelectionConfig
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
@@ -121,6 +122,13 @@ class CompareWorkflowConfigRapidSelectionConfigsInner(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
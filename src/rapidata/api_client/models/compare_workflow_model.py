@@ -80,6 +80,11 @@ class CompareWorkflowModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "pair_maker_config",
+            "elo_config",
+            "context_asset",
+            "metadata",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -88,24 +93,24 @@ class CompareWorkflowModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of pair_maker_config
-        if self.pair_maker_config:
+        if self.pair_maker_config is not None:
             _dict['pairMakerConfig'] = self.pair_maker_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of elo_config
-        if self.elo_config:
+        if self.elo_config is not None:
             _dict['eloConfig'] = self.elo_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in metadata (list)
         _items = []
-        if self.metadata:
+        if self.metadata is not None:
             for _item_metadata in self.metadata:
                 if _item_metadata:
                     _items.append(_item_metadata.to_dict())
             _dict['metadata'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
@@ -82,6 +82,10 @@ class CompareWorkflowModel1(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "referee",
+            "pair_maker_information",
+            "elo_config",
+            "context_asset",
         ])
 
         _dict = self.model_dump(
@@ -90,16 +94,16 @@ class CompareWorkflowModel1(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of pair_maker_information
-        if self.pair_maker_information:
+        if self.pair_maker_information is not None:
             _dict['pairMakerInformation'] = self.pair_maker_information.to_dict()
         # override the default output from pydantic by calling `to_dict()` of elo_config
-        if self.elo_config:
+        if self.elo_config is not None:
             _dict['eloConfig'] = self.elo_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # set to None if context (nullable) is None
         # and model_fields_set contains the field
@@ -65,6 +65,8 @@ class CompletedRapidModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "answers",
         ])
 
         _dict = self.model_dump(
@@ -73,11 +75,11 @@ class CompletedRapidModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in answers (list)
         _items = []
-        if self.answers:
+        if self.answers is not None:
             for _item_answers in self.answers:
                 if _item_answers:
                     _items.append(_item_answers.to_dict())
@@ -71,6 +71,7 @@ class ConditionalValidationSelection(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "validation_chances",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class ConditionalValidationSelection(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in validation_chances (list)
         _items = []
-        if self.validation_chances:
+        if self.validation_chances is not None:
             for _item_validation_chances in self.validation_chances:
                 if _item_validation_chances:
                     _items.append(_item_validation_chances.to_dict())
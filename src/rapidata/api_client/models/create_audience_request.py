@@ -85,6 +85,8 @@ class CreateAudienceRequest(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filters",
+            "logo",
         ])
 
         _dict = self.model_dump(
@@ -94,13 +96,13 @@ class CreateAudienceRequest(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
             _dict['filters'] = _items
         # override the default output from pydantic by calling `to_dict()` of logo
-        if self.logo:
+        if self.logo is not None:
             _dict['logo'] = self.logo.to_dict()
         # set to None if description (nullable) is None
         # and model_fields_set contains the field
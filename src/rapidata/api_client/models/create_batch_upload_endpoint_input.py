@@ -61,6 +61,7 @@ class CreateBatchUploadEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "compression",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class CreateBatchUploadEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of compression
-        if self.compression:
+        if self.compression is not None:
             _dict['compression'] = self.compression.to_dict()
         # set to None if correlation_id (nullable) is None
         # and model_fields_set contains the field
@@ -65,6 +65,7 @@ class CreateBenchmarkParticipantEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "logo",
         ])
 
         _dict = self.model_dump(
@@ -73,7 +74,7 @@ class CreateBenchmarkParticipantEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of logo
-        if self.logo:
+        if self.logo is not None:
             _dict['logo'] = self.logo.to_dict()
         # set to None if family (nullable) is None
         # and model_fields_set contains the field
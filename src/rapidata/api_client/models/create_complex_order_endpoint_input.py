@@ -62,6 +62,7 @@ class CreateComplexOrderEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "pipeline",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class CreateComplexOrderEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of pipeline
-        if self.pipeline:
+        if self.pipeline is not None:
             _dict['pipeline'] = self.pipeline.to_dict()
         # set to None if preceding_order_id (nullable) is None
         # and model_fields_set contains the field
@@ -64,6 +64,7 @@ class CreateDatapointFromUrlsModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "metadata",
         ])
 
         _dict = self.model_dump(
@@ -73,7 +74,7 @@ class CreateDatapointFromUrlsModel(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in metadata (list)
         _items = []
-        if self.metadata:
+        if self.metadata is not None:
             for _item_metadata in self.metadata:
                 if _item_metadata:
                     _items.append(_item_metadata.to_dict())
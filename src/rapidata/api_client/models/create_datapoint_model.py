@@ -66,6 +66,8 @@ class CreateDatapointModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "context_asset",
         ])
 
         _dict = self.model_dump(
@@ -74,10 +76,10 @@ class CreateDatapointModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # set to None if context (nullable) is None
         # and model_fields_set contains the field
@@ -71,6 +71,7 @@ class CreateDatasetArtifactModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "dataset",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class CreateDatasetArtifactModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of dataset
-        if self.dataset:
+        if self.dataset is not None:
             _dict['dataset'] = self.dataset.to_dict()
         return _dict
 
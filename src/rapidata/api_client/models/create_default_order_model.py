@@ -76,6 +76,7 @@ class CreateDefaultOrderModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow_config",
         ])
 
         _dict = self.model_dump(
@@ -84,7 +85,7 @@ class CreateDefaultOrderModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow_config
-        if self.workflow_config:
+        if self.workflow_config is not None:
             _dict['workflowConfig'] = self.workflow_config.to_dict()
         return _dict
 
@@ -67,6 +67,9 @@ class CreateDemographicRapidModelNew(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "payload",
+            "feature_flags",
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -75,17 +78,17 @@ class CreateDemographicRapidModelNew(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
             _dict['featureFlags'] = _items
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # set to None if feature_flags (nullable) is None
         # and model_fields_set contains the field
@@ -59,6 +59,7 @@ class CreateFilteredAudienceEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filter",
         ])
 
         _dict = self.model_dump(
@@ -67,7 +68,7 @@ class CreateFilteredAudienceEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of filter
-        if self.filter:
+        if self.filter is not None:
             _dict['filter'] = self.filter.to_dict()
         return _dict
 
@@ -63,6 +63,7 @@ class CreateIndependentWorkflowModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow_config",
         ])
 
         _dict = self.model_dump(
@@ -71,7 +72,7 @@ class CreateIndependentWorkflowModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow_config
-        if self.workflow_config:
+        if self.workflow_config is not None:
             _dict['workflowConfig'] = self.workflow_config.to_dict()
         return _dict
 
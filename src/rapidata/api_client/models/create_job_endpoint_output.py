@@ -62,6 +62,7 @@ class CreateJobEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "cost_warning",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class CreateJobEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of cost_warning
-        if self.cost_warning:
+        if self.cost_warning is not None:
             _dict['costWarning'] = self.cost_warning.to_dict()
         return _dict
 
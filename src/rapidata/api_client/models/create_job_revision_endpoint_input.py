@@ -68,6 +68,10 @@ class CreateJobRevisionEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow",
+            "referee",
+            "rapid_feature_flags",
+            "campaign_feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -76,21 +80,21 @@ class CreateJobRevisionEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow
-        if self.workflow:
+        if self.workflow is not None:
             _dict['workflow'] = self.workflow.to_dict()
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in rapid_feature_flags (list)
         _items = []
-        if self.rapid_feature_flags:
+        if self.rapid_feature_flags is not None:
             for _item_rapid_feature_flags in self.rapid_feature_flags:
                 if _item_rapid_feature_flags:
                     _items.append(_item_rapid_feature_flags.to_dict())
             _dict['rapidFeatureFlags'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in campaign_feature_flags (list)
         _items = []
-        if self.campaign_feature_flags:
+        if self.campaign_feature_flags is not None:
             for _item_campaign_feature_flags in self.campaign_feature_flags:
                 if _item_campaign_feature_flags:
                     _items.append(_item_campaign_feature_flags.to_dict())
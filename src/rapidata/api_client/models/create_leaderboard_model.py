@@ -70,6 +70,7 @@ class CreateLeaderboardModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class CreateLeaderboardModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
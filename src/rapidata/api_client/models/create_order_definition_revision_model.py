@@ -69,6 +69,9 @@ class CreateOrderDefinitionRevisionModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow",
+            "referee",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -77,14 +80,14 @@ class CreateOrderDefinitionRevisionModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow
-        if self.workflow:
+        if self.workflow is not None:
             _dict['workflow'] = self.workflow.to_dict()
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
@@ -81,6 +81,13 @@ class CreateOrderModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow",
+            "referee",
+            "rapid_feature_flags",
+            "campaign_feature_flags",
+            "sticky_config",
+            "user_filters",
+            "selections",
         ])
 
         _dict = self.model_dump(
@@ -89,38 +96,38 @@ class CreateOrderModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow
-        if self.workflow:
+        if self.workflow is not None:
             _dict['workflow'] = self.workflow.to_dict()
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in rapid_feature_flags (list)
         _items = []
-        if self.rapid_feature_flags:
+        if self.rapid_feature_flags is not None:
             for _item_rapid_feature_flags in self.rapid_feature_flags:
                 if _item_rapid_feature_flags:
                     _items.append(_item_rapid_feature_flags.to_dict())
             _dict['rapidFeatureFlags'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in campaign_feature_flags (list)
         _items = []
-        if self.campaign_feature_flags:
+        if self.campaign_feature_flags is not None:
             for _item_campaign_feature_flags in self.campaign_feature_flags:
                 if _item_campaign_feature_flags:
                     _items.append(_item_campaign_feature_flags.to_dict())
             _dict['campaignFeatureFlags'] = _items
         # override the default output from pydantic by calling `to_dict()` of sticky_config
-        if self.sticky_config:
+        if self.sticky_config is not None:
             _dict['stickyConfig'] = self.sticky_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in user_filters (list)
         _items = []
-        if self.user_filters:
+        if self.user_filters is not None:
             for _item_user_filters in self.user_filters:
                 if _item_user_filters:
                     _items.append(_item_user_filters.to_dict())
             _dict['userFilters'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in selections (list)
         _items = []
-        if self.selections:
+        if self.selections is not None:
             for _item_selections in self.selections:
                 if _item_selections:
                     _items.append(_item_selections.to_dict())
@@ -64,6 +64,7 @@ class CreateProgramCampaignEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "nodes",
         ])
 
         _dict = self.model_dump(
@@ -73,7 +74,7 @@ class CreateProgramCampaignEndpointInput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in nodes (dict)
         _field_dict = {}
-        if self.nodes:
+        if self.nodes is not None:
             for _key_nodes in self.nodes:
                 if self.nodes[_key_nodes]:
                     _field_dict[_key_nodes] = self.nodes[_key_nodes].to_dict()
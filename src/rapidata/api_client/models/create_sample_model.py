@@ -61,6 +61,7 @@ class CreateSampleModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class CreateSampleModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         return _dict
 
@@ -60,6 +60,7 @@ class CreateSampleNewEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class CreateSampleNewEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         return _dict
 
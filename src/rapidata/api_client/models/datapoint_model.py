@@ -64,6 +64,7 @@ class DatapointModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -72,7 +73,7 @@ class DatapointModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         return _dict
 
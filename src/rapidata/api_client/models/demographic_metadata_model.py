@@ -70,6 +70,7 @@ class DemographicMetadataModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "demographics",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class DemographicMetadataModel(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in demographics (dict)
         _field_dict = {}
-        if self.demographics:
+        if self.demographics is not None:
             for _key_demographics in self.demographics:
                 if self.demographics[_key_demographics]:
                     _field_dict[_key_demographics] = self.demographics[_key_demographics].to_dict()
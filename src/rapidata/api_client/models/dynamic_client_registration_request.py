@@ -71,6 +71,7 @@ class DynamicClientRegistrationRequest(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "jwks",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class DynamicClientRegistrationRequest(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of jwks
-        if self.jwks:
+        if self.jwks is not None:
             _dict['jwks'] = self.jwks.to_dict()
         # set to None if redirect_uris (nullable) is None
         # and model_fields_set contains the field
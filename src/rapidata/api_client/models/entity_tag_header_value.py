@@ -63,6 +63,7 @@ class EntityTagHeaderValue(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "tag",
         ])
 
         _dict = self.model_dump(
@@ -71,7 +72,7 @@ class EntityTagHeaderValue(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of tag
-        if self.tag:
+        if self.tag is not None:
             _dict['tag'] = self.tag.to_dict()
         return _dict
 
@@ -75,6 +75,7 @@ class EvaluationWorkflowModel1(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "referee",
         ])
 
         _dict = self.model_dump(
@@ -83,7 +84,7 @@ class EvaluationWorkflowModel1(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # set to None if owner_mail (nullable) is None
         # and model_fields_set contains the field
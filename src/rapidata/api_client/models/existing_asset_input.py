@@ -61,6 +61,7 @@ class ExistingAssetInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "metadata",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class ExistingAssetInput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in metadata (dict)
         _field_dict = {}
-        if self.metadata:
+        if self.metadata is not None:
             for _key_metadata in self.metadata:
                 if self.metadata[_key_metadata]:
                     _field_dict[_key_metadata] = self.metadata[_key_metadata].to_dict()
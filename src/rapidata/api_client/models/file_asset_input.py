@@ -73,6 +73,7 @@ class FileAssetInput(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "identifier",
+            "file",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class FileAssetInput(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of file
-        if self.file:
+        if self.file is not None:
             _dict['file'] = self.file.to_dict()
         return _dict
 
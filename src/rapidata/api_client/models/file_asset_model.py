@@ -72,6 +72,7 @@ class FileAssetModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "metadata",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class FileAssetModel(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in metadata (dict)
         _field_dict = {}
-        if self.metadata:
+        if self.metadata is not None:
             for _key_metadata in self.metadata:
                 if self.metadata[_key_metadata]:
                     _field_dict[_key_metadata] = self.metadata[_key_metadata].to_dict()
@@ -68,6 +68,7 @@ class FileStreamResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "entity_tag",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class FileStreamResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of entity_tag
-        if self.entity_tag:
+        if self.entity_tag is not None:
             _dict['entityTag'] = self.entity_tag.to_dict()
         # set to None if content_type (nullable) is None
         # and model_fields_set contains the field
@@ -82,6 +82,7 @@ class FormFileWrapper(BaseModel):
             "content_length",
             "content_type",
             "is_in_memory",
+            "metadata",
         ])
 
         _dict = self.model_dump(
@@ -91,7 +92,7 @@ class FormFileWrapper(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in metadata (dict)
         _field_dict = {}
-        if self.metadata:
+        if self.metadata is not None:
             for _key_metadata in self.metadata:
                 if self.metadata[_key_metadata]:
                     _field_dict[_key_metadata] = self.metadata[_key_metadata].to_dict()
@@ -59,6 +59,7 @@ class GetAllGlobalTextsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "global_texts",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetAllGlobalTextsEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in global_texts (list)
         _items = []
-        if self.global_texts:
+        if self.global_texts is not None:
             for _item_global_texts in self.global_texts:
                 if _item_global_texts:
                     _items.append(_item_global_texts.to_dict())
@@ -60,6 +60,7 @@ class GetBenchmarkDemographicsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "dimensions",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetBenchmarkDemographicsEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of dimensions
-        if self.dimensions:
+        if self.dimensions is not None:
             _dict['dimensions'] = self.dimensions.to_dict()
         return _dict
 
@@ -63,6 +63,11 @@ class GetBenchmarkDemographicsEndpointOutputDimensionSet(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "age_bucket",
+            "gender",
+            "occupation",
+            "country",
+            "language",
         ])
 
         _dict = self.model_dump(
@@ -72,35 +77,35 @@ class GetBenchmarkDemographicsEndpointOutputDimensionSet(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in age_bucket (list)
         _items = []
-        if self.age_bucket:
+        if self.age_bucket is not None:
             for _item_age_bucket in self.age_bucket:
                 if _item_age_bucket:
                     _items.append(_item_age_bucket.to_dict())
             _dict['ageBucket'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in gender (list)
         _items = []
-        if self.gender:
+        if self.gender is not None:
             for _item_gender in self.gender:
                 if _item_gender:
                     _items.append(_item_gender.to_dict())
             _dict['gender'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in occupation (list)
         _items = []
-        if self.occupation:
+        if self.occupation is not None:
             for _item_occupation in self.occupation:
                 if _item_occupation:
                     _items.append(_item_occupation.to_dict())
             _dict['occupation'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in country (list)
         _items = []
-        if self.country:
+        if self.country is not None:
             for _item_country in self.country:
                 if _item_country:
                     _items.append(_item_country.to_dict())
             _dict['country'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in language (list)
         _items = []
-        if self.language:
+        if self.language is not None:
             for _item_language in self.language:
                 if _item_language:
                     _items.append(_item_language.to_dict())
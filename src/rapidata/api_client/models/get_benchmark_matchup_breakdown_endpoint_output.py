@@ -69,6 +69,7 @@ class GetBenchmarkMatchupBreakdownEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt_asset",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class GetBenchmarkMatchupBreakdownEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # set to None if prompt_id (nullable) is None
         # and model_fields_set contains the field
@@ -63,6 +63,8 @@ class GetBenchmarkStandingsBreakdownEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "var_global",
+            "segments",
         ])
 
         _dict = self.model_dump(
@@ -72,14 +74,14 @@ class GetBenchmarkStandingsBreakdownEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in var_global (list)
         _items = []
-        if self.var_global:
+        if self.var_global is not None:
             for _item_var_global in self.var_global:
                 if _item_var_global:
                     _items.append(_item_var_global.to_dict())
             _dict['global'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in segments (list)
         _items = []
-        if self.segments:
+        if self.segments is not None:
             for _item_segments in self.segments:
                 if _item_segments:
                     _items.append(_item_segments.to_dict())
@@ -73,6 +73,7 @@ class GetBenchmarkStandingsBreakdownEndpointOutputOutputItem(LazyValidatedModel)
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "confidence_interval",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class GetBenchmarkStandingsBreakdownEndpointOutputOutputItem(LazyValidatedModel)
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of confidence_interval
-        if self.confidence_interval:
+        if self.confidence_interval is not None:
             _dict['confidenceInterval'] = self.confidence_interval.to_dict()
         # set to None if family (nullable) is None
         # and model_fields_set contains the field
@@ -61,6 +61,7 @@ class GetBenchmarkStandingsBreakdownEndpointOutputSegment(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "items",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class GetBenchmarkStandingsBreakdownEndpointOutputSegment(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in items (list)
         _items = []
-        if self.items:
+        if self.items is not None:
             for _item_items in self.items:
                 if _item_items:
                     _items.append(_item_items.to_dict())
@@ -80,6 +80,7 @@ class GetBillingPeriodOverviewEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "line_items",
         ])
 
         _dict = self.model_dump(
@@ -89,7 +90,7 @@ class GetBillingPeriodOverviewEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in line_items (list)
         _items = []
-        if self.line_items:
+        if self.line_items is not None:
             for _item_line_items in self.line_items:
                 if _item_line_items:
                     _items.append(_item_line_items.to_dict())
@@ -59,6 +59,7 @@ class GetBillingSettingsTimelineEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "intervals",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetBillingSettingsTimelineEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in intervals (list)
         _items = []
-        if self.intervals:
+        if self.intervals is not None:
             for _item_intervals in self.intervals:
                 if _item_intervals:
                     _items.append(_item_intervals.to_dict())
@@ -60,6 +60,7 @@ class GetBoostInsightsEndpointGlobalBoostOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "contributors",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class GetBoostInsightsEndpointGlobalBoostOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in contributors (list)
         _items = []
-        if self.contributors:
+        if self.contributors is not None:
             for _item_contributors in self.contributors:
                 if _item_contributors:
                     _items.append(_item_contributors.to_dict())
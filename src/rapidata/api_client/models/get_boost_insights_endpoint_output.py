@@ -67,6 +67,10 @@ class GetBoostInsightsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "global_boost",
+            "prospect_blacklist",
+            "distilling_boosts",
+            "labeling_boosts",
         ])
 
         _dict = self.model_dump(
@@ -75,25 +79,25 @@ class GetBoostInsightsEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of global_boost
-        if self.global_boost:
+        if self.global_boost is not None:
             _dict['globalBoost'] = self.global_boost.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in prospect_blacklist (list)
         _items = []
-        if self.prospect_blacklist:
+        if self.prospect_blacklist is not None:
             for _item_prospect_blacklist in self.prospect_blacklist:
                 if _item_prospect_blacklist:
                     _items.append(_item_prospect_blacklist.to_dict())
             _dict['prospectBlacklist'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in distilling_boosts (list)
         _items = []
-        if self.distilling_boosts:
+        if self.distilling_boosts is not None:
             for _item_distilling_boosts in self.distilling_boosts:
                 if _item_distilling_boosts:
                     _items.append(_item_distilling_boosts.to_dict())
             _dict['distillingBoosts'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in labeling_boosts (list)
         _items = []
-        if self.labeling_boosts:
+        if self.labeling_boosts is not None:
             for _item_labeling_boosts in self.labeling_boosts:
                 if _item_labeling_boosts:
                     _items.append(_item_labeling_boosts.to_dict())
@@ -78,6 +78,7 @@ class GetBulkCloseBillingPeriodsStatusEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "periods",
         ])
 
         _dict = self.model_dump(
@@ -87,7 +88,7 @@ class GetBulkCloseBillingPeriodsStatusEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in periods (list)
         _items = []
-        if self.periods:
+        if self.periods is not None:
             for _item_periods in self.periods:
                 if _item_periods:
                     _items.append(_item_periods.to_dict())
@@ -92,6 +92,11 @@ class GetCampaignByIdEndpointICampaignDetailsGetCampaignByIdEndpointProgramCampa
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "boosting_profile",
+            "sticky_config",
+            "filters",
+            "feature_flags",
+            "nodes",
         ])
 
         _dict = self.model_dump(
@@ -100,28 +105,28 @@ class GetCampaignByIdEndpointICampaignDetailsGetCampaignByIdEndpointProgramCampa
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of boosting_profile
-        if self.boosting_profile:
+        if self.boosting_profile is not None:
             _dict['boostingProfile'] = self.boosting_profile.to_dict()
         # override the default output from pydantic by calling `to_dict()` of sticky_config
-        if self.sticky_config:
+        if self.sticky_config is not None:
             _dict['stickyConfig'] = self.sticky_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
             _dict['filters'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
             _dict['featureFlags'] = _items
         # override the default output from pydantic by calling `to_dict()` of each value in nodes (dict)
         _field_dict = {}
-        if self.nodes:
+        if self.nodes is not None:
             for _key_nodes in self.nodes:
                 if self.nodes[_key_nodes]:
                     _field_dict[_key_nodes] = self.nodes[_key_nodes].to_dict()
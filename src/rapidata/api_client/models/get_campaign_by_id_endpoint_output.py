@@ -80,6 +80,11 @@ class GetCampaignByIdEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "boosting_profile",
+            "sticky_config",
+            "filters",
+            "selections",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -88,28 +93,28 @@ class GetCampaignByIdEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of boosting_profile
-        if self.boosting_profile:
+        if self.boosting_profile is not None:
             _dict['boostingProfile'] = self.boosting_profile.to_dict()
         # override the default output from pydantic by calling `to_dict()` of sticky_config
-        if self.sticky_config:
+        if self.sticky_config is not None:
             _dict['stickyConfig'] = self.sticky_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
             _dict['filters'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in selections (list)
         _items = []
-        if self.selections:
+        if self.selections is not None:
             for _item_selections in self.selections:
                 if _item_selections:
                     _items.append(_item_selections.to_dict())
             _dict['selections'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
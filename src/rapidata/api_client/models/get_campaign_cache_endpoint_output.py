@@ -60,6 +60,7 @@ class GetCampaignCacheEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "campaigns",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class GetCampaignCacheEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in campaigns (list)
         _items = []
-        if self.campaigns:
+        if self.campaigns is not None:
             for _item_campaigns in self.campaigns:
                 if _item_campaigns:
                     _items.append(_item_campaigns.to_dict())
@@ -84,6 +84,10 @@ class GetClassifyWorkflowResultOverviewResult(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "result_type",
+            "progress",
+            "not_started_rapids",
+            "in_progress_rapids",
+            "completed_rapids",
         ])
 
         _dict = self.model_dump(
@@ -92,25 +96,25 @@ class GetClassifyWorkflowResultOverviewResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of progress
-        if self.progress:
+        if self.progress is not None:
             _dict['progress'] = self.progress.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in not_started_rapids (list)
         _items = []
-        if self.not_started_rapids:
+        if self.not_started_rapids is not None:
             for _item_not_started_rapids in self.not_started_rapids:
                 if _item_not_started_rapids:
                     _items.append(_item_not_started_rapids.to_dict())
             _dict['notStartedRapids'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in in_progress_rapids (list)
         _items = []
-        if self.in_progress_rapids:
+        if self.in_progress_rapids is not None:
             for _item_in_progress_rapids in self.in_progress_rapids:
                 if _item_in_progress_rapids:
                     _items.append(_item_in_progress_rapids.to_dict())
             _dict['inProgressRapids'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in completed_rapids (list)
         _items = []
-        if self.completed_rapids:
+        if self.completed_rapids is not None:
             for _item_completed_rapids in self.completed_rapids:
                 if _item_completed_rapids:
                     _items.append(_item_completed_rapids.to_dict())
@@ -77,6 +77,9 @@ class GetCompareWorkflowResultOverviewResult(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "result_type",
+            "progress",
+            "top",
+            "bottom",
         ])
 
         _dict = self.model_dump(
@@ -85,18 +88,18 @@ class GetCompareWorkflowResultOverviewResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of progress
-        if self.progress:
+        if self.progress is not None:
             _dict['progress'] = self.progress.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in top (list)
         _items = []
-        if self.top:
+        if self.top is not None:
             for _item_top in self.top:
                 if _item_top:
                     _items.append(_item_top.to_dict())
             _dict['top'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in bottom (list)
         _items = []
-        if self.bottom:
+        if self.bottom is not None:
             for _item_bottom in self.bottom:
                 if _item_bottom:
                     _items.append(_item_bottom.to_dict())
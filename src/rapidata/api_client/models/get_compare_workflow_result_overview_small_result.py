@@ -75,6 +75,8 @@ class GetCompareWorkflowResultOverviewSmallResult(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "result_type",
+            "progress",
+            "datapoints",
         ])
 
         _dict = self.model_dump(
@@ -83,11 +85,11 @@ class GetCompareWorkflowResultOverviewSmallResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of progress
-        if self.progress:
+        if self.progress is not None:
             _dict['progress'] = self.progress.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in datapoints (list)
         _items = []
-        if self.datapoints:
+        if self.datapoints is not None:
             for _item_datapoints in self.datapoints:
                 if _item_datapoints:
                     _items.append(_item_datapoints.to_dict())
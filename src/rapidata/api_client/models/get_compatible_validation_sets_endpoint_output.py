@@ -59,6 +59,7 @@ class GetCompatibleValidationSetsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "validation_sets",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetCompatibleValidationSetsEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in validation_sets (list)
         _items = []
-        if self.validation_sets:
+        if self.validation_sets is not None:
             for _item_validation_sets in self.validation_sets:
                 if _item_validation_sets:
                     _items.append(_item_validation_sets.to_dict())
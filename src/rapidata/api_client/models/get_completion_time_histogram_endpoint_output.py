@@ -59,6 +59,7 @@ class GetCompletionTimeHistogramEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "buckets",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetCompletionTimeHistogramEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in buckets (list)
         _items = []
-        if self.buckets:
+        if self.buckets is not None:
             for _item_buckets in self.buckets:
                 if _item_buckets:
                     _items.append(_item_buckets.to_dict())
@@ -62,6 +62,7 @@ class GetCostTimeSeriesEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "time_series",
         ])
 
         _dict = self.model_dump(
@@ -71,7 +72,7 @@ class GetCostTimeSeriesEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in time_series (list)
         _items = []
-        if self.time_series:
+        if self.time_series is not None:
             for _item_time_series in self.time_series:
                 if _item_time_series:
                     _items.append(_item_time_series.to_dict())
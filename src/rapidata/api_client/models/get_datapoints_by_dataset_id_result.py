@@ -62,6 +62,7 @@ class GetDatapointsByDatasetIdResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "list",
         ])
 
         _dict = self.model_dump(
@@ -71,7 +72,7 @@ class GetDatapointsByDatasetIdResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in list (list)
         _items = []
-        if self.list:
+        if self.list is not None:
             for _item_list in self.list:
                 if _item_list:
                     _items.append(_item_list.to_dict())
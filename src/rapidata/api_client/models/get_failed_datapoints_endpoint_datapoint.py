@@ -64,6 +64,7 @@ class GetFailedDatapointsEndpointDatapoint(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -72,7 +73,7 @@ class GetFailedDatapointsEndpointDatapoint(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # set to None if sort_index (nullable) is None
         # and model_fields_set contains the field
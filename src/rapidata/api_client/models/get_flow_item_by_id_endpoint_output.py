@@ -73,6 +73,7 @@ class GetFlowItemByIdEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "context_asset",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class GetFlowItemByIdEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # set to None if workflow_id (nullable) is None
         # and model_fields_set contains the field
@@ -62,6 +62,7 @@ class GetGroupedRankingWorkflowResultsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "pair_maker_information",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class GetGroupedRankingWorkflowResultsEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of pair_maker_information
-        if self.pair_maker_information:
+        if self.pair_maker_information is not None:
             _dict['pairMakerInformation'] = self.pair_maker_information.to_dict()
         return _dict
 
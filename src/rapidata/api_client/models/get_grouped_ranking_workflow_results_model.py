@@ -64,6 +64,8 @@ class GetGroupedRankingWorkflowResultsModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "page",
+            "sort_criteria",
         ])
 
         _dict = self.model_dump(
@@ -72,11 +74,11 @@ class GetGroupedRankingWorkflowResultsModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of page
-        if self.page:
+        if self.page is not None:
             _dict['page'] = self.page.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in sort_criteria (list)
         _items = []
-        if self.sort_criteria:
+        if self.sort_criteria is not None:
             for _item_sort_criteria in self.sort_criteria:
                 if _item_sort_criteria:
                     _items.append(_item_sort_criteria.to_dict())
@@ -70,6 +70,7 @@ class GetParticipantByIdEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "faucet",
         ])
 
         _dict = self.model_dump(
@@ -78,7 +79,7 @@ class GetParticipantByIdEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of faucet
-        if self.faucet:
+        if self.faucet is not None:
             _dict['faucet'] = self.faucet.to_dict()
         # set to None if family (nullable) is None
         # and model_fields_set contains the field
@@ -62,6 +62,8 @@ class GetPipelineByIdResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "artifacts",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -71,14 +73,14 @@ class GetPipelineByIdResult(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in artifacts (dict)
         _field_dict = {}
-        if self.artifacts:
+        if self.artifacts is not None:
             for _key_artifacts in self.artifacts:
                 if self.artifacts[_key_artifacts]:
                     _field_dict[_key_artifacts] = self.artifacts[_key_artifacts].to_dict()
             _dict['artifacts'] = _field_dict
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
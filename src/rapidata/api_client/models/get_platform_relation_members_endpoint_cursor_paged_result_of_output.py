@@ -60,6 +60,7 @@ class GetPlatformRelationMembersEndpointCursorPagedResultOfOutput(LazyValidatedM
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "items",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class GetPlatformRelationMembersEndpointCursorPagedResultOfOutput(LazyValidatedM
         )
         # override the default output from pydantic by calling `to_dict()` of each item in items (list)
         _items = []
-        if self.items:
+        if self.items is not None:
             for _item_items in self.items:
                 if _item_items:
                     _items.append(_item_items.to_dict())
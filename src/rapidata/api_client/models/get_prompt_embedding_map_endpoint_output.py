@@ -64,6 +64,8 @@ class GetPromptEmbeddingMapEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "tags",
+            "points",
         ])
 
         _dict = self.model_dump(
@@ -73,14 +75,14 @@ class GetPromptEmbeddingMapEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in tags (list)
         _items = []
-        if self.tags:
+        if self.tags is not None:
             for _item_tags in self.tags:
                 if _item_tags:
                     _items.append(_item_tags.to_dict())
             _dict['tags'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in points (list)
         _items = []
-        if self.points:
+        if self.points is not None:
             for _item_points in self.points:
                 if _item_points:
                     _items.append(_item_points.to_dict())
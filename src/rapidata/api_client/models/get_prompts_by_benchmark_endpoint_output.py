@@ -69,6 +69,9 @@ class GetPromptsByBenchmarkEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt_asset",
+            "tags",
+            "origin",
         ])
 
         _dict = self.model_dump(
@@ -77,17 +80,17 @@ class GetPromptsByBenchmarkEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in tags (list)
         _items = []
-        if self.tags:
+        if self.tags is not None:
             for _item_tags in self.tags:
                 if _item_tags:
                     _items.append(_item_tags.to_dict())
             _dict['tags'] = _items
         # override the default output from pydantic by calling `to_dict()` of origin
-        if self.origin:
+        if self.origin is not None:
             _dict['origin'] = self.origin.to_dict()
         # set to None if english_prompt (nullable) is None
         # and model_fields_set contains the field
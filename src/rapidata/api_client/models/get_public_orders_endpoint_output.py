@@ -59,6 +59,7 @@ class GetPublicOrdersEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "orders",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetPublicOrdersEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in orders (list)
         _items = []
-        if self.orders:
+        if self.orders is not None:
             for _item_orders in self.orders:
                 if _item_orders:
                     _items.append(_item_orders.to_dict())
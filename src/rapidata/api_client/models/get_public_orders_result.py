@@ -62,6 +62,7 @@ class GetPublicOrdersResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "orders",
         ])
 
         _dict = self.model_dump(
@@ -71,7 +72,7 @@ class GetPublicOrdersResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in orders (list)
         _items = []
-        if self.orders:
+        if self.orders is not None:
             for _item_orders in self.orders:
                 if _item_orders:
                     _items.append(_item_orders.to_dict())
@@ -60,6 +60,7 @@ class GetPublicResponsesResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "responses",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class GetPublicResponsesResult(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in responses (list)
         _items = []
-        if self.responses:
+        if self.responses is not None:
             for _item_responses in self.responses:
                 if _item_responses:
                     _items.append(_item_responses.to_dict())
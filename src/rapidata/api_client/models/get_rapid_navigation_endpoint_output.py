@@ -64,6 +64,9 @@ class GetRapidNavigationEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "current",
+            "previous",
+            "next",
         ])
 
         _dict = self.model_dump(
@@ -72,18 +75,18 @@ class GetRapidNavigationEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of current
-        if self.current:
+        if self.current is not None:
             _dict['current'] = self.current.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in previous (list)
         _items = []
-        if self.previous:
+        if self.previous is not None:
             for _item_previous in self.previous:
                 if _item_previous:
                     _items.append(_item_previous.to_dict())
             _dict['previous'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in next (list)
         _items = []
-        if self.next:
+        if self.next is not None:
             for _item_next in self.next:
                 if _item_next:
                     _items.append(_item_next.to_dict())
@@ -67,6 +67,8 @@ class GetRapidResponsesResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "responses",
         ])
 
         _dict = self.model_dump(
@@ -75,11 +77,11 @@ class GetRapidResponsesResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in responses (list)
         _items = []
-        if self.responses:
+        if self.responses is not None:
             for _item_responses in self.responses:
                 if _item_responses:
                     _items.append(_item_responses.to_dict())
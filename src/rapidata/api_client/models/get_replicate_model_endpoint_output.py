@@ -66,6 +66,7 @@ class GetReplicateModelEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "parameters",
         ])
 
         _dict = self.model_dump(
@@ -75,7 +76,7 @@ class GetReplicateModelEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in parameters (list)
         _items = []
-        if self.parameters:
+        if self.parameters is not None:
             for _item_parameters in self.parameters:
                 if _item_parameters:
                     _items.append(_item_parameters.to_dict())
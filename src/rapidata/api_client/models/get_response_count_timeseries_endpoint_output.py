@@ -59,6 +59,7 @@ class GetResponseCountTimeseriesEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "datapoints",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetResponseCountTimeseriesEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in datapoints (list)
         _items = []
-        if self.datapoints:
+        if self.datapoints is not None:
             for _item_datapoints in self.datapoints:
                 if _item_datapoints:
                     _items.append(_item_datapoints.to_dict())
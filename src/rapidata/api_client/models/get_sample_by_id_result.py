@@ -71,6 +71,8 @@ class GetSampleByIdResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "prompt_asset",
         ])
 
         _dict = self.model_dump(
@@ -79,10 +81,10 @@ class GetSampleByIdResult(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # set to None if prompt (nullable) is None
         # and model_fields_set contains the field
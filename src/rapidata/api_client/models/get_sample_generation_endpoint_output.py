@@ -75,6 +75,7 @@ class GetSampleGenerationEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "participant_filter",
         ])
 
         _dict = self.model_dump(
@@ -84,7 +85,7 @@ class GetSampleGenerationEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in participant_filter (list)
         _items = []
-        if self.participant_filter:
+        if self.participant_filter is not None:
             for _item_participant_filter in self.participant_filter:
                 if _item_participant_filter:
                     _items.append(_item_participant_filter.to_dict())
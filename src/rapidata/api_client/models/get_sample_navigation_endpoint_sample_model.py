@@ -72,6 +72,8 @@ class GetSampleNavigationEndpointSampleModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "prompt_asset",
         ])
 
         _dict = self.model_dump(
@@ -80,10 +82,10 @@ class GetSampleNavigationEndpointSampleModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # set to None if english_prompt (nullable) is None
         # and model_fields_set contains the field
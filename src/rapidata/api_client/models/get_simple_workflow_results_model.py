@@ -64,6 +64,8 @@ class GetSimpleWorkflowResultsModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "page",
+            "sort_criteria",
         ])
 
         _dict = self.model_dump(
@@ -72,10 +74,10 @@ class GetSimpleWorkflowResultsModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of page
-        if self.page:
+        if self.page is not None:
             _dict['page'] = self.page.to_dict()
         # override the default output from pydantic by calling `to_dict()` of sort_criteria
-        if self.sort_criteria:
+        if self.sort_criteria is not None:
             _dict['sortCriteria'] = self.sort_criteria.to_dict()
         # set to None if states (nullable) is None
         # and model_fields_set contains the field
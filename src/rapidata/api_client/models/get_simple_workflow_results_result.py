@@ -75,6 +75,9 @@ class GetSimpleWorkflowResultsResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "payload",
+            "asset",
+            "responses",
         ])
 
         _dict = self.model_dump(
@@ -83,14 +86,14 @@ class GetSimpleWorkflowResultsResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in responses (list)
         _items = []
-        if self.responses:
+        if self.responses is not None:
             for _item_responses in self.responses:
                 if _item_responses:
                     _items.append(_item_responses.to_dict())
@@ -75,6 +75,9 @@ class GetValidationRapidsQuery(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "page_info",
+            "root_filter",
+            "sort_criteria",
         ])
 
         _dict = self.model_dump(
@@ -83,14 +86,14 @@ class GetValidationRapidsQuery(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of page_info
-        if self.page_info:
+        if self.page_info is not None:
             _dict['pageInfo'] = self.page_info.to_dict()
         # override the default output from pydantic by calling `to_dict()` of root_filter
-        if self.root_filter:
+        if self.root_filter is not None:
             _dict['rootFilter'] = self.root_filter.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in sort_criteria (list)
         _items = []
-        if self.sort_criteria:
+        if self.sort_criteria is not None:
             for _item_sort_criteria in self.sort_criteria:
                 if _item_sort_criteria:
                     _items.append(_item_sort_criteria.to_dict())
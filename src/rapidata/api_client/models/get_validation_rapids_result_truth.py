@@ -30,6 +30,7 @@ from rapidata.api_client.models.scrub_truth import ScrubTruth
 from rapidata.api_client.models.skip_truth import SkipTruth
 from rapidata.api_client.models.transcription_truth import TranscriptionTruth
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
@@ -164,6 +165,13 @@ class GetValidationRapidsResultTruth(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
@@ -59,6 +59,7 @@ class GetWorkflowByIdEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow",
         ])
 
         _dict = self.model_dump(
@@ -67,7 +68,7 @@ class GetWorkflowByIdEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow
-        if self.workflow:
+        if self.workflow is not None:
             _dict['workflow'] = self.workflow.to_dict()
         return _dict
 
@@ -60,6 +60,7 @@ class GetWorkflowByIdResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetWorkflowByIdResult(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow
-        if self.workflow:
+        if self.workflow is not None:
             _dict['workflow'] = self.workflow.to_dict()
         return _dict
 
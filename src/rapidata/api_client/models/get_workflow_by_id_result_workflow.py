@@ -22,6 +22,7 @@ from rapidata.api_client.models.evaluation_workflow_model1 import EvaluationWork
 from rapidata.api_client.models.grouped_ranking_workflow_model1 import GroupedRankingWorkflowModel1
 from rapidata.api_client.models.simple_workflow_model1 import SimpleWorkflowModel1
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
@@ -97,6 +98,13 @@ class GetWorkflowByIdResultWorkflow(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
@@ -62,6 +62,7 @@ class GetWorkflowConfigResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow_config",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class GetWorkflowConfigResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow_config
-        if self.workflow_config:
+        if self.workflow_config is not None:
             _dict['workflowConfig'] = self.workflow_config.to_dict()
         return _dict
 
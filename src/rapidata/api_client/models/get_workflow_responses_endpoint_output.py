@@ -59,6 +59,7 @@ class GetWorkflowResponsesEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "responses",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class GetWorkflowResponsesEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in responses (list)
         _items = []
-        if self.responses:
+        if self.responses is not None:
             for _item_responses in self.responses:
                 if _item_responses:
                     _items.append(_item_responses.to_dict())
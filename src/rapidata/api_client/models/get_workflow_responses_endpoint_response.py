@@ -69,6 +69,7 @@ class GetWorkflowResponsesEndpointResponse(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "result",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class GetWorkflowResponsesEndpointResponse(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of result
-        if self.result:
+        if self.result is not None:
             _dict['result'] = self.result.to_dict()
         # set to None if age (nullable) is None
         # and model_fields_set contains the field
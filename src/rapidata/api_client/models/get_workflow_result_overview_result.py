@@ -73,6 +73,7 @@ class GetWorkflowResultOverviewResult(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "result_type",
+            "progress",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class GetWorkflowResultOverviewResult(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of progress
-        if self.progress:
+        if self.progress is not None:
             _dict['progress'] = self.progress.to_dict()
         return _dict
 
@@ -65,6 +65,8 @@ class GroupedRankingGroup(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "pair_maker_information",
+            "datapoints",
         ])
 
         _dict = self.model_dump(
@@ -73,11 +75,11 @@ class GroupedRankingGroup(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of pair_maker_information
-        if self.pair_maker_information:
+        if self.pair_maker_information is not None:
             _dict['pairMakerInformation'] = self.pair_maker_information.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in datapoints (list)
         _items = []
-        if self.datapoints:
+        if self.datapoints is not None:
             for _item_datapoints in self.datapoints:
                 if _item_datapoints:
                     _items.append(_item_datapoints.to_dict())
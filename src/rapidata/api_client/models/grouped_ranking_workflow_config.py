@@ -82,6 +82,11 @@ class GroupedRankingWorkflowConfig(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "referee",
+            "context_assets",
+            "elo_config",
+            "pair_maker_config",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -90,24 +95,24 @@ class GroupedRankingWorkflowConfig(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each value in context_assets (dict)
         _field_dict = {}
-        if self.context_assets:
+        if self.context_assets is not None:
             for _key_context_assets in self.context_assets:
                 if self.context_assets[_key_context_assets]:
                     _field_dict[_key_context_assets] = self.context_assets[_key_context_assets].to_dict()
             _dict['contextAssets'] = _field_dict
         # override the default output from pydantic by calling `to_dict()` of elo_config
-        if self.elo_config:
+        if self.elo_config is not None:
             _dict['eloConfig'] = self.elo_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of pair_maker_config
-        if self.pair_maker_config:
+        if self.pair_maker_config is not None:
             _dict['pairMakerConfig'] = self.pair_maker_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
@@ -77,6 +77,8 @@ class GroupedRankingWorkflowModel1(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "referee",
+            "elo_config",
         ])
 
         _dict = self.model_dump(
@@ -85,10 +87,10 @@ class GroupedRankingWorkflowModel1(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of elo_config
-        if self.elo_config:
+        if self.elo_config is not None:
             _dict['eloConfig'] = self.elo_config.to_dict()
         # set to None if owner_mail (nullable) is None
         # and model_fields_set contains the field
@@ -68,6 +68,7 @@ class IArtifactModelWorkflowConfigArtifactModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow_config",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class IArtifactModelWorkflowConfigArtifactModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow_config
-        if self.workflow_config:
+        if self.workflow_config is not None:
             _dict['workflowConfig'] = self.workflow_config.to_dict()
         return _dict
 
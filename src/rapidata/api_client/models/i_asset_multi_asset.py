@@ -69,6 +69,8 @@ class IAssetMultiAsset(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "assets",
+            "metadata",
         ])
 
         _dict = self.model_dump(
@@ -78,14 +80,14 @@ class IAssetMultiAsset(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in assets (list)
         _items = []
-        if self.assets:
+        if self.assets is not None:
             for _item_assets in self.assets:
                 if _item_assets:
                     _items.append(_item_assets.to_dict())
             _dict['assets'] = _items
         # override the default output from pydantic by calling `to_dict()` of each value in metadata (dict)
         _field_dict = {}
-        if self.metadata:
+        if self.metadata is not None:
             for _key_metadata in self.metadata:
                 if self.metadata[_key_metadata]:
                     _field_dict[_key_metadata] = self.metadata[_key_metadata].to_dict()
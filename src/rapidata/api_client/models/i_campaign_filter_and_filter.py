@@ -66,6 +66,7 @@ class ICampaignFilterAndFilter(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filters",
         ])
 
         _dict = self.model_dump(
@@ -75,7 +76,7 @@ class ICampaignFilterAndFilter(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
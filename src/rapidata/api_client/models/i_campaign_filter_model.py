@@ -30,6 +30,7 @@ from rapidata.api_client.models.i_campaign_filter_model_response_count_filter_mo
 from rapidata.api_client.models.i_campaign_filter_model_user_action_restriction_filter_model import ICampaignFilterModelUserActionRestrictionFilterModel
 from rapidata.api_client.models.i_campaign_filter_model_user_score_filter_model import ICampaignFilterModelUserScoreFilterModel
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from rapidata.api_client.lazy_model import LazyValidatedModel
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
@@ -180,6 +181,13 @@ class ICampaignFilterModel(LazyValidatedModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
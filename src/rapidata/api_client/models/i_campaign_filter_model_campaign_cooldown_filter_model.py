@@ -67,6 +67,7 @@ class ICampaignFilterModelCampaignCooldownFilterModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "cooldown",
         ])
 
         _dict = self.model_dump(
@@ -75,7 +76,7 @@ class ICampaignFilterModelCampaignCooldownFilterModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of cooldown
-        if self.cooldown:
+        if self.cooldown is not None:
             _dict['cooldown'] = self.cooldown.to_dict()
         return _dict
 
@@ -66,6 +66,7 @@ class ICampaignFilterModelNotFilterModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filter",
         ])
 
         _dict = self.model_dump(
@@ -74,7 +75,7 @@ class ICampaignFilterModelNotFilterModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of filter
-        if self.filter:
+        if self.filter is not None:
             _dict['filter'] = self.filter.to_dict()
         return _dict
 
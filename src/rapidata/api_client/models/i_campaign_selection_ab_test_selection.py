@@ -67,6 +67,8 @@ class ICampaignSelectionAbTestSelection(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "a",
+            "b",
         ])
 
         _dict = self.model_dump(
@@ -76,14 +78,14 @@ class ICampaignSelectionAbTestSelection(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in a (list)
         _items = []
-        if self.a:
+        if self.a is not None:
             for _item_a in self.a:
                 if _item_a:
                     _items.append(_item_a.to_dict())
             _dict['a'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in b (list)
         _items = []
-        if self.b:
+        if self.b is not None:
             for _item_b in self.b:
                 if _item_b:
                     _items.append(_item_b.to_dict())
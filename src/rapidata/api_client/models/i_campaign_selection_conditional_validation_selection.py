@@ -67,6 +67,7 @@ class ICampaignSelectionConditionalValidationSelection(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "validation_chances",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class ICampaignSelectionConditionalValidationSelection(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in validation_chances (list)
         _items = []
-        if self.validation_chances:
+        if self.validation_chances is not None:
             for _item_validation_chances in self.validation_chances:
                 if _item_validation_chances:
                     _items.append(_item_validation_chances.to_dict())
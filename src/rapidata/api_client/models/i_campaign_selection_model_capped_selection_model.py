@@ -67,6 +67,7 @@ class ICampaignSelectionModelCappedSelectionModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "selections",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class ICampaignSelectionModelCappedSelectionModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in selections (list)
         _items = []
-        if self.selections:
+        if self.selections is not None:
             for _item_selections in self.selections:
                 if _item_selections:
                     _items.append(_item_selections.to_dict())
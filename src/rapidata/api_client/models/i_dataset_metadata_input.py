@@ -21,6 +21,7 @@ from rapidata.api_client.models.i_dataset_metadata_input_prompt_asset_metadata_i
 from rapidata.api_client.models.i_dataset_metadata_input_prompt_metadata_input import IDatasetMetadataInputPromptMetadataInput
 from rapidata.api_client.models.i_dataset_metadata_input_transcription_metadata_input import IDatasetMetadataInputTranscriptionMetadataInput
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
@@ -89,6 +90,13 @@ class IDatasetMetadataInput(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
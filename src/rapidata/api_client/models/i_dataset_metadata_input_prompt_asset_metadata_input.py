@@ -70,6 +70,7 @@ class IDatasetMetadataInputPromptAssetMetadataInput(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -78,7 +79,7 @@ class IDatasetMetadataInputPromptAssetMetadataInput(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         return _dict
 
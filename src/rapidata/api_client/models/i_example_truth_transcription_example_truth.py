@@ -70,6 +70,7 @@ class IExampleTruthTranscriptionExampleTruth(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "correct_words",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class IExampleTruthTranscriptionExampleTruth(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in correct_words (list)
         _items = []
-        if self.correct_words:
+        if self.correct_words is not None:
             for _item_correct_words in self.correct_words:
                 if _item_correct_words:
                     _items.append(_item_correct_words.to_dict())
@@ -23,6 +23,7 @@ from rapidata.api_client.models.i_line_item_refund import ILineItemRefund
 from rapidata.api_client.models.i_line_item_running_cost import ILineItemRunningCost
 from rapidata.api_client.models.i_line_item_volume_discount import ILineItemVolumeDiscount
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from rapidata.api_client.lazy_model import LazyValidatedModel
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
@@ -110,6 +111,13 @@ class ILineItem(LazyValidatedModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
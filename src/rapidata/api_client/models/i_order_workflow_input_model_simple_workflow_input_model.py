@@ -70,6 +70,8 @@ class IOrderWorkflowInputModelSimpleWorkflowInputModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "blueprint",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -78,11 +80,11 @@ class IOrderWorkflowInputModelSimpleWorkflowInputModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of blueprint
-        if self.blueprint:
+        if self.blueprint is not None:
             _dict['blueprint'] = self.blueprint.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
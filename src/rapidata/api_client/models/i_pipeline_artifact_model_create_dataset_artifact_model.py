@@ -68,6 +68,7 @@ class IPipelineArtifactModelCreateDatasetArtifactModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "dataset",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class IPipelineArtifactModelCreateDatasetArtifactModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of dataset
-        if self.dataset:
+        if self.dataset is not None:
             _dict['dataset'] = self.dataset.to_dict()
         return _dict
 
@@ -70,6 +70,8 @@ class IPipelineCreateSimplePipeline(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "artifacts",
+            "pipeline_steps",
         ])
 
         _dict = self.model_dump(
@@ -79,14 +81,14 @@ class IPipelineCreateSimplePipeline(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in artifacts (list)
         _items = []
-        if self.artifacts:
+        if self.artifacts is not None:
             for _item_artifacts in self.artifacts:
                 if _item_artifacts:
                     _items.append(_item_artifacts.to_dict())
             _dict['artifacts'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in pipeline_steps (list)
         _items = []
-        if self.pipeline_steps:
+        if self.pipeline_steps is not None:
             for _item_pipeline_steps in self.pipeline_steps:
                 if _item_pipeline_steps:
                     _items.append(_item_pipeline_steps.to_dict())
@@ -67,6 +67,7 @@ class IProgramNodeActionNode(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "action",
         ])
 
         _dict = self.model_dump(
@@ -75,7 +76,7 @@ class IProgramNodeActionNode(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of action
-        if self.action:
+        if self.action is not None:
             _dict['action'] = self.action.to_dict()
         return _dict
 
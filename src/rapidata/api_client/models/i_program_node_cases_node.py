@@ -68,6 +68,7 @@ class IProgramNodeCasesNode(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "cases",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IProgramNodeCasesNode(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in cases (list)
         _items = []
-        if self.cases:
+        if self.cases is not None:
             for _item_cases in self.cases:
                 if _item_cases:
                     _items.append(_item_cases.to_dict())
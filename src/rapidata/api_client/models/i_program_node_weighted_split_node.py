@@ -67,6 +67,7 @@ class IProgramNodeWeightedSplitNode(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "branches",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class IProgramNodeWeightedSplitNode(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in branches (list)
         _items = []
-        if self.branches:
+        if self.branches is not None:
             for _item_branches in self.branches:
                 if _item_branches:
                     _items.append(_item_branches.to_dict())
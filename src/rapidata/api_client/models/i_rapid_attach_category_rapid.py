@@ -76,6 +76,12 @@ class IRapidAttachCategoryRapid(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "categories",
+            "title",
+            "asset",
+            "context",
+            "context_asset",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -85,26 +91,26 @@ class IRapidAttachCategoryRapid(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in categories (list)
         _items = []
-        if self.categories:
+        if self.categories is not None:
             for _item_categories in self.categories:
                 if _item_categories:
                     _items.append(_item_categories.to_dict())
             _dict['categories'] = _items
         # override the default output from pydantic by calling `to_dict()` of title
-        if self.title:
+        if self.title is not None:
             _dict['title'] = self.title.to_dict()
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context
-        if self.context:
+        if self.context is not None:
             _dict['context'] = self.context.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
@@ -74,6 +74,11 @@ class IRapidLineRapid(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "target",
+            "asset",
+            "context",
+            "context_asset",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -82,20 +87,20 @@ class IRapidLineRapid(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of target
-        if self.target:
+        if self.target is not None:
             _dict['target'] = self.target.to_dict()
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context
-        if self.context:
+        if self.context is not None:
             _dict['context'] = self.context.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
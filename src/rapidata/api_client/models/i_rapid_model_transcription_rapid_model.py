@@ -76,6 +76,12 @@ class IRapidModelTranscriptionRapidModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "transcription",
+            "title",
+            "asset",
+            "context",
+            "context_asset",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -85,26 +91,26 @@ class IRapidModelTranscriptionRapidModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in transcription (list)
         _items = []
-        if self.transcription:
+        if self.transcription is not None:
             for _item_transcription in self.transcription:
                 if _item_transcription:
                     _items.append(_item_transcription.to_dict())
             _dict['transcription'] = _items
         # override the default output from pydantic by calling `to_dict()` of title
-        if self.title:
+        if self.title is not None:
             _dict['title'] = self.title.to_dict()
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context
-        if self.context:
+        if self.context is not None:
             _dict['context'] = self.context.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
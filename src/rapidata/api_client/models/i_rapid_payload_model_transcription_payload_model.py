@@ -68,6 +68,7 @@ class IRapidPayloadModelTranscriptionPayloadModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "transcription",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidPayloadModelTranscriptionPayloadModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in transcription (list)
         _items = []
-        if self.transcription:
+        if self.transcription is not None:
             for _item_transcription in self.transcription:
                 if _item_transcription:
                     _items.append(_item_transcription.to_dict())
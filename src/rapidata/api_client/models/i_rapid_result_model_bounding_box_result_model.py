@@ -68,6 +68,7 @@ class IRapidResultModelBoundingBoxResultModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "bounding_boxes",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidResultModelBoundingBoxResultModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in bounding_boxes (list)
         _items = []
-        if self.bounding_boxes:
+        if self.bounding_boxes is not None:
             for _item_bounding_boxes in self.bounding_boxes:
                 if _item_bounding_boxes:
                     _items.append(_item_bounding_boxes.to_dict())
@@ -68,6 +68,7 @@ class IRapidResultModelLineResultModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "lines",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidResultModelLineResultModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in lines (list)
         _items = []
-        if self.lines:
+        if self.lines is not None:
             for _item_lines in self.lines:
                 if _item_lines:
                     _items.append(_item_lines.to_dict())
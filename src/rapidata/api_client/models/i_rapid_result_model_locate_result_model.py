@@ -68,6 +68,7 @@ class IRapidResultModelLocateResultModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "coordinates",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidResultModelLocateResultModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in coordinates (list)
         _items = []
-        if self.coordinates:
+        if self.coordinates is not None:
             for _item_coordinates in self.coordinates:
                 if _item_coordinates:
                     _items.append(_item_coordinates.to_dict())
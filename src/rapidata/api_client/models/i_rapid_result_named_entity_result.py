@@ -68,6 +68,7 @@ class IRapidResultNamedEntityResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "classifications",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidResultNamedEntityResult(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in classifications (list)
         _items = []
-        if self.classifications:
+        if self.classifications is not None:
             for _item_classifications in self.classifications:
                 if _item_classifications:
                     _items.append(_item_classifications.to_dict())
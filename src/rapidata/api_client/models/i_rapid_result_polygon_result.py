@@ -68,6 +68,7 @@ class IRapidResultPolygonResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "shapes",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidResultPolygonResult(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in shapes (list)
         _items = []
-        if self.shapes:
+        if self.shapes is not None:
             for _item_shapes in self.shapes:
                 if _item_shapes:
                     _items.append(_item_shapes.to_dict())
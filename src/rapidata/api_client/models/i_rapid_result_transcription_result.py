@@ -68,6 +68,7 @@ class IRapidResultTranscriptionResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "selected_words",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class IRapidResultTranscriptionResult(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in selected_words (list)
         _items = []
-        if self.selected_words:
+        if self.selected_words is not None:
             for _item_selected_words in self.selected_words:
                 if _item_selected_words:
                     _items.append(_item_selected_words.to_dict())
@@ -67,6 +67,7 @@ class IResponseAggregationClassifyAggregation(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "category_tallies",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class IResponseAggregationClassifyAggregation(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in category_tallies (dict)
         _field_dict = {}
-        if self.category_tallies:
+        if self.category_tallies is not None:
             for _key_category_tallies in self.category_tallies:
                 if self.category_tallies[_key_category_tallies]:
                     _field_dict[_key_category_tallies] = self.category_tallies[_key_category_tallies].to_dict()
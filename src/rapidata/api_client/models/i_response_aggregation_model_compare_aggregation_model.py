@@ -67,6 +67,7 @@ class IResponseAggregationModelCompareAggregationModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "winner_tallies",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class IResponseAggregationModelCompareAggregationModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in winner_tallies (dict)
         _field_dict = {}
-        if self.winner_tallies:
+        if self.winner_tallies is not None:
             for _key_winner_tallies in self.winner_tallies:
                 if self.winner_tallies[_key_winner_tallies]:
                     _field_dict[_key_winner_tallies] = self.winner_tallies[_key_winner_tallies].to_dict()
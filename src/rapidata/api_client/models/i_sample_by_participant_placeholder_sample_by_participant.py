@@ -71,6 +71,7 @@ class ISampleByParticipantPlaceholderSampleByParticipant(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt_asset",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class ISampleByParticipantPlaceholderSampleByParticipant(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # set to None if prompt (nullable) is None
         # and model_fields_set contains the field
@@ -68,6 +68,7 @@ class ISelectionConditionalValidationSelection(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "validation_chances",
         ])
 
         _dict = self.model_dump(
@@ -77,7 +78,7 @@ class ISelectionConditionalValidationSelection(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in validation_chances (list)
         _items = []
-        if self.validation_chances:
+        if self.validation_chances is not None:
             for _item_validation_chances in self.validation_chances:
                 if _item_validation_chances:
                     _items.append(_item_validation_chances.to_dict())
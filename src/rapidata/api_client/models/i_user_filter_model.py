@@ -27,6 +27,7 @@ from rapidata.api_client.models.i_user_filter_model_new_user_filter_model import
 from rapidata.api_client.models.i_user_filter_model_response_count_user_filter_model import IUserFilterModelResponseCountUserFilterModel
 from rapidata.api_client.models.i_user_filter_model_user_score_user_filter_model import IUserFilterModelUserScoreUserFilterModel
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from rapidata.api_client.lazy_model import LazyValidatedModel
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
@@ -163,6 +164,13 @@ class IUserFilterModel(LazyValidatedModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
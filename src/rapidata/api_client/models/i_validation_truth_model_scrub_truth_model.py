@@ -67,6 +67,7 @@ class IValidationTruthModelScrubTruthModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "valid_ranges",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class IValidationTruthModelScrubTruthModel(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in valid_ranges (list)
         _items = []
-        if self.valid_ranges:
+        if self.valid_ranges is not None:
             for _item_valid_ranges in self.valid_ranges:
                 if _item_valid_ranges:
                     _items.append(_item_valid_ranges.to_dict())
@@ -73,6 +73,7 @@ class IWorkflowModelEvaluationWorkflowModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "referee",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class IWorkflowModelEvaluationWorkflowModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # set to None if owner_mail (nullable) is None
         # and model_fields_set contains the field
@@ -75,6 +75,8 @@ class IWorkflowModelGroupedRankingWorkflowModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "referee",
+            "ranking_config",
         ])
 
         _dict = self.model_dump(
@@ -83,10 +85,10 @@ class IWorkflowModelGroupedRankingWorkflowModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # override the default output from pydantic by calling `to_dict()` of ranking_config
-        if self.ranking_config:
+        if self.ranking_config is not None:
             _dict['rankingConfig'] = self.ranking_config.to_dict()
         # set to None if owner_mail (nullable) is None
         # and model_fields_set contains the field
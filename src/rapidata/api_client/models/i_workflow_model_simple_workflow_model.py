@@ -74,6 +74,8 @@ class IWorkflowModelSimpleWorkflowModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "blueprint",
+            "referee",
         ])
 
         _dict = self.model_dump(
@@ -82,10 +84,10 @@ class IWorkflowModelSimpleWorkflowModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of blueprint
-        if self.blueprint:
+        if self.blueprint is not None:
             _dict['blueprint'] = self.blueprint.to_dict()
         # override the default output from pydantic by calling `to_dict()` of referee
-        if self.referee:
+        if self.referee is not None:
             _dict['referee'] = self.referee.to_dict()
         # set to None if owner_mail (nullable) is None
         # and model_fields_set contains the field
@@ -72,6 +72,11 @@ class JobRapidResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
+            "responses",
+            "payload",
+            "context_asset",
+            "aggregation",
         ])
 
         _dict = self.model_dump(
@@ -80,23 +85,23 @@ class JobRapidResult(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in responses (list)
         _items = []
-        if self.responses:
+        if self.responses is not None:
             for _item_responses in self.responses:
                 if _item_responses:
                     _items.append(_item_responses.to_dict())
             _dict['responses'] = _items
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of aggregation
-        if self.aggregation:
+        if self.aggregation is not None:
             _dict['aggregation'] = self.aggregation.to_dict()
         # set to None if context (nullable) is None
         # and model_fields_set contains the field
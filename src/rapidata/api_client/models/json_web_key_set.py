@@ -59,6 +59,7 @@ class JsonWebKeySet(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "keys",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class JsonWebKeySet(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in keys (list)
         _items = []
-        if self.keys:
+        if self.keys is not None:
             for _item_keys in self.keys:
                 if _item_keys:
                     _items.append(_item_keys.to_dict())
@@ -74,6 +74,8 @@ class LeaderboardQueryResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filters",
+            "feature_flags",
         ])
 
         _dict = self.model_dump(
@@ -83,14 +85,14 @@ class LeaderboardQueryResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
             _dict['filters'] = _items
         # override the default output from pydantic by calling `to_dict()` of each item in feature_flags (list)
         _items = []
-        if self.feature_flags:
+        if self.feature_flags is not None:
             for _item_feature_flags in self.feature_flags:
                 if _item_feature_flags:
                     _items.append(_item_feature_flags.to_dict())
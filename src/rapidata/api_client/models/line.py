@@ -60,6 +60,7 @@ class Line(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "points",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class Line(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in points (list)
         _items = []
-        if self.points:
+        if self.points is not None:
             for _item_points in self.points:
                 if _item_points:
                     _items.append(_item_points.to_dict())
@@ -71,6 +71,7 @@ class LineResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "lines",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class LineResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in lines (list)
         _items = []
-        if self.lines:
+        if self.lines is not None:
             for _item_lines in self.lines:
                 if _item_lines:
                     _items.append(_item_lines.to_dict())
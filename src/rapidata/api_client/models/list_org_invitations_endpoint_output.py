@@ -59,6 +59,7 @@ class ListOrgInvitationsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "invitations",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class ListOrgInvitationsEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in invitations (list)
         _items = []
-        if self.invitations:
+        if self.invitations is not None:
             for _item_invitations in self.invitations:
                 if _item_invitations:
                     _items.append(_item_invitations.to_dict())
@@ -59,6 +59,7 @@ class ListOrgMembersEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "members",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class ListOrgMembersEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in members (list)
         _items = []
-        if self.members:
+        if self.members is not None:
             for _item_members in self.members:
                 if _item_members:
                     _items.append(_item_members.to_dict())
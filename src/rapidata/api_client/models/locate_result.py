@@ -71,6 +71,7 @@ class LocateResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "coordinates",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class LocateResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in coordinates (list)
         _items = []
-        if self.coordinates:
+        if self.coordinates is not None:
             for _item_coordinates in self.coordinates:
                 if _item_coordinates:
                     _items.append(_item_coordinates.to_dict())
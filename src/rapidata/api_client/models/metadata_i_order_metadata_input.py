@@ -21,6 +21,7 @@ from rapidata.api_client.models.metadata_i_order_metadata_input_metadata_prompt_
 from rapidata.api_client.models.metadata_i_order_metadata_input_metadata_prompt_metadata_input import MetadataIOrderMetadataInputMetadataPromptMetadataInput
 from rapidata.api_client.models.metadata_i_order_metadata_input_metadata_transcription_metadata_input import MetadataIOrderMetadataInputMetadataTranscriptionMetadataInput
 from pydantic import StrictStr, Field
+from rapidata.api_client.oneof_dispatch import discriminated_variant
 from rapidata.api_client.lazy_model import LazyValidatedModel
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
@@ -87,6 +88,13 @@ class MetadataIOrderMetadataInput(LazyValidatedModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
+        # Deserialize straight into the variant named by `_t`; trial-match
+        # every oneOf schema only when the discriminator does not settle it.
+        variant = discriminated_variant(cls, obj)
+        if variant is not None:
+            instance = cls.model_construct()
+            instance.actual_instance = variant.from_dict(obj)
+            return instance
         return cls.from_json(json.dumps(obj))
 
     @classmethod
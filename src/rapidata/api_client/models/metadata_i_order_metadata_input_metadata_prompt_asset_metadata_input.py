@@ -68,6 +68,7 @@ class MetadataIOrderMetadataInputMetadataPromptAssetMetadataInput(LazyValidatedM
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -76,7 +77,7 @@ class MetadataIOrderMetadataInputMetadataPromptAssetMetadataInput(LazyValidatedM
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         return _dict
 
@@ -72,6 +72,7 @@ class MultiAssetInput3(BaseModel):
         """
         excluded_fields: Set[str] = set([
             "identifier",
+            "assets",
         ])
 
         _dict = self.model_dump(
@@ -81,7 +82,7 @@ class MultiAssetInput3(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in assets (list)
         _items = []
-        if self.assets:
+        if self.assets is not None:
             for _item_assets in self.assets:
                 if _item_assets:
                     _items.append(_item_assets.to_dict())
@@ -71,6 +71,7 @@ class NamedEntityResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "classifications",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class NamedEntityResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in classifications (list)
         _items = []
-        if self.classifications:
+        if self.classifications is not None:
             for _item_classifications in self.classifications:
                 if _item_classifications:
                     _items.append(_item_classifications.to_dict())
@@ -75,6 +75,7 @@ class NotFilter(BaseModel):
         excluded_fields: Set[str] = set([
             "execution_order",
             "inner_filters",
+            "filter",
         ])
 
         _dict = self.model_dump(
@@ -83,11 +84,11 @@ class NotFilter(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of filter
-        if self.filter:
+        if self.filter is not None:
             _dict['filter'] = self.filter.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in inner_filters (list)
         _items = []
-        if self.inner_filters:
+        if self.inner_filters is not None:
             for _item_inner_filters in self.inner_filters:
                 if _item_inner_filters:
                     _items.append(_item_inner_filters.to_dict())
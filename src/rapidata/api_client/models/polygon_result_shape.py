@@ -59,6 +59,7 @@ class PolygonResultShape(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "edges",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class PolygonResultShape(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in edges (list)
         _items = []
-        if self.edges:
+        if self.edges is not None:
             for _item_edges in self.edges:
                 if _item_edges:
                     _items.append(_item_edges.to_dict())
@@ -67,6 +67,8 @@ class PotentialValidationRapid(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "payload",
+            "truth",
         ])
 
         _dict = self.model_dump(
@@ -75,10 +77,10 @@ class PotentialValidationRapid(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of truth
-        if self.truth:
+        if self.truth is not None:
             _dict['truth'] = self.truth.to_dict()
         return _dict
 
@@ -60,6 +60,7 @@ class ProgramCaseModel(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "predicate",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class ProgramCaseModel(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of predicate
-        if self.predicate:
+        if self.predicate is not None:
             _dict['predicate'] = self.predicate.to_dict()
         return _dict
 
@@ -66,6 +66,7 @@ class PromptByBenchmarkResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt_asset",
         ])
 
         _dict = self.model_dump(
@@ -74,7 +75,7 @@ class PromptByBenchmarkResult(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # set to None if prompt (nullable) is None
         # and model_fields_set contains the field
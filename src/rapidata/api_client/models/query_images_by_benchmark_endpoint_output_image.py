@@ -66,6 +66,7 @@ class QueryImagesByBenchmarkEndpointOutputImage(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -74,7 +75,7 @@ class QueryImagesByBenchmarkEndpointOutputImage(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # set to None if participant_name (nullable) is None
         # and model_fields_set contains the field
@@ -69,6 +69,8 @@ class QueryImagesByBenchmarkEndpointOutputPrompt(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt_asset",
+            "images",
         ])
 
         _dict = self.model_dump(
@@ -77,11 +79,11 @@ class QueryImagesByBenchmarkEndpointOutputPrompt(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt_asset
-        if self.prompt_asset:
+        if self.prompt_asset is not None:
             _dict['promptAsset'] = self.prompt_asset.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in images (list)
         _items = []
-        if self.images:
+        if self.images is not None:
             for _item_images in self.images:
                 if _item_images:
                     _items.append(_item_images.to_dict())
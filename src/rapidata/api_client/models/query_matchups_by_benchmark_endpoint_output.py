@@ -64,6 +64,8 @@ class QueryMatchupsByBenchmarkEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "items",
+            "corpus",
         ])
 
         _dict = self.model_dump(
@@ -73,13 +75,13 @@ class QueryMatchupsByBenchmarkEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in items (list)
         _items = []
-        if self.items:
+        if self.items is not None:
             for _item_items in self.items:
                 if _item_items:
                     _items.append(_item_items.to_dict())
             _dict['items'] = _items
         # override the default output from pydantic by calling `to_dict()` of corpus
-        if self.corpus:
+        if self.corpus is not None:
             _dict['corpus'] = self.corpus.to_dict()
         return _dict
 
@@ -68,6 +68,9 @@ class QueryMatchupsByBenchmarkEndpointOutputMatchup(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "leaderboard",
+            "prompt",
+            "sides",
         ])
 
         _dict = self.model_dump(
@@ -76,14 +79,14 @@ class QueryMatchupsByBenchmarkEndpointOutputMatchup(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of leaderboard
-        if self.leaderboard:
+        if self.leaderboard is not None:
             _dict['leaderboard'] = self.leaderboard.to_dict()
         # override the default output from pydantic by calling `to_dict()` of prompt
-        if self.prompt:
+        if self.prompt is not None:
             _dict['prompt'] = self.prompt.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in sides (list)
         _items = []
-        if self.sides:
+        if self.sides is not None:
             for _item_sides in self.sides:
                 if _item_sides:
                     _items.append(_item_sides.to_dict())
@@ -62,6 +62,7 @@ class QueryMatchupsByBenchmarkEndpointOutputPromptDetails(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "asset",
         ])
 
         _dict = self.model_dump(
@@ -70,7 +71,7 @@ class QueryMatchupsByBenchmarkEndpointOutputPromptDetails(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of asset
-        if self.asset:
+        if self.asset is not None:
             _dict['asset'] = self.asset.to_dict()
         # set to None if english (nullable) is None
         # and model_fields_set contains the field
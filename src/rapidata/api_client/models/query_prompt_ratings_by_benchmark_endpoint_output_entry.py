@@ -65,6 +65,7 @@ class QueryPromptRatingsByBenchmarkEndpointOutputEntry(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "images",
         ])
 
         _dict = self.model_dump(
@@ -74,7 +75,7 @@ class QueryPromptRatingsByBenchmarkEndpointOutputEntry(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in images (list)
         _items = []
-        if self.images:
+        if self.images is not None:
             for _item_images in self.images:
                 if _item_images:
                     _items.append(_item_images.to_dict())
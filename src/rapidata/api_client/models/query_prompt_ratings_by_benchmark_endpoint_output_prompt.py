@@ -64,6 +64,9 @@ class QueryPromptRatingsByBenchmarkEndpointOutputPrompt(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt",
+            "entries",
+            "matrix",
         ])
 
         _dict = self.model_dump(
@@ -72,17 +75,17 @@ class QueryPromptRatingsByBenchmarkEndpointOutputPrompt(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt
-        if self.prompt:
+        if self.prompt is not None:
             _dict['prompt'] = self.prompt.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in entries (list)
         _items = []
-        if self.entries:
+        if self.entries is not None:
             for _item_entries in self.entries:
                 if _item_entries:
                     _items.append(_item_entries.to_dict())
             _dict['entries'] = _items
         # override the default output from pydantic by calling `to_dict()` of matrix
-        if self.matrix:
+        if self.matrix is not None:
             _dict['matrix'] = self.matrix.to_dict()
         # set to None if prompt (nullable) is None
         # and model_fields_set contains the field
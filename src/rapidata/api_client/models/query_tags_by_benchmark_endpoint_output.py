@@ -59,6 +59,7 @@ class QueryTagsByBenchmarkEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "tags",
         ])
 
         _dict = self.model_dump(
@@ -68,7 +69,7 @@ class QueryTagsByBenchmarkEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in tags (list)
         _items = []
-        if self.tags:
+        if self.tags is not None:
             for _item_tags in self.tags:
                 if _item_tags:
                     _items.append(_item_tags.to_dict())
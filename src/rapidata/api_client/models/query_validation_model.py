@@ -64,6 +64,8 @@ class QueryValidationModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "page",
+            "filter",
         ])
 
         _dict = self.model_dump(
@@ -72,10 +74,10 @@ class QueryValidationModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of page
-        if self.page:
+        if self.page is not None:
             _dict['page'] = self.page.to_dict()
         # override the default output from pydantic by calling `to_dict()` of filter
-        if self.filter:
+        if self.filter is not None:
             _dict['filter'] = self.filter.to_dict()
         return _dict
 
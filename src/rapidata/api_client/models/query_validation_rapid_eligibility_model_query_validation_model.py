@@ -62,6 +62,8 @@ class QueryValidationRapidEligibilityModelQueryValidationModel(LazyValidatedMode
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "page",
+            "filter",
         ])
 
         _dict = self.model_dump(
@@ -70,10 +72,10 @@ class QueryValidationRapidEligibilityModelQueryValidationModel(LazyValidatedMode
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of page
-        if self.page:
+        if self.page is not None:
             _dict['page'] = self.page.to_dict()
         # override the default output from pydantic by calling `to_dict()` of filter
-        if self.filter:
+        if self.filter is not None:
             _dict['filter'] = self.filter.to_dict()
         return _dict
 
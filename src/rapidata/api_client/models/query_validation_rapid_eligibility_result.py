@@ -65,6 +65,8 @@ class QueryValidationRapidEligibilityResult(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "payload",
+            "truth",
         ])
 
         _dict = self.model_dump(
@@ -73,10 +75,10 @@ class QueryValidationRapidEligibilityResult(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of payload
-        if self.payload:
+        if self.payload is not None:
             _dict['payload'] = self.payload.to_dict()
         # override the default output from pydantic by calling `to_dict()` of truth
-        if self.truth:
+        if self.truth is not None:
             _dict['truth'] = self.truth.to_dict()
         return _dict
 
@@ -66,6 +66,9 @@ class QueryWorkflowsModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "page",
+            "filter",
+            "sort_criteria",
         ])
 
         _dict = self.model_dump(
@@ -74,14 +77,14 @@ class QueryWorkflowsModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of page
-        if self.page:
+        if self.page is not None:
             _dict['page'] = self.page.to_dict()
         # override the default output from pydantic by calling `to_dict()` of filter
-        if self.filter:
+        if self.filter is not None:
             _dict['filter'] = self.filter.to_dict()
         # override the default output from pydantic by calling `to_dict()` of each item in sort_criteria (list)
         _items = []
-        if self.sort_criteria:
+        if self.sort_criteria is not None:
             for _item_sort_criteria in self.sort_criteria:
                 if _item_sort_criteria:
                     _items.append(_item_sort_criteria.to_dict())
@@ -70,6 +70,7 @@ class ScrubTruth(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "valid_ranges",
         ])
 
         _dict = self.model_dump(
@@ -79,7 +80,7 @@ class ScrubTruth(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in valid_ranges (list)
         _items = []
-        if self.valid_ranges:
+        if self.valid_ranges is not None:
             for _item_valid_ranges in self.valid_ranges:
                 if _item_valid_ranges:
                     _items.append(_item_valid_ranges.to_dict())
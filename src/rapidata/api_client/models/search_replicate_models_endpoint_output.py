@@ -60,6 +60,7 @@ class SearchReplicateModelsEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "models",
         ])
 
         _dict = self.model_dump(
@@ -69,7 +70,7 @@ class SearchReplicateModelsEndpointOutput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in models (list)
         _items = []
-        if self.models:
+        if self.models is not None:
             for _item_models in self.models:
                 if _item_models:
                     _items.append(_item_models.to_dict())
@@ -65,6 +65,9 @@ class SkipRapidEndpointOutput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "validation_truth",
+            "explanation",
+            "next_rapid",
         ])
 
         _dict = self.model_dump(
@@ -73,13 +76,13 @@ class SkipRapidEndpointOutput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of validation_truth
-        if self.validation_truth:
+        if self.validation_truth is not None:
             _dict['validationTruth'] = self.validation_truth.to_dict()
         # override the default output from pydantic by calling `to_dict()` of explanation
-        if self.explanation:
+        if self.explanation is not None:
             _dict['explanation'] = self.explanation.to_dict()
         # override the default output from pydantic by calling `to_dict()` of next_rapid
-        if self.next_rapid:
+        if self.next_rapid is not None:
             _dict['nextRapid'] = self.next_rapid.to_dict()
         return _dict
 
@@ -71,6 +71,7 @@ class TranscriptionPayload(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "transcription",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class TranscriptionPayload(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in transcription (list)
         _items = []
-        if self.transcription:
+        if self.transcription is not None:
             for _item_transcription in self.transcription:
                 if _item_transcription:
                     _items.append(_item_transcription.to_dict())
@@ -71,6 +71,7 @@ class TranscriptionResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "selected_words",
         ])
 
         _dict = self.model_dump(
@@ -80,7 +81,7 @@ class TranscriptionResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in selected_words (list)
         _items = []
-        if self.selected_words:
+        if self.selected_words is not None:
             for _item_selected_words in self.selected_words:
                 if _item_selected_words:
                     _items.append(_item_selected_words.to_dict())
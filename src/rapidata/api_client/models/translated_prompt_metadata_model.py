@@ -70,6 +70,7 @@ class TranslatedPromptMetadataModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "prompt",
         ])
 
         _dict = self.model_dump(
@@ -78,7 +79,7 @@ class TranslatedPromptMetadataModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of prompt
-        if self.prompt:
+        if self.prompt is not None:
             _dict['prompt'] = self.prompt.to_dict()
         return _dict
 
@@ -77,6 +77,9 @@ class UpdateAudienceEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filters",
+            "logo",
+            "graduation_rule",
         ])
 
         _dict = self.model_dump(
@@ -86,16 +89,16 @@ class UpdateAudienceEndpointInput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in filters (list)
         _items = []
-        if self.filters:
+        if self.filters is not None:
             for _item_filters in self.filters:
                 if _item_filters:
                     _items.append(_item_filters.to_dict())
             _dict['filters'] = _items
         # override the default output from pydantic by calling `to_dict()` of logo
-        if self.logo:
+        if self.logo is not None:
             _dict['logo'] = self.logo.to_dict()
         # override the default output from pydantic by calling `to_dict()` of graduation_rule
-        if self.graduation_rule:
+        if self.graduation_rule is not None:
             _dict['graduationRule'] = self.graduation_rule.to_dict()
         # set to None if description (nullable) is None
         # and model_fields_set contains the field
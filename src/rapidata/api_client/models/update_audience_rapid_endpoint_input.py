@@ -68,6 +68,8 @@ class UpdateAudienceRapidEndpointInput(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "truth",
+            "context_asset",
         ])
 
         _dict = self.model_dump(
@@ -76,10 +78,10 @@ class UpdateAudienceRapidEndpointInput(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of truth
-        if self.truth:
+        if self.truth is not None:
             _dict['truth'] = self.truth.to_dict()
         # override the default output from pydantic by calling `to_dict()` of context_asset
-        if self.context_asset:
+        if self.context_asset is not None:
             _dict['contextAsset'] = self.context_asset.to_dict()
         # set to None if truth (nullable) is None
         # and model_fields_set contains the field
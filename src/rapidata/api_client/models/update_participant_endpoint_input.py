@@ -67,6 +67,8 @@ class UpdateParticipantEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "logo",
+            "faucet",
         ])
 
         _dict = self.model_dump(
@@ -75,10 +77,10 @@ class UpdateParticipantEndpointInput(LazyValidatedModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of logo
-        if self.logo:
+        if self.logo is not None:
             _dict['logo'] = self.logo.to_dict()
         # override the default output from pydantic by calling `to_dict()` of faucet
-        if self.faucet:
+        if self.faucet is not None:
             _dict['faucet'] = self.faucet.to_dict()
         # set to None if family (nullable) is None
         # and model_fields_set contains the field
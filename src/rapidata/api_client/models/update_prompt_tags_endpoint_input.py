@@ -61,6 +61,8 @@ class UpdatePromptTagsEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "tags",
+            "origin",
         ])
 
         _dict = self.model_dump(
@@ -70,13 +72,13 @@ class UpdatePromptTagsEndpointInput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in tags (list)
         _items = []
-        if self.tags:
+        if self.tags is not None:
             for _item_tags in self.tags:
                 if _item_tags:
                     _items.append(_item_tags.to_dict())
             _dict['tags'] = _items
         # override the default output from pydantic by calling `to_dict()` of origin
-        if self.origin:
+        if self.origin is not None:
             _dict['origin'] = self.origin.to_dict()
         return _dict
 
@@ -62,6 +62,7 @@ class UpdateStreamProgramEndpointInput(LazyValidatedModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "nodes",
         ])
 
         _dict = self.model_dump(
@@ -71,7 +72,7 @@ class UpdateStreamProgramEndpointInput(LazyValidatedModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each value in nodes (dict)
         _field_dict = {}
-        if self.nodes:
+        if self.nodes is not None:
             for _key_nodes in self.nodes:
                 if self.nodes[_key_nodes]:
                     _field_dict[_key_nodes] = self.nodes[_key_nodes].to_dict()
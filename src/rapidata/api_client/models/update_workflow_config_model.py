@@ -64,6 +64,7 @@ class UpdateWorkflowConfigModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "workflow_config",
         ])
 
         _dict = self.model_dump(
@@ -72,7 +73,7 @@ class UpdateWorkflowConfigModel(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of workflow_config
-        if self.workflow_config:
+        if self.workflow_config is not None:
             _dict['workflowConfig'] = self.workflow_config.to_dict()
         # set to None if workflow_config_artifact_id (nullable) is None
         # and model_fields_set contains the field
@@ -65,6 +65,7 @@ class UpdateWorkflowConfigRequest(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "config",
         ])
 
         _dict = self.model_dump(
@@ -73,7 +74,7 @@ class UpdateWorkflowConfigRequest(BaseModel):
             exclude_none=True,
         )
         # override the default output from pydantic by calling `to_dict()` of config
-        if self.config:
+        if self.config is not None:
             _dict['config'] = self.config.to_dict()
         # set to None if artifact_id (nullable) is None
         # and model_fields_set contains the field
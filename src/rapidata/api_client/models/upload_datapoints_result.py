@@ -63,6 +63,7 @@ class UploadDatapointsResult(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "errors",
         ])
 
         _dict = self.model_dump(
@@ -72,7 +73,7 @@ class UploadDatapointsResult(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in errors (list)
         _items = []
-        if self.errors:
+        if self.errors is not None:
             for _item_errors in self.errors:
                 if _item_errors:
                     _items.append(_item_errors.to_dict())
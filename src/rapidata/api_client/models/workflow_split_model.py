@@ -73,6 +73,7 @@ class WorkflowSplitModel(BaseModel):
           are ignored.
         """
         excluded_fields: Set[str] = set([
+            "filter_configs",
         ])
 
         _dict = self.model_dump(
@@ -82,7 +83,7 @@ class WorkflowSplitModel(BaseModel):
         )
         # override the default output from pydantic by calling `to_dict()` of each item in filter_configs (list)
         _items = []
-        if self.filter_configs:
+        if self.filter_configs is not None:
             for _item_filter_configs in self.filter_configs:
                 if _item_filter_configs:
                     _items.append(_item_filter_configs.to_dict())
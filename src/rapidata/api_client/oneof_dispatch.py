@@ -0,0 +1,85 @@
+"""Discriminator lookup for generated oneOf models.
+
+A generated oneOf wrapper deserializes a payload by trying every variant and
+counting the ones that accept it, which for nested unions (an asset inside a
+multi-asset inside a datapoint) multiplies into many full deserializations.
+Every variant of the API's unions carries a `_t` discriminator restricted to
+a single value, so the variant can be picked by looking at `_t` alone; the
+wrappers' ``from_dict`` does that first and keeps trial matching as the
+fallback.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, get_args
+
+from pydantic import BaseModel
+
+# oneOf wrapper class -> {`_t` value -> the only variant accepting it, or None}
+_variants_by_discriminator: Dict[type, Dict[str, Optional[type]]] = {}
+
+
+def discriminated_variant(wrapper: type, obj: Any) -> Optional[type]:
+    """Return the variant of ``wrapper`` that ``obj["_t"]`` unambiguously selects.
+
+    Returns None, so that the caller falls back to trial matching, when
+    ``obj`` has no string `_t`, when some variant has no validated `_t` to
+    tell it apart, or when the value is accepted by no variant or by several.
+    The answer is computed once per wrapper and value.
+    """
+    if not isinstance(obj, dict):
+        return None
+    value = obj.get("_t")
+    if not isinstance(value, str):
+        return None
+    lookup = _variants_by_discriminator.setdefault(wrapper, {})
+    try:
+        return lookup[value]
+    except KeyError:
+        variant = lookup[value] = _resolve(wrapper, value)
+        return variant
+
+
+def _resolve(wrapper: type, value: str) -> Optional[type]:
+    matches = []
+    for field_name, field_info in wrapper.model_fields.items():
+        if not field_name.startswith("oneof_schema_"):
+            continue
+        variant = next(
+            (
+                arg
+                for arg in get_args(field_info.annotation)
+                if isinstance(arg, type) and issubclass(arg, BaseModel)
+            ),
+            None,
+        )
+        if variant is None:
+            return None
+        accepts = _discriminator_accepts(variant, value)
+        if accepts is None:
+            return None
+        if accepts:
+            matches.append(variant)
+    return matches[0] if len(matches) == 1 else None
+
+
+def _discriminator_accepts(variant: type, value: str) -> Optional[bool]:
+    """Run the variant's `_t` validators on ``value``; None if it has none."""
+    discriminator_fields = {
+        field_name
+        for field_name, field_info in variant.model_fields.items()
+        if field_info.alias == "_t"
+    }
+    validators = [
+        decorator.func
+        for decorator in variant.__pydantic_decorators__.field_validators.values()
+        if discriminator_fields & set(decorator.info.fields)
+    ]
+    if not validators:
+        return None
+    try:
+        for validator in validators:
+            validator(value)
+    except ValueError:
+        return False
+    return True
@@ -10,6 +10,10 @@
 
     Do not edit the class manually.
 """  # noqa: E501
+import asyncio
+import contextlib
+import datetime
+import decimal
 import io
 import json
 import logging
@@ -17,7 +21,10 @@ import random
 import re
 import threading
 import time
-from typing import Dict, Optional
+import weakref
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Union
 
 import httpx
 from authlib.integrations.httpx_client import OAuth2Client
@@ -32,8 +39,15 @@ from httpx import (
     WriteError,
 )
 
+from pydantic import SecretStr
+
 from rapidata.api_client.exceptions import ApiException, ApiValueError
 
+try:
+    import orjson
+except ImportError:  # optional: pip install rapidata[json]
+    orjson = None
+
 _logger = logging.getLogger("rapidata.api_client")
 _TRANSIENT_RETRY_MAX_ATTEMPTS = 3
 _TRANSIENT_RETRY_BASE_DELAY = 0.5
@@ -48,6 +62,9 @@ _RETRY_AFTER_MAX_SECONDS = 60.0
 # stalled upload holds its worker thread open indefinitely instead of failing fast
 # enough for the retry below to reach a healthy connection.
 _DEFAULT_TIMEOUT = Timeout(connect=15.0, read=120.0, write=120.0, pool=60.0)
+# Bulk uploads are large and many queue for a connection at once, so they get
+# room to finish and to wait, without holding up the control-plane pool above.
+_BULK_TIMEOUT = Timeout(connect=15.0, read=300.0, write=300.0, pool=600.0)
 
 # ReadError and WriteError are the NetworkError siblings of ConnectError: a local
 # firewall or TLS-inspecting proxy aborting a live request surfaces as one of those
@@ -63,6 +80,111 @@ _RETRYABLE_TRANSPORT_ERRORS = (
 # One summary line per interval instead of one line per retried request.
 _RETRY_SUMMARY_INTERVAL = 30.0
 
+# Callers that adapt to backend health (e.g. an adaptive concurrency limiter)
+# set this to see every attempt, including the ones retried below:
+# ``observer(status_code, seconds)``, with ``status_code`` None when the attempt
+# failed at the transport level (timeout, connection reset, ...).
+request_observer: ContextVar[Optional[Callable[[Optional[int], float], None]]] = ContextVar(
+    "rapidata_request_observer", default=None
+)
+
+# Set this to wait out retry back-offs yourself, e.g. to hand a concurrency
+# slot held around the request to someone else meanwhile:
+# ``sleep(seconds)`` is called instead of ``time.sleep``.
+request_backoff: ContextVar[Optional[Callable[[float], None]]] = ContextVar(
+    "rapidata_request_backoff", default=None
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the values ``ApiClient.sanitize_for_serialization`` would convert."""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON.
+
+    Uses orjson when it is installed. Values orjson rejects (integers beyond
+    64 bits, for one) go through the standard library instead. Dates,
+    decimals, enums and secrets are encoded the way
+    ``ApiClient.sanitize_for_serialization`` converts them, so a model's
+    ``to_dict()`` can be encoded without sanitizing it first.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def is_json_body(content_type: Optional[str]) -> bool:
+    """Whether a request body with this Content-Type is sent as JSON."""
+    return not content_type or re.search("json", content_type, re.IGNORECASE) is not None
+
+
+# orjson reads integers beyond 64 bits as floats. Any run of 20 digits might
+# be one, so documents containing such a run are decoded by the standard
+# library (a false match inside a string only costs speed).
+_WIDE_INTEGER = re.compile(r"\d{20}")
+_WIDE_INTEGER_BYTES = re.compile(rb"\d{20}")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document, straight from the response bytes if orjson is installed.
+
+    Documents orjson would decode differently from the standard library go
+    through the standard library instead: integers beyond 64 bits, which
+    orjson turns into floats, and NaN or Infinity, which it rejects.
+    """
+    if orjson is not None:
+        wide = (_WIDE_INTEGER_BYTES if isinstance(data, bytes) else _WIDE_INTEGER).search(data)
+        if wide is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+# Requests sent while this is True (see ``bulk_requests``) go through a separate
+# connection pool, so a burst of uploads cannot starve status polls, job
+# creation and token refreshes of connections.
+bulk_traffic: ContextVar[bool] = ContextVar("rapidata_bulk_traffic", default=False)
+
+
+@contextlib.contextmanager
+def bulk_requests():
+    """Send the requests made inside the block through the bulk-upload pool."""
+    token = bulk_traffic.set(True)
+    try:
+        yield
+    finally:
+        bulk_traffic.reset(token)
+
+
+def _observe_attempt(status_code: Optional[int], started: float) -> None:
+    observer = request_observer.get()
+    if observer is not None:
+        observer(status_code, time.monotonic() - started)
+
+
+def _backoff_sleep(seconds: float) -> None:
+    sleep = request_backoff.get() or time.sleep
+    sleep(seconds)
+
 
 def _backoff_delay(attempt: int) -> float:
     """Exponential backoff with equal jitter, in seconds.
@@ -140,9 +262,13 @@ class RESTResponse(io.IOBase):
 
     def read(self):
         if self.data is None:
-            self.data = self.response.content
+            self.data = self.response.read()
         return self.data
 
+    def iter_bytes(self, chunk_size: Optional[int] = None):
+        """Yields the body of a streamed response as it arrives."""
+        return self.response.iter_bytes(chunk_size)
+
     def getheaders(self) -> Dict[str, str]:
         """Returns a dictionary of the response headers."""
         return dict(self.response.headers)
@@ -155,6 +281,25 @@ class RESTResponse(io.IOBase):
 RESTResponseType = RESTResponse
 
 
+class LocalFile:
+    """A multipart file part that is read from disk while the request is sent.
+
+    ``ApiClient.files_parameters`` hands these out instead of the file's bytes,
+    so serializing an upload costs no memory. The file is opened only for the
+    duration of the request and streamed in chunks by httpx, which also derives
+    the part's ``Content-Length`` from the open file's size and rewinds it
+    before each retry.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"LocalFile({self.path!r})"
+
+
 class RESTClientObject:
 
     def __init__(self, configuration) -> None:
@@ -163,6 +308,19 @@ class RESTClientObject:
         self.session: Optional[OAuth2Client] = None
         self._token_file: Optional[str] = None
         self._token_leeway: int = 60
+        # httpx binds an AsyncClient's connection pool to the event loop that
+        # first used it, so the async session is rebuilt whenever a different
+        # loop asks for it (e.g. consecutive asyncio.run() calls).
+        self._async_session: Optional[httpx.AsyncClient] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Open ``async_sessions`` blocks per loop.
+        self._async_session_users: Dict[asyncio.AbstractEventLoop, int] = {}
+        # Bulk uploads get their own pools (see ``bulk_requests``); they borrow
+        # the OAuth session's token, which it keeps refreshing.
+        self._bulk_session: Optional[httpx.Client] = None
+        self._bulk_session_lock = threading.Lock()
+        self._async_bulk_session: Optional[httpx.AsyncClient] = None
+        self._async_bulk_session_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def setup_oauth_client_credentials(
         self,
@@ -312,33 +470,297 @@ class RESTClientObject:
         if self._token_file is not None:
             self._reload_token_from_file_if_expired(self._token_file)
 
+        session = self.session
+        if bulk_traffic.get():
+            session = self._get_bulk_session()
+            headers = dict(headers)
+            headers["Authorization"] = self._authorization_header()
+
+        timeout = self._build_timeout(_request_timeout)
+
+        with contextlib.ExitStack() as open_files:
+            post_params = self._open_local_files(post_params, open_files)
+            for attempt in range(_TRANSIENT_RETRY_MAX_ATTEMPTS + 1):
+                started = time.monotonic()
+                try:
+                    r = self._send_request(session, method, url, headers, body, post_params, timeout)
+                except httpx.HTTPError as e:
+                    _observe_attempt(None, started)
+                    self._handle_http_error(e, method, url, attempt)
+                    continue
+                _observe_attempt(r.status_code, started)
+
+                if r.status_code in _RETRYABLE_STATUS_CODES and attempt < _TRANSIENT_RETRY_MAX_ATTEMPTS:
+                    # Prefer the server's `Retry-After` hint when present
+                    # (common for 429). Fall back to exponential backoff.
+                    delay = self._retry_after_from_response(r)
+                    if delay is None:
+                        delay = _backoff_delay(attempt)
+                    _logger.debug(
+                        "Server error on %s %s (attempt %d/%d): %d. Retrying in %.1fs...",
+                        method, url, attempt + 1, _TRANSIENT_RETRY_MAX_ATTEMPTS + 1,
+                        r.status_code, delay,
+                    )
+                    _retry_noise.record(f"HTTP {r.status_code}")
+                    _backoff_sleep(delay)
+                    continue
+
+                return RESTResponse(r)
+
+            raise ApiException(status=0, reason="All retry attempts exhausted")
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        method,
+        url,
+        headers=None,
+        _request_timeout=None,
+    ):
+        """Perform a request whose response body is read while it arrives.
+
+        Yields a :class:`RESTResponse` once the status line and headers are in;
+        its body is consumed with ``iter_bytes()`` (or ``read()``) inside the
+        ``with`` block and the connection is released on exit. Connection
+        errors and retryable statuses are retried as in :meth:`request`;
+        once the response is yielded nothing is retried, since part of the
+        body may already have been consumed.
+        """
+        method = method.upper()
+        assert method in ["GET", "HEAD", "DELETE", "OPTIONS"]
+
+        headers = headers or {}
+
+        if not self.session:
+            raise ApiValueError(
+                "OAuth2 session is not initialized. Please initialize it before making requests."
+            )
+
+        if self._token_file is not None:
+            self._reload_token_from_file_if_expired(self._token_file)
+
+        session = self.session
+        if bulk_traffic.get():
+            session = self._get_bulk_session()
+            headers = dict(headers)
+            headers["Authorization"] = self._authorization_header()
+
         timeout = self._build_timeout(_request_timeout)
 
         for attempt in range(_TRANSIENT_RETRY_MAX_ATTEMPTS + 1):
-            try:
-                r = self._send_request(self.session, method, url, headers, body, post_params, timeout)
-            except httpx.HTTPError as e:
-                self._handle_http_error(e, method, url, attempt)
-                continue
-
-            if r.status_code in _RETRYABLE_STATUS_CODES and attempt < _TRANSIENT_RETRY_MAX_ATTEMPTS:
-                # Prefer the server's `Retry-After` hint when present
-                # (common for 429). Fall back to exponential backoff.
-                delay = self._retry_after_from_response(r)
-                if delay is None:
-                    delay = _backoff_delay(attempt)
-                _logger.debug(
-                    "Server error on %s %s (attempt %d/%d): %d. Retrying in %.1fs...",
-                    method, url, attempt + 1, _TRANSIENT_RETRY_MAX_ATTEMPTS + 1,
-                    r.status_code, delay,
+            with contextlib.ExitStack() as open_response:
+                started = time.monotonic()
+                try:
+                    r = open_response.enter_context(
+                        session.stream(method, url, timeout=timeout, headers=headers)
+                    )
+                except httpx.HTTPError as e:
+                    _observe_attempt(None, started)
+                    self._handle_http_error(e, method, url, attempt)
+                    continue
+                _observe_attempt(r.status_code, started)
+
+                if r.status_code in _RETRYABLE_STATUS_CODES and attempt < _TRANSIENT_RETRY_MAX_ATTEMPTS:
+                    delay = self._retry_after_from_response(r)
+                    if delay is None:
+                        delay = _backoff_delay(attempt)
+                    _logger.debug(
+                        "Server error on %s %s (attempt %d/%d): %d. Retrying in %.1fs...",
+                        method, url, attempt + 1, _TRANSIENT_RETRY_MAX_ATTEMPTS + 1,
+                        r.status_code, delay,
+                    )
+                    _retry_noise.record(f"HTTP {r.status_code}")
+                    open_response.close()
+                    _backoff_sleep(delay)
+                    continue
+
+                yield RESTResponse(r)
+                return
+
+        raise ApiException(status=0, reason="All retry attempts exhausted")
+
+    async def request_async(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        """Perform a request on the running event loop.
+
+        Same contract and retry policy as :meth:`request`, but sent through an
+        ``httpx.AsyncClient`` so many requests can be in flight without a
+        thread each. The OAuth session stays the single owner of the token;
+        this only borrows its current access token for the request.
+        """
+        method = method.upper()
+        assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = dict(headers or {})
+        headers["Authorization"] = await self._authorization_header_async()
+
+        if bulk_traffic.get():
+            session = self._get_async_bulk_session()
+        else:
+            session = self._get_async_session()
+        timeout = self._build_timeout(_request_timeout)
+
+        with contextlib.ExitStack() as open_files:
+            post_params = self._open_local_files(post_params, open_files)
+            for attempt in range(_TRANSIENT_RETRY_MAX_ATTEMPTS + 1):
+                started = time.monotonic()
+                try:
+                    r = await self._send_request(session, method, url, headers, body, post_params, timeout)
+                except httpx.HTTPError as e:
+                    _observe_attempt(None, started)
+                    await asyncio.sleep(self._http_error_retry_delay(e, method, url, attempt))
+                    continue
+                _observe_attempt(r.status_code, started)
+
+                if r.status_code in _RETRYABLE_STATUS_CODES and attempt < _TRANSIENT_RETRY_MAX_ATTEMPTS:
+                    delay = self._retry_after_from_response(r)
+                    if delay is None:
+                        delay = _backoff_delay(attempt)
+                    _logger.debug(
+                        "Server error on %s %s (attempt %d/%d): %d. Retrying in %.1fs...",
+                        method, url, attempt + 1, _TRANSIENT_RETRY_MAX_ATTEMPTS + 1,
+                        r.status_code, delay,
+                    )
+                    _retry_noise.record(f"HTTP {r.status_code}")
+                    await asyncio.sleep(delay)
+                    continue
+
+                return RESTResponse(r)
+
+            raise ApiException(status=0, reason="All retry attempts exhausted")
+
+    def _authorization_header(self) -> str:
+        """Bearer header for a request sent outside the OAuth session."""
+        assert self.session is not None
+        token = self.session.token
+        if token is None or token.is_expired(leeway=self._token_leeway) is not False:
+            token = self.get_token()
+        return f"Bearer {token['access_token']}"
+
+    async def _authorization_header_async(self) -> str:
+        """Build the bearer header for an async request.
+
+        Refreshing (or re-reading the token file) is a blocking call, so it is
+        pushed to a worker thread; the common case of a still-valid token never
+        leaves the event loop.
+        """
+        if not self.session:
+            raise ApiValueError(
+                "OAuth2 session is not initialized. Please initialize it before making requests."
+            )
+        token = self.session.token
+        if (
+            self._token_file is not None
+            or token is None
+            or token.is_expired(leeway=self._token_leeway) is not False
+        ):
+            token = await asyncio.to_thread(self.get_token)
+        return f"Bearer {token['access_token']}"
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """Return the AsyncClient bound to the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session_loop is not loop:
+            if self._async_session is not None:
+                self._close_on_owner_loop(self._async_session, self._async_session_loop)
+            self._async_session = httpx.AsyncClient(
+                **self._get_session_defaults(asynchronous=True)
+            )
+            self._async_session_loop = loop
+        return self._async_session
+
+    def _get_bulk_session(self) -> httpx.Client:
+        """Return the client for bulk uploads, creating it on first use."""
+        if self._bulk_session is None:
+            with self._bulk_session_lock:
+                if self._bulk_session is None:
+                    self._bulk_session = httpx.Client(
+                        **self._get_session_defaults(bulk=True)
+                    )
+                    # Released with this client even if close() is never called.
+                    weakref.finalize(self, self._bulk_session.close)
+        return self._bulk_session
+
+    def _get_async_bulk_session(self) -> httpx.AsyncClient:
+        """Bulk-upload counterpart of :meth:`_get_async_session`."""
+        loop = asyncio.get_running_loop()
+        if self._async_bulk_session is None or self._async_bulk_session_loop is not loop:
+            if self._async_bulk_session is not None:
+                self._close_on_owner_loop(
+                    self._async_bulk_session, self._async_bulk_session_loop
                 )
-                _retry_noise.record(f"HTTP {r.status_code}")
-                time.sleep(delay)
-                continue
+            self._async_bulk_session = httpx.AsyncClient(
+                **self._get_session_defaults(asynchronous=True, bulk=True)
+            )
+            self._async_bulk_session_loop = loop
+        return self._async_bulk_session
 
-            return RESTResponse(r)
+    def close(self) -> None:
+        """Close the bulk-upload connection pool, if it was opened."""
+        with self._bulk_session_lock:
+            bulk_session, self._bulk_session = self._bulk_session, None
+        if bulk_session is not None:
+            bulk_session.close()
 
-        raise ApiException(status=0, reason="All retry attempts exhausted")
+    @staticmethod
+    def _close_on_owner_loop(
+        session: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Close an AsyncClient replaced by one for another loop.
+
+        Its connections belong to the loop that opened them, so it is closed on
+        that loop. A loop that has stopped can no longer close them; clients used
+        within ``async_sessions`` are closed before their loop stops.
+        """
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.aclose(), loop)
+        else:
+            _logger.debug("Dropping an AsyncClient whose event loop has stopped")
+
+    @contextlib.asynccontextmanager
+    async def async_sessions(self):
+        """Keep the running loop's AsyncClients for the block, then close them.
+
+        Blocks may nest or run concurrently on one loop; the clients are closed
+        when the last of them exits.
+        """
+        loop = asyncio.get_running_loop()
+        self._async_session_users[loop] = self._async_session_users.get(loop, 0) + 1
+        try:
+            yield
+        finally:
+            remaining = self._async_session_users.pop(loop) - 1
+            if remaining:
+                self._async_session_users[loop] = remaining
+            else:
+                await self.close_async_session()
+
+    async def close_async_session(self) -> None:
+        """Close the AsyncClients owned by the running event loop, if any."""
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is not None and self._async_session_loop is loop:
+            self._async_session = None
+            self._async_session_loop = None
+            await session.aclose()
+        bulk_session = self._async_bulk_session
+        if bulk_session is not None and self._async_bulk_session_loop is loop:
+            self._async_bulk_session = None
+            self._async_bulk_session_loop = None
+            await bulk_session.aclose()
 
     def _send_request(self, session, method, url, headers, body, post_params, timeout):
         """Dispatch the HTTP request based on method and content type."""
@@ -351,8 +773,12 @@ class RESTClientObject:
         """Send a request that may include a body."""
         content_type = headers.get("Content-Type")
 
-        if not content_type or re.search("json", content_type, re.IGNORECASE):
-            request_body = json.dumps(body) if body is not None else None
+        if is_json_body(content_type):
+            # Model bodies arrive already encoded (see ApiClient.param_serialize).
+            if body is None or isinstance(body, bytes):
+                request_body = body
+            else:
+                request_body = json_dumps(body)
             return session.request(method, url, content=request_body, timeout=timeout, headers=headers)
 
         if content_type == "application/x-www-form-urlencoded":
@@ -375,6 +801,22 @@ class RESTClientObject:
                  Please check that your arguments match declared content type."""
         raise ApiException(status=0, reason=msg)
 
+    @staticmethod
+    def _open_local_files(post_params, open_files: contextlib.ExitStack):
+        """Swap every ``LocalFile`` part for an open handle owned by ``open_files``."""
+        if not any(
+            isinstance(value, tuple) and len(value) >= 2 and isinstance(value[1], LocalFile)
+            for _, value in post_params
+        ):
+            return post_params
+        opened = []
+        for key, value in post_params:
+            if isinstance(value, tuple) and len(value) >= 2 and isinstance(value[1], LocalFile):
+                handle = open_files.enter_context(open(value[1].path, "rb"))
+                value = (value[0], handle, *value[2:])
+            opened.append((key, value))
+        return opened
+
     @staticmethod
     def _parse_multipart_params(post_params):
         """Parse post parameters into files and data for multipart upload."""
@@ -442,6 +884,14 @@ class RESTClientObject:
 
         Returns normally to signal a retry. Raises ApiException for permanent failures.
         """
+        _backoff_sleep(self._http_error_retry_delay(error, method, url, attempt))
+
+    def _http_error_retry_delay(self, error, method, url, attempt) -> float:
+        """Return how long to wait before retrying a failed request.
+
+        Raises ApiException for permanent failures, so callers only have to
+        decide *how* to wait (blocking or on the event loop).
+        """
         if isinstance(error, ConnectError) and self._is_certificate_validation_error(error):
             raise ApiException(
                 status=0,
@@ -457,16 +907,24 @@ class RESTClientObject:
                 type(error).__name__, delay,
             )
             _retry_noise.record(type(error).__name__)
-            time.sleep(delay)
-            return
+            return delay
 
         msg = "\n".join([type(error).__name__, str(error)])
         raise ApiException(status=0, reason=msg)
 
-    def _get_session_defaults(self):
+    def _get_session_defaults(self, asynchronous: bool = False, bulk: bool = False):
         # Set connection pool limits to support high concurrency uploads
-        limits = Limits(max_connections=200, max_keepalive_connections=200)
+        if bulk:
+            pool_size = getattr(self.configuration, "bulk_pool_maxsize", 200)
+            limits = Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        else:
+            limits = Limits(max_connections=200, max_keepalive_connections=200)
 
+        # Only the asyncio client multiplexes: httpcore's blocking HTTP/2
+        # connection allocates stream ids and sends headers under separate
+        # locks, so threads sharing it can send them out of order, which
+        # servers answer by closing the connection (PROTOCOL_ERROR).
+        http2 = asynchronous and self._http2_enabled()
         client_kwargs = {
             "verify": (
                 self.configuration.ssl_ca_cert
@@ -474,7 +932,8 @@ class RESTClientObject:
                 else self.configuration.verify_ssl
             ),
             "limits": limits,
-            "timeout": _DEFAULT_TIMEOUT,
+            "timeout": _BULK_TIMEOUT if bulk else _DEFAULT_TIMEOUT,
+            "http2": http2,
         }
 
         if self.configuration.proxy:
@@ -489,11 +948,27 @@ class RESTClientObject:
                 client_kwargs["headers"] = existing_headers
 
         if self.configuration.retries is not None:
-            transport = httpx.HTTPTransport(retries=self.configuration.retries, limits=limits)
-            client_kwargs["transport"] = transport
+            transport_cls = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+            client_kwargs["transport"] = transport_cls(
+                retries=self.configuration.retries, limits=limits, http2=http2
+            )
 
         return client_kwargs
 
+    def _http2_enabled(self) -> bool:
+        """Whether to offer HTTP/2; falls back to HTTP/1.1 if ``h2`` is missing."""
+        if not getattr(self.configuration, "http2", False):
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            _logger.warning(
+                "HTTP/2 needs the h2 package (pip install rapidata[http2]); "
+                "using HTTP/1.1."
+            )
+            return False
+        return True
+
     @staticmethod
     def _is_retryable_error(error: httpx.HTTPError) -> bool:
         """Check if the error is a transient network error safe to retry."""
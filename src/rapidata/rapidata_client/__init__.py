@@ -1,84 +1,293 @@
-from .rapidata_client import RapidataClient
-from .audience import (
-    RapidataAudience,
-    RapidataAudienceBase,
-    RapidataAudienceManager,
-    RapidataFilteredAudience,
-    RecruitingMetrics,
-)
-from .job import (
-    RapidataJob,
-    RapidataJobDefinition,
-    RapidataJobManager,
-    CostEstimate,
-    JobProgress,
-)
-from .signal import RapidataSignal, RapidataSignalManager
-from .billing import BillingPeriod, RapidataBillingManager
-from .validation import ValidationSetManager, RapidataValidationSet, Box
-from .results import RapidataResults
-from .selection import (
-    DemographicSelection,
-    LabelingSelection,
-    ValidationSelection,
-    ConditionalValidationSelection,
-    CappedSelection,
-    ShufflingSelection,
-    RapidataRetrievalMode,
-    EffortSelection,
-)
-from .benchmark.prompt_metadata import Origin, Tag
-from .benchmark.leaderboard.vote_aggregation import VoteAggregation
-from .benchmark.participant.sample_upload import SampleUpload
-from .datapoints import Datapoint
-from .context import ContextManager
-from .datapoints.metadata import (
-    PrivateTextMetadata,
-    PublicTextMetadata,
-    SelectWordsMetadata,
-)
+"""Public surface of the Rapidata client.
 
-# --- GENERATED SETTINGS IMPORTS START ---
-from .settings import (
-    RapidataSettings,
-    CustomSetting,
-    NoShuffleSetting,
-    MuteVideoSetting,
-    FreeTextMinimumCharactersSetting,
-    FreeTextMaxCharactersSetting,
-    SwapContextInstructionSetting,
-    PlayPercentageVideoSetting,
-    MarkdownSetting,
-    AllowNeitherBothSetting,
-    OriginalLanguageOnlySetting,
-    NoMistakeOptionSetting,
-    DisableAutoloopSetting,
-    NoInstructionDisplaySetting,
-    KeyboardNumericSetting,
-    LocateMaxPointsSetting,
-    LocateMinPointsSetting,
-    ComparePanoramaSetting,
-    CompareEquirectangularSetting,
-    ClassifyEquirectangularSetting,
-)
+Names are imported from their submodules on first access (PEP 562), so that
+importing the package, or ``rapidata``, does not load the whole client, its
+generated API and its dependencies. Short-lived worker processes only pay for
+what they use.
+"""
 
-# --- GENERATED SETTINGS IMPORTS END ---
-from .filter import (
-    CountryFilter,
-    LanguageFilter,
-    NotFilter,
-    OrFilter,
-    AndFilter,
-    UserScoreFilter,
-    CampaignFilter,
-    AgeFilter,
-    GenderFilter,
-    CustomFilter,
-    AgeGroup,
-    Gender,
-    DeviceFilter,
-    DeviceType,
-)
-from .exceptions import FailedUploadException, FailedUpload
-from .config import rapidata_config, logger, managed_print
-from .config.upload_config import CompressionConfig
+import importlib as _importlib
+from typing import TYPE_CHECKING
+
+__all__ = [
+    "RapidataClient",
+    "RapidataAudience",
+    "RapidataAudienceBase",
+    "RapidataAudienceManager",
+    "RapidataFilteredAudience",
+    "RecruitingMetrics",
+    "RapidataJob",
+    "RapidataJobDefinition",
+    "RapidataJobManager",
+    "CostEstimate",
+    "JobProgress",
+    "RapidataSignal",
+    "RapidataSignalManager",
+    "BillingPeriod",
+    "RapidataBillingManager",
+    "ValidationSetManager",
+    "RapidataValidationSet",
+    "Box",
+    "RapidataResults",
+    "RapidataResultsFile",
+    "DemographicSelection",
+    "LabelingSelection",
+    "ValidationSelection",
+    "ConditionalValidationSelection",
+    "CappedSelection",
+    "ShufflingSelection",
+    "RapidataRetrievalMode",
+    "EffortSelection",
+    "Origin",
+    "Tag",
+    "VoteAggregation",
+    "SampleUpload",
+    "Datapoint",
+    "ContextManager",
+    "PrivateTextMetadata",
+    "PublicTextMetadata",
+    "SelectWordsMetadata",
+    # --- GENERATED SETTINGS ALL START ---
+    "RapidataSettings",
+    "CustomSetting",
+    "NoShuffleSetting",
+    "MuteVideoSetting",
+    "FreeTextMinimumCharactersSetting",
+    "FreeTextMaxCharactersSetting",
+    "SwapContextInstructionSetting",
+    "PlayPercentageVideoSetting",
+    "MarkdownSetting",
+    "AllowNeitherBothSetting",
+    "OriginalLanguageOnlySetting",
+    "NoMistakeOptionSetting",
+    "DisableAutoloopSetting",
+    "NoInstructionDisplaySetting",
+    "KeyboardNumericSetting",
+    "LocateMaxPointsSetting",
+    "LocateMinPointsSetting",
+    "ComparePanoramaSetting",
+    "CompareEquirectangularSetting",
+    "ClassifyEquirectangularSetting",
+    # --- GENERATED SETTINGS ALL END ---
+    "CountryFilter",
+    "LanguageFilter",
+    "NotFilter",
+    "OrFilter",
+    "AndFilter",
+    "UserScoreFilter",
+    "CampaignFilter",
+    "AgeFilter",
+    "GenderFilter",
+    "CustomFilter",
+    "AgeGroup",
+    "Gender",
+    "DeviceFilter",
+    "DeviceType",
+    "FailedUploadException",
+    "FailedUpload",
+    "rapidata_config",
+    "logger",
+    "managed_print",
+    "CompressionConfig",
+]
+
+# Public name -> submodule defining it; holds the names in __all__
+_LAZY_IMPORTS: dict[str, str] = {
+    "RapidataClient": ".rapidata_client",
+    "RapidataAudience": ".audience",
+    "RapidataAudienceBase": ".audience",
+    "RapidataAudienceManager": ".audience",
+    "RapidataFilteredAudience": ".audience",
+    "RecruitingMetrics": ".audience",
+    "RapidataJob": ".job",
+    "RapidataJobDefinition": ".job",
+    "RapidataJobManager": ".job",
+    "CostEstimate": ".job",
+    "JobProgress": ".job",
+    "RapidataSignal": ".signal",
+    "RapidataSignalManager": ".signal",
+    "BillingPeriod": ".billing",
+    "RapidataBillingManager": ".billing",
+    "ValidationSetManager": ".validation",
+    "RapidataValidationSet": ".validation",
+    "Box": ".validation",
+    "RapidataResults": ".results",
+    "RapidataResultsFile": ".results",
+    "DemographicSelection": ".selection",
+    "LabelingSelection": ".selection",
+    "ValidationSelection": ".selection",
+    "ConditionalValidationSelection": ".selection",
+    "CappedSelection": ".selection",
+    "ShufflingSelection": ".selection",
+    "RapidataRetrievalMode": ".selection",
+    "EffortSelection": ".selection",
+    "Origin": ".benchmark.prompt_metadata",
+    "Tag": ".benchmark.prompt_metadata",
+    "VoteAggregation": ".benchmark.leaderboard.vote_aggregation",
+    "SampleUpload": ".benchmark.participant.sample_upload",
+    "Datapoint": ".datapoints",
+    "ContextManager": ".context",
+    "PrivateTextMetadata": ".datapoints.metadata",
+    "PublicTextMetadata": ".datapoints.metadata",
+    "SelectWordsMetadata": ".datapoints.metadata",
+    # --- GENERATED SETTINGS LAZY START ---
+    "RapidataSettings": ".settings",
+    "CustomSetting": ".settings",
+    "NoShuffleSetting": ".settings",
+    "MuteVideoSetting": ".settings",
+    "FreeTextMinimumCharactersSetting": ".settings",
+    "FreeTextMaxCharactersSetting": ".settings",
+    "SwapContextInstructionSetting": ".settings",
+    "PlayPercentageVideoSetting": ".settings",
+    "MarkdownSetting": ".settings",
+    "AllowNeitherBothSetting": ".settings",
+    "OriginalLanguageOnlySetting": ".settings",
+    "NoMistakeOptionSetting": ".settings",
+    "DisableAutoloopSetting": ".settings",
+    "NoInstructionDisplaySetting": ".settings",
+    "KeyboardNumericSetting": ".settings",
+    "LocateMaxPointsSetting": ".settings",
+    "LocateMinPointsSetting": ".settings",
+    "ComparePanoramaSetting": ".settings",
+    "CompareEquirectangularSetting": ".settings",
+    "ClassifyEquirectangularSetting": ".settings",
+    # --- GENERATED SETTINGS LAZY END ---
+    "CountryFilter": ".filter",
+    "LanguageFilter": ".filter",
+    "NotFilter": ".filter",
+    "OrFilter": ".filter",
+    "AndFilter": ".filter",
+    "UserScoreFilter": ".filter",
+    "CampaignFilter": ".filter",
+    "AgeFilter": ".filter",
+    "GenderFilter": ".filter",
+    "CustomFilter": ".filter",
+    "AgeGroup": ".filter",
+    "Gender": ".filter",
+    "DeviceFilter": ".filter",
+    "DeviceType": ".filter",
+    "FailedUploadException": ".exceptions",
+    "FailedUpload": ".exceptions",
+    "rapidata_config": ".config",
+    "logger": ".config",
+    "managed_print": ".config",
+    "CompressionConfig": ".config.upload_config",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from .rapidata_client import RapidataClient
+    from .audience import (
+        RapidataAudience,
+        RapidataAudienceBase,
+        RapidataAudienceManager,
+        RapidataFilteredAudience,
+        RecruitingMetrics,
+    )
+    from .job import (
+        RapidataJob,
+        RapidataJobDefinition,
+        RapidataJobManager,
+        CostEstimate,
+        JobProgress,
+    )
+    from .signal import (
+        RapidataSignal,
+        RapidataSignalManager,
+    )
+    from .billing import (
+        BillingPeriod,
+        RapidataBillingManager,
+    )
+    from .validation import (
+        ValidationSetManager,
+        RapidataValidationSet,
+        Box,
+    )
+    from .results import RapidataResults, RapidataResultsFile
+    from .selection import (
+        DemographicSelection,
+        LabelingSelection,
+        ValidationSelection,
+        ConditionalValidationSelection,
+        CappedSelection,
+        ShufflingSelection,
+        RapidataRetrievalMode,
+        EffortSelection,
+    )
+    from .benchmark.prompt_metadata import (
+        Origin,
+        Tag,
+    )
+    from .benchmark.leaderboard.vote_aggregation import VoteAggregation
+    from .benchmark.participant.sample_upload import SampleUpload
+    from .datapoints import Datapoint
+    from .context import ContextManager
+    from .datapoints.metadata import (
+        PrivateTextMetadata,
+        PublicTextMetadata,
+        SelectWordsMetadata,
+    )
+    # --- GENERATED SETTINGS IMPORTS START ---
+    from .settings import (
+        RapidataSettings,
+        CustomSetting,
+        NoShuffleSetting,
+        MuteVideoSetting,
+        FreeTextMinimumCharactersSetting,
+        FreeTextMaxCharactersSetting,
+        SwapContextInstructionSetting,
+        PlayPercentageVideoSetting,
+        MarkdownSetting,
+        AllowNeitherBothSetting,
+        OriginalLanguageOnlySetting,
+        NoMistakeOptionSetting,
+        DisableAutoloopSetting,
+        NoInstructionDisplaySetting,
+        KeyboardNumericSetting,
+        LocateMaxPointsSetting,
+        LocateMinPointsSetting,
+        ComparePanoramaSetting,
+        CompareEquirectangularSetting,
+        ClassifyEquirectangularSetting,
+    )
+    # --- GENERATED SETTINGS IMPORTS END ---
+    from .filter import (
+        CountryFilter,
+        LanguageFilter,
+        NotFilter,
+        OrFilter,
+        AndFilter,
+        UserScoreFilter,
+        CampaignFilter,
+        AgeFilter,
+        GenderFilter,
+        CustomFilter,
+        AgeGroup,
+        Gender,
+        DeviceFilter,
+        DeviceType,
+    )
+    from .exceptions import (
+        FailedUploadException,
+        FailedUpload,
+    )
+    from .config import (
+        rapidata_config,
+        logger,
+        managed_print,
+    )
+    from .config.upload_config import CompressionConfig
@@ -0,0 +1,120 @@
+"""Check for a newer SDK release without delaying client construction.
+
+The latest release is looked up at most once a day per machine: the answer is
+cached in ``~/.cache/rapidata/version_check.json`` and refreshed by a daemon
+thread when it is older than a day, so a slow or unreachable network never
+holds up ``RapidataClient()``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from packaging import version
+
+from rapidata import __version__
+from rapidata.rapidata_client.api.rapidata_api_client import (
+    mark_sdk_outdated,
+    optional_api_call,
+)
+from rapidata.rapidata_client.config import logger, managed_print
+
+_LATEST_RELEASE_URL = (
+    "https://api.github.com/repos/RapidataAI/rapidata-python-sdk/releases/latest"
+)
+_CACHE_PATH = Path.home() / ".cache" / "rapidata" / "version_check.json"
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Nobody waits on the request any more, so slow networks get more time.
+_REQUEST_TIMEOUT_SECONDS = 10
+
+_refresh_thread: Optional[threading.Thread] = None
+_refresh_lock = threading.Lock()
+
+
+def check_for_update() -> None:
+    """Report a newer release if one is known, refreshing stale knowledge in the background."""
+    global _refresh_thread
+    cached = _read_cache()
+    if cached is not None and time.time() - cached["checked_at"] < _CACHE_TTL_SECONDS:
+        if cached["latest_version"]:
+            _report(cached["latest_version"])
+        return
+
+    with _refresh_lock:
+        # One refresh at a time; a finished one leaves the next stale check free
+        # to refresh again, e.g. in a long-running process a day later.
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        previous = cached["latest_version"] if cached is not None else None
+        _refresh_thread = threading.Thread(
+            target=_refresh,
+            args=(previous,),
+            name="rapidata-version-check",
+            daemon=True,
+        )
+        _refresh_thread.start()
+
+
+def _refresh(previous: Optional[str]) -> None:
+    import requests
+
+    # Claim today's check before the request, so clients starting meanwhile in
+    # other processes don't repeat it, and an unreachable network is only tried
+    # once a day.
+    _write_cache(previous)
+    with optional_api_call("version check"):
+        response = requests.get(
+            _LATEST_RELEASE_URL,
+            headers={"Accept": "application/vnd.github.v3+json"},
+            timeout=_REQUEST_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        latest_version = response.json()["tag_name"].lstrip("v")
+        _write_cache(latest_version)
+        _report(latest_version)
+
+
+def _report(latest_version: str) -> None:
+    try:
+        outdated = version.parse(latest_version) > version.parse(__version__)
+    except version.InvalidVersion:
+        logger.debug("Ignoring unparsable latest version: %s", latest_version)
+        return
+    if outdated:
+        mark_sdk_outdated(current_version=__version__, latest_version=latest_version)
+        managed_print(
+            f"""A new version of the Rapidata SDK is available: {latest_version}
+Your current version is: {__version__}"""
+        )
+    else:
+        logger.debug("Current version is up to date. Version: %s", __version__)
+
+
+def _read_cache() -> Optional[dict[str, Any]]:
+    try:
+        data = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+        return {
+            "checked_at": float(data["checked_at"]),
+            "latest_version": data.get("latest_version") or None,
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(latest_version: Optional[str]) -> None:
+    # Written to a temporary file and renamed, so readers never see half a file.
+    temporary = _CACHE_PATH.with_name(f"{_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(
+            json.dumps({"checked_at": time.time(), "latest_version": latest_version}),
+            encoding="utf-8",
+        )
+        os.replace(temporary, _CACHE_PATH)
+    except OSError as e:
+        logger.debug("Could not write the version check cache: %s", e)
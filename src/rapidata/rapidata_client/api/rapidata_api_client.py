@@ -7,17 +7,20 @@ from rapidata.api_client.api_client import (
 )
 from rapidata.api_client.exceptions import ApiException
 import json
-import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
 from rapidata.rapidata_client.config import logger, tracer
 from rapidata.rapidata_client.exceptions.rapidata_error import RapidataError
 from opentelemetry import trace
 from opentelemetry.trace import format_trace_id, format_span_id, Link, SpanContext
-from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 
 
-# Thread-local storage for controlling error logging
-_thread_local = threading.local()
+# Controls error logging for the current thread or asyncio task. A ContextVar
+# rather than a threading.local so that concurrent upload coroutines sharing
+# one event-loop thread don't switch each other's logging on and off.
+_suppress_error_logging: ContextVar[bool] = ContextVar(
+    "rapidata_suppress_error_logging", default=False
+)
 
 # Header the backend echoes the trace id on. Responses generated before a
 # handler runs — a Kestrel request-timeout 408, an LB-generated error — have
@@ -40,10 +43,15 @@ def _trace_id_from_headers(headers: Any) -> Optional[str]:
     return None
 
 
+def _traceparent(trace_id: int, span_id: int, trace_flags: int) -> str:
+    """Format a W3C ``traceparent`` header value."""
+    return f"00-{format_trace_id(trace_id)}-{format_span_id(span_id)}-{trace_flags:02x}"
+
+
 # Module-level state recording whether the installed SDK is outdated.
-# Populated by RapidataClient._check_version and read when formatting
-# API errors so the user sees the outdated-version hint even if they
-# missed the startup notice.
+# Populated by the version check in rapidata_client._version_check and read
+# when formatting API errors so the user sees the outdated-version hint even
+# if they missed the startup notice.
 _sdk_outdated_info: Optional[dict[str, str]] = None
 
 
@@ -77,17 +85,16 @@ def format_outdated_sdk_note() -> Optional[str]:
 @contextmanager
 def suppress_rapidata_error_logging():
     """Context manager to suppress error logging for RapidataApiClient calls."""
-    old_value = getattr(_thread_local, "suppress_error_logging", False)
-    _thread_local.suppress_error_logging = True
+    token = _suppress_error_logging.set(True)
     try:
         yield
     finally:
-        _thread_local.suppress_error_logging = old_value
+        _suppress_error_logging.reset(token)
 
 
 def _should_suppress_error_logging() -> bool:
-    """Check if error logging should be suppressed for the current thread."""
-    return getattr(_thread_local, "suppress_error_logging", False)
+    """Check if error logging should be suppressed for the current thread or task."""
+    return _suppress_error_logging.get()
 
 
 @contextmanager
@@ -115,6 +122,9 @@ class RapidataApiClient(ApiClient):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Importing the tracing SDK is deferred like the OTLP exporters.
+        from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+
         self.id_generator = RandomIdGenerator()
 
     def call_api(
@@ -126,6 +136,63 @@ class RapidataApiClient(ApiClient):
         post_params=None,
         _request_timeout=None,
     ) -> rest.RESTResponse:
+        with self._backend_trace(method, url, header_params) as header_params:
+            return super().call_api(
+                method,
+                url,
+                header_params,
+                body,
+                post_params,
+                _request_timeout,
+            )
+
+    async def call_api_async(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        with self._backend_trace(method, url, header_params) as header_params:
+            return await super().call_api_async(
+                method,
+                url,
+                header_params,
+                body,
+                post_params,
+                _request_timeout,
+            )
+
+    @contextmanager
+    def call_api_stream(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        with self._backend_trace(method, url, header_params) as header_params:
+            with super().call_api_stream(
+                method,
+                url,
+                header_params,
+                body,
+                post_params,
+                _request_timeout,
+            ) as response_data:
+                yield response_data
+
+    @contextmanager
+    def _backend_trace(self, method, url, header_params):
+        """Open the linked SDK/backend spans around a request.
+
+        Yields the header dict to send, carrying a ``traceparent`` for the
+        backend trace when the current span is recording.
+        """
         # Get the current span from OpenTelemetry
         current_span = trace.get_current_span()
 
@@ -135,17 +202,22 @@ class RapidataApiClient(ApiClient):
 
         # Add tracing headers if we have a valid span
         if not current_span.is_recording():
-            return super().call_api(
-                method,
-                url,
-                header_params,
-                body,
-                post_params,
-                _request_timeout,
-            )
+            yield header_params
+            return
 
         current_span_context = current_span.get_span_context()
 
+        if not tracer.should_trace_request():
+            # No spans for this request; the backend continues the current
+            # span's trace, which keeps its spans correlated with the operation.
+            header_params["traceparent"] = _traceparent(
+                current_span_context.trace_id,
+                current_span_context.span_id,
+                current_span_context.trace_flags,
+            )
+            yield header_params
+            return
+
         # Generate a new trace ID for backend communication
         # This separates the backend trace from the SDK trace
         backend_trace_id = self.id_generator.generate_trace_id()
@@ -203,23 +275,13 @@ class RapidataApiClient(ApiClient):
 
                 # Format the traceparent header with the backend trace ID
                 # The backend will receive this and continue the trace
-                header_params["traceparent"] = (
-                    "00-"
-                    + format_trace_id(backend_trace_id)
-                    + "-"
-                    + format_span_id(backend_initial_span.get_span_context().span_id)
-                    + "-"
-                    + f"{backend_span_context.trace_flags:02x}"
+                header_params["traceparent"] = _traceparent(
+                    backend_trace_id,
+                    backend_initial_span.get_span_context().span_id,
+                    backend_span_context.trace_flags,
                 )
 
-                return super().call_api(
-                    method,
-                    url,
-                    header_params,
-                    body,
-                    post_params,
-                    _request_timeout,
-                )
+                yield header_params
 
     def response_deserialize(
         self,
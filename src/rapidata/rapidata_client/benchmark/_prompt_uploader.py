@@ -5,9 +5,13 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from opentelemetry import context as otel_context
-from tqdm.auto import tqdm
 
 from rapidata.rapidata_client.config import logger, rapidata_config, tracer
+from rapidata.rapidata_client.config.upload_concurrency import (
+    file_traffic_class,
+    upload_slot,
+    upload_workers,
+)
 from rapidata.rapidata_client.benchmark.prompt_metadata import Origin, Tag
 from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
 
@@ -98,7 +102,8 @@ class BenchmarkPromptUploader:
         def upload_one(prompt: BenchmarkPrompt) -> None:
             token = otel_context.attach(current_context)
             try:
-                self.upload(prompt)
+                with upload_slot(file_traffic_class(prompt.prompt_asset)):
+                    self.upload(prompt)
             except Exception as e:
                 failures[prompt.identifier] = e
                 # The post-batch summary below reports every failed identifier, so an
@@ -107,10 +112,10 @@ class BenchmarkPromptUploader:
             finally:
                 otel_context.detach(token)
 
+        from tqdm.auto import tqdm
+
         with tracer.start_as_current_span("BenchmarkPromptUploader.upload_many"):
-            with ThreadPoolExecutor(
-                max_workers=rapidata_config.upload.maxWorkers
-            ) as executor:
+            with ThreadPoolExecutor(max_workers=upload_workers()) as executor:
                 futures = [executor.submit(upload_one, prompt) for prompt in prompts]
                 with tqdm(
                     total=len(prompts),
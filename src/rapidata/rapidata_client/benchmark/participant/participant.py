@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
 from typing import Literal
-from tqdm.auto import tqdm
 
 from rapidata.rapidata_client.config import logger, tracer
 from rapidata.rapidata_client.config._backoff import backoff_delay
 from rapidata.rapidata_client.config.rapidata_config import rapidata_config
+from rapidata.rapidata_client.config.upload_concurrency import (
+    backoff_sleep,
+    file_traffic_class,
+    upload_slot,
+    upload_workers,
+)
 from rapidata.rapidata_client.api.rapidata_api_client import (
     suppress_rapidata_error_logging,
 )
@@ -20,6 +24,7 @@ from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
 from rapidata.rapidata_client.exceptions.rapidata_error import RapidataError
 
 
+from rapidata.api_client.rest import bulk_requests
 from rapidata.service.openapi_service import OpenAPIService
 from rapidata.api_client.models.participant_status import ParticipantStatus
 
@@ -189,7 +194,7 @@ class BenchmarkParticipant:
             try:
                 asset_input = self._asset_uploader.build_asset_input(asset, data_type)
 
-                with suppress_rapidata_error_logging():
+                with suppress_rapidata_error_logging(), bulk_requests():
                     self._openapi_service.leaderboard.participant_api.participant_participant_id_sample_post(
                         participant_id=self.id,
                         create_sample_endpoint_input=CreateSampleEndpointInput(
@@ -220,7 +225,7 @@ class BenchmarkParticipant:
                         last_exception,
                         retry_delay,
                     )
-                    time.sleep(retry_delay)
+                    backoff_sleep(retry_delay)
 
             except Exception as e:
                 last_exception = e
@@ -237,7 +242,7 @@ class BenchmarkParticipant:
                         last_exception,
                         retry_delay,
                     )
-                    time.sleep(retry_delay)
+                    backoff_sleep(retry_delay)
 
         # Not the last word on this sample: callers sweep with `retry_missing` and then
         # report whatever is still short, so an error here double-counts recoveries.
@@ -275,9 +280,10 @@ class BenchmarkParticipant:
             """Wrapper function that runs _process_single_sample_upload with the provided context."""
             token = otel_context.attach(context)
             try:
-                return self._process_single_sample_upload(
-                    asset, identifier, data_type=data_type
-                )
+                with upload_slot(file_traffic_class(asset)):
+                    return self._process_single_sample_upload(
+                        asset, identifier, data_type=data_type
+                    )
             finally:
                 otel_context.detach(token)
 
@@ -288,9 +294,7 @@ class BenchmarkParticipant:
         # Capture the current OpenTelemetry context before creating threads
         current_context = otel_context.get_current()
 
-        with ThreadPoolExecutor(
-            max_workers=rapidata_config.upload.maxWorkers
-        ) as executor:
+        with ThreadPoolExecutor(max_workers=upload_workers()) as executor:
             futures = {
                 executor.submit(
                     upload_with_context,
@@ -301,6 +305,8 @@ class BenchmarkParticipant:
                 for asset, identifier in zip(assets, identifiers)
             }
 
+            from tqdm.auto import tqdm
+
             with tqdm(
                 total=total_uploads,
                 desc="Uploading media",
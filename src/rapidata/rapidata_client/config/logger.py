@@ -1,11 +1,6 @@
 import logging
 import threading
 from typing import Protocol, runtime_checkable
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.resources import Resource
 from rapidata import __version__
 from .logging_config import LoggingConfig, register_config_handler
 
@@ -65,6 +60,16 @@ class RapidataLogger:
                 return
 
             try:
+                # The SDK and exporter take a noticeable share of import time,
+                # so they are only loaded once OTLP logging is actually used.
+                from opentelemetry._logs import set_logger_provider
+                from opentelemetry.exporter.otlp.proto.http._log_exporter import (
+                    OTLPLogExporter,
+                )
+                from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+                from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+                from opentelemetry.sdk.resources import Resource
+
                 logger_provider = LoggerProvider(
                     resource=Resource.create(
                         {
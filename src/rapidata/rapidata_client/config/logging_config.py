@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from typing import Any, Callable
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from rapidata.rapidata_client.config import logger
 from rapidata.rapidata_client.config._env_utils import apply_env_overrides
@@ -44,8 +44,18 @@ class LoggingConfig(BaseModel):
             Can also be disabled via the RAPIDATA_DISABLE_OTLP=1 environment variable.
         environment (str): The API environment the client targets, used to derive the
             OTLP collector host (``otlp-sdk.<environment>``). Set by RapidataClient.
+        tracing_level (str): How much of the API traffic is traced when OTLP is enabled.
+            ``"full"`` (default) traces every request with a pair of linked spans,
+            ``"sampled"`` does so for a ``tracing_sample_rate`` share of requests and
+            ``"stage"`` only traces the SDK operations (uploads, job creation, ...).
+            Requests that get no spans of their own still carry a ``traceparent``, so
+            the backend trace stays correlated with the operation that sent them.
+        tracing_sample_rate (float): Share of requests traced with ``"sampled"``,
+            between 0 and 1. Defaults to 0.01.
     """
 
+    model_config = ConfigDict(validate_assignment=True)
+
     @model_validator(mode="before")
     @classmethod
     def _apply_env_vars(cls, data: Any) -> Any:
@@ -59,6 +69,28 @@ class LoggingConfig(BaseModel):
     silent_mode: bool = Field(default=False)
     enable_otlp: bool = Field(default_factory=_default_enable_otlp)
     environment: str = Field(default="rapidata.ai")
+    tracing_level: str = Field(
+        default="full",
+        description='Requests traced with their own spans: "full", "sampled" or "stage".',
+    )
+    tracing_sample_rate: float = Field(
+        default=0.01,
+        description='Share of requests traced when tracing_level is "sampled".',
+    )
+
+    @field_validator("tracing_level")
+    @classmethod
+    def validate_tracing_level(cls, v: str) -> str:
+        if v not in ("full", "sampled", "stage"):
+            raise ValueError('tracing_level must be "full", "sampled" or "stage"')
+        return v
+
+    @field_validator("tracing_sample_rate")
+    @classmethod
+    def validate_tracing_sample_rate(cls, v: float) -> float:
+        if not 0 <= v <= 1:
+            raise ValueError("tracing_sample_rate must be between 0 and 1")
+        return v
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field, model_validator
 
 from rapidata.rapidata_client.config._env_utils import apply_env_overrides
 from rapidata.rapidata_client.config.logging_config import LoggingConfig
+from rapidata.rapidata_client.config.results_config import ResultsConfig
 from rapidata.rapidata_client.config.upload_config import UploadConfig
 
 
@@ -21,6 +22,8 @@ class RapidataConfig(BaseModel):
             Such as the maximum number of worker threads for processing media paths and the maximum number of retries for failed uploads.
         logging (LoggingConfig): The configuration for the logging process.
             Such as the logging level and the logging file.
+        results (ResultsConfig): The configuration for retrieving job results.
+            Such as whether to cache the results of completed jobs on disk.
 
     Example:
         ```python
@@ -39,6 +42,7 @@ class RapidataConfig(BaseModel):
     enableBetaFeatures: bool = False
     upload: UploadConfig = Field(default_factory=UploadConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    results: ResultsConfig = Field(default_factory=ResultsConfig)
 
 
 rapidata_config = RapidataConfig()
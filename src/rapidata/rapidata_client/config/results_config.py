@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from rapidata.rapidata_client.config._env_utils import apply_env_overrides
+
+
+class ResultsConfig(BaseModel):
+    """
+    Holds the configuration for retrieving job results.
+
+    Attributes:
+        cacheResultsToDisk (bool): Keep the results of completed jobs on disk, so
+            that ``get_results`` on a job whose results were fetched before returns
+            them without downloading them again. Defaults to False.
+        resultsCacheLocation (Path): Directory of the results cache. Defaults to
+            ~/.cache/rapidata/results.
+        resultsCacheSizeLimit (int): Most bytes the results cache takes on disk.
+            The least recently used results are removed first. Defaults to 2 GiB.
+    """
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _apply_env_vars(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return apply_env_overrides(cls.model_fields, data)
+        return data
+
+    cacheResultsToDisk: bool = Field(
+        default=False,
+        description="Cache the results of completed jobs on disk.",
+    )
+    resultsCacheLocation: Path = Field(
+        default=Path.home() / ".cache" / "rapidata" / "results",
+    )
+    resultsCacheSizeLimit: int = Field(
+        default=2 * 1024**3,
+        description="Most bytes the results cache takes on disk (LRU eviction).",
+    )
+
+    @field_validator("resultsCacheSizeLimit")
+    @classmethod
+    def validate_results_cache_size_limit(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("resultsCacheSizeLimit must be at least 1")
+        return v
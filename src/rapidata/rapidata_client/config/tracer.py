@@ -3,12 +3,9 @@ import threading
 import platform
 import sys
 import os
+import random
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.resources import Resource
 from rapidata import __version__
 from .logging_config import LoggingConfig, register_config_handler
 from rapidata.rapidata_client.config import logger
@@ -40,6 +37,7 @@ class TracerProtocol(Protocol):
     def set_session_id(self, session_id: str) -> None: ...
     def set_user_info(self, client_id: str, email: str) -> None: ...
     def fail_current_span(self, message: str | None = None) -> None: ...
+    def should_trace_request(self) -> bool: ...
 
 
 class NoOpSpan:
@@ -86,6 +84,9 @@ class NoOpTracer:
     def fail_current_span(self, message: str | None = None) -> None:
         pass
 
+    def should_trace_request(self) -> bool:
+        return False
+
     def __getattr__(self, name: str) -> Any:
         """Delegate to no-op behavior."""
         return lambda *args, **kwargs: NoOpSpan()
@@ -133,6 +134,8 @@ class RapidataTracer:
         self._no_op_tracer = NoOpTracer()
         self._enabled = True  # Default to enabled
         self._environment = "rapidata.ai"
+        self._tracing_level = "full"
+        self._tracing_sample_rate = 0.01
         self.session_id: str | None = None
         self.client_id: str | None = None
         self.email: str | None = None
@@ -148,6 +151,8 @@ class RapidataTracer:
         """Update the tracer based on the new configuration."""
         self._enabled = config.enable_otlp
         self._environment = config.environment
+        self._tracing_level = config.tracing_level
+        self._tracing_sample_rate = config.tracing_sample_rate
 
     def _ensure_initialized(self) -> None:
         """Lazily initialize OTLP tracing on first use."""
@@ -159,6 +164,14 @@ class RapidataTracer:
                 return
 
             try:
+                # Loaded on first use, like the OTLP log exporter.
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                    OTLPSpanExporter,
+                )
+                from opentelemetry.sdk.resources import Resource
+                from opentelemetry.sdk.trace import TracerProvider
+                from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
                 resource_attributes = {
                     "service.name": "Rapidata.Python.SDK",
                     "service.version": __version__,
@@ -228,6 +241,14 @@ class RapidataTracer:
             f"User info set - client_id: {self.client_id}, email: {self.email}"
         )
 
+    def should_trace_request(self) -> bool:
+        """Whether an API request gets spans of its own at the configured tracing level."""
+        if self._tracing_level == "full":
+            return True
+        if self._tracing_level == "sampled":
+            return random.random() < self._tracing_sample_rate
+        return False
+
     def fail_current_span(self, message: str | None = None) -> None:
         """Mark the current span as errored."""
         span = trace.get_current_span()
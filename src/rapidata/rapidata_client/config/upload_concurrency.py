@@ -0,0 +1,308 @@
+"""
+Adaptive (AIMD) concurrency control for the threaded upload paths.
+
+With ``rapidata_config.upload.adaptiveConcurrency`` enabled, every upload task
+(asset files, datapoint creations, benchmark media and prompts) runs inside a
+slot of one process-wide :class:`AdaptiveConcurrencyLimiter`. The limiter sees
+the outcome of every HTTP attempt those tasks make, retried ones included,
+through ``rapidata.api_client.rest.request_observer``, and moves the number of
+slots the way TCP moves its congestion window:
+
+- Additive increase: after a full window of healthy responses (one per slot),
+  the limit grows by one. Nothing grows during the ``cooldown`` after a cut.
+- Multiplicative decrease: a throttling or gateway response (429/502/503/504),
+  a transport failure (timeout, reset) or latency far above the observed
+  baseline cuts the limit by ``decrease_factor``, at most once per
+  ``cooldown`` so one burst of failures counts as one congestion event.
+
+Latency is tracked per traffic class, so a multi-megabyte file upload is only
+compared with uploads of a similar size and never with a small JSON request.
+A task waiting out a retry back-off hands its slot to another task meanwhile.
+
+The current limit and the most recent decisions are available from
+:func:`upload_limiter` for monitoring.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import ContextManager, Iterator
+
+from rapidata.api_client.rest import request_backoff, request_observer
+from rapidata.rapidata_client.config import logger, rapidata_config
+
+_CONGESTION_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Traffic class of requests without a sizeable payload (JSON calls, URLs).
+DEFAULT_TRAFFIC_CLASS = "request"
+
+
+@dataclass(frozen=True)
+class ConcurrencyDecision:
+    """One change of the concurrency limit.
+
+    Attributes:
+        timestamp (float): ``time.time()`` of the change.
+        previous (int): The limit before the change.
+        limit (int): The limit after the change.
+        reason (str): What triggered it, e.g. ``"HTTP 429"`` or ``"healthy"``.
+    """
+
+    timestamp: float
+    previous: int
+    limit: int
+    reason: str
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds in-flight upload tasks with a limit that follows backend health.
+
+    Args:
+        initial: The starting limit.
+        minimum: The limit never drops below this.
+        maximum: The limit never grows above this; size thread pools to it.
+        decrease_factor: Multiplier applied to the limit on congestion.
+        latency_tolerance: A smoothed latency above ``latency_tolerance`` times
+            the baseline (the lowest smoothed latency seen for the same traffic
+            class) counts as congestion.
+        cooldown: Minimum seconds between two decreases.
+        history: Number of recent decisions kept for :attr:`decisions`.
+    """
+
+    _EWMA_WEIGHT = 0.2
+    # Lets the baseline follow the backend up again after a fast period, so
+    # one lucky stretch doesn't make every later latency look unhealthy.
+    _BASELINE_DRIFT = 1.001
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 100,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        cooldown: float = 1.0,
+        history: int = 100,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError("Expected 1 <= minimum <= maximum")
+        if not 0.0 < decrease_factor < 1.0:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._cooldown = cooldown
+
+        self._condition = threading.Condition()
+        self._limit = max(minimum, min(initial, maximum))
+        self._in_flight = 0
+        self._healthy_since_change = 0
+        self._last_decrease = float("-inf")
+        # Smoothed latency and its baseline, per traffic class.
+        self._latency: dict[str, float] = {}
+        self._baseline: dict[str, float] = {}
+        self._decisions: deque[ConcurrencyDecision] = deque(maxlen=history)
+
+    @property
+    def limit(self) -> int:
+        """The current number of slots."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of slots currently taken."""
+        return self._in_flight
+
+    @property
+    def decisions(self) -> list[ConcurrencyDecision]:
+        """The most recent limit changes, oldest first."""
+        with self._condition:
+            return list(self._decisions)
+
+    @contextmanager
+    def slot(self, traffic_class: str = DEFAULT_TRAFFIC_CLASS) -> Iterator[None]:
+        """Hold one slot for the duration of the block.
+
+        Blocks while all slots are taken. HTTP attempts made inside the block
+        feed the limiter, their latency compared within ``traffic_class``.
+        Retry back-off waits inside the block release the slot until they are
+        over. Re-entering from a thread that already holds a slot does not
+        take a second one.
+        """
+        if isinstance(observer := request_observer.get(), _SlotObserver) and (
+            observer.limiter is self
+        ):
+            yield
+            return
+
+        self._acquire()
+        observer_token = request_observer.set(_SlotObserver(self, traffic_class))
+        backoff_token = request_backoff.set(self._back_off)
+        try:
+            yield
+        finally:
+            request_backoff.reset(backoff_token)
+            request_observer.reset(observer_token)
+            self._release()
+
+    def observe(
+        self,
+        status_code: int | None,
+        seconds: float,
+        traffic_class: str = DEFAULT_TRAFFIC_CLASS,
+    ) -> None:
+        """Feed the outcome of one HTTP attempt into the limit."""
+        with self._condition:
+            if status_code is None:
+                self._decrease("transport error")
+                return
+            if status_code in _CONGESTION_STATUS_CODES:
+                self._decrease(f"HTTP {status_code}")
+                return
+
+            latency = self._latency.get(traffic_class)
+            if latency is None:
+                latency = seconds
+            else:
+                latency += self._EWMA_WEIGHT * (seconds - latency)
+            self._latency[traffic_class] = latency
+            baseline = self._baseline.get(traffic_class)
+            if baseline is None or latency < baseline:
+                baseline = latency
+            else:
+                baseline *= self._BASELINE_DRIFT
+            self._baseline[traffic_class] = baseline
+
+            if latency > baseline * self._latency_tolerance:
+                self._decrease("latency", traffic_class)
+                return
+
+            if time.monotonic() - self._last_decrease < self._cooldown:
+                # Let the last cut take effect before growing again.
+                return
+            self._healthy_since_change += 1
+            if self._healthy_since_change >= self._limit:
+                self._change(self._limit + 1, "healthy")
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def _back_off(self, seconds: float) -> None:
+        """Sleep for a retry back-off without holding the caller's slot."""
+        self._release()
+        try:
+            time.sleep(seconds)
+        finally:
+            self._acquire()
+
+    def _decrease(self, reason: str, traffic_class: str | None = None) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        if traffic_class is not None:
+            # Start over from the current latency; otherwise a permanently
+            # slower backend would keep the limit at the minimum forever.
+            self._baseline[traffic_class] = self._latency[traffic_class]
+        self._change(int(self._limit * self._decrease_factor), reason)
+
+    def _change(self, limit: int, reason: str) -> None:
+        limit = max(self.minimum, min(limit, self.maximum))
+        self._healthy_since_change = 0
+        if limit == self._limit:
+            return
+        previous, self._limit = self._limit, limit
+        self._decisions.append(ConcurrencyDecision(time.time(), previous, limit, reason))
+        if limit < previous:
+            logger.debug(
+                "Upload concurrency reduced %d -> %d (%s)", previous, limit, reason
+            )
+        else:
+            logger.debug("Upload concurrency raised %d -> %d", previous, limit)
+        self._condition.notify_all()
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self._limit}, in_flight={self._in_flight}, "
+            f"minimum={self.minimum}, maximum={self.maximum})"
+        )
+
+
+@dataclass(frozen=True)
+class _SlotObserver:
+    """``request_observer`` of a held slot: feeds attempts to its limiter."""
+
+    limiter: AdaptiveConcurrencyLimiter
+    traffic_class: str
+
+    def __call__(self, status_code: int | None, seconds: float) -> None:
+        self.limiter.observe(status_code, seconds, self.traffic_class)
+
+
+_limiter: AdaptiveConcurrencyLimiter | None = None
+_limiter_settings: tuple[int, int] | None = None
+_limiter_lock = threading.Lock()
+
+
+def upload_limiter() -> AdaptiveConcurrencyLimiter | None:
+    """The process-wide upload limiter, or None if adaptive concurrency is off.
+
+    The limiter, and what it has learned, is kept across uploads; it is only
+    rebuilt when ``maxWorkers`` or ``adaptiveMaxWorkers`` change.
+    """
+    global _limiter, _limiter_settings
+    config = rapidata_config.upload
+    if not config.adaptiveConcurrency:
+        return None
+    settings = (config.maxWorkers, config.adaptiveMaxWorkers)
+    with _limiter_lock:
+        if _limiter is None or _limiter_settings != settings:
+            _limiter = AdaptiveConcurrencyLimiter(
+                initial=config.maxWorkers,
+                maximum=max(config.maxWorkers, config.adaptiveMaxWorkers),
+            )
+            _limiter_settings = settings
+        return _limiter
+
+
+def upload_workers() -> int:
+    """Thread-pool size for an upload path: room for the highest possible limit."""
+    limiter = upload_limiter()
+    return limiter.maximum if limiter is not None else rapidata_config.upload.maxWorkers
+
+
+def upload_slot(traffic_class: str = DEFAULT_TRAFFIC_CLASS) -> ContextManager[None]:
+    """A slot of the upload limiter, or a no-op when adaptive concurrency is off."""
+    limiter = upload_limiter()
+    return limiter.slot(traffic_class) if limiter is not None else nullcontext()
+
+
+def file_traffic_class(asset: str | None) -> str:
+    """Traffic class for uploading ``asset``: local files by size, one per doubling."""
+    if asset is None:
+        return DEFAULT_TRAFFIC_CLASS
+    try:
+        size = os.path.getsize(asset)
+    except (OSError, ValueError):
+        return DEFAULT_TRAFFIC_CLASS
+    return f"file/{size.bit_length()}"
+
+
+def backoff_sleep(seconds: float) -> None:
+    """Wait out a retry back-off, releasing the caller's upload slot meanwhile."""
+    sleep = request_backoff.get() or time.sleep
+    sleep(seconds)
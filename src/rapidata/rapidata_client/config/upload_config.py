@@ -20,6 +20,13 @@ class CompressionConfig(BaseModel):
     expected in the 1..100 range and ``max_dimension`` must be at least 1; both
     are validated server-side.
 
+    With ``local=True``, images given as local files are additionally downscaled
+    to ``max_dimension`` and re-encoded as WebP at ``quality`` on this machine,
+    on a thread pool, before they are uploaded, so only the compressed bytes
+    cross the network. Needs Pillow (``pip install rapidata[images]``); files
+    that are not images, or would not get smaller, are uploaded unchanged.
+    ``local`` does not change what the asset service is asked to do.
+
     Currently applies to single-asset uploads (file paths and individual URLs
     via the ``/asset/file`` and ``/asset/url`` endpoints). Batched URL uploads
     via the orchestrator's ``/asset/batch-upload`` path will gain the same
@@ -30,6 +37,7 @@ class CompressionConfig(BaseModel):
         enabled (bool | None): Force compression on or off. ``None`` to defer to the server default.
         quality (int | None): WebP quality (1..100) to use when compression runs.
         max_dimension (int | None): Maximum width or height in pixels when compression runs.
+        local (bool): Also compress local image files client-side before uploading them.
     """
 
     model_config = ConfigDict(validate_assignment=True)
@@ -37,6 +45,7 @@ class CompressionConfig(BaseModel):
     enabled: bool | None = None
     quality: int | None = None
     max_dimension: int | None = None
+    local: bool = False
 
     @field_validator("quality")
     @classmethod
@@ -91,6 +100,22 @@ class UploadConfig(BaseModel):
         cacheTimeout (float): Cache operation timeout in seconds. Defaults to 0.1.
         cacheLocation (Path): Directory for cache storage. Defaults to ~/.cache/rapidata/upload_cache.
             This is immutable. Only used for file uploads when cacheToDisk=True.
+        cacheBackend (str): Storage for the on-disk file cache. ``"diskcache"`` (default) is
+            per-process single-flight over a sharded diskcache. ``"sqlite"`` (one machine) and
+            ``"filelock"`` (shared filesystems) also de-duplicate uploads across processes: a
+            process uploading a file the cache does not know yet holds a lock on it, and other
+            processes wait and reuse its result. ``"package.module:factory"`` plugs in a custom
+            backend, built as ``factory(cacheLocation)``. Only used when cacheToDisk=True.
+        contentAddressedCache (bool): Key the file cache on a BLAKE2b digest of each file's
+            content instead of its path, size and modification time. A file copied to another
+            directory, re-extracted from an archive or synced to another machine sharing the
+            cache is then not uploaded again. Costs one read of every file per process;
+            digests are memoized per file version and computed in parallel. Defaults to False.
+        urlCacheMaxEntries (int): Most URL uploads remembered in memory; the least recently
+            used are forgotten first, and uploaded again if they come up again. Bounds the
+            URL cache's memory in long-lived processes. Defaults to 100000.
+        urlCacheTtl (float | None): Seconds a remembered URL upload stays valid, or None
+            (default) to keep it until evicted.
         cacheShards (int): Number of disk-cache shards for concurrent file-cache access. Defaults to 32.
             Each shard is a separate on-disk store that holds open file handles, so a higher value
             raises the process's file-descriptor count — which can exceed a low ``ulimit -n`` and
@@ -99,7 +124,12 @@ class UploadConfig(BaseModel):
             variable. Only used for file uploads when cacheToDisk=True.
         enableBatchUpload (bool): Enable batch URL uploading (two-step process). Defaults to True.
         batchSize (int): Number of URLs per batch (100-5000). Defaults to 1000.
-        batchPollInterval (float): Polling interval in seconds. Defaults to 0.5.
+        batchPollInterval (float): Polling interval in seconds while batches are finishing.
+            Defaults to 0.5.
+        batchPollMaxInterval (float): Upper bound the polling interval backs off to (doubling
+            per poll) while no batch makes progress. Defaults to 5.0.
+        batchConcurrency (int): Number of batches submitted, and of completed batches whose
+            results are fetched, in parallel. Defaults to 8.
         compression (CompressionConfig | None): Per-upload override for the asset service's
             image-compression behaviour. Defaults to None (use server-side defaults).
         contextShortening (bool): When True, every datapoint context is shortened for the
@@ -120,6 +150,39 @@ class UploadConfig(BaseModel):
             ``None`` (default) uses the account's default. ``True`` forces the check on.
             ``False`` requests skipping it — honored only when the account is permitted to
             skip; otherwise the check still runs and a warning is logged. Defaults to None.
+        streamingWindowSize (int): Maximum number of datapoints ``add_datapoints_streaming`` holds
+            in memory and uploads at a time. The input is read in quarter-window slices, each
+            pulled as soon as an earlier one is done. Job definitions with more datapoints than
+            this are uploaded the same way. Defaults to 5000.
+        asyncUpload (bool): Run ``add_datapoints`` on an asyncio engine instead of thread pools.
+            Asset and datapoint requests are issued as coroutines over a single async HTTP
+            client, so thousands of requests can be in flight without a thread each. The
+            public API stays synchronous. Defaults to False.
+        asyncConcurrency (int): Maximum number of in-flight asset and datapoint requests when
+            ``asyncUpload`` is enabled. Plays the role ``maxWorkers`` plays for the threaded
+            engine. Defaults to 100.
+        adaptiveConcurrency (bool): Let the threaded upload paths adapt how many requests they
+            keep in flight. Starting at ``maxWorkers``, the limit grows by one per window of
+            healthy responses and is halved on throttling (429), gateway errors (502-504),
+            timeouts or a sharp rise in latency. Shared by asset, datapoint and benchmark
+            uploads. Defaults to False.
+        adaptiveMaxWorkers (int): Upper bound for the adaptive limit. Upload thread pools are
+            sized to it while ``adaptiveConcurrency`` is enabled. Defaults to 100.
+        journalDirectory (Path | None): Directory for job-definition upload journals. When set,
+            every datapoint created while building a job definition is recorded on disk, and
+            creating a job definition with the same name and datapoints again (e.g. after the
+            process was killed) reuses the dataset and only uploads the missing datapoints. The journal is
+            deleted once the definition exists. Defaults to None (no journal).
+        http2 (bool): Talk HTTP/2 to the API from the asyncio upload engine (``asyncUpload``),
+            so its concurrent asset uploads and datapoint requests share a few multiplexed
+            connections instead of opening up to 200, each with its own TLS handshake and file
+            descriptor. The threaded engine and other calls stay on HTTP/1.1. Needs
+            ``pip install rapidata[http2]``; falls back to HTTP/1.1 without it. Read when a
+            client is created. Defaults to False.
+        bulkPoolSize (int): Connections reserved for bulk traffic: asset uploads and sample
+            submissions. They go through a pool of their own with longer timeouts, so status
+            polls, job creation and token refreshes stay fast while uploads saturate it. Read
+            when a client is created. Defaults to 200.
     """
 
     model_config = ConfigDict(validate_assignment=True)
@@ -142,6 +205,22 @@ class UploadConfig(BaseModel):
         default=Path.home() / ".cache" / "rapidata" / "upload_cache",
         frozen=True,
     )
+    cacheBackend: str = Field(
+        default="diskcache",
+        description='File-cache storage: "diskcache", "sqlite", "filelock" or "package.module:factory".',
+    )
+    urlCacheMaxEntries: int = Field(
+        default=100_000,
+        description="Most URL uploads held in the in-memory URL cache (LRU eviction)",
+    )
+    urlCacheTtl: float | None = Field(
+        default=None,
+        description="Seconds a cached URL upload stays valid. None keeps entries until evicted.",
+    )
+    contentAddressedCache: bool = Field(
+        default=False,
+        description="Key the file cache on a content digest instead of path, size and mtime.",
+    )
     cacheShards: int = Field(
         default=32,
         frozen=True,
@@ -155,6 +234,14 @@ class UploadConfig(BaseModel):
         default=0.5,
         description="Polling interval in seconds",
     )
+    batchPollMaxInterval: float = Field(
+        default=5.0,
+        description="Longest polling interval, reached by backing off while batches make no progress",
+    )
+    batchConcurrency: int = Field(
+        default=8,
+        description="Batches submitted, and completed batches fetched, in parallel",
+    )
     compression: CompressionConfig | None = Field(
         default=None,
         description="Per-upload override for image compression. None uses server defaults.",
@@ -171,6 +258,38 @@ class UploadConfig(BaseModel):
         default=None,
         description="Opt in/out of the server-side explicit-content check on job assignment. None uses the account default; True forces it on; False requests skip (honored only if permitted).",
     )
+    streamingWindowSize: int = Field(
+        default=5000,
+        description="Maximum datapoints held in memory and uploaded at a time by add_datapoints_streaming; larger job definitions are streamed.",
+    )
+    asyncUpload: bool = Field(
+        default=False,
+        description="Upload assets and datapoints with the asyncio engine instead of thread pools.",
+    )
+    asyncConcurrency: int = Field(
+        default=100,
+        description="Maximum in-flight asset and datapoint requests when asyncUpload is enabled.",
+    )
+    adaptiveConcurrency: bool = Field(
+        default=False,
+        description="Adapt upload concurrency to throttling, errors and latency (AIMD), starting at maxWorkers.",
+    )
+    adaptiveMaxWorkers: int = Field(
+        default=100,
+        description="Upper bound for the adaptive upload concurrency limit.",
+    )
+    journalDirectory: Path | None = Field(
+        default=None,
+        description="Directory for upload journals that let an interrupted job-definition upload resume.",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Multiplex asyncUpload requests over a few HTTP/2 connections. Read when a client is created.",
+    )
+    bulkPoolSize: int = Field(
+        default=200,
+        description="Connections in the separate pool used by asset uploads. Read when a client is created.",
+    )
 
     @field_validator("maxWorkers")
     @classmethod
@@ -182,6 +301,32 @@ class UploadConfig(BaseModel):
             )
         return v
 
+    @field_validator("streamingWindowSize")
+    @classmethod
+    def validate_streaming_window_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("streamingWindowSize must be at least 1")
+        return v
+
+    @field_validator("asyncConcurrency")
+    @classmethod
+    def validate_async_concurrency(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("asyncConcurrency must be at least 1")
+        if v > 200:
+            logger.warning(
+                f"asyncConcurrency is set to {v}, which is above the connection pool size of 200. "
+                "Requests beyond that will queue for a connection."
+            )
+        return v
+
+    @field_validator("adaptiveMaxWorkers")
+    @classmethod
+    def validate_adaptive_max_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("adaptiveMaxWorkers must be at least 1")
+        return v
+
     @field_validator("cacheShards")
     @classmethod
     def validate_cache_shards(cls, v: int) -> int:
@@ -193,6 +338,32 @@ class UploadConfig(BaseModel):
             )
         return v
 
+    @field_validator("cacheBackend")
+    @classmethod
+    def validate_cache_backend(cls, v: str) -> str:
+        if v not in ("diskcache", "sqlite", "filelock"):
+            module_name, separator, attribute = v.partition(":")
+            if not (module_name and separator and attribute):
+                raise ValueError(
+                    'cacheBackend must be "diskcache", "sqlite", "filelock" '
+                    'or "package.module:factory"'
+                )
+        return v
+
+    @field_validator("urlCacheMaxEntries")
+    @classmethod
+    def validate_url_cache_max_entries(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("urlCacheMaxEntries must be at least 1")
+        return v
+
+    @field_validator("urlCacheTtl")
+    @classmethod
+    def validate_url_cache_ttl(cls, v: float | None) -> float | None:
+        if v is not None and v <= 0:
+            raise ValueError("urlCacheTtl must be positive")
+        return v
+
     @field_validator("batchSize")
     @classmethod
     def validate_batch_size(cls, v: int) -> int:
@@ -200,6 +371,20 @@ class UploadConfig(BaseModel):
             raise ValueError("batchSize must be at least 100")
         return v
 
+    @field_validator("batchConcurrency")
+    @classmethod
+    def validate_batch_concurrency(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("batchConcurrency must be at least 1")
+        return v
+
+    @field_validator("bulkPoolSize")
+    @classmethod
+    def validate_bulk_pool_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("bulkPoolSize must be at least 1")
+        return v
+
     @field_validator("failureTolerance")
     @classmethod
     def validate_failure_tolerance(cls, v: float) -> float:
@@ -4,7 +4,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Sequence, TYPE_CHECKING
 
 from opentelemetry import context as otel_context
-from tqdm.auto import tqdm
 
 from rapidata.rapidata_client.config import logger, tracer, rapidata_config
 
@@ -76,6 +75,8 @@ class ContextManager:
             results: list[list[str]] = [[] for _ in batches]
             current_context = otel_context.get_current()
 
+            from tqdm.auto import tqdm
+
             def shorten_batch(index: int) -> None:
                 token = otel_context.attach(current_context)
                 try:
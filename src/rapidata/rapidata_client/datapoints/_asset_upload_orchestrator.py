@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable, TYPE_CHECKING
 
 from opentelemetry import context as otel_context
-from tqdm.auto import tqdm
 
 from rapidata.rapidata_client.config import logger, rapidata_config
+from rapidata.rapidata_client.config.upload_concurrency import (
+    file_traffic_class,
+    upload_slot,
+    upload_workers,
+)
 from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
 from rapidata.rapidata_client.datapoints._batch_asset_uploader import (
     BatchAssetUploader,
@@ -17,6 +24,7 @@ from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
 from rapidata.rapidata_client.datapoints._single_flight_cache import SingleFlightCache
 
 if TYPE_CHECKING:
+    from tqdm.auto import tqdm
     from rapidata.rapidata_client.datapoints._datapoint import Datapoint
     from rapidata.service.openapi_service import OpenAPIService
 
@@ -70,6 +78,8 @@ class AssetUploadOrchestrator:
         self,
         assets: set[str] | list[str],
         asset_completion_callback: Callable[[list[str]], None] | None = None,
+        show_progress: bool = True,
+        file_slots: threading.Semaphore | None = None,
     ) -> list[FailedUpload[str]]:
         """
         Step 1/2: Upload ALL assets.
@@ -78,19 +88,136 @@ class AssetUploadOrchestrator:
         Args:
             assets: Set or list of asset identifiers (URLs or file paths) to upload.
             asset_completion_callback: Optional callback to notify when assets complete (called with list of successful assets).
+            show_progress: Whether to show the step's progress bar.
+            file_slots: Optional semaphore each file upload holds while it runs,
+                to share one concurrency limit between concurrent calls.
 
         Returns:
             List of FailedUpload instances for any assets that failed.
         """
-        # 1. Validate assets
+        # 1-2. Validate, separate and filter assets
+        uncached_urls, uncached_files = self._prepare_uploads(
+            assets, asset_completion_callback
+        )
+        if len(uncached_urls) + len(uncached_files) == 0:
+            return []
+
+        # 3. Perform uploads
+        failed_uploads = self._perform_uploads(
+            uncached_urls,
+            uncached_files,
+            asset_completion_callback,
+            show_progress,
+            file_slots,
+        )
+
+        # 4. Report results
+        self._log_upload_results(failed_uploads)
+        self._log_upload_warnings(self._collect_warnings())
+        return failed_uploads
+
+    async def upload_all_assets_async(
+        self,
+        assets: set[str] | list[str],
+        asset_completion_callback: Callable[[list[str]], None] | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        show_progress: bool = True,
+    ) -> list[FailedUpload[str]]:
+        """
+        Step 1/2 on the running event loop. Same contract as :meth:`upload_all_assets`.
+
+        Files are uploaded as coroutines bounded by ``semaphore`` (a fresh one
+        of ``asyncConcurrency`` slots if not given) instead of by a thread pool. The URL batch flow is poll-driven and stays on a
+        worker thread, running concurrently with the file uploads; its
+        callbacks are handed back to the event loop, so the completion
+        callback is only ever invoked from the loop thread.
+        """
+        uncached_urls, uncached_files = self._prepare_uploads(
+            assets, asset_completion_callback
+        )
+        if len(uncached_urls) + len(uncached_files) == 0:
+            return []
+
+        loop = asyncio.get_running_loop()
+        failed_uploads: list[FailedUpload[str]] = []
+
+        from tqdm.auto import tqdm
+
+        with tqdm(
+            total=len(uncached_urls) + len(uncached_files),
+            desc="Step 1/2: Uploading assets",
+            position=0,
+            disable=rapidata_config.logging.silent_mode or not show_progress,
+            leave=True,
+        ) as pbar:
+
+            def on_url_progress(n: int) -> None:
+                loop.call_soon_threadsafe(pbar.update, n)
+
+            def on_urls_complete(completed: list[str]) -> None:
+                if asset_completion_callback:
+                    loop.call_soon_threadsafe(asset_completion_callback, completed)
+
+            async def upload_urls() -> list[FailedUpload[str]]:
+                if not uncached_urls:
+                    logger.debug("No uncached URLs to upload")
+                    return []
+                logger.debug(f"Batch uploading {len(uncached_urls)} URL(s)")
+                return await asyncio.to_thread(
+                    self.batch_uploader.batch_upload_urls,
+                    list(uncached_urls),
+                    progress_callback=on_url_progress,
+                    completion_callback=on_urls_complete,
+                )
+
+            limit = semaphore or asyncio.Semaphore(
+                rapidata_config.upload.asyncConcurrency
+            )
+
+            async def upload_single_file(file_path: str) -> None:
+                async with limit:
+                    try:
+                        await self.asset_uploader.upload_asset_async(file_path)
+                    except Exception as e:
+                        logger.warning(f"Failed to upload file {file_path}: {e}")
+                        failed_uploads.append(FailedUpload.from_exception(file_path, e))
+                    else:
+                        if asset_completion_callback:
+                            asset_completion_callback([file_path])
+                    finally:
+                        pbar.update(1)
+
+            logger.debug(f"Concurrently uploading {len(uncached_files)} file(s)")
+            url_failures, *_ = await asyncio.gather(
+                upload_urls(),
+                *(upload_single_file(file_path) for file_path in uncached_files),
+            )
+            failed_uploads.extend(url_failures or [])
+
+        self._log_upload_results(failed_uploads)
+        self._log_upload_warnings(self._collect_warnings())
+        return failed_uploads
+
+    def _prepare_uploads(
+        self,
+        assets: set[str] | list[str],
+        asset_completion_callback: Callable[[list[str]], None] | None,
+    ) -> tuple[set[str], set[str]]:
+        """
+        Separate assets into URLs and files and drop the cached ones.
+
+        Cached assets are reported to ``asset_completion_callback`` right away.
+
+        Returns:
+            Tuple of (uncached_urls, uncached_files).
+        """
         all_assets = set(assets) if isinstance(assets, list) else assets
         logger.info(f"Uploading {len(all_assets)} unique asset(s)")
 
         if not all_assets:
             logger.debug("No assets to upload")
-            return []
+            return set(), set()
 
-        # 2. Separate and filter assets
         urls, files = self._separate_urls_and_files(all_assets)
         uncached_urls, uncached_files = self._filter_and_log_cached_assets(urls, files)
 
@@ -105,17 +232,8 @@ class AssetUploadOrchestrator:
 
         if len(uncached_urls) + len(uncached_files) == 0:
             logger.debug("All assets cached, nothing to upload")
-            return []
-
-        # 3. Perform uploads
-        failed_uploads = self._perform_uploads(
-            uncached_urls, uncached_files, asset_completion_callback
-        )
 
-        # 4. Report results
-        self._log_upload_results(failed_uploads)
-        self._log_upload_warnings(self._collect_warnings())
-        return failed_uploads
+        return uncached_urls, uncached_files
 
     # Keep the URL scheme check case-insensitive to match AssetUploader.
     _URL_SCHEME_RE = re.compile(r"^https?://", re.IGNORECASE)
@@ -154,6 +272,8 @@ class AssetUploadOrchestrator:
             uncached_urls = set()
 
         if files:
+            self.asset_uploader.precompress_files(files)
+            self.asset_uploader.prefetch_file_digests(files)
             uncached_files = self._filter_uncached(
                 files, self.asset_uploader._get_file_cache()
             )
@@ -173,6 +293,8 @@ class AssetUploadOrchestrator:
         uncached_urls: set[str],
         uncached_files: set[str],
         asset_completion_callback: Callable[[list[str]], None] | None,
+        show_progress: bool = True,
+        file_slots: threading.Semaphore | None = None,
     ) -> list[FailedUpload[str]]:
         """
         Execute asset uploads with progress tracking.
@@ -181,6 +303,8 @@ class AssetUploadOrchestrator:
             uncached_urls: URLs to upload.
             uncached_files: Files to upload.
             asset_completion_callback: Callback for completed assets.
+            show_progress: Whether to show the progress bar.
+            file_slots: Optional semaphore shared with concurrent callers.
 
         Returns:
             List of failed uploads.
@@ -188,11 +312,13 @@ class AssetUploadOrchestrator:
         failed_uploads: list[FailedUpload[str]] = []
         total = len(uncached_urls) + len(uncached_files)
 
+        from tqdm.auto import tqdm
+
         with tqdm(
             total=total,
             desc="Step 1/2: Uploading assets",
             position=0,
-            disable=rapidata_config.logging.silent_mode,
+            disable=rapidata_config.logging.silent_mode or not show_progress,
             leave=True,
         ) as pbar:
             # Upload URLs
@@ -200,14 +326,14 @@ class AssetUploadOrchestrator:
                 url_failures = self._upload_urls_with_progress(
                     uncached_urls, pbar, asset_completion_callback
                 )
-                failed_uploads.extend(url_failures)
+                failed_uploads.extend(url_failures or [])
             else:
                 logger.debug("No uncached URLs to upload")
 
             # Upload files
             if uncached_files:
                 file_failures = self._upload_files_with_progress(
-                    uncached_files, pbar, asset_completion_callback
+                    uncached_files, pbar, asset_completion_callback, file_slots
                 )
                 failed_uploads.extend(file_failures)
             else:
@@ -238,6 +364,7 @@ class AssetUploadOrchestrator:
         files: set[str],
         pbar: tqdm,
         completion_callback: Callable[[list[str]], None] | None,
+        file_slots: threading.Semaphore | None = None,
     ) -> list[FailedUpload[str]]:
         """Upload files with progress bar updates."""
         logger.debug(f"Parallel uploading {len(files)} file(s)")
@@ -249,6 +376,7 @@ class AssetUploadOrchestrator:
             files,
             progress_callback=update_progress,
             completion_callback=completion_callback,
+            file_slots=file_slots,
         )
 
     def _log_upload_results(self, failed_uploads: list[FailedUpload[str]]) -> None:
@@ -314,6 +442,7 @@ class AssetUploadOrchestrator:
         files: set[str],
         progress_callback: Callable[[], None] | None = None,
         completion_callback: Callable[[list[str]], None] | None = None,
+        file_slots: threading.Semaphore | None = None,
     ) -> list[FailedUpload[str]]:
         """
         Upload files in parallel using ThreadPoolExecutor.
@@ -322,6 +451,7 @@ class AssetUploadOrchestrator:
             files: Set of file paths to upload.
             progress_callback: Optional callback to report progress (called once per completed file).
             completion_callback: Optional callback to notify when files complete (called with list of successful files).
+            file_slots: Optional semaphore each upload holds while it runs.
 
         Returns:
             List of FailedUpload instances for any files that failed.
@@ -335,7 +465,10 @@ class AssetUploadOrchestrator:
             """Upload a single file and return FailedUpload if it fails."""
             token = otel_context.attach(current_context)
             try:
-                self.asset_uploader.upload_asset(file_path)
+                with file_slots or nullcontext(), upload_slot(
+                    file_traffic_class(file_path)
+                ):
+                    self.asset_uploader.upload_asset(file_path)
                 return None
             except Exception as e:
                 logger.warning(f"Failed to upload file {file_path}: {e}")
@@ -343,9 +476,7 @@ class AssetUploadOrchestrator:
             finally:
                 otel_context.detach(token)
 
-        with ThreadPoolExecutor(
-            max_workers=rapidata_config.upload.maxWorkers
-        ) as executor:
+        with ThreadPoolExecutor(max_workers=upload_workers()) as executor:
             futures = {
                 executor.submit(upload_single_file, file_path): file_path
                 for file_path in files
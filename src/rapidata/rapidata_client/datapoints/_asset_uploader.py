@@ -1,67 +1,96 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import os
 import threading
-from typing import Any, Literal
+from pathlib import Path
+from typing import Any, Iterable, Literal
 
 from rapidata.api_client.models.i_asset_input import IAssetInput
+from rapidata.api_client.rest import LocalFile, bulk_requests
 from rapidata.service.openapi_service import OpenAPIService
 from rapidata.rapidata_client.config import logger, rapidata_config, tracer
 from rapidata.rapidata_client.config.upload_config import CompressionConfig
 from rapidata.rapidata_client.datapoints._asset_mapper import AssetMapper
+from rapidata.rapidata_client.datapoints._file_digester import FileDigester
+from rapidata.rapidata_client.datapoints._media_precompressor import MediaPrecompressor
 from rapidata.rapidata_client.datapoints._single_flight_cache import SingleFlightCache
+from rapidata.rapidata_client.datapoints.cache_backends import (
+    CacheBackend,
+    LRUCacheBackend,
+    create_cache_backend,
+)
 from rapidata.rapidata_client.exceptions.asset_warning import AssetWarning
-from diskcache import FanoutCache
+
+# Response maps of the generated asset endpoints, needed when calling them
+# through ``call_endpoint`` / ``call_endpoint_async`` instead of the generated
+# blocking methods.
+_FILE_POST_RESPONSE_TYPES: dict[str, str | None] = {
+    "200": "UploadFileEndpointOutput",
+    "400": "ValidationProblemDetails",
+    "401": None,
+    "403": None,
+}
+_URL_POST_RESPONSE_TYPES: dict[str, str | None] = {
+    "200": "UploadFileFromUrlEndpointOutput",
+    "400": "ValidationProblemDetails",
+    "401": None,
+    "403": None,
+}
 
 
 class AssetUploader:
     # Class-level caches shared across all instances
-    # URL cache: Always in-memory (URLs are lightweight, no benefit to disk caching)
-    # File cache: Lazily initialized based on cacheToDisk config
-    _url_cache: SingleFlightCache = SingleFlightCache("URL cache", storage={})
+    # URL cache: Always in-memory (URLs are lightweight, no benefit to disk caching),
+    # bounded by urlCacheMaxEntries / urlCacheTtl so long-lived processes don't grow
+    # File cache: Lazily initialized based on cacheToDisk and cacheBackend config
+    _url_cache: SingleFlightCache = SingleFlightCache(
+        "URL cache", storage=LRUCacheBackend.from_upload_config()
+    )
     _file_cache: SingleFlightCache | None = None
-    _file_cache_uses_disk: bool | None = None
+    _file_cache_backend: str | None = None
     _file_cache_lock: threading.Lock = threading.Lock()
+    # Content digests for contentAddressedCache mode, memoized per file version
+    _file_digester: FileDigester = FileDigester()
+    # Local WebP copies of images for CompressionConfig(local=True)
+    _precompressor: MediaPrecompressor = MediaPrecompressor()
 
     @classmethod
     def _get_file_cache(cls) -> SingleFlightCache:
         """
         Get or create the file cache based on current config.
 
-        Uses lazy initialization to respect cacheToDisk setting at runtime.
-        Thread-safe with double-checked locking pattern.
+        Uses lazy initialization to respect the cacheToDisk and cacheBackend
+        settings at runtime. Thread-safe with double-checked locking pattern.
 
         Returns:
-            Configured file cache (disk or memory based on cacheToDisk).
+            Configured file cache (the configured disk backend, or memory when
+            cacheToDisk is off).
         """
-        cache_to_disk = rapidata_config.upload.cacheToDisk
+        config = rapidata_config.upload
+        backend = config.cacheBackend if config.cacheToDisk else "memory"
 
-        if cls._file_cache is not None and cls._file_cache_uses_disk == cache_to_disk:
+        if cls._file_cache is not None and cls._file_cache_backend == backend:
             return cls._file_cache
 
         with cls._file_cache_lock:
             # Double-check after acquiring lock
-            if (
-                cls._file_cache is not None
-                and cls._file_cache_uses_disk == cache_to_disk
-            ):
+            if cls._file_cache is not None and cls._file_cache_backend == backend:
                 return cls._file_cache
 
             # Create cache storage based on current config
-            if cache_to_disk:
-                storage: dict[str, str] | FanoutCache = FanoutCache(
-                    rapidata_config.upload.cacheLocation,
-                    shards=rapidata_config.upload.cacheShards,
-                    timeout=rapidata_config.upload.cacheTimeout,
+            if config.cacheToDisk:
+                storage: CacheBackend = create_cache_backend(
+                    backend, config.cacheLocation, timeout=config.cacheTimeout
                 )
-                logger.debug("Initialized file cache with disk storage")
+                logger.debug("Initialized file cache with %s storage", backend)
             else:
                 storage = {}
                 logger.debug("Initialized file cache with in-memory storage")
 
             cls._file_cache = SingleFlightCache("File cache", storage=storage)
-            cls._file_cache_uses_disk = cache_to_disk
+            cls._file_cache_backend = backend
             return cls._file_cache
 
     def __init__(self, openapi_service: OpenAPIService) -> None:
@@ -118,11 +147,70 @@ class AssetUploader:
             stat = os.stat(asset)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {asset}") from None
+        upload_path = self._file_to_send(asset, compression)
+        if upload_path != asset:
+            # Keyed on the compressed bytes that are actually sent, so new
+            # compression settings (or a new encoder) upload again.
+            digest = self._file_digester.digest(upload_path)
+            return (
+                f"{env}@{FileDigester.ALGORITHM}:{digest}"
+                f"{self._compression_cache_suffix(compression)}"
+            )
+        if rapidata_config.upload.contentAddressedCache:
+            # Keyed on the bytes alone, so copies of a file under other paths
+            # or on other machines (sharing the disk cache) hit the same entry.
+            digest = self._file_digester.digest(asset, stat)
+            return (
+                f"{env}@{FileDigester.ALGORITHM}:{digest}"
+                f"{self._compression_cache_suffix(compression)}"
+            )
         return (
             f"{env}@{asset}:{stat.st_size}:{stat.st_mtime_ns}"
             f"{self._compression_cache_suffix(compression)}"
         )
 
+    def _file_to_send(self, asset: str, compression: CompressionConfig | None) -> str:
+        """The locally compressed copy of ``asset`` if one applies, else ``asset``."""
+        if compression is None or not MediaPrecompressor.is_enabled(compression):
+            return asset
+        return self._precompressor.resolve(asset, compression)
+
+    def _file_part(
+        self, asset: str, compression: CompressionConfig | None
+    ) -> str | tuple[str, LocalFile]:
+        """The multipart file to upload for ``asset``.
+
+        A compressed copy is sent under the name of ``asset`` with a ``.webp``
+        suffix rather than its own hashed name, so the asset keeps the name
+        the user gave it.
+        """
+        upload_path = self._file_to_send(asset, compression)
+        if upload_path == asset:
+            return asset
+        return Path(asset).stem + ".webp", LocalFile(upload_path)
+
+    def precompress_files(self, files: Iterable[str]) -> None:
+        """Compress ``files`` in parallel ahead of building their cache keys.
+
+        Only does work when ``rapidata_config.upload.compression.local`` is set.
+        """
+        compression = rapidata_config.upload.compression
+        if compression is None or not MediaPrecompressor.is_enabled(compression):
+            return
+        self._precompressor.prepare(files, compression)
+
+    def prefetch_file_digests(self, files: Iterable[str]) -> None:
+        """Hash ``files`` in parallel ahead of building their cache keys.
+
+        Only does work in ``contentAddressedCache`` mode; otherwise cache keys
+        come from ``os.stat`` alone and there is nothing to precompute.
+        """
+        if not rapidata_config.upload.contentAddressedCache:
+            return
+        self._file_digester.digest_many(
+            files, max_workers=rapidata_config.upload.maxWorkers
+        )
+
     def _build_url_cache_key(
         self, url: str, compression: CompressionConfig | None
     ) -> str:
@@ -174,9 +262,10 @@ class AssetUploader:
         cache_key = self._build_url_cache_key(url, compression)
 
         def upload_url() -> str:
-            response = self.openapi_service.asset.asset_api.asset_url_post(
-                url=url, **kwargs
-            )
+            with bulk_requests():
+                response = self.openapi_service.asset.asset_api.asset_url_post(
+                    url=url, **kwargs
+                )
             self._record_warnings(url, getattr(response, "warnings", None))
             logger.info(
                 "Asset uploaded from URL: %s, file name: %s", url, response.file_name
@@ -196,11 +285,29 @@ class AssetUploader:
         compression = rapidata_config.upload.compression
         kwargs = self._compression_kwargs(compression)
         cache_key = self._build_file_cache_key(file_path, compression)
+        file_part = self._file_part(file_path, compression)
+        asset_api = self.openapi_service.asset.asset_api
 
         def upload_file() -> str:
-            response = self.openapi_service.asset.asset_api.asset_file_post(
-                file=file_path, **kwargs
-            )
+            with bulk_requests():
+                if isinstance(file_part, str):
+                    response = asset_api.asset_file_post(file=file_part, **kwargs)
+                else:
+                    # The generated method would only take a renamed part as
+                    # bytes; this one is still streamed from disk.
+                    serialized = asset_api._asset_file_post_serialize(
+                        file=file_part,
+                        compress=kwargs.get("compress"),
+                        quality=kwargs.get("quality"),
+                        maxdim=kwargs.get("maxdim"),
+                        _request_auth=None,
+                        _content_type=None,
+                        _headers=None,
+                        _host_index=0,
+                    )
+                    response = asset_api.api_client.call_endpoint(
+                        serialized, _FILE_POST_RESPONSE_TYPES
+                    )
             self._record_warnings(file_path, getattr(response, "warnings", None))
             logger.info(
                 "Asset uploaded from file: %s, file name: %s",
@@ -211,6 +318,78 @@ class AssetUploader:
 
         return self._get_file_cache().get_or_fetch(cache_key, upload_file)
 
+    async def _upload_url_asset_async(self, url: str) -> str:
+        """Non-blocking variant of :meth:`_upload_url_asset`, sharing its cache."""
+        compression = rapidata_config.upload.compression
+        kwargs = self._compression_kwargs(compression)
+        cache_key = self._build_url_cache_key(url, compression)
+        asset_api = self.openapi_service.asset.asset_api
+
+        async def upload_url() -> str:
+            serialized = asset_api._asset_url_post_serialize(
+                url=url,
+                compress=kwargs.get("compress"),
+                quality=kwargs.get("quality"),
+                maxdim=kwargs.get("maxdim"),
+                _request_auth=None,
+                _content_type=None,
+                _headers=None,
+                _host_index=0,
+            )
+            with bulk_requests():
+                response = await asset_api.api_client.call_endpoint_async(
+                    serialized, _URL_POST_RESPONSE_TYPES
+                )
+            self._record_warnings(url, getattr(response, "warnings", None))
+            logger.info(
+                "Asset uploaded from URL: %s, file name: %s", url, response.file_name
+            )
+            return response.file_name
+
+        return await self._url_cache.get_or_fetch_async(cache_key, upload_url)
+
+    async def _upload_file_asset_async(self, file_path: str) -> str:
+        """Non-blocking variant of :meth:`_upload_file_asset`, sharing its cache."""
+        compression = rapidata_config.upload.compression
+        kwargs = self._compression_kwargs(compression)
+        if rapidata_config.upload.contentAddressedCache or MediaPrecompressor.is_enabled(
+            compression
+        ):
+            # May have to hash or compress the file; keep that off the event loop.
+            cache_key = await asyncio.to_thread(
+                self._build_file_cache_key, file_path, compression
+            )
+        else:
+            cache_key = self._build_file_cache_key(file_path, compression)
+        # Resolved while building the key, so this is a lookup.
+        file_part = self._file_part(file_path, compression)
+        asset_api = self.openapi_service.asset.asset_api
+
+        async def upload_file() -> str:
+            serialized = asset_api._asset_file_post_serialize(
+                file=file_part,
+                compress=kwargs.get("compress"),
+                quality=kwargs.get("quality"),
+                maxdim=kwargs.get("maxdim"),
+                _request_auth=None,
+                _content_type=None,
+                _headers=None,
+                _host_index=0,
+            )
+            with bulk_requests():
+                response = await asset_api.api_client.call_endpoint_async(
+                    serialized, _FILE_POST_RESPONSE_TYPES
+                )
+            self._record_warnings(file_path, getattr(response, "warnings", None))
+            logger.info(
+                "Asset uploaded from file: %s, file name: %s",
+                file_path,
+                response.file_name,
+            )
+            return response.file_name
+
+        return await self._get_file_cache().get_or_fetch_async(cache_key, upload_file)
+
     # Accept http / https / HTTP / HTTPS / mixed case — people type URLs
     # by hand or copy them from docs with varying capitalisation.
     _URL_SCHEME_RE = re.compile(r"^https?://", re.IGNORECASE)
@@ -225,6 +404,17 @@ class AssetUploader:
 
         return self._upload_file_asset(asset)
 
+    async def upload_asset_async(self, asset: str) -> str:
+        """Upload a single asset on the running event loop. See :meth:`upload_asset`."""
+        logger.debug("Uploading asset: %s", asset)
+        if not isinstance(asset, str):
+            raise TypeError(f"Asset must be a string, got {type(asset).__name__}")
+
+        if self._URL_SCHEME_RE.match(asset):
+            return await self._upload_url_asset_async(asset)
+
+        return await self._upload_file_asset_async(asset)
+
     def upload_and_map_asset(self, asset: str | list[str]) -> IAssetInput:
         """Upload asset(s) and wrap the result in an ``IAssetInput``.
 
@@ -238,6 +428,18 @@ class AssetUploader:
 
         return AssetMapper.create_existing_asset_input(self.upload_asset(asset))
 
+    async def upload_and_map_asset_async(self, asset: str | list[str]) -> IAssetInput:
+        """Async counterpart of :meth:`upload_and_map_asset`."""
+        if isinstance(asset, list):
+            uploaded_names = await asyncio.gather(
+                *(self.upload_asset_async(a) for a in asset)
+            )
+            return AssetMapper.create_existing_asset_input(list(uploaded_names))
+
+        return AssetMapper.create_existing_asset_input(
+            await self.upload_asset_async(asset)
+        )
+
     def build_asset_input(
         self, asset: str | list[str], data_type: Literal["media", "text"]
     ) -> IAssetInput:
@@ -274,10 +476,20 @@ class AssetUploader:
             {asset: uploaded_name},
         )
 
+    async def build_asset_input_async(
+        self, asset: str | list[str], data_type: Literal["media", "text"]
+    ) -> IAssetInput:
+        """Async counterpart of :meth:`build_asset_input`."""
+        if data_type == "text":
+            return AssetMapper.create_text_input(asset)
+        return await self.upload_and_map_asset_async(asset)
+
     def clear_cache(self) -> None:
         """Clear both URL and file caches."""
         self._get_file_cache().clear()
         self._url_cache.clear()
+        self._file_digester.clear()
+        self._precompressor.clear()
         logger.info("Upload cache cleared")
 
     def __str__(self) -> str:
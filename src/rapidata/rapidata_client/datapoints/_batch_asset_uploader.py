@@ -4,6 +4,7 @@ import signal
 import time
 import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, TYPE_CHECKING
 
 from opentelemetry import context as otel_context
@@ -11,6 +12,7 @@ from opentelemetry import context as otel_context
 from rapidata.rapidata_client.config import logger, rapidata_config
 from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
 from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
+from rapidata.api_client.rest import bulk_requests
 from rapidata.api_client.models.batch_upload_status import BatchUploadStatus
 from rapidata.api_client.models.batch_upload_url_status import BatchUploadUrlStatus
 from rapidata.api_client.models.create_batch_upload_endpoint_input import (
@@ -30,6 +32,13 @@ class BatchAssetUploader:
 
     This class submits URLs in batches, polls for completion, and updates
     the shared URL cache with successful uploads.
+
+    Up to ``batchConcurrency`` batches are submitted at a time, and the
+    results of completed batches are fetched just as concurrently, each
+    reported to the completion callback as soon as it arrives. Polling starts
+    at ``batchPollInterval``, backs off (up to ``batchPollMaxInterval``) while
+    nothing changes, and drops back to the base interval as soon as batches
+    make progress.
     """
 
     def __init__(self, openapi_service: OpenAPIService) -> None:
@@ -83,50 +92,67 @@ class BatchAssetUploader:
         batch_ids_lock = threading.Lock()
         batch_ids: list[str] = []
         batch_to_urls: dict[str, list[str]] = {}
+        submission_failures: list[FailedUpload[str]] = []
         submission_complete = threading.Event()
+        first_submitted = threading.Event()
 
         # Capture the current OpenTelemetry context before creating threads
         current_context = otel_context.get_current()
 
         try:
-            # Submit batches in background thread
-            def submit_batches_background():
-                """Submit all batches and signal completion."""
+
+            def submit_batch(batch_idx: int, batch: list[str]) -> None:
+                """Submit one batch and register its id for polling."""
+                # Check if interrupted before submitting the batch
+                if self._interrupted:
+                    return
                 token = otel_context.attach(current_context)
                 try:
-                    for batch_idx, batch in enumerate(batches):
-                        # Check if interrupted before submitting next batch
-                        if self._interrupted:
-                            logger.debug("Batch submission stopped due to interruption")
-                            break
-
-                        try:
-                            result = self.openapi_service.asset.batch_upload_api.asset_batch_upload_post(
-                                create_batch_upload_endpoint_input=CreateBatchUploadEndpointInput(
-                                    urls=batch, correlationId=correlation_id
-                                )
+                    with bulk_requests():
+                        result = self.openapi_service.asset.batch_upload_api.asset_batch_upload_post(
+                            create_batch_upload_endpoint_input=CreateBatchUploadEndpointInput(
+                                urls=batch, correlationId=correlation_id
                             )
-                            batch_id = result.batch_upload_id
+                        )
+                    batch_id = result.batch_upload_id
 
-                            # Add to shared collections (thread-safe)
-                            with batch_ids_lock:
-                                batch_ids.append(batch_id)
-                                batch_to_urls[batch_id] = batch
+                    # Add to shared collections (thread-safe)
+                    with batch_ids_lock:
+                        batch_ids.append(batch_id)
+                        batch_to_urls[batch_id] = batch
+                    first_submitted.set()
 
-                            logger.debug(
-                                f"Submitted batch {batch_idx + 1}/{len(batches)}: {batch_id}"
-                            )
-                        except Exception as e:
-                            logger.error(f"Failed to submit batch {batch_idx + 1}: {e}")
+                    logger.debug(
+                        f"Submitted batch {batch_idx + 1}/{len(batches)}: {batch_id}"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to submit batch {batch_idx + 1}: {e}")
+                    with batch_ids_lock:
+                        submission_failures.extend(
+                            FailedUpload.from_exception(url, e) for url in batch
+                        )
+                finally:
+                    otel_context.detach(token)
 
+            # Submit batches in background thread
+            def submit_batches_background():
+                """Submit all batches through a bounded pool and signal completion."""
+                try:
+                    with ThreadPoolExecutor(
+                        max_workers=rapidata_config.upload.batchConcurrency
+                    ) as executor:
+                        for batch_idx, batch in enumerate(batches):
+                            executor.submit(submit_batch, batch_idx, batch)
+                    if self._interrupted:
+                        logger.debug("Batch submission stopped due to interruption")
+                finally:
                     # Signal that all batches have been submitted
                     submission_complete.set()
+                    first_submitted.set()
                     with batch_ids_lock:
                         logger.info(
                             f"Successfully submitted {len(batch_ids)}/{len(batches)} batches"
                         )
-                finally:
-                    otel_context.detach(token)
 
             # Start background submission
             submission_thread = threading.Thread(
@@ -135,15 +161,14 @@ class BatchAssetUploader:
             submission_thread.start()
 
             # Wait for at least one batch to be submitted before starting poll
-            while len(batch_ids) == 0 and not submission_complete.is_set():
-                time.sleep(0.5)
+            first_submitted.wait()
 
-            if len(batch_ids) == 0:
+            if submission_complete.is_set() and len(batch_ids) == 0:
                 logger.error("No batches were successfully submitted")
                 return self._create_submission_failures(urls)
 
             # Poll until complete (will handle dynamically growing batch list)
-            return self._poll_until_complete(
+            failures = self._poll_until_complete(
                 batch_ids,
                 batch_to_urls,
                 batch_ids_lock,
@@ -152,6 +177,10 @@ class BatchAssetUploader:
                 progress_callback,
                 completion_callback,
             )
+            with batch_ids_lock:
+                if submission_failures and progress_callback:
+                    progress_callback(len(submission_failures))
+                return failures + submission_failures
 
         except KeyboardInterrupt:
             logger.warning("Batch upload interrupted by user (Ctrl+C)")
@@ -198,75 +227,116 @@ class BatchAssetUploader:
         Returns:
             List of FailedUpload instances for any URLs that failed.
         """
-        poll_interval = rapidata_config.upload.batchPollInterval
+        base_interval = rapidata_config.upload.batchPollInterval
+        max_interval = max(base_interval, rapidata_config.upload.batchPollMaxInterval)
+        poll_interval = base_interval
 
         last_completed = 0
         start_time = time.time()
         all_failures: list[FailedUpload[str]] = []
+        results_lock = threading.Lock()
+        pending_fetches: set[Future] = set()
+        current_context = otel_context.get_current()
 
-        while True:
-            # Check for interruption at start of each iteration
-            if self._interrupted:
-                logger.debug("Polling stopped due to interruption")
-                break
-
-            # Get current batch IDs (thread-safe)
-            with batch_ids_lock:
-                current_batch_ids = batch_ids.copy()
-                total_batches_submitted = len(current_batch_ids)
-
-            if not current_batch_ids:
-                # No batches yet, wait a bit
-                time.sleep(poll_interval)
-                continue
-
-            logger.debug(
-                f"Polling {total_batches_submitted} submitted batch(es) for completion"
-            )
+        def fetch_results(batch_id: str) -> None:
+            """Fetch a completed batch and hand its URLs on right away."""
+            token = otel_context.attach(current_context)
             try:
-                status = self.openapi_service.asset.batch_upload_api.asset_batch_upload_status_get(
-                    correlation_id=correlation_id
+                successful_urls, failures = self._process_single_batch(
+                    batch_id, batch_to_urls
+                )
+            finally:
+                otel_context.detach(token)
+            with results_lock:
+                all_failures.extend(failures)
+            # Notify callback with completed URLs
+            if completion_callback and successful_urls:
+                completion_callback(successful_urls)
+
+        fetch_pool = ThreadPoolExecutor(
+            max_workers=rapidata_config.upload.batchConcurrency
+        )
+        try:
+            while True:
+                # Check for interruption at start of each iteration
+                if self._interrupted:
+                    logger.debug("Polling stopped due to interruption")
+                    break
+
+                # Read the flag before the ids, so a batch registered in between
+                # is never missed once submission is complete.
+                all_submitted = submission_complete.is_set()
+                # Get current batch IDs (thread-safe)
+                with batch_ids_lock:
+                    current_batch_ids = batch_ids.copy()
+                    total_batches_submitted = len(current_batch_ids)
+
+                if not current_batch_ids:
+                    if all_submitted:
+                        break
+                    # No batches yet, wait a bit
+                    time.sleep(base_interval)
+                    continue
+
+                logger.debug(
+                    f"Polling {total_batches_submitted} submitted batch(es) for completion"
                 )
+                try:
+                    status = self.openapi_service.asset.batch_upload_api.asset_batch_upload_status_get(
+                        correlation_id=correlation_id
+                    )
 
-                # Process newly completed batches
-                for batch_id in status.completed_batches:
-                    if batch_id not in self._processed_batches:
-                        successful_urls, failures = self._process_single_batch(
-                            batch_id, batch_to_urls
-                        )
+                    # Fetch newly completed batches in parallel
+                    newly_completed = [
+                        batch_id
+                        for batch_id in status.completed_batches
+                        if batch_id not in self._processed_batches
+                    ]
+                    for batch_id in newly_completed:
                         self._processed_batches.add(batch_id)
-                        all_failures.extend(failures)
-
-                        # Notify callback with completed URLs
-                        if completion_callback and successful_urls:
-                            completion_callback(successful_urls)
-
-                # Update progress
-                self._update_progress(status, last_completed, progress_callback)
-                last_completed = status.completed_count + status.failed_count
-
-                # Check if we're done:
-                # 1. All batches have been submitted
-                # 2. All submitted batches have been processed
-                if submission_complete.is_set() and len(self._processed_batches) == len(
-                    current_batch_ids
-                ):
-                    elapsed = time.time() - start_time
-                    logger.info(
-                        f"All batches completed in {elapsed:.1f}s: "
-                        f"{status.completed_count} succeeded, {status.failed_count} failed"
-                    )
-                    return all_failures
+                        pending_fetches.add(fetch_pool.submit(fetch_results, batch_id))
+                    for future in [f for f in pending_fetches if f.done()]:
+                        pending_fetches.discard(future)
+                        future.result()
+
+                    # Update progress
+                    self._update_progress(status, last_completed, progress_callback)
+                    completed = status.completed_count + status.failed_count
+                    progressed = bool(newly_completed) or completed > last_completed
+                    last_completed = completed
+
+                    # Check if we're done:
+                    # 1. All batches have been submitted
+                    # 2. All submitted batches have been processed
+                    if all_submitted and len(self._processed_batches) == len(
+                        current_batch_ids
+                    ):
+                        for future in pending_fetches:
+                            future.result()
+                        elapsed = time.time() - start_time
+                        logger.info(
+                            f"All batches completed in {elapsed:.1f}s: "
+                            f"{status.completed_count} succeeded, {status.failed_count} failed"
+                        )
+                        return all_failures
 
-                # Wait before next poll
-                time.sleep(poll_interval)
+                    # Poll fast while batches are finishing, back off while idle
+                    poll_interval = (
+                        base_interval
+                        if progressed
+                        else min(poll_interval * 2, max_interval)
+                    )
+                    time.sleep(poll_interval)
 
-            except Exception as e:
-                logger.error(f"Error polling batch status: {e}")
-                time.sleep(poll_interval)
+                except Exception as e:
+                    logger.error(f"Error polling batch status: {e}")
+                    time.sleep(poll_interval)
+        finally:
+            fetch_pool.shutdown(wait=not self._interrupted, cancel_futures=True)
 
         # Return failures collected so far (reached via break on interruption)
-        return all_failures
+        with results_lock:
+            return list(all_failures)
 
     def _update_progress(
         self,
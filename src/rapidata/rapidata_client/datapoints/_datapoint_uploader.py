@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import time
+import asyncio
 from typing import TYPE_CHECKING
 
 from rapidata.rapidata_client.api.rapidata_api_client import (
     suppress_rapidata_error_logging,
 )
 from rapidata.rapidata_client.config import logger, rapidata_config
+from rapidata.rapidata_client.config.upload_concurrency import backoff_sleep
 from rapidata.rapidata_client.datapoints._datapoint import Datapoint
 from rapidata.service.openapi_service import OpenAPIService
 from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
 
 if TYPE_CHECKING:
+    from rapidata.api_client.models.i_asset_input import IAssetInput
     from rapidata.api_client.models.create_datapoint_endpoint_input import (
         CreateDatapointEndpointInput,
     )
@@ -20,6 +22,16 @@ if TYPE_CHECKING:
     )
 
 
+# Response map of the generated create-datapoint endpoint, needed when calling
+# it through ``call_endpoint_async`` instead of the generated blocking method.
+_CREATE_DATAPOINT_RESPONSE_TYPES: dict[str, str | None] = {
+    "200": "CreateDatapointEndpointOutput",
+    "400": "ValidationProblemDetails",
+    "401": None,
+    "403": None,
+}
+
+
 class DatapointUploader:
     def __init__(self, openapi_service: OpenAPIService):
         self.openapi_service = openapi_service
@@ -28,26 +40,60 @@ class DatapointUploader:
     def upload_datapoint(
         self, datapoint: Datapoint, dataset_id: str, index: int
     ) -> CreateDatapointEndpointOutput:
-        from rapidata.api_client.models.create_datapoint_endpoint_input import (
-            CreateDatapointEndpointInput,
-        )
-
         uploaded_asset = self.asset_uploader.build_asset_input(
             datapoint.asset, datapoint.data_type
         )
+        media_context = self._media_context_to_upload(datapoint)
+        context_asset = (
+            None
+            if media_context is None
+            else self.asset_uploader.upload_and_map_asset(media_context)
+        )
+        payload = self._build_payload(datapoint, index, uploaded_asset, context_asset)
 
-        # If the datapoint belongs to a group, context is handled at group level
-        has_group = datapoint.group is not None
-        context = None if has_group else datapoint.context
+        return self._create_datapoint_with_retries(dataset_id, index, payload)
+
+    async def upload_datapoint_async(
+        self, datapoint: Datapoint, dataset_id: str, index: int
+    ) -> CreateDatapointEndpointOutput:
+        """Non-blocking counterpart of :meth:`upload_datapoint`."""
+        uploaded_asset = await self.asset_uploader.build_asset_input_async(
+            datapoint.asset, datapoint.data_type
+        )
+        media_context = self._media_context_to_upload(datapoint)
         context_asset = (
             None
-            if has_group or not datapoint.media_context
-            else self.asset_uploader.upload_and_map_asset(datapoint.media_context)
+            if media_context is None
+            else await self.asset_uploader.upload_and_map_asset_async(media_context)
+        )
+        payload = self._build_payload(datapoint, index, uploaded_asset, context_asset)
+
+        return await self._create_datapoint_with_retries_async(
+            dataset_id, index, payload
         )
 
-        payload = CreateDatapointEndpointInput(
+    @staticmethod
+    def _media_context_to_upload(datapoint: Datapoint) -> list[str] | None:
+        # If the datapoint belongs to a group, context is handled at group level
+        if datapoint.group is not None or not datapoint.media_context:
+            return None
+        return datapoint.media_context
+
+    @staticmethod
+    def _build_payload(
+        datapoint: Datapoint,
+        index: int,
+        uploaded_asset: IAssetInput,
+        context_asset: IAssetInput | None,
+    ) -> CreateDatapointEndpointInput:
+        from rapidata.api_client.models.create_datapoint_endpoint_input import (
+            CreateDatapointEndpointInput,
+        )
+
+        has_group = datapoint.group is not None
+        return CreateDatapointEndpointInput(
             asset=uploaded_asset,
-            context=context,
+            context=None if has_group else datapoint.context,
             contextAsset=context_asset,
             transcription=datapoint.sentence,
             sortIndex=index,
@@ -55,8 +101,6 @@ class DatapointUploader:
             privateMetadata=datapoint.private_metadata,
         )
 
-        return self._create_datapoint_with_retries(dataset_id, index, payload)
-
     def _create_datapoint_with_retries(
         self,
         dataset_id: str,
@@ -86,7 +130,48 @@ class DatapointUploader:
                         e,
                         retry_delay,
                     )
-                    time.sleep(retry_delay)
+                    backoff_sleep(retry_delay)
+
+        assert last_exception is not None
+        raise last_exception
+
+    async def _create_datapoint_with_retries_async(
+        self,
+        dataset_id: str,
+        index: int,
+        payload: CreateDatapointEndpointInput,
+    ) -> CreateDatapointEndpointOutput:
+        datapoints_api = self.openapi_service.dataset.datapoints_api
+        max_retries = rapidata_config.upload.maxRetries
+        last_exception: Exception | None = None
+
+        for attempt in range(max_retries):
+            try:
+                with suppress_rapidata_error_logging():
+                    serialized = datapoints_api._dataset_dataset_id_datapoint_post_serialize(
+                        dataset_id=dataset_id,
+                        create_datapoint_endpoint_input=payload,
+                        _request_auth=None,
+                        _content_type=None,
+                        _headers=None,
+                        _host_index=0,
+                    )
+                    return await datapoints_api.api_client.call_endpoint_async(
+                        serialized, _CREATE_DATAPOINT_RESPONSE_TYPES
+                    )
+            except Exception as e:
+                last_exception = e
+                if attempt < max_retries - 1:
+                    retry_delay = 2**attempt
+                    logger.debug(
+                        "Datapoint creation failed (attempt %s/%s) for index %s: %s. Retrying in %ss...",
+                        attempt + 1,
+                        max_retries,
+                        index,
+                        e,
+                        retry_delay,
+                    )
+                    await asyncio.sleep(retry_delay)
 
         assert last_exception is not None
         raise last_exception
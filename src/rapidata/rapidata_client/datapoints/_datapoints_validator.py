@@ -1,9 +1,13 @@
 from itertools import zip_longest
-from typing import Literal, cast, Iterable
+from typing import Any, Iterator, Literal, Sized, cast, Iterable
 from rapidata.rapidata_client.datapoints._datapoint import (
     Datapoint,
     coerce_media_context,
 )
+from rapidata.rapidata_client.datapoints.cache_backends import LRUCacheBackend
+
+# Number of recent groups ``iter_datapoints`` checks new groups against.
+_GROUP_CHECK_LIMIT = 100_000
 
 
 class DatapointsValidator:
@@ -89,3 +93,80 @@ class DatapointsValidator:
                 ),
             )
         ]
+
+    @staticmethod
+    def iter_datapoints(
+        datapoints: Iterable[str] | Iterable[list[str]],
+        contexts: Iterable[str] | None = None,
+        media_contexts: Iterable[list[str]] | Iterable[str] | None = None,
+        sentences: Iterable[str] | None = None,
+        private_metadata: Iterable[dict[str, str]] | None = None,
+        groups: Iterable[str] | None = None,
+        data_type: Literal["text", "media"] = "media",
+        multi_asset: bool = False,
+    ) -> Iterator[Datapoint]:
+        """Lazy counterpart of ``map_datapoints`` for inputs that don't fit in memory.
+
+        Accepts any iterables (e.g. generators reading a file) and yields one
+        ``Datapoint`` at a time. The same checks apply, but without the whole
+        input at hand they run row by row: a length mismatch raises once the
+        shorter input runs out, after the rows before it were already yielded.
+        Group uniqueness is checked against the last ``_GROUP_CHECK_LIMIT``
+        groups, so memory stays bounded however long the input is.
+        """
+        missing = object()
+        columns: dict[str, Iterable[Any] | None] = {
+            "contexts": contexts,
+            "media contexts": media_contexts,
+            "sentences": sentences,
+            "private metadata entries": private_metadata,
+            "groups": groups,
+        }
+        # Mirror validate_datapoints: an empty list means "not provided",
+        # except for media contexts, which are checked whenever given.
+        present = {
+            name: column
+            for name, column in columns.items()
+            if column is not None
+            and (
+                name == "media contexts"
+                or not (isinstance(column, Sized) and len(column) == 0)
+            )
+        }
+        seen_groups = LRUCacheBackend(max_entries=_GROUP_CHECK_LIMIT)
+
+        for row in zip_longest(datapoints, *present.values(), fillvalue=missing):
+            asset, *values = row
+            for name, value in zip(present, values):
+                if value is missing or asset is missing:
+                    if name == "groups":
+                        raise ValueError(
+                            "Number of groups must match number of datapoints and must be unique."
+                        )
+                    raise ValueError(f"Number of {name} must match number of datapoints")
+            if multi_asset and isinstance(asset, str):
+                raise ValueError("Datapoints must be a list of lists of strings")
+            if not multi_asset and isinstance(asset, list):
+                raise ValueError("Datapoints must be a list of strings")
+
+            row_values = dict(zip(present, values))
+            group = cast("str | None", row_values.get("groups"))
+            if group is not None:
+                if group in seen_groups:
+                    raise ValueError(
+                        "Number of groups must match number of datapoints and must be unique."
+                    )
+                seen_groups[group] = group
+
+            yield Datapoint(
+                asset=cast("str | list[str]", asset),
+                data_type=data_type,
+                context=cast("str | None", row_values.get("contexts")),
+                media_context=coerce_media_context(row_values.get("media contexts")),
+                sentence=cast("str | None", row_values.get("sentences")),
+                private_metadata=cast(
+                    "dict[str, str] | None",
+                    row_values.get("private metadata entries"),
+                ),
+                group=group,
+            )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from rapidata.rapidata_client.config import logger
+from rapidata.rapidata_client.datapoints._single_flight_cache import SingleFlightCache
+from rapidata.rapidata_client.datapoints.cache_backends import LRUCacheBackend
+
+
+class FileDigester:
+    """Streaming BLAKE2b digests of local files, memoized per file version.
+
+    A file version is identified by ``(device, inode, size, mtime_ns)``, so an
+    unchanged file is normally hashed once per process no matter how often its
+    cache key is asked for, while an edited (or replaced) file is rehashed.
+    Concurrent requests for the same version share one hashing pass. The memo
+    keeps the ``max_entries`` most recently used versions.
+
+    Args:
+        max_entries: The most file versions whose digests are kept.
+    """
+
+    ALGORITHM = "blake2b"
+    _CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self._memo = SingleFlightCache(
+            "File digest cache", storage=LRUCacheBackend(max_entries=max_entries)
+        )
+
+    def digest(self, path: str, stat: os.stat_result | None = None) -> str:
+        """Return the hex digest of ``path``'s content.
+
+        Args:
+            path: The file to hash.
+            stat: The file's ``os.stat`` result, if the caller already has it.
+        """
+        if stat is None:
+            stat = os.stat(path)
+        version = f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+        return self._memo.get_or_fetch(version, lambda: self._hash_file(path))
+
+    def digest_many(self, paths: Iterable[str], max_workers: int) -> None:
+        """Hash ``paths`` in a thread pool so later ``digest`` calls are memo hits.
+
+        hashlib releases the GIL while hashing large buffers, so this scales
+        with cores. Failures are only logged here; they resurface with their
+        proper error when the digest is asked for again.
+        """
+
+        def warm(path: str) -> None:
+            try:
+                self.digest(path)
+            except OSError as e:
+                logger.debug("Could not pre-hash %s: %s", path, e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Drain the iterator so worker exceptions can't go unnoticed.
+            list(executor.map(warm, paths))
+
+    def clear(self) -> None:
+        """Forget all memoized digests."""
+        self._memo.clear()
+
+    @classmethod
+    def _hash_file(cls, path: str) -> str:
+        hasher = hashlib.blake2b(digest_size=32)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls._CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from rapidata.rapidata_client.config import logger, rapidata_config
+from rapidata.rapidata_client.config.upload_config import CompressionConfig
+
+_COMPRESSIBLE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
+)
+_DEFAULT_QUALITY = 80
+_DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def _compress_to_webp(
+    source: str, target: str, quality: int, max_dimension: int | None
+) -> bool:
+    """Re-encode ``source`` as WebP at ``target``; False if that isn't smaller."""
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as opened:
+        # WebP output drops EXIF, so bake the camera orientation into the pixels.
+        image = ImageOps.exif_transpose(opened)
+        if max_dimension is not None and max(image.size) > max_dimension:
+            image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        partial = f"{target}.{os.getpid()}-{threading.get_ident()}.part"
+        image.save(partial, format="WEBP", quality=quality, method=4)
+
+    if os.path.getsize(partial) >= os.path.getsize(source):
+        os.remove(partial)
+        return False
+    os.replace(partial, target)
+    return True
+
+
+class MediaPrecompressor:
+    """Downscales and re-encodes local images to WebP before they are uploaded.
+
+    Compressed copies live next to the upload cache, named after the source
+    file's version (path, size, mtime) and the compression settings, so each
+    image is only compressed once across runs. Once the copies take more than
+    ``max_bytes``, the least recently used ones are deleted, except those this
+    instance handed out for upload. Files that are not images, fail to decode,
+    or would not get smaller are uploaded as they are. Compression runs on a
+    thread pool; Pillow releases the GIL while encoding and decoding.
+    Requires Pillow (``pip install rapidata[images]``).
+
+    Args:
+        directory: Where to keep compressed copies. Defaults to a sibling of
+            ``rapidata_config.upload.cacheLocation``.
+        max_bytes: Size the compressed copies may take on disk.
+    """
+
+    def __init__(
+        self, directory: Path | None = None, max_bytes: int = _DEFAULT_MAX_BYTES
+    ) -> None:
+        self._directory_override = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Remembered per source version so a file is only inspected once.
+        self._resolved: dict[str, str] = {}
+        # Size of the copies on disk; counted on first use, then kept up to date.
+        self._stored_bytes: int | None = None
+        self._pillow_missing_logged = False
+
+    @staticmethod
+    def is_enabled(compression: CompressionConfig | None) -> bool:
+        return compression is not None and compression.local
+
+    def resolve(self, path: str, compression: CompressionConfig) -> str:
+        """Return the file to upload in place of ``path``, compressing it if needed."""
+        job = self._job(path, compression)
+        if job is None:
+            return path
+        key, target, quality, max_dimension = job
+        with self._lock:
+            resolved = self._resolved.get(key)
+        if resolved is not None and os.path.exists(resolved):
+            return resolved
+        if os.path.exists(target):
+            return self._finish(key, path, target, True)
+        compressed = self._try_compress(path, target, quality, max_dimension)
+        resolved = self._finish(key, path, target, compressed, new=compressed)
+        self._evict()
+        return resolved
+
+    def prepare(self, paths: Iterable[str], compression: CompressionConfig) -> None:
+        """Compress ``paths`` in a thread pool so later :meth:`resolve` calls are cheap."""
+        jobs = []
+        for path in paths:
+            try:
+                job = self._job(path, compression)
+            except OSError:
+                # Reported with a proper error when the file itself is uploaded.
+                continue
+            if job is None:
+                continue
+            key, target = job[0], job[1]
+            with self._lock:
+                if key in self._resolved:
+                    continue
+            if os.path.exists(target):
+                # Compressed by an earlier run.
+                self._finish(key, path, target, True)
+                continue
+            jobs.append((path, *job))
+        if len(jobs) < 2:
+            for path, key, target, quality, max_dimension in jobs:
+                compressed = self._try_compress(path, target, quality, max_dimension)
+                self._finish(key, path, target, compressed, new=compressed)
+            self._evict()
+            return
+
+        logger.info("Compressing %d image(s) before upload", len(jobs))
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            futures = [
+                (
+                    path,
+                    key,
+                    target,
+                    pool.submit(self._try_compress, path, target, quality, max_dimension),
+                )
+                for path, key, target, quality, max_dimension in jobs
+            ]
+            for path, key, target, future in futures:
+                compressed = future.result()
+                self._finish(key, path, target, compressed, new=compressed)
+        self._evict()
+
+    def clear(self) -> None:
+        """Forget resolved files and delete the compressed copies."""
+        with self._lock:
+            self._resolved.clear()
+            self._stored_bytes = None
+        directory = self._directory()
+        if directory.exists():
+            for entry in directory.iterdir():
+                entry.unlink(missing_ok=True)
+
+    def _job(
+        self, path: str, compression: CompressionConfig
+    ) -> tuple[str, str, int, int | None] | None:
+        """``(key, target, quality, max_dimension)`` for ``path``, or None to upload it as is."""
+        if Path(path).suffix.lower() not in _COMPRESSIBLE_EXTENSIONS:
+            return None
+        if not self._pillow_available():
+            return None
+        stat = os.stat(path)
+        quality = compression.quality or _DEFAULT_QUALITY
+        max_dimension = compression.max_dimension
+        key = (
+            f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+            f"|webp/{quality}/{max_dimension}"
+        )
+        name = f"{Path(path).stem}-{hashlib.sha256(key.encode()).hexdigest()[:16]}.webp"
+        return key, str(self._directory() / name), quality, max_dimension
+
+    def _try_compress(
+        self, path: str, target: str, quality: int, max_dimension: int | None
+    ) -> bool:
+        try:
+            return _compress_to_webp(path, target, quality, max_dimension)
+        except Exception as e:
+            logger.debug("Could not compress %s, uploading original: %s", path, e)
+            return False
+
+    def _finish(
+        self, key: str, path: str, target: str, compressed: bool, new: bool = False
+    ) -> str:
+        """Remember what to upload for ``key``; ``new`` if ``target`` was just written."""
+        resolved = target if compressed else path
+        if compressed and not new:
+            # Mark a reused copy as recently used, so eviction keeps it.
+            try:
+                os.utime(target)
+            except OSError:
+                pass
+        with self._lock:
+            self._resolved[key] = resolved
+            if new and self._stored_bytes is not None:
+                self._stored_bytes += os.path.getsize(target)
+        return resolved
+
+    def _evict(self) -> None:
+        """Delete the least recently used copies while they exceed ``max_bytes``."""
+        with self._lock:
+            if self._stored_bytes is not None and self._stored_bytes <= self._max_bytes:
+                return
+            copies = []
+            for entry in self._directory().iterdir():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                copies.append((stat.st_mtime_ns, stat.st_size, entry))
+            stored = sum(size for _, size, _ in copies)
+            in_use = set(self._resolved.values())
+            for _, size, entry in sorted(copies):
+                if stored <= self._max_bytes:
+                    break
+                if str(entry) in in_use:
+                    continue
+                entry.unlink(missing_ok=True)
+                stored -= size
+            self._stored_bytes = stored
+
+    def _directory(self) -> Path:
+        directory = self._directory_override
+        if directory is None:
+            cache_location = rapidata_config.upload.cacheLocation
+            directory = cache_location.with_name(f"{cache_location.name}_precompressed")
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    def _pillow_available(self) -> bool:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            if not self._pillow_missing_logged:
+                self._pillow_missing_logged = True
+                logger.warning(
+                    "Local image compression needs Pillow (pip install rapidata[images]); "
+                    "uploading images uncompressed."
+                )
+            return False
+        return True
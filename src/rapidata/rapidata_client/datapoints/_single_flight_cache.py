@@ -1,35 +1,48 @@
+import asyncio
 import threading
-from typing import Callable, cast
+from typing import Awaitable, Callable, ContextManager, cast
 
-from diskcache import FanoutCache
 from rapidata.rapidata_client.config import logger
+from rapidata.rapidata_client.datapoints.cache_backends import (
+    CacheBackend,
+    CacheStats,
+    LRUCacheBackend,
+    SharedCacheBackend,
+)
 
 from concurrent.futures import Future
 
 
 class SingleFlightCache:
-    """Cache with single-flight pattern to prevent duplicate concurrent fetches."""
+    """Cache with single-flight pattern to prevent duplicate concurrent fetches.
 
-    def __init__(self, name: str, storage: dict[str, str] | FanoutCache | None = None):
+    Concurrent requests for one key within the process share a single fetch.
+    If the storage is a :class:`SharedCacheBackend`, the fetching thread also
+    holds the backend's cross-process lock on the key, so other processes
+    sharing the storage wait for that fetch and reuse its result.
+    """
+
+    def __init__(self, name: str, storage: CacheBackend | None = None):
         self._name = name
-        self._storage: dict[str, str] | FanoutCache = (
-            storage if storage is not None else {}
-        )
+        self._storage: CacheBackend = storage if storage is not None else {}
         self._in_flight: dict[str, Future[str]] = {}
         self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
-    def set_storage(self, storage: dict[str, str] | FanoutCache) -> None:
+    def set_storage(self, storage: CacheBackend) -> None:
         """Replace the cache storage."""
         with self._lock:
             old_storage = self._storage
             self._storage = storage
-            if isinstance(old_storage, FanoutCache):
+            close = getattr(old_storage, "close", None)
+            if close is not None:
                 try:
-                    old_storage.close()
+                    close()
                 except Exception:
                     pass
 
-    def get_storage(self) -> dict[str, str] | FanoutCache:
+    def get_storage(self) -> CacheBackend:
         """Get the cache storage."""
         return self._storage
 
@@ -40,43 +53,172 @@ class SingleFlightCache:
         should_cache: bool = True,
     ) -> str:
         """Get value from cache or fetch it, preventing duplicate concurrent fetches."""
+        cached, in_flight, should_fetch = self._lookup_or_claim(key)
+        if cached is not None:
+            return cached
+        assert in_flight is not None
+
+        if not should_fetch:
+            logger.debug("%s: waiting for in-flight request", self._name)
+            return in_flight.result()
+
+        # We need to fetch
+        storage = self._storage
+        if should_cache and isinstance(storage, SharedCacheBackend):
+            try:
+                with storage.lock(key):
+                    return self._fetch_under_lock(
+                        key, in_flight, storage, fetch_fn, should_cache
+                    )
+            except BaseException as e:
+                if not in_flight.done():
+                    self._settle(key, in_flight, exception=e)
+                raise
+
+        try:
+            result = fetch_fn()
+        except Exception as e:
+            self._settle(key, in_flight, exception=e)
+            raise
+        self._settle(key, in_flight, result=result, should_cache=should_cache)
+        return result
+
+    def _fetch_under_lock(
+        self,
+        key: str,
+        in_flight: Future[str],
+        storage: CacheBackend,
+        fetch_fn: Callable[[], str],
+        should_cache: bool,
+    ) -> str:
+        """Fetch while holding the cross-process lock, unless another process just did."""
+        cached = storage.get(key)
+        if cached is not None:
+            logger.debug("%s: fetched by another process", self._name)
+            self._settle(key, in_flight, result=cached, should_cache=False)
+            return cached
+        result = fetch_fn()
+        self._settle(key, in_flight, result=result, should_cache=should_cache)
+        return result
+
+    async def get_or_fetch_async(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[str]],
+        should_cache: bool = True,
+    ) -> str:
+        """Async counterpart of :meth:`get_or_fetch`.
+
+        Shares the in-flight table with the sync path, so a coroutine and a
+        worker thread asking for the same key still trigger a single fetch.
+        """
+        cached, in_flight, should_fetch = self._lookup_or_claim(key)
+        if cached is not None:
+            return cached
+        assert in_flight is not None
+
+        if not should_fetch:
+            logger.debug("%s: waiting for in-flight request", self._name)
+            return await asyncio.wrap_future(in_flight)
+
+        storage = self._storage
+        shared_lock: ContextManager[None] | None = None
+        try:
+            if should_cache and isinstance(storage, SharedCacheBackend):
+                # Another process may hold the key for minutes; wait off the loop.
+                shared_lock = await self._acquire_shared_lock(storage, key)
+                cached = await asyncio.to_thread(storage.get, key)
+                if cached is not None:
+                    logger.debug("%s: fetched by another process", self._name)
+                    self._settle(key, in_flight, result=cached, should_cache=False)
+                    return cached
+            result = await fetch_fn()
+            self._settle(key, in_flight, result=result, should_cache=should_cache)
+            return result
+        except BaseException as e:
+            # Also settle on cancellation, otherwise waiters would hang forever.
+            if not in_flight.done():
+                self._settle(key, in_flight, exception=e)
+            raise
+        finally:
+            if shared_lock is not None:
+                shared_lock.__exit__(None, None, None)
+
+    @staticmethod
+    async def _acquire_shared_lock(
+        storage: SharedCacheBackend, key: str
+    ) -> ContextManager[None]:
+        """Enter ``storage.lock(key)`` in a worker thread and return it."""
+        shared_lock = storage.lock(key)
+        acquiring = asyncio.ensure_future(asyncio.to_thread(shared_lock.__enter__))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The thread still gets the lock eventually; give it straight back.
+            def release(future: asyncio.Future) -> None:
+                if not future.cancelled() and future.exception() is None:
+                    shared_lock.__exit__(None, None, None)
+
+            acquiring.add_done_callback(release)
+            raise
+        return shared_lock
+
+    def _lookup_or_claim(
+        self, key: str
+    ) -> tuple[str | None, Future[str] | None, bool]:
+        """Return ``(cached, in_flight, should_fetch)`` for ``key``.
+
+        Either the cached value, or the in-flight future to wait on, or a
+        freshly registered future the caller is now responsible for settling.
+        """
         # Fast path - check cache without lock
         cached = self._storage.get(key)
         if cached is not None:
             logger.debug("%s: cache hit", self._name)
-            return cast(str, cached)
+            with self._lock:
+                self._hits += 1
+            return cast(str, cached), None, False
 
         with self._lock:
             # Double-check cache under lock
             cached = self._storage.get(key)
             if cached is not None:
                 logger.debug("%s: cache hit", self._name)
-                return cast(str, cached)
+                self._hits += 1
+                return cast(str, cached), None, False
 
             # Check if there's an in-flight request
             in_flight = self._in_flight.get(key)
             if in_flight is None:
                 in_flight = Future()
                 self._in_flight[key] = in_flight
-                should_fetch = True
-            else:
-                should_fetch = False
+                self._misses += 1
+                return None, in_flight, True
+            self._hits += 1
+            return None, in_flight, False
 
-        if not should_fetch:
-            logger.debug("%s: waiting for in-flight request", self._name)
-            return in_flight.result()
-
-        # We need to fetch
+    def _settle(
+        self,
+        key: str,
+        in_flight: Future[str],
+        result: str | None = None,
+        exception: BaseException | None = None,
+        should_cache: bool = True,
+    ) -> None:
+        """Store the fetched value (or error), wake up waiters, release the key."""
         try:
-            result = fetch_fn()
+            if exception is not None:
+                in_flight.set_exception(exception)
+                return
+            assert result is not None
             if should_cache:
-                self._storage[key] = result
+                try:
+                    self._storage[key] = result
+                except Exception as e:
+                    in_flight.set_exception(e)
+                    raise
                 logger.debug("%s: cached result", self._name)
             in_flight.set_result(result)
-            return result
-        except Exception as e:
-            in_flight.set_exception(e)
-            raise
         finally:
             with self._lock:
                 self._in_flight.pop(key, None)
@@ -88,3 +230,20 @@ class SingleFlightCache:
     def clear(self) -> None:
         """Clear the cache."""
         self._storage.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters since creation or the last :meth:`clear`."""
+        storage = self._storage
+        evictions = expirations = 0
+        if isinstance(storage, LRUCacheBackend):
+            evictions, expirations = storage.evictions, storage.expirations
+        size: int | None
+        try:
+            size = len(storage)  # type: ignore[arg-type]
+        except TypeError:
+            size = None
+        with self._lock:
+            return CacheStats(self._hits, self._misses, evictions, expirations, size)
@@ -0,0 +1,494 @@
+"""
+Storage backends for the upload cache.
+
+The file-upload cache maps an asset's cache key to the name the backend
+stored it under. Anything with dict-like ``get``, ``__setitem__``,
+``__contains__`` and ``clear`` can hold it (:class:`CacheBackend`); a plain
+``dict`` qualifies, and :class:`DiskCacheBackend` adapts a
+``diskcache.FanoutCache``.
+
+A backend that additionally implements :class:`SharedCacheBackend` offers a
+per-key lock that works *across processes*. The upload cache takes that lock
+around every upload, so when several processes (e.g. the workers of a
+distributed training job) upload the same file at the same time, one uploads
+it and the others wait and reuse the result.
+
+Two shared backends ship with the SDK:
+
+- :class:`SQLiteCacheBackend`: one SQLite database in WAL mode. Fast, and
+  safe for any number of processes on the same machine.
+- :class:`FileLockCacheBackend`: one small file per entry plus OS file locks.
+  Works on shared network filesystems that support ``flock`` (e.g. NFSv4),
+  so processes on different machines can share one cache directory.
+
+Pick one with ``rapidata_config.upload.cacheBackend`` (``"diskcache"``,
+``"sqlite"`` or ``"filelock"``), or plug in your own by setting it to
+``"package.module:factory"``, where ``factory(directory: Path)`` returns a
+:class:`CacheBackend`.
+
+The URL cache is always in memory, in an :class:`LRUCacheBackend` bounded by
+``rapidata_config.upload.urlCacheMaxEntries`` and ``urlCacheTtl``;
+:func:`url_cache_stats` reports how it is doing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ContextManager,
+    Iterator,
+    Protocol,
+    runtime_checkable,
+)
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from rapidata.rapidata_client.config import logger
+
+if TYPE_CHECKING:
+    from diskcache import FanoutCache
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Key-value storage for the upload cache.
+
+    The parameters are positional-only and ``clear`` may return anything, so
+    that a plain ``dict`` matches as it is.
+    """
+
+    def get(self, key: str, /) -> str | None: ...
+
+    def __setitem__(self, key: str, value: str, /) -> None: ...
+
+    def __contains__(self, key: object, /) -> bool: ...
+
+    def clear(self) -> object: ...
+
+
+@runtime_checkable
+class SharedCacheBackend(CacheBackend, Protocol):
+    """A :class:`CacheBackend` that several processes can share.
+
+    ``lock(key)`` holds an exclusive, cross-process lock on ``key`` for the
+    duration of the block. Waiters block until it is released. The returned
+    context manager may be entered and exited on different threads.
+    """
+
+    def lock(self, key: str) -> ContextManager[None]: ...
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of an upload cache since it was created or last cleared.
+
+    Attributes:
+        hits (int): Lookups answered without uploading, including those that
+            waited for an upload already in flight.
+        misses (int): Lookups that started an upload.
+        evictions (int): Entries dropped because the cache was full.
+        expirations (int): Entries dropped because they outlived the TTL.
+        size (int | None): Entries currently held, if the storage can tell.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int | None
+
+
+class LRUCacheBackend:
+    """In-memory cache bounded by entry count and, optionally, entry age.
+
+    When full, the least recently used entry is evicted. With a TTL, an entry
+    older than ``ttl`` seconds (counted from when it was stored) is dropped on
+    access as if it had never been cached.
+
+    Args:
+        max_entries: The most entries held at once.
+        ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl: float | None = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._limits: Callable[[], tuple[int, float | None]] = lambda: (
+            max_entries,
+            ttl,
+        )
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_upload_config(cls) -> LRUCacheBackend:
+        """A cache whose limits follow ``urlCacheMaxEntries`` and ``urlCacheTtl``,
+        including changes made at runtime."""
+        from rapidata.rapidata_client.config import rapidata_config
+
+        cache = cls()
+        cache._limits = lambda: (
+            rapidata_config.upload.urlCacheMaxEntries,
+            rapidata_config.upload.urlCacheTtl,
+        )
+        return cache
+
+    def get(self, key: str) -> str | None:
+        _, ttl = self._limits()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if ttl is not None and time.monotonic() - stored_at > ttl:
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: str) -> None:
+        max_entries, ttl = self._limits()
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, now)
+            self._entries.move_to_end(key)
+            if ttl is not None:
+                # Stale entries that were never read again collect at the front.
+                while self._entries:
+                    oldest_key, (_, stored_at) = next(iter(self._entries.items()))
+                    if now - stored_at <= ttl:
+                        break
+                    del self._entries[oldest_key]
+                    self.expirations += 1
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        _, ttl = self._limits()
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry is not None and (ttl is None or time.monotonic() - entry[1] <= ttl)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.evictions = 0
+            self.expirations = 0
+
+    def __repr__(self) -> str:
+        max_entries, ttl = self._limits()
+        return f"LRUCacheBackend(size={len(self)}, max_entries={max_entries}, ttl={ttl})"
+
+
+class DiskCacheBackend:
+    """Upload cache in a ``diskcache.FanoutCache``.
+
+    diskcache stores values of any type; only strings are returned, so an
+    entry written by something else reads as a cache miss.
+
+    Args:
+        cache: The cache to store the entries in.
+    """
+
+    def __init__(self, cache: FanoutCache) -> None:
+        self._cache = cache
+
+    def get(self, key: str) -> str | None:
+        value = self._cache.get(key)
+        return value if isinstance(value, str) else None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._cache[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def close(self) -> None:
+        self._cache.close()
+
+    def __repr__(self) -> str:
+        return f"DiskCacheBackend(directory={self._cache.directory!r})"
+
+
+class SQLiteCacheBackend:
+    """Upload cache in a single SQLite database in WAL mode.
+
+    Cross-process locks are leases stored in the same database. While a lock
+    is held, a background thread renews its lease every third of
+    ``lease_seconds``, so uploads of any length keep it. A lease left behind
+    by a crashed process is no longer renewed and expires after
+    ``lease_seconds``; another process then takes the key over.
+
+    Args:
+        path: The database file.
+        timeout: Seconds a write waits for the database to become available.
+        lease_seconds: How long a lock outlives its holder before others may
+            take it.
+    """
+
+    _POLL_INITIAL = 0.05
+    _POLL_MAX = 1.0
+
+    def __init__(
+        self, path: Path, timeout: float = 5.0, lease_seconds: float = 600.0
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        # (key, owner) of the leases this instance holds, renewed by _renewer.
+        self._held: set[tuple[str, str]] = set()
+        self._renewer: threading.Thread | None = None
+        self._closed = threading.Event()
+        self._connection = sqlite3.connect(
+            self._path,
+            timeout=timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS leases "
+                "(key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        owner = uuid.uuid4().hex
+        delay = self._POLL_INITIAL
+        while not self._try_lease(key, owner):
+            time.sleep(delay)
+            delay = min(delay * 2, self._POLL_MAX)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._held.discard((key, owner))
+                self._connection.execute(
+                    "DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner)
+                )
+
+    def _try_lease(self, key: str, owner: str) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO leases (key, owner, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, "
+                "expires = excluded.expires WHERE leases.expires < ?",
+                (key, owner, now + self._lease_seconds, now),
+            )
+            if cursor.rowcount != 1:
+                return False
+            self._held.add((key, owner))
+            if self._renewer is None:
+                self._renewer = threading.Thread(
+                    target=self._renew_leases,
+                    name="rapidata-cache-leases",
+                    daemon=True,
+                )
+                self._renewer.start()
+            return True
+
+    def _renew_leases(self) -> None:
+        """Push the expiry of every held lease forward until the backend closes."""
+        while not self._closed.wait(self._lease_seconds / 3):
+            with self._lock:
+                if self._closed.is_set() or not self._held:
+                    continue
+                expires = time.time() + self._lease_seconds
+                try:
+                    self._connection.executemany(
+                        "UPDATE leases SET expires = ? WHERE key = ? AND owner = ?",
+                        [(expires, key, owner) for key, owner in self._held],
+                    )
+                except sqlite3.Error as e:
+                    logger.debug("Could not renew upload cache leases: %s", e)
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            self._connection.close()
+
+    def __repr__(self) -> str:
+        return f"SQLiteCacheBackend(path={str(self._path)!r})"
+
+
+class FileLockCacheBackend:
+    """Upload cache as one file per entry, locked with OS file locks.
+
+    Entries are written atomically (write, then rename), and locks are
+    released by the OS when a process dies, so nothing is ever left locked.
+
+    Args:
+        directory: The directory holding the entries and lock files.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = Path(directory)
+        self._entries = self._directory / "entries"
+        self._locks = self._directory / "locks"
+        self._entries.mkdir(parents=True, exist_ok=True)
+        self._locks.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._entry(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        entry = self._entry(key)
+        entry.parent.mkdir(exist_ok=True)
+        partial = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}")
+        partial.write_text(value, encoding="utf-8")
+        os.replace(partial, entry)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._entry(key).exists()
+
+    def clear(self) -> None:
+        shutil.rmtree(self._entries, ignore_errors=True)
+        self._entries.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        fd = os.open(self._locks / self._name(key), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_file(fd)
+            try:
+                yield
+            finally:
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+
+    def _entry(self, key: str) -> Path:
+        name = self._name(key)
+        return self._entries / name[:2] / name
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def __repr__(self) -> str:
+        return f"FileLockCacheBackend(directory={str(self._directory)!r})"
+
+
+def _lock_file(fd: int) -> None:
+    if os.name == "nt":
+        while True:
+            try:
+                # Retries for about 10 seconds before raising.
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_file(fd: int) -> None:
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def create_cache_backend(name: str, directory: Path, timeout: float) -> CacheBackend:
+    """Build the backend configured as ``rapidata_config.upload.cacheBackend``.
+
+    Args:
+        name: ``"diskcache"``, ``"sqlite"``, ``"filelock"`` or ``"package.module:factory"``.
+        directory: The cache directory (``rapidata_config.upload.cacheLocation``).
+        timeout: Seconds a cache operation may wait for a busy store.
+    """
+    from rapidata.rapidata_client.config import rapidata_config
+
+    if name == "diskcache":
+        from diskcache import FanoutCache
+
+        return DiskCacheBackend(
+            FanoutCache(
+                directory,
+                shards=rapidata_config.upload.cacheShards,
+                timeout=timeout,
+            )
+        )
+    if name == "sqlite":
+        return SQLiteCacheBackend(directory / "sqlite" / "cache.sqlite", timeout=timeout)
+    if name == "filelock":
+        return FileLockCacheBackend(directory / "filelock")
+
+    module_name, _, attribute = name.partition(":")
+    factory = getattr(importlib.import_module(module_name), attribute)
+    backend = factory(directory)
+    if not isinstance(backend, CacheBackend):
+        raise TypeError(
+            f"Cache backend factory {name!r} returned {type(backend).__name__}, "
+            "which does not implement get, __setitem__, __contains__ and clear"
+        )
+    return backend
+
+
+def url_cache_stats() -> CacheStats:
+    """Hit, miss and eviction counters of the process-wide URL upload cache."""
+    from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
+
+    return AssetUploader._url_cache.stats()
@@ -13,6 +13,8 @@ This module uses concurrent processing for both asset uploads and datapoint crea
 2. Datapoint Creation Phase (Step 2/2):
    - Datapoints are created incrementally as their required assets complete
    - Uses ThreadPoolExecutor with max_workers=rapidata_config.upload.maxWorkers
+     (or, with ``adaptiveConcurrency``, the adaptive limit's ceiling; each
+     creation then also holds a slot of the shared upload limiter)
    - Callbacks from asset upload trigger datapoint creation submissions
 
 Thread-Safety:
@@ -32,16 +34,46 @@ The callback-based design ensures:
 - Assets can complete incrementally (batch-by-batch, file-by-file)
 - Datapoints are created as soon as all their assets are ready
 - No deadlocks occur between asset completion and datapoint submission
+
+Asyncio Engine:
+--------------
+With ``rapidata_config.upload.asyncUpload`` enabled, ``add_datapoints`` runs
+``add_datapoints_async`` instead. Same two steps and the same incremental
+hand-off, but file uploads and datapoint creations are coroutines on one event
+loop, sharing a single ``asyncConcurrency`` limit, rather than thread-pool tasks. Only the
+poll-driven URL batch flow stays on a worker thread; its completion callbacks
+are marshalled back onto the loop, so all shared state is touched from the
+loop thread only.
+
+Upload Journal:
+--------------
+Passing an ``UploadJournal`` records every created datapoint's sort index on
+disk as it lands. Re-running the same upload with the same journal, even from a
+new process, skips those datapoints and only uploads what is still missing.
+Before resuming, the journal is reconciled with the backend: datapoints the
+backend later reported as failed are uploaded again.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 import threading
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Callable, Iterable, TypeVar
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, Future, wait
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Coroutine,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
 
 from opentelemetry import context as otel_context
-from tqdm.auto import tqdm
 
 from rapidata.rapidata_client.datapoints._datapoint import Datapoint
 from rapidata.service.openapi_service import OpenAPIService
@@ -50,11 +82,55 @@ from rapidata.rapidata_client.datapoints._asset_upload_orchestrator import (
     AssetUploadOrchestrator,
     extract_assets_from_datapoint,
 )
+from rapidata.rapidata_client.dataset._upload_journal import UploadJournal
 from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
 from rapidata.rapidata_client.config import rapidata_config, logger
+from rapidata.rapidata_client.config.upload_concurrency import upload_slot, upload_workers
+
+if TYPE_CHECKING:
+    from tqdm.auto import tqdm
 
 T = TypeVar("T")
 
+# A streaming window is uploaded as this many slices with their own upload
+# state. A new slice starts as soon as any running one finishes, so the tail of
+# one slice overlaps with the next instead of stalling the whole pipeline.
+_STREAMING_SLICES = 4
+
+
+def _windows(
+    datapoints: Iterable[Datapoint], window_size: int
+) -> Iterator[tuple[int, list[Datapoint]]]:
+    """Yield ``(index_offset, window)`` slices of ``datapoints``, pulled lazily."""
+    iterator = iter(datapoints)
+    index_offset = 0
+    while window := list(islice(iterator, window_size)):
+        yield index_offset, window
+        index_offset += len(window)
+
+
+def _slice_size(window_size: int) -> int:
+    """Datapoints per slice for a streaming window of ``window_size``."""
+    return -(-window_size // _STREAMING_SLICES)
+
+
+def _run_blocking(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion from synchronous code.
+
+    When the caller already sits inside a running event loop (e.g. a Jupyter
+    cell), ``asyncio.run`` is not allowed on that thread, so the coroutine gets
+    its own loop on a helper thread. The caller's context (OpenTelemetry span,
+    logging suppression) is carried over in both cases.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, asyncio.run, coro).result()
+
 
 class RapidataDataset:
     def __init__(self, dataset_id: str, openapi_service: OpenAPIService) -> None:
@@ -62,10 +138,12 @@ class RapidataDataset:
         self.openapi_service = openapi_service
         self.datapoint_uploader = DatapointUploader(openapi_service)
         self.asset_orchestrator = AssetUploadOrchestrator(openapi_service)
+        self._groups_lock = threading.Lock()
 
     def add_datapoints(
         self,
         datapoints: list[Datapoint],
+        journal: UploadJournal | None = None,
     ) -> tuple[list[Datapoint], list[FailedUpload[Datapoint]]]:
         """
         Upload datapoints with incremental creation:
@@ -75,6 +153,9 @@ class RapidataDataset:
 
         Args:
             datapoints: List of datapoints to upload
+            journal: Optional journal to record progress in. Datapoints it
+                already records as created are skipped and reported as
+                successful, so an interrupted upload can be resumed.
 
         Returns:
             tuple[list[Datapoint], list[FailedUpload[Datapoint]]]: Lists of successful uploads and failed uploads with error details
@@ -82,41 +163,494 @@ class RapidataDataset:
         if not datapoints:
             return [], []
 
+        if journal is not None:
+            self._prepare_journal(journal)
+
+        if rapidata_config.upload.asyncUpload:
+            return _run_blocking(self._add_datapoints_on_own_loop(datapoints, journal))
+
+        return self._add_window(datapoints, journal=journal)
+
+    def add_datapoints_streaming(
+        self,
+        datapoints: Iterable[Datapoint],
+        on_failure: Callable[[FailedUpload[Datapoint]], None] | None = None,
+        window_size: int | None = None,
+        journal: UploadJournal | None = None,
+    ) -> tuple[int, int]:
+        """
+        Upload datapoints from any iterable with bounded memory.
+
+        The iterable is consumed lazily as a sliding window of at most
+        ``window_size`` datapoints in flight, taken in slices of a quarter
+        window; the next slice is pulled as soon as a running one is fully
+        uploaded, so a generator reading a huge file is throttled to the upload
+        rate without the pipeline draining at window boundaries. Only the
+        in-flight datapoints and their upload state are held in memory, and
+        file uploads and datapoint creations stay within the same concurrency
+        limits as :meth:`add_datapoints`. Sort indices follow the iteration
+        order.
+
+        Args:
+            datapoints: Any iterable of datapoints, e.g. a generator over a JSONL file.
+            on_failure: Called with each failed upload as soon as its slice
+                completes. Without it, failures are only logged and counted.
+            window_size: Datapoints in flight at most. Defaults to
+                ``rapidata_config.upload.streamingWindowSize``.
+            journal: Optional journal to record progress in, see
+                :meth:`add_datapoints`. The iterable must yield the same
+                datapoints in the same order when resuming.
+
+        Returns:
+            tuple[int, int]: The number of successful and failed datapoints.
+        """
+        window_size = window_size or rapidata_config.upload.streamingWindowSize
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1")
+
+        if journal is not None:
+            self._prepare_journal(journal)
+
+        if rapidata_config.upload.asyncUpload:
+            return _run_blocking(
+                self._stream_on_own_loop(datapoints, on_failure, window_size, journal)
+            )
+
+        from tqdm.auto import tqdm
+
+        succeeded = failed = 0
+        in_flight: dict[Future, int] = {}
+        file_slots = threading.BoundedSemaphore(upload_workers())
+        # A group can span slices but must only be created once.
+        created_groups: set[str] = set()
+
+        def collect(done: Iterable[Future]) -> None:
+            nonlocal succeeded, failed
+            for future in done:
+                successful, failures = future.result()
+                succeeded += len(successful)
+                failed += self._report_failures(failures, on_failure)
+                pbar.update(in_flight.pop(future))
+
+        with (
+            tqdm(
+                desc="Uploading datapoints",
+                unit="datapoint",
+                disable=rapidata_config.logging.silent_mode,
+            ) as pbar,
+            ThreadPoolExecutor(max_workers=upload_workers()) as creation_executor,
+            ThreadPoolExecutor(max_workers=_STREAMING_SLICES) as slices,
+        ):
+            pending_slices = _windows(datapoints, _slice_size(window_size))
+            while True:
+                # Wait for a free slot before pulling the next slice.
+                if len(in_flight) == _STREAMING_SLICES:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                if (next_slice := next(pending_slices, None)) is None:
+                    break
+                index_offset, window = next_slice
+                future = slices.submit(
+                    contextvars.copy_context().run,
+                    self._add_window,
+                    window,
+                    index_offset,
+                    False,
+                    journal,
+                    creation_executor,
+                    file_slots,
+                    created_groups,
+                )
+                in_flight[future] = len(window)
+            collect(wait(in_flight).done)
+
+        logger.info(
+            f"Streaming upload complete: {succeeded} succeeded, {failed} failed"
+        )
+        return succeeded, failed
+
+    @staticmethod
+    def _report_failures(
+        failures: list[FailedUpload[Datapoint]],
+        on_failure: Callable[[FailedUpload[Datapoint]], None] | None,
+    ) -> int:
+        if on_failure is not None:
+            for failure in failures:
+                on_failure(failure)
+        return len(failures)
+
+    def _prepare_journal(self, journal: UploadJournal) -> None:
+        """Bind ``journal`` to this dataset and reconcile it with the backend.
+
+        Datapoints the backend reports as failed (e.g. an unreachable URL,
+        discovered after creation) are flagged in the journal so the resumed
+        upload sends them again. A dataset holding more datapoints than the
+        journal knows about means some requests were in flight when the
+        previous run stopped; those datapoints may now be created twice.
+        """
+        journal.bind_dataset(self.id)
+        created, _ = journal.counts()
+        if not created:
+            return
+
+        datapoints_api = self.openapi_service.dataset.datapoints_api
+        backend_failed = datapoints_api.dataset_dataset_id_datapoints_failed_get(
+            dataset_id=self.id
+        ).datapoints
+        reopened = journal.mark_failed(
+            [dp.sort_index for dp in backend_failed if dp.sort_index is not None],
+            "Datapoint failed on the backend after creation",
+        )
+        if reopened:
+            logger.info(
+                "%d journaled datapoint(s) failed on the backend and will be uploaded again",
+                reopened,
+            )
+
+        total = datapoints_api.dataset_dataset_id_datapoints_get(
+            dataset_id=self.id, page=1, page_size=1
+        ).total
+        if total > created:
+            logger.warning(
+                "Dataset %s holds %d datapoints but upload journal %s only records %d. "
+                "Datapoints that were in flight when the previous upload stopped may be "
+                "uploaded twice.",
+                self.id,
+                total,
+                journal.path,
+                created,
+            )
+        logger.info("Resuming upload: %d datapoint(s) already created", created - reopened)
+
+    @staticmethod
+    def _journaled_positions(
+        datapoints: list[Datapoint],
+        index_offset: int,
+        journal: UploadJournal | None,
+    ) -> set[int]:
+        """Positions in ``datapoints`` that ``journal`` records as created."""
+        if journal is None:
+            return set()
+        pending = journal.pending(datapoints, index_offset)
+        return set(range(len(datapoints))).difference(pending)
+
+    def _add_window(
+        self,
+        datapoints: list[Datapoint],
+        index_offset: int = 0,
+        show_progress: bool = True,
+        journal: UploadJournal | None = None,
+        creation_executor: ThreadPoolExecutor | None = None,
+        file_slots: threading.Semaphore | None = None,
+        created_groups: set[str] | None = None,
+    ) -> tuple[list[Datapoint], list[FailedUpload[Datapoint]]]:
+        """
+        Run both upload steps for ``datapoints`` on thread pools.
+
+        Args:
+            datapoints: The datapoints to upload.
+            index_offset: Sort index of ``datapoints[0]`` within the dataset.
+            show_progress: Whether to show the per-step progress bars.
+            journal: Journal to skip already created datapoints with and to
+                record the outcome of the others in.
+            creation_executor: Pool to create the datapoints on, shared by
+                windows running side by side. A private one is used if not given.
+            file_slots: Semaphore bounding file uploads across those windows.
+            created_groups: Groups already created by those windows, updated
+                with the groups this window creates.
+        """
         # 1. Build asset-to-datapoint mappings
+        already_created = self._journaled_positions(datapoints, index_offset, journal)
         asset_to_datapoints, datapoint_pending_count = (
-            self._build_asset_to_datapoint_mapping(datapoints)
+            self._build_asset_to_datapoint_mapping(datapoints, skip=already_created)
         )
 
         # 2. Set up shared state for incremental creation
         creation_futures: list[tuple[int, Future]] = []
         lock = threading.Lock()
-        executor = ThreadPoolExecutor(max_workers=rapidata_config.upload.maxWorkers)
+        executor = creation_executor or ThreadPoolExecutor(
+            max_workers=upload_workers()
+        )
 
         # 3. Execute uploads and incremental datapoint creation
-        asset_failures = self._execute_incremental_creation(
+        try:
+            asset_failures = self._execute_incremental_creation(
+                datapoints,
+                asset_to_datapoints,
+                datapoint_pending_count,
+                creation_futures,
+                lock,
+                executor,
+                index_offset,
+                show_progress,
+                journal,
+                file_slots,
+            )
+        finally:
+            if creation_executor is None:
+                executor.shutdown(wait=True)
+
+        # 4. Create dataset groups for datapoints that have group info
+        self._create_dataset_groups(datapoints, created_groups)
+
+        # 5. Collect and return results
+        successful, failed = self._collect_and_return_results(
             datapoints,
-            asset_to_datapoints,
-            datapoint_pending_count,
             creation_futures,
+            datapoint_pending_count,
             lock,
-            executor,
+            asset_failures,
+            asset_to_datapoints,
+            index_offset,
+            journal,
         )
+        successful.extend(datapoints[idx] for idx in sorted(already_created))
+        return successful, failed
 
-        # 4. Create dataset groups for datapoints that have group info
-        self._create_dataset_groups(datapoints)
+    async def add_datapoints_async(
+        self,
+        datapoints: list[Datapoint],
+        journal: UploadJournal | None = None,
+    ) -> tuple[list[Datapoint], list[FailedUpload[Datapoint]]]:
+        """
+        Asyncio counterpart of :meth:`add_datapoints` with the same results.
 
-        # 5. Collect and return results
-        return self._collect_and_return_results(
+        Must be awaited on a running event loop. File uploads and datapoint
+        creations draw from one pool of ``rapidata_config.upload.asyncConcurrency``
+        in-flight requests.
+
+        Args:
+            datapoints: List of datapoints to upload
+            journal: Optional journal to resume from and record progress in,
+                see :meth:`add_datapoints`.
+
+        Returns:
+            tuple[list[Datapoint], list[FailedUpload[Datapoint]]]: Lists of successful uploads and failed uploads with error details
+        """
+        if not datapoints:
+            return [], []
+
+        # The journal and reconciliation calls are blocking; keep them off the loop.
+        if journal is not None:
+            await asyncio.to_thread(
+                contextvars.copy_context().run, self._prepare_journal, journal
+            )
+
+        # The HTTP clients bound to the caller's loop are closed once the last
+        # upload running on it returns.
+        rest_client = self.openapi_service.api_client.rest_client
+        async with rest_client.async_sessions():
+            return await self._add_window_async(datapoints, journal=journal)
+
+    async def _add_window_async(
+        self,
+        datapoints: list[Datapoint],
+        index_offset: int = 0,
+        show_progress: bool = True,
+        journal: UploadJournal | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        created_groups: set[str] | None = None,
+    ) -> tuple[list[Datapoint], list[FailedUpload[Datapoint]]]:
+        """Asyncio counterpart of :meth:`_add_window`.
+
+        File uploads and datapoint creations are bounded by ``semaphore``, so
+        windows running side by side can share one limit; a fresh one of
+        ``asyncConcurrency`` slots is used if not given. Those windows share
+        ``created_groups`` the same way. Journal reads and
+        writes go to SQLite and run on worker threads, off the loop.
+        """
+        already_created = (
+            set()
+            if journal is None
+            else await asyncio.to_thread(
+                self._journaled_positions, datapoints, index_offset, journal
+            )
+        )
+        asset_to_datapoints, datapoint_pending_count = (
+            self._build_asset_to_datapoint_mapping(datapoints, skip=already_created)
+        )
+
+        # Everything below runs on the loop thread; the lock is only here
+        # because _find_ready_datapoints is shared with the threaded engine.
+        lock = threading.Lock()
+        creation_tasks: list[tuple[int, asyncio.Task]] = []
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(rapidata_config.upload.asyncConcurrency)
+        asset_failures: list[FailedUpload[str]] = []
+
+        from tqdm.auto import tqdm
+
+        datapoint_pbar = tqdm(
+            total=len(datapoint_pending_count),
+            desc="Step 2/2: Creating datapoints",
+            position=1,
+            disable=rapidata_config.logging.silent_mode or not show_progress,
+            leave=True,
+        )
+
+        async def create(dp_idx: int) -> None:
+            async with semaphore:
+                try:
+                    created = await self.datapoint_uploader.upload_datapoint_async(
+                        dataset_id=self.id,
+                        datapoint=datapoints[dp_idx],
+                        index=index_offset + dp_idx,
+                    )
+                    if journal is not None:
+                        await asyncio.to_thread(
+                            journal.record_created,
+                            index_offset + dp_idx,
+                            datapoints[dp_idx],
+                            created.datapoint_id,
+                        )
+                finally:
+                    datapoint_pbar.update(1)
+
+        def submit(ready_datapoint_indices: list[int]) -> None:
+            for dp_idx in ready_datapoint_indices:
+                creation_tasks.append((dp_idx, asyncio.create_task(create(dp_idx))))
+            if ready_datapoint_indices:
+                logger.debug(
+                    f"Asset batch completed, {len(ready_datapoint_indices)} datapoints now ready for creation"
+                )
+
+        def on_assets_complete(assets: list[str]) -> None:
+            submit(
+                self._find_ready_datapoints(
+                    assets, asset_to_datapoints, datapoint_pending_count, lock
+                )
+            )
+
+        try:
+            immediately_ready = [
+                idx for idx, count in datapoint_pending_count.items() if count == 0
+            ]
+            for idx in immediately_ready:
+                del datapoint_pending_count[idx]
+            submit(immediately_ready)
+
+            logger.info("Starting incremental datapoint creation")
+            asset_failures = await self.asset_orchestrator.upload_all_assets_async(
+                set(asset_to_datapoints.keys()),
+                asset_completion_callback=on_assets_complete,
+                semaphore=semaphore,
+                show_progress=show_progress,
+            )
+
+            if asset_failures:
+                logger.warning(
+                    f"{len(asset_failures)} asset(s) failed to upload, affected datapoints will be marked as failed"
+                )
+
+            await asyncio.gather(
+                *(task for _, task in creation_tasks), return_exceptions=True
+            )
+            logger.debug("All datapoint creation tasks completed")
+        finally:
+            datapoint_pbar.close()
+
+        # Group creation is a handful of sequential calls; keep it off the loop.
+        await asyncio.to_thread(
+            contextvars.copy_context().run,
+            self._create_dataset_groups,
             datapoints,
-            creation_futures,
+            created_groups,
+        )
+
+        collect = functools.partial(
+            self._collect_and_return_results,
+            datapoints,
+            creation_tasks,
             datapoint_pending_count,
             lock,
             asset_failures,
             asset_to_datapoints,
+            index_offset,
+            journal,
+        )
+        # Every task is done here; only the journal writes need a worker thread.
+        successful, failed = (
+            collect() if journal is None else await asyncio.to_thread(collect)
+        )
+        successful.extend(datapoints[idx] for idx in sorted(already_created))
+        return successful, failed
+
+    async def _add_datapoints_on_own_loop(
+        self, datapoints: list[Datapoint], journal: UploadJournal | None = None
+    ) -> tuple[list[Datapoint], list[FailedUpload[Datapoint]]]:
+        """Run the asyncio engine and close the loop-bound HTTP clients after.
+
+        ``journal`` has already been prepared by :meth:`add_datapoints`.
+        """
+        rest_client = self.openapi_service.api_client.rest_client
+        async with rest_client.async_sessions():
+            return await self._add_window_async(datapoints, journal=journal)
+
+    async def _stream_on_own_loop(
+        self,
+        datapoints: Iterable[Datapoint],
+        on_failure: Callable[[FailedUpload[Datapoint]], None] | None,
+        window_size: int,
+        journal: UploadJournal | None = None,
+    ) -> tuple[int, int]:
+        """Asyncio engine behind :meth:`add_datapoints_streaming`."""
+        rest_client = self.openapi_service.api_client.rest_client
+        succeeded = failed = 0
+        in_flight: dict[asyncio.Task, int] = {}
+        semaphore = asyncio.Semaphore(rapidata_config.upload.asyncConcurrency)
+        created_groups: set[str] = set()
+
+        def collect(done: Iterable[asyncio.Task]) -> None:
+            nonlocal succeeded, failed
+            for task in done:
+                successful, failures = task.result()
+                succeeded += len(successful)
+                failed += self._report_failures(failures, on_failure)
+                pbar.update(in_flight.pop(task))
+
+        async with rest_client.async_sessions():
+            from tqdm.auto import tqdm
+
+            with tqdm(
+                desc="Uploading datapoints",
+                unit="datapoint",
+                disable=rapidata_config.logging.silent_mode,
+            ) as pbar:
+                try:
+                    pending_slices = _windows(datapoints, _slice_size(window_size))
+                    while True:
+                        if len(in_flight) == _STREAMING_SLICES:
+                            done, _ = await asyncio.wait(
+                                in_flight, return_when=asyncio.FIRST_COMPLETED
+                            )
+                            collect(done)
+                        if (next_slice := next(pending_slices, None)) is None:
+                            break
+                        index_offset, window = next_slice
+                        task = asyncio.create_task(
+                            self._add_window_async(
+                                window,
+                                index_offset=index_offset,
+                                show_progress=False,
+                                journal=journal,
+                                semaphore=semaphore,
+                                created_groups=created_groups,
+                            )
+                        )
+                        in_flight[task] = len(window)
+                    if in_flight:
+                        done, _ = await asyncio.wait(in_flight)
+                        collect(done)
+                finally:
+                    for task in in_flight:
+                        task.cancel()
+
+        logger.info(
+            f"Streaming upload complete: {succeeded} succeeded, {failed} failed"
         )
+        return succeeded, failed
 
     def _build_asset_to_datapoint_mapping(
-        self, datapoints: list[Datapoint]
+        self, datapoints: list[Datapoint], skip: Collection[int] = ()
     ) -> tuple[dict[str, set[int]], dict[int, int]]:
         """
         Build efficient reverse mapping: asset -> datapoint indices that need it.
@@ -130,6 +664,8 @@ class RapidataDataset:
 
         Args:
             datapoints: List of datapoints to process. Indices into this list are used as identifiers.
+            skip: Indices of datapoints that must not be uploaded, e.g. because
+                the upload journal already records them as created.
 
         Returns:
             Tuple of (asset_to_datapoints, datapoint_pending_count):
@@ -141,6 +677,9 @@ class RapidataDataset:
         datapoint_pending_count: dict[int, int] = {}
 
         for idx, dp in enumerate(datapoints):
+            if idx in skip:
+                continue
+
             # Extract all assets for this datapoint using shared utility
             assets = extract_assets_from_datapoint(dp)
 
@@ -164,6 +703,10 @@ class RapidataDataset:
         creation_futures: list[tuple[int, Future]],
         lock: threading.Lock,
         executor: ThreadPoolExecutor,
+        index_offset: int = 0,
+        show_progress: bool = True,
+        journal: UploadJournal | None = None,
+        file_slots: threading.Semaphore | None = None,
     ) -> list[FailedUpload[str]]:
         """
         Execute asset uploads and incremental datapoint creation.
@@ -175,18 +718,24 @@ class RapidataDataset:
             creation_futures: List to store creation futures.
             lock: Lock protecting shared state.
             executor: Thread pool executor for datapoint creation.
+            index_offset: Sort index of ``datapoints[0]`` within the dataset.
+            show_progress: Whether to show the per-step progress bars.
+            journal: Journal to record created datapoints in.
+            file_slots: Semaphore bounding file uploads, see :meth:`_add_window`.
 
         Returns:
             Asset-level failures from the upload phase, so callers can map them
             back to the datapoints they blocked.
         """
         asset_failures: list[FailedUpload[str]] = []
+        from tqdm.auto import tqdm
+
         # Create progress bar for datapoint creation
         datapoint_pbar = tqdm(
-            total=len(datapoints),
+            total=len(datapoint_pending_count),
             desc="Step 2/2: Creating datapoints",
             position=1,
-            disable=rapidata_config.logging.silent_mode,
+            disable=rapidata_config.logging.silent_mode or not show_progress,
             leave=True,
         )
 
@@ -210,6 +759,8 @@ class RapidataDataset:
                     lock,
                     executor,
                     datapoint_pbar,
+                    index_offset,
+                    journal,
                 )
 
             # Create callback that submits datapoints for creation
@@ -221,6 +772,8 @@ class RapidataDataset:
                 lock,
                 executor,
                 datapoint_pbar,
+                index_offset,
+                journal,
             )
 
             # Extract all unique assets from the mapping
@@ -229,7 +782,10 @@ class RapidataDataset:
             # Start uploads (blocking, but triggers callbacks as assets complete)
             logger.info("Starting incremental datapoint creation")
             asset_failures = self.asset_orchestrator.upload_all_assets(
-                all_assets, asset_completion_callback=on_assets_complete
+                all_assets,
+                asset_completion_callback=on_assets_complete,
+                show_progress=show_progress,
+                file_slots=file_slots,
             )
 
             if asset_failures:
@@ -237,8 +793,11 @@ class RapidataDataset:
                     f"{len(asset_failures)} asset(s) failed to upload, affected datapoints will be marked as failed"
                 )
 
-            # Wait for all datapoint creation to complete
-            executor.shutdown(wait=True)
+            # Wait for all datapoint creation to complete. The executor may be
+            # shared with other windows, so wait on this window's futures only.
+            with lock:
+                pending_creations = [future for _, future in creation_futures]
+            wait(pending_creations)
             logger.debug("All datapoint creation tasks completed")
         finally:
             # Always close progress bar, even on exception
@@ -255,6 +814,8 @@ class RapidataDataset:
         lock: threading.Lock,
         executor: ThreadPoolExecutor,
         datapoint_pbar: tqdm,
+        index_offset: int = 0,
+        journal: UploadJournal | None = None,
     ) -> Callable[[list[str]], None]:
         """
         Create callback function that handles asset completion.
@@ -270,6 +831,8 @@ class RapidataDataset:
             lock: Lock protecting shared state.
             executor: Thread pool executor for datapoint creation.
             datapoint_pbar: Progress bar for datapoint creation.
+            index_offset: Sort index of ``datapoints[0]`` within the dataset.
+            journal: Journal to record created datapoints in.
 
         Returns:
             Callback function to be invoked when assets complete.
@@ -289,6 +852,8 @@ class RapidataDataset:
                 lock,
                 executor,
                 datapoint_pbar,
+                index_offset,
+                journal,
             )
 
         return on_assets_complete
@@ -335,6 +900,12 @@ class RapidataDataset:
                             # Remove this datapoint from this asset's waiting list
                             asset_to_datapoints[asset].discard(datapoint_idx)
 
+                    # Nobody waits on this asset anymore; drop it so the
+                    # mapping shrinks as the upload progresses. Entries of
+                    # failed assets never get here and stay for reporting.
+                    if not asset_to_datapoints[asset]:
+                        del asset_to_datapoints[asset]
+
         return ready_datapoint_indices
 
     def _submit_datapoints_for_creation(
@@ -345,6 +916,8 @@ class RapidataDataset:
         lock: threading.Lock,
         executor: ThreadPoolExecutor,
         datapoint_pbar: tqdm,
+        index_offset: int = 0,
+        journal: UploadJournal | None = None,
     ) -> None:
         """
         Submit ready datapoints for creation.
@@ -356,6 +929,8 @@ class RapidataDataset:
             lock: Lock protecting creation_futures.
             executor: Thread pool executor for datapoint creation.
             datapoint_pbar: Progress bar for datapoint creation.
+            index_offset: Sort index of ``datapoints[0]`` within the dataset.
+            journal: Journal to record created datapoints in.
         """
         # Capture the current OpenTelemetry context before creating threads
         current_context = otel_context.get_current()
@@ -366,11 +941,18 @@ class RapidataDataset:
                 """Upload datapoint and update progress bar when done."""
                 token = otel_context.attach(current_context)
                 try:
-                    self.datapoint_uploader.upload_datapoint(
-                        dataset_id=self.id,
-                        datapoint=datapoints[dp_idx],
-                        index=dp_idx,
-                    )
+                    with upload_slot():
+                        created = self.datapoint_uploader.upload_datapoint(
+                            dataset_id=self.id,
+                            datapoint=datapoints[dp_idx],
+                            index=index_offset + dp_idx,
+                        )
+                    if journal is not None:
+                        journal.record_created(
+                            index_offset + dp_idx,
+                            datapoints[dp_idx],
+                            created.datapoint_id,
+                        )
                 finally:
                     otel_context.detach(token)
                     datapoint_pbar.update(1)
@@ -387,11 +969,13 @@ class RapidataDataset:
     def _collect_and_return_results(
         self,
         datapoints: list[Datapoint],
-        creation_futures: list[tuple[int, Future]],
+        creation_futures: list[tuple[int, Future]] | list[tuple[int, asyncio.Task]],
         datapoint_pending_count: dict[int, int],
         lock: threading.Lock,
         asset_failures: list[FailedUpload[str]],
         asset_to_datapoints: dict[str, set[int]],
+        index_offset: int = 0,
+        journal: UploadJournal | None = None,
     ) -> tuple[list[Datapoint], list[FailedUpload[Datapoint]]]:
         """
         Collect results from datapoint creation tasks.
@@ -405,6 +989,8 @@ class RapidataDataset:
                 attach the underlying error reasons and trace IDs to the
                 datapoint-level FailedUpload entries.
             asset_to_datapoints: Mapping from asset to datapoint indices.
+            index_offset: Sort index of ``datapoints[0]`` within the dataset.
+            journal: Journal to record failed datapoints in.
 
         Returns:
             Tuple of (successful_uploads, failed_uploads).
@@ -414,6 +1000,21 @@ class RapidataDataset:
 
         # Collect results from creation tasks
         for idx, future in creation_futures:
+            # A cancelled task's result() raises a BaseException in asyncio.
+            if future.cancelled():
+                logger.warning(f"Creation of datapoint {idx} was cancelled")
+                failed_uploads.append(
+                    FailedUpload(
+                        item=datapoints[idx],
+                        error_message="Datapoint creation was cancelled",
+                        error_type="CancelledError",
+                    )
+                )
+                if journal is not None:
+                    journal.record_failed(
+                        index_offset + idx, datapoints[idx], "cancelled"
+                    )
+                continue
             try:
                 future.result()  # Raises exception if failed
                 successful_uploads.append(datapoints[idx])
@@ -421,6 +1022,8 @@ class RapidataDataset:
                 logger.warning(f"Failed to create datapoint {idx}: {e}")
                 # Use from_exception to extract proper error reason from RapidataError
                 failed_uploads.append(FailedUpload.from_exception(datapoints[idx], e))
+                if journal is not None:
+                    journal.record_failed(index_offset + idx, datapoints[idx], str(e))
 
         # Build reverse mapping: datapoint index -> the asset-level failures
         # that blocked it. A single datapoint can have multiple required
@@ -441,6 +1044,12 @@ class RapidataDataset:
                         datapoint_to_asset_failures.get(idx, []),
                     )
                 )
+                if journal is not None:
+                    journal.record_failed(
+                        index_offset + idx,
+                        datapoints[idx],
+                        failed_uploads[-1].error_message,
+                    )
 
         logger.info(
             f"Datapoint creation complete: {len(successful_uploads)} succeeded, {len(failed_uploads)} failed"
@@ -516,8 +1125,14 @@ class RapidataDataset:
         distinct = {v for v in values if v is not None}
         return next(iter(distinct)) if len(distinct) == 1 else None
 
-    def _create_dataset_groups(self, datapoints: list[Datapoint]) -> None:
-        """Create dataset groups from datapoints that have a group field."""
+    def _create_dataset_groups(
+        self, datapoints: list[Datapoint], created_groups: set[str] | None = None
+    ) -> None:
+        """Create dataset groups from datapoints that have a group field.
+
+        Groups in ``created_groups`` are skipped, and the ones created here
+        are added to it.
+        """
         from rapidata.api_client.models.create_dataset_group_endpoint_input import (
             CreateDatasetGroupEndpointInput,
         )
@@ -528,6 +1143,16 @@ class RapidataDataset:
             if dp.group is not None and dp.group not in groups:
                 groups[dp.group] = (dp.context, dp.media_context)
 
+        if created_groups is not None:
+            # Windows running side by side claim their groups under the lock.
+            with self._groups_lock:
+                groups = {
+                    group_id: context
+                    for group_id, context in groups.items()
+                    if group_id not in created_groups
+                }
+                created_groups.update(groups)
+
         if not groups:
             return
 
@@ -0,0 +1,202 @@
+"""
+On-disk journal of a dataset upload, so an interrupted upload can be resumed.
+
+The journal is a small SQLite database recording which dataset an upload goes
+into and, per datapoint sort index, whether it was created (with the backend's
+datapoint id) or failed. Every record is committed as soon as it is known, in
+WAL mode, so a killed process loses at most the datapoints that were in flight.
+Re-running the same upload against the same journal then skips everything that
+is already in the dataset.
+
+Each entry also stores a fingerprint of the datapoint it was recorded for. A
+resumed upload must present the same datapoints in the same order; a datapoint
+that differs from the journaled one at its sort index is rejected rather than
+silently skipped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+from rapidata.rapidata_client.config import logger
+
+if TYPE_CHECKING:
+    from rapidata.rapidata_client.datapoints._datapoint import Datapoint
+
+_CREATED = "created"
+_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS datapoints (
+    sort_index INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    state TEXT NOT NULL,
+    datapoint_id TEXT,
+    error TEXT
+);
+"""
+
+
+class UploadJournal:
+    """Crash-safe record of a dataset upload.
+
+    Args:
+        path: The journal file. Created (with its parent directories) if missing.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Written from upload worker threads, serialized by self._lock.
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        # WAL + NORMAL survives the process being killed (the case we care
+        # about) without paying an fsync per datapoint.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def dataset_id(self) -> str | None:
+        """The dataset this journal uploads into, or None if not bound yet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'dataset_id'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def bind_dataset(self, dataset_id: str) -> None:
+        """Tie the journal to ``dataset_id``.
+
+        Raises:
+            ValueError: If the journal already belongs to a different dataset.
+        """
+        current = self.dataset_id
+        if current is not None and current != dataset_id:
+            raise ValueError(
+                f"Upload journal {self.path} belongs to dataset {current}, "
+                f"not {dataset_id}. Use a separate journal per dataset."
+            )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('dataset_id', ?)",
+                (dataset_id,),
+            )
+
+    def pending(self, datapoints: Sequence[Datapoint], index_offset: int = 0) -> list[int]:
+        """Return the positions in ``datapoints`` that still have to be uploaded.
+
+        Args:
+            datapoints: The datapoints of this upload (or one window of it).
+            index_offset: Sort index of ``datapoints[0]``.
+
+        Raises:
+            ValueError: If a journaled datapoint differs from the one now given
+                for its sort index.
+        """
+        with self._lock:
+            created = dict(
+                self._conn.execute(
+                    "SELECT sort_index, fingerprint FROM datapoints "
+                    "WHERE state = ? AND sort_index >= ? AND sort_index < ?",
+                    (_CREATED, index_offset, index_offset + len(datapoints)),
+                ).fetchall()
+            )
+        if not created:
+            return list(range(len(datapoints)))
+
+        pending: list[int] = []
+        for position, datapoint in enumerate(datapoints):
+            sort_index = index_offset + position
+            fingerprint = created.get(sort_index)
+            if fingerprint is None:
+                pending.append(position)
+            elif fingerprint != self.fingerprint(datapoint):
+                raise ValueError(
+                    f"The datapoint at sort index {sort_index} differs from the one "
+                    f"recorded in upload journal {self.path}. Resume with the same "
+                    "datapoints in the same order, or start a new journal."
+                )
+        return pending
+
+    def record_created(
+        self, sort_index: int, datapoint: Datapoint, datapoint_id: str | None
+    ) -> None:
+        self._record(sort_index, datapoint, _CREATED, datapoint_id, None)
+
+    def record_failed(self, sort_index: int, datapoint: Datapoint, error: str) -> None:
+        self._record(sort_index, datapoint, _FAILED, None, error)
+
+    def mark_failed(self, sort_indices: Sequence[int], error: str) -> int:
+        """Flag journaled datapoints as failed so a resume uploads them again.
+
+        Used for datapoints the backend reports as failed after creation (e.g.
+        an unreachable URL). Returns the number of entries changed.
+        """
+        with self._lock:
+            cursor = self._conn.executemany(
+                "UPDATE datapoints SET state = ?, error = ? WHERE sort_index = ? AND state = ?",
+                [(_FAILED, error, index, _CREATED) for index in sort_indices],
+            )
+        return cursor.rowcount
+
+    def counts(self) -> tuple[int, int]:
+        """Return the number of created and failed datapoints on record."""
+        with self._lock:
+            rows = dict(
+                self._conn.execute(
+                    "SELECT state, COUNT(*) FROM datapoints GROUP BY state"
+                ).fetchall()
+            )
+        return rows.get(_CREATED, 0), rows.get(_FAILED, 0)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def delete(self) -> None:
+        """Close the journal and remove its files, e.g. once the upload is finished."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+        logger.debug("Deleted upload journal %s", self.path)
+
+    def __enter__(self) -> UploadJournal:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def fingerprint(datapoint: Datapoint) -> str:
+        return hashlib.sha256(datapoint.model_dump_json().encode()).hexdigest()
+
+    def _record(
+        self,
+        sort_index: int,
+        datapoint: Datapoint,
+        state: str,
+        datapoint_id: str | None,
+        error: str | None,
+    ) -> None:
+        fingerprint = self.fingerprint(datapoint)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO datapoints "
+                "(sort_index, fingerprint, state, datapoint_id, error) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (sort_index, fingerprint, state, datapoint_id, error),
+            )
+
+    def __repr__(self) -> str:
+        return f"UploadJournal(path={str(self.path)!r})"
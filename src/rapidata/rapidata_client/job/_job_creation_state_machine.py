@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import re
 from enum import Enum, auto
+from pathlib import Path
 from typing import TYPE_CHECKING, Sequence
 
-from rapidata.rapidata_client.config import logger, tracer
+from rapidata.rapidata_client.config import logger, rapidata_config, tracer
 from rapidata.rapidata_client.config._qr_preview import (
     print_job_definition_preview_link,
 )
 from rapidata.rapidata_client.dataset._rapidata_dataset import RapidataDataset
+from rapidata.rapidata_client.dataset._upload_journal import UploadJournal
 from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
 from rapidata.rapidata_client.exceptions.failed_upload_exception import (
     FailedUploadException,
@@ -47,6 +51,13 @@ class JobDefinitionCreationMachine:
     count, so it stays meaningful across resume attempts. Regardless of the
     tolerance, at least one datapoint must upload successfully - a definition
     over an empty dataset is never created.
+
+    With ``rapidata_config.upload.journalDirectory`` set, the upload is also
+    recorded in an on-disk :class:`UploadJournal` named after the definition
+    and its datapoints. A machine for the same name and datapoints started in a
+    later process picks up the journaled dataset and uploads only the
+    datapoints that are still missing.
+    The journal is removed once the definition is persisted.
     """
 
     def __init__(
@@ -69,6 +80,7 @@ class JobDefinitionCreationMachine:
         self._campaign_feature_flags = campaign_feature_flags
 
         self._total_datapoints = len(datapoints)
+        self._datapoints: list[Datapoint] = list(datapoints)
         self._pending: list[Datapoint] = list(datapoints)
         self._succeeded_count = 0
 
@@ -77,6 +89,17 @@ class JobDefinitionCreationMachine:
         self.failed_uploads: list[FailedUpload[Datapoint]] = []
         self.job_definition: RapidataJobDefinition | None = None
 
+        self._journal = self._open_journal()
+        if self._journal is not None and self._journal.dataset_id is not None:
+            logger.info(
+                "Resuming upload of '%s' into dataset %s from journal %s",
+                name,
+                self._journal.dataset_id,
+                self._journal.path,
+            )
+            self.dataset = RapidataDataset(self._journal.dataset_id, openapi_service)
+            self._state = _State.UPLOAD_DATAPOINTS
+
     def run(self) -> RapidataJobDefinition:
         """Drive the machine to a terminal state.
 
@@ -132,14 +155,36 @@ class JobDefinitionCreationMachine:
             )
         )
         self.dataset = RapidataDataset(dataset.dataset_id, self._openapi_service)
+        if self._journal is not None:
+            # Bind right away so a crash before the first datapoint lands
+            # still resumes into this dataset instead of creating another.
+            self._journal.bind_dataset(self.dataset.id)
         self._state = _State.UPLOAD_DATAPOINTS
 
     def _upload_datapoints(self) -> None:
         assert self.dataset is not None
         with tracer.start_as_current_span("add_datapoints"):
-            successful, failed = self.dataset.add_datapoints(self._pending)
+            # The journal skips every datapoint already created, in this
+            # process or an earlier one, and reports it as successful.
+            datapoints = self._pending if self._journal is None else self._datapoints
+            if len(datapoints) > rapidata_config.upload.streamingWindowSize:
+                # Large uploads go window by window so only the in-flight
+                # windows' upload state is held in memory.
+                failed: list[FailedUpload[Datapoint]] = []
+                succeeded, _ = self.dataset.add_datapoints_streaming(
+                    datapoints, on_failure=failed.append, journal=self._journal
+                )
+            else:
+                successful, failed = self.dataset.add_datapoints(
+                    datapoints, journal=self._journal
+                )
+                succeeded = len(successful)
+
+            if self._journal is None:
+                self._succeeded_count += succeeded
+            else:
+                self._succeeded_count = succeeded
 
-        self._succeeded_count += len(successful)
         self.failed_uploads = failed
         self._pending = []
 
@@ -200,4 +245,29 @@ class JobDefinitionCreationMachine:
             environment=self._openapi_service.environment,
             job_definition_id=self.job_definition.id,
         )
+        if self._journal is not None:
+            self._journal.delete()
+            self._journal = None
         self._state = _State.SUCCEEDED
+
+    def _open_journal(self) -> UploadJournal | None:
+        directory = rapidata_config.upload.journalDirectory
+        if directory is None:
+            return None
+        return UploadJournal(Path(directory) / self._journal_file_name())
+
+    def _journal_file_name(self) -> str:
+        """File name for this definition's journal.
+
+        Unique per name, environment and datapoints, so a definition reusing a
+        name for other datapoints starts a fresh upload instead of resuming
+        into the earlier one's dataset.
+        """
+        key = hashlib.sha256(
+            f"{self._openapi_service.environment}/{self._name}".encode()
+        )
+        for datapoint in self._datapoints:
+            key.update(UploadJournal.fingerprint(datapoint).encode())
+        digest = key.hexdigest()[:16]
+        readable = re.sub(r"[^A-Za-z0-9_.-]+", "_", self._name)[:64]
+        return f"{readable}-{digest}.journal.sqlite"
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import json
+import os
 import urllib.parse
 import webbrowser
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from time import sleep
-from typing import Callable, TypeVar, TYPE_CHECKING
+from typing import Callable, Iterator, TypeVar, TYPE_CHECKING
 from colorama import Fore
-from tqdm.auto import tqdm
+from opentelemetry import context as otel_context, trace
 
 from rapidata.api_client.models.audience_job_state import AudienceJobState
+from rapidata.api_client.rest import json_loads
 from rapidata.service.openapi_service import OpenAPIService
 from rapidata.rapidata_client.config import (
     logger,
@@ -20,6 +25,7 @@ from rapidata.rapidata_client.config import (
 from rapidata.rapidata_client.api.rapidata_api_client import (
     suppress_rapidata_error_logging,
 )
+from rapidata.rapidata_client.exceptions.rapidata_error import RapidataError
 from rapidata.rapidata_client.job.cost import (
     CostEstimate,
     DEFAULT_ESTIMATE_POLL_INTERVAL,
@@ -34,12 +40,22 @@ if TYPE_CHECKING:
     from rapidata.api_client.models.get_job_progress_endpoint_output import (
         GetJobProgressEndpointOutput,
     )
+    from rapidata.api_client.models.grouped_ranking_group import GroupedRankingGroup
+    from rapidata.api_client.models.job_rapid_result import JobRapidResult
+    from rapidata.api_client.models.rapid_state import RapidState
+    from rapidata.api_client.models.ranking_datapoint import RankingDatapoint
     from rapidata.rapidata_client.results.rapidata_results import RapidataResults
+    from rapidata.rapidata_client.results.rapidata_results_file import (
+        RapidataResultsFile,
+    )
     from rapidata.rapidata_client.job.progress import JobProgress
     from rapidata.rapidata_client.audience.recruiting import RecruitingMetrics
 
 T = TypeVar("T")
 
+# Bytes written per write() while streaming a results file to disk.
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class RapidataJob:
     """
@@ -208,7 +224,7 @@ class RapidataJob:
         target_statuses: list[str],
         check_interval: float = 5,
         status_message: str | None = None,
-    ) -> str:
+    ) -> GetJobByIdEndpointOutput:
         """
         Wait until the job reaches one of the target statuses.
 
@@ -218,7 +234,7 @@ class RapidataJob:
             status_message: Optional message to display while waiting
 
         Returns:
-            The final status reached
+            The job as fetched once it reached one of the target statuses
 
         Raises:
             Exception: If the job enters a state it can't progress out of on its own
@@ -230,7 +246,7 @@ class RapidataJob:
             job = self._fetch_job()
             current_status = job.state.value
             if current_status in target_statuses:
-                return current_status
+                return job
             if current_status in self._BLOCKING_STATUSES:
                 self._raise_for_blocking_status(job)
             if status_message:
@@ -350,6 +366,12 @@ class RapidataJob:
             "this may take a few minutes..."
         )
         self._openapi_service.order.job_api.job_job_id_retry_post(self.id)
+        # The job completes anew, so its completion time and results change.
+        self.__completed_at = None
+        if rapidata_config.results.cacheResultsToDisk:
+            from rapidata.rapidata_client.results import _results_cache
+
+            _results_cache.invalidate(self.id)
 
     def get_results(self) -> RapidataResults:
         """
@@ -360,6 +382,10 @@ class RapidataJob:
         If the job's results have gone stale, regeneration is triggered automatically
         and this method blocks until the fresh results are ready.
 
+        With ``rapidata_config.results.cacheResultsToDisk`` enabled, the results of a
+        completed job are kept on disk and later calls return them from there
+        instead of downloading them again, until the job completes anew.
+
         Returns:
             RapidataResults: The results of the job.
 
@@ -372,21 +398,31 @@ class RapidataJob:
         """
         with tracer.start_as_current_span("RapidataJob.get_results"):
             from rapidata.api_client.exceptions import ApiException
+            from rapidata.rapidata_client.results import _results_cache
             from rapidata.rapidata_client.results.rapidata_results import (
                 RapidataResults,
             )
 
             logger.info("Getting results for job '%s'...", self)
-
-            # Stale results have no downloadable file until the pipeline is re-run;
-            # trigger that automatically before waiting for the re-completion.
-            if self.get_status() == "StaleResults":
-                self._regenerate_results()
-
-            self._wait_for_status(
-                target_statuses=["Completed", "Failed"],
-                status_message="Job '%s' is in status %s, waiting for completion...",
-            )
+            job = self._wait_for_results()
+
+            cache_key = None
+            if (
+                rapidata_config.results.cacheResultsToDisk
+                and job.state == AudienceJobState.COMPLETED
+                and job.completed_at is not None
+            ):
+                cache_key = (self.id, job.completed_at)
+                cached = _results_cache.get(*cache_key)
+                if cached is not None:
+                    try:
+                        cached_results = RapidataResults(json_loads(cached))
+                    except ValueError:
+                        logger.debug("Cached results of job '%s' are corrupt", self)
+                        _results_cache.invalidate(self.id)
+                    else:
+                        logger.debug("Using cached results for job '%s'", self)
+                        return cached_results
 
             try:
                 results = (
@@ -394,10 +430,189 @@ class RapidataJob:
                         job_id=self.id
                     )
                 )
-                return RapidataResults(json.loads(results))
+                parsed = RapidataResults(json_loads(results))
             except (ApiException, json.JSONDecodeError) as e:
                 raise Exception(f"Failed to get job results: {str(e)}") from e
 
+            if cache_key is not None:
+                _results_cache.put(*cache_key, results)
+            return parsed
+
+    def download_results(
+        self, path: str | Path = "./results.json"
+    ) -> RapidataResultsFile:
+        """
+        Downloads the results of the job to a file, without holding them in memory.
+
+        The results are written to disk as they arrive. Iterating the returned
+        ``RapidataResultsFile`` yields one result at a time, so jobs too large for
+        ``get_results`` can be processed with memory proportional to a single
+        result. Like ``get_results``, this blocks until the job is completed.
+
+        Args:
+            path: Where to write the results file. An existing file is replaced
+                once the download has finished.
+
+        Returns:
+            RapidataResultsFile: The downloaded results.
+
+        Raises:
+            Exception: If failed to download the job results, or if the job cannot
+                complete without intervention (see ``get_results``).
+        """
+        with tracer.start_as_current_span("RapidataJob.download_results"):
+            from rapidata.api_client.exceptions import ApiException
+            from rapidata.rapidata_client.results.rapidata_results_file import (
+                RapidataResultsFile,
+            )
+
+            logger.info("Downloading results for job '%s' to '%s'...", self, path)
+            self._wait_for_results()
+
+            path = Path(path)
+            partial_path = path.with_name(path.name + ".part")
+            job_api = self._openapi_service.order.job_api
+            serialized = job_api._job_job_id_download_results_get_serialize(
+                job_id=self.id,
+                _request_auth=None,
+                _content_type=None,
+                _headers=None,
+                _host_index=0,
+            )
+            try:
+                with job_api.api_client.call_api_stream(*serialized) as response:
+                    with open(partial_path, "wb") as file:
+                        for chunk in response.iter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                            file.write(chunk)
+                os.replace(partial_path, path)
+            except ApiException as e:
+                raise Exception(f"Failed to download job results: {str(e)}") from e
+            finally:
+                partial_path.unlink(missing_ok=True)
+
+            return RapidataResultsFile(path)
+
+    def iter_results(
+        self,
+        states: list[RapidState] | None = None,
+        page_size: int = 100,
+        max_concurrent_pages: int = 4,
+    ) -> Iterator[JobRapidResult | RankingDatapoint | GroupedRankingGroup]:
+        """
+        Iterates over the job's results one item at a time, as typed models.
+
+        Unlike ``get_results``, this does not wait for the job to complete and does
+        not download the results file: the items are read from the paged results
+        endpoint, so partial results of a running job can be processed as they come
+        in. Once the first page tells how many pages there are, up to
+        ``max_concurrent_pages`` of the following pages are fetched in the
+        background while earlier ones are being consumed. Items are yielded in page
+        order.
+
+        Pages are requested by number. While the job is still running, items that
+        come in during the iteration can shift the pages, so an item may be
+        yielded twice or not at all; pages added by a growing total are still
+        fetched. Iterate a completed job for an exact, stable listing.
+
+        The item type depends on the job: ``JobRapidResult`` for simple and
+        evaluation jobs, ``RankingDatapoint`` for compare jobs and
+        ``GroupedRankingGroup`` for grouped-ranking jobs.
+
+        Args:
+            states: Only yield rapids in these states, e.g. ``[RapidState.DONE]``.
+                Applies to ``JobRapidResult`` items only.
+            page_size: The number of items fetched per request.
+            max_concurrent_pages: The most pages fetched ahead of the one being
+                consumed.
+
+        Returns:
+            Iterator[JobRapidResult | RankingDatapoint | GroupedRankingGroup]: The
+                job's result items.
+
+        Raises:
+            ValueError: If page_size or max_concurrent_pages is less than 1.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_concurrent_pages < 1:
+            raise ValueError("max_concurrent_pages must be at least 1")
+        return self._iter_result_pages(states, page_size, max_concurrent_pages)
+
+    def _iter_result_pages(
+        self,
+        states: list[RapidState] | None,
+        page_size: int,
+        max_concurrent_pages: int,
+    ) -> Iterator[JobRapidResult | RankingDatapoint | GroupedRankingGroup]:
+        job_api = self._openapi_service.order.job_api
+        # Ended once the iteration ends rather than after the first page, and
+        # never made current: the caller's code runs between the yields.
+        span = tracer.start_span("RapidataJob.iter_results")
+        span_context = trace.set_span_in_context(span)
+
+        def fetch(page: int):
+            token = otel_context.attach(span_context)
+            try:
+                result = job_api.job_job_id_results_get(
+                    job_id=self.id, states=states, page=page, page_size=page_size
+                ).actual_instance
+            finally:
+                otel_context.detach(token)
+            if result is None:
+                raise RapidataError(
+                    message=f"Results page {page} of job '{self.id}' has no content"
+                )
+            return result
+
+        def page_count(result) -> int:
+            # The server may cap the page size; count pages in the size it used.
+            return -(-result.total // (result.page_size or page_size))
+
+        try:
+            logger.info("Iterating results of job '%s'...", self)
+            first = fetch(1)
+            pages = page_count(first)
+            if pages <= 1:
+                yield from first.items
+                return
+
+            pool = ThreadPoolExecutor(
+                max_workers=max_concurrent_pages,
+                thread_name_prefix="rapidata-results",
+            )
+            pending: deque[Future] = deque()
+            next_page = 2
+            try:
+                while next_page <= pages and len(pending) < max_concurrent_pages:
+                    pending.append(pool.submit(fetch, next_page))
+                    next_page += 1
+                yield from first.items
+                while pending:
+                    page = pending.popleft().result()
+                    # A running job's total grows; fetch the pages it adds.
+                    pages = max(pages, page_count(page))
+                    if next_page <= pages:
+                        pending.append(pool.submit(fetch, next_page))
+                        next_page += 1
+                    yield from page.items
+            finally:
+                # Stops fetching ahead when the caller breaks off early.
+                pool.shutdown(wait=False, cancel_futures=True)
+        finally:
+            span.end()
+
+    def _wait_for_results(self) -> GetJobByIdEndpointOutput:
+        """Blocks until the job has a results file to download and returns the job."""
+        # Stale results have no downloadable file until the pipeline is re-run;
+        # trigger that automatically before waiting for the re-completion.
+        if self.get_status() == "StaleResults":
+            self._regenerate_results()
+
+        return self._wait_for_status(
+            target_statuses=["Completed", "Failed"],
+            status_message="Job '%s' is in status %s, waiting for completion...",
+        )
+
     def display_progress_bar(self, refresh_rate: int = 5) -> None:
         """
         Displays a progress bar for the job processing using tqdm.
@@ -428,6 +643,8 @@ class RapidataJob:
 
         self._raise_if_audience_cannot_produce_responses()
 
+        from tqdm.auto import tqdm
+
         with tqdm(
             total=100,
             desc="Processing job",
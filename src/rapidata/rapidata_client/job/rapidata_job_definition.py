@@ -3,9 +3,14 @@ from __future__ import annotations
 from rapidata.rapidata_client.exceptions.failed_upload_exception import (
     FailedUploadException,
 )
-from typing import Literal
+from typing import Literal, TYPE_CHECKING
 from rapidata.service.openapi_service import OpenAPIService
-from rapidata.rapidata_client.config import tracer, logger, managed_print
+from rapidata.rapidata_client.config import (
+    tracer,
+    logger,
+    managed_print,
+    rapidata_config,
+)
 from rapidata.rapidata_client.job.cost import (
     CostEstimate,
     DEFAULT_ESTIMATE_POLL_INTERVAL,
@@ -16,6 +21,10 @@ import webbrowser
 import urllib.parse
 from colorama import Fore
 
+if TYPE_CHECKING:
+    from rapidata.rapidata_client.datapoints._datapoint import Datapoint
+    from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
+
 
 class RapidataJobDefinition:
     def __init__(
@@ -112,13 +121,12 @@ class RapidataJobDefinition:
                 CreateJobRevisionEndpointInput,
             )
 
-            datapoints_list = DatapointsValidator.map_datapoints(
+            DatapointsValidator.validate_datapoints(
                 datapoints=datapoints,
                 contexts=contexts,
                 media_contexts=media_contexts,
                 sentences=sentences,
                 private_metadata=private_metadata,
-                data_type=data_type,
             )
 
             dataset = self._openapi_service.dataset.dataset_api.dataset_post(
@@ -131,8 +139,27 @@ class RapidataJobDefinition:
                 dataset.dataset_id, self._openapi_service
             )
 
+            # Datapoints are built lazily, so a large dataset is never held
+            # as Datapoint objects all at once.
+            datapoints_iter = DatapointsValidator.iter_datapoints(
+                datapoints=datapoints,
+                contexts=contexts,
+                media_contexts=media_contexts,
+                sentences=sentences,
+                private_metadata=private_metadata,
+                data_type=data_type,
+            )
+
             with tracer.start_as_current_span("update_datapoints"):
-                _, failed_uploads = rapidata_dataset.add_datapoints(datapoints_list)
+                if len(datapoints) > rapidata_config.upload.streamingWindowSize:
+                    failed_uploads: list[FailedUpload[Datapoint]] = []
+                    rapidata_dataset.add_datapoints_streaming(
+                        datapoints_iter, on_failure=failed_uploads.append
+                    )
+                else:
+                    _, failed_uploads = rapidata_dataset.add_datapoints(
+                        list(datapoints_iter)
+                    )
                 if failed_uploads:
                     raise FailedUploadException(
                         rapidata_dataset, failed_uploads, job_definition=self
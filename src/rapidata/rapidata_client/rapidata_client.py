@@ -6,9 +6,6 @@ import threading
 import time
 from dataclasses import dataclass
 from typing import Any
-import requests
-from packaging import version
-from rapidata import __version__
 import uuid
 import random
 from rapidata.service.openapi_service import OpenAPIService
@@ -42,10 +39,8 @@ from rapidata.rapidata_client.signal.rapidata_signal_manager import (
 from rapidata.rapidata_client.billing.rapidata_billing_manager import (
     RapidataBillingManager,
 )
-from rapidata.rapidata_client.api.rapidata_api_client import (
-    optional_api_call,
-    mark_sdk_outdated,
-)
+from rapidata.rapidata_client.api.rapidata_api_client import optional_api_call
+from rapidata.rapidata_client._version_check import check_for_update
 
 
 # Cache userinfo process-wide so request bursts that spin up many short-lived
@@ -155,7 +150,7 @@ class RapidataClient:
 
         with tracer.start_as_current_span("RapidataClient.__init__"):
             logger.debug("Checking version")
-            self._check_version()
+            check_for_update()
 
             logger.debug("Initializing OpenAPIService")
             self._openapi_service = OpenAPIService(
@@ -368,29 +363,6 @@ class RapidataClient:
 
                 self._apply_userinfo(result)
 
-    def _check_version(self):
-        with optional_api_call("version check"):
-            response = requests.get(
-                "https://api.github.com/repos/RapidataAI/rapidata-python-sdk/releases/latest",
-                headers={"Accept": "application/vnd.github.v3+json"},
-                timeout=1,
-            )
-            if response.status_code == 200:
-                latest_version = response.json()["tag_name"].lstrip("v")
-                if version.parse(latest_version) > version.parse(__version__):
-                    mark_sdk_outdated(
-                        current_version=__version__,
-                        latest_version=latest_version,
-                    )
-                    managed_print(
-                        f"""A new version of the Rapidata SDK is available: {latest_version}
-Your current version is: {__version__}"""
-                    )
-                else:
-                    logger.debug(
-                        "Current version is up to date. Version: %s", __version__
-                    )
-
     def __str__(self) -> str:
         return f"RapidataClient(environment={self._openapi_service.environment})"
 
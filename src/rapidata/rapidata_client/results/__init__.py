@@ -1,3 +1,4 @@
 from .rapidata_results import RapidataResults
+from .rapidata_results_file import RapidataResultsFile
 
-__all__ = ["RapidataResults"]
+__all__ = ["RapidataResults", "RapidataResultsFile"]
@@ -0,0 +1,220 @@
+"""Incremental reading of one large array inside a JSON document.
+
+A job's results file is one JSON object whose ``results`` array holds a row
+per datapoint, each with its ``detailedResults``. ``iter_array`` reads the
+object chunk by chunk and decodes one array item at a time, so the memory used
+is that of the read buffer plus one row.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import IO, Any, Iterator
+
+_CHUNK_SIZE = 1 << 20
+_WHITESPACE = " \t\r\n"
+_NUMBER_START = "-0123456789"
+# What can follow a number's prefix and still belong to it ("1" of "1.5e3").
+_NUMBER_REST = re.compile(r"[0-9.eE+-]*")
+# ``raw_decode`` parses a value out of the buffer at C speed and reports where
+# it ended; a value cut off by the end of the buffer fails and is retried once
+# more has been read.
+_DECODER = json.JSONDecoder()
+# Skipping a value only needs its extent: outside strings, quotes and
+# brackets; inside them, the closing quote and escapes.
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class _Reader:
+    """A text buffer over a binary file that reads JSON values as more arrives."""
+
+    def __init__(self, fp: IO[bytes], chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, keep_from: int, size: int = 0) -> bool:
+        """Read at least ``size`` more bytes, discarding the buffer before ``keep_from``.
+
+        Returns False at end of file. ``self._pos`` is moved along with the
+        buffer; other positions must be shifted by ``keep_from`` by the caller.
+        """
+        if self._eof:
+            return False
+        data = self._fp.read(max(self._chunk_size, size))
+        self._eof = not data
+        self._buffer = self._buffer[keep_from:] + self._decoder.decode(
+            data, final=self._eof
+        )
+        self._pos -= keep_from
+        return not self._eof
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buffer):
+                return buffer[self._pos]
+            if not self._fill(self._pos):
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON document, found {found!r}")
+        self._pos += 1
+
+    def take_value(self) -> Any:
+        """Consume and decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Most likely cut off by the end of the buffer. Reading as much
+                # again as is buffered keeps retries of large values linear.
+                if not self._fill(self._pos, len(self._buffer) - self._pos):
+                    raise
+                continue
+            if (
+                self._buffer[self._pos] in _NUMBER_START
+                and _NUMBER_REST.fullmatch(self._buffer, end)
+                and self._fill(self._pos)
+            ):
+                continue  # the number may go on in the next chunk
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Consume the next JSON value without decoding or keeping it."""
+        if self.peek() not in "[{":
+            self.take_value()
+            return
+
+        depth = 0
+        position = self._pos
+        while True:
+            match = _STRUCTURAL.search(self._buffer, position)
+            if match is None:
+                position = self._drop_before(len(self._buffer))
+                continue
+            char = match.group()
+            position = match.end()
+            if char == '"':
+                position = self._skip_string(position)
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._pos = position
+                    return
+
+    def _skip_string(self, position: int) -> int:
+        """Return the offset just past the string whose body starts at ``position``."""
+        while True:
+            match = _STRING_SPECIAL.search(self._buffer, position)
+            if match is None:
+                position = self._drop_before(len(self._buffer))
+            elif match.group() == '"':
+                return match.end()
+            elif match.start() + 1 < len(self._buffer):
+                position = match.start() + 2  # skip the escaped character
+            else:
+                position = self._drop_before(match.start())
+
+    def _drop_before(self, position: int) -> int:
+        """Read more while skipping, dropping what was already scanned.
+
+        Returns ``position`` in the new buffer.
+        """
+        if not self._fill(position):
+            raise ValueError("Unexpected end of JSON document")
+        return 0
+
+
+def _iter_members(reader: _Reader) -> Iterator[str]:
+    """Yield the member names of a JSON object, each with ``reader`` at its value.
+
+    The caller must consume the value before asking for the next name.
+    """
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+    while True:
+        name = reader.take_value()
+        reader.expect(":")
+        yield name
+        if reader.peek() == "}":
+            reader.expect("}")
+            return
+        reader.expect(",")
+
+
+def _iter_items(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        yield reader.take_value()
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+        reader.expect(",")
+
+
+def iter_array(
+    fp: IO[bytes],
+    key: str,
+    members: dict[str, Any] | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Yield the items of the array under the top-level ``key`` one at a time.
+
+    Args:
+        fp: A binary file positioned at the start of a JSON object.
+        key: The member holding the array to iterate.
+        members: If given, the object's other members are parsed into it as
+            they are passed; members after the array are only added once the
+            iteration is exhausted. Otherwise they are skipped unparsed.
+        chunk_size: How many bytes to read from ``fp`` at a time.
+
+    Raises:
+        ValueError: If the document is not a JSON object, or ``key`` does not
+            hold an array.
+    """
+    reader = _Reader(fp, chunk_size)
+    for name in _iter_members(reader):
+        if name == key:
+            yield from _iter_items(reader)
+        elif members is not None:
+            members[name] = reader.take_value()
+        else:
+            reader.skip_value()
+
+
+def read_members(
+    fp: IO[bytes], skip: str, chunk_size: int = _CHUNK_SIZE
+) -> dict[str, Any]:
+    """Parse the top-level members of the JSON object in ``fp``, except ``skip``.
+
+    The ``skip`` member is passed over without being parsed or kept in memory.
+    """
+    reader = _Reader(fp, chunk_size)
+    members: dict[str, Any] = {}
+    for name in _iter_members(reader):
+        if name == skip:
+            reader.skip_value()
+        else:
+            members[name] = reader.take_value()
+    return members
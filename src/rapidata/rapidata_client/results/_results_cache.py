@@ -0,0 +1,89 @@
+"""On-disk cache of the results files of completed jobs.
+
+Enabled with ``rapidata_config.results.cacheResultsToDisk``. A job's results
+only change when it completes again, so entries are keyed by the job id and its
+``completed_at``: regenerating stale results yields a new completion time and
+thus a new key, and the job's older entries are dropped. The cache is an
+optimization only; when it cannot be read or written, results are downloaded
+as if it were disabled.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rapidata.rapidata_client.config import logger, rapidata_config
+
+if TYPE_CHECKING:
+    from diskcache import Cache
+
+_caches: dict[Path, Cache] = {}
+_size_limits: dict[Path, int] = {}
+_lock = threading.Lock()
+
+
+def _cache() -> Cache:
+    """The cache at the configured location, with the configured size limit."""
+    config = rapidata_config.results
+    location, size_limit = config.resultsCacheLocation, config.resultsCacheSizeLimit
+    with _lock:
+        cache = _caches.get(location)
+        if cache is not None and _size_limits[location] == size_limit:
+            return cache
+        if cache is not None:
+            # Opening the cache again stores the new size limit in its settings.
+            cache.close()
+        from diskcache import Cache
+
+        cache = Cache(
+            str(location),
+            size_limit=size_limit,
+            eviction_policy="least-recently-used",
+        )
+        cache.create_tag_index()
+        _caches[location] = cache
+        _size_limits[location] = size_limit
+        return cache
+
+
+def _key(job_id: str, completed_at: datetime) -> tuple[str, str]:
+    return job_id, completed_at.isoformat()
+
+
+def get(job_id: str, completed_at: datetime) -> bytes | None:
+    """The cached results file of a job's completion, or None if it is not cached."""
+    try:
+        results = _cache().get(_key(job_id, completed_at))
+    except Exception:
+        logger.debug("Could not read cached results of job '%s'", job_id, exc_info=True)
+        return None
+    return results if isinstance(results, bytes) else None
+
+
+def put(job_id: str, completed_at: datetime, results: bytes) -> None:
+    """Caches the results file of a job's completion, replacing older ones."""
+    if len(results) > rapidata_config.results.resultsCacheSizeLimit:
+        logger.debug(
+            "Results of job '%s' exceed the results cache size limit, not caching",
+            job_id,
+        )
+        return
+    try:
+        cache = _cache()
+        cache.evict(job_id)
+        cache.set(_key(job_id, completed_at), results, tag=job_id)
+    except Exception:
+        logger.debug("Could not cache results of job '%s'", job_id, exc_info=True)
+
+
+def invalidate(job_id: str) -> None:
+    """Drops every cached results file of a job."""
+    try:
+        _cache().evict(job_id)
+    except Exception:
+        logger.debug(
+            "Could not drop cached results of job '%s'", job_id, exc_info=True
+        )
@@ -1,10 +1,257 @@
-from typing import TYPE_CHECKING, Any
+from itertools import chain, repeat
+from typing import TYPE_CHECKING, Any, Sequence
 from rapidata.rapidata_client.config import managed_print
 import json
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
-    from pandas.core.indexes.base import Index
+    import polars as pl
+    import pyarrow as pa
+
+# What ``pd.DataFrame`` fills in for a key a row lacks. Compared by identity
+# to tell a missing key from a value.
+_MISSING = float("nan")
+_EMPTY: dict[str, Any] = {}
+
+
+class _Columns:
+    """
+    Table columns collected row by row.
+
+    A key a row lacks is filled with NaN, as ``pd.DataFrame`` does for a list
+    of dicts, but without building a dict per row. ``first_seen`` records
+    the row each key first appeared in and a rank ordering the keys first
+    seen in the same row, which is where ``pd.DataFrame`` would place its
+    column.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[str, list[Any]] = {}
+        self.first_seen: dict[str, tuple[int, int]] = {}
+        self.rows = 0
+
+    def add(self, row: Any, flatten: bool = False) -> None:
+        """Adds a row; with ``flatten`` nested dicts become ``parent_child`` columns.
+
+        A row that is not a dict adds a row of missing values.
+        """
+        if isinstance(row, dict):
+            self._add(row, "", flatten)
+        self.rows += 1
+
+    def _add(self, row: dict[str, Any], parent_key: str, flatten: bool) -> None:
+        values = self.values
+        rows = self.rows
+        for key, value in row.items():
+            if parent_key:
+                key = f"{parent_key}_{key}"
+            if flatten and isinstance(value, dict):
+                self._add(value, key, flatten)
+                continue
+            column = values.get(key)
+            if column is None:
+                self.first_seen[key] = (rows, len(values))
+                column = values[key] = [_MISSING] * rows
+            elif len(column) != rows:
+                if len(column) > rows:
+                    # Flattening produced the key twice; the last one wins.
+                    column[-1] = value
+                    continue
+                column.extend([_MISSING] * (rows - len(column)))
+            column.append(value)
+
+    def finish(self) -> dict[str, list[Any]]:
+        """Pads every column to the full number of rows and returns them by key."""
+        for column in self.values.values():
+            if len(column) < self.rows:
+                column.extend([_MISSING] * (self.rows - len(column)))
+        return self.values
+
+
+def _flatten_columns(records: list[Any]) -> _Columns:
+    """Flattens a list of nested dicts into ``parent_child`` columns.
+
+    Equivalent to adding every record to a ``_Columns`` with ``flatten``, but
+    reads each key of a nesting level for all records at once instead of
+    walking every record, which is what makes splitting a large job by its
+    detailed results fast. Falls back to the row-by-row walk when two keys
+    flatten to the same name, where only the walk knows which one wins.
+    """
+    columns = _Columns()
+    columns.rows = len(records)
+
+    def visit(level: list[Any], parent_key: str) -> bool:
+        if set(map(type, level)) != {dict}:
+            level = [record if isinstance(record, dict) else _EMPTY for record in level]
+        missing = repeat(_MISSING)
+        for key in dict.fromkeys(chain.from_iterable(level)):
+            name = f"{parent_key}_{key}" if parent_key else key
+            values = list(map(dict.get, level, repeat(key), missing))
+            if any(issubclass(kind, dict) for kind in set(map(type, values))):
+                # Dicts become subcolumns; any other values keep this column.
+                if not visit(values, name):
+                    return False
+                values = [
+                    _MISSING if isinstance(value, dict) else value for value in values
+                ]
+                if values.count(_MISSING) == len(values):
+                    continue
+            if name in columns.values:
+                return False
+            columns.values[name] = values
+        return True
+
+    if not visit(records, ""):
+        columns = _Columns()
+        for record in records:
+            columns.add(record, flatten=True)
+        return columns
+
+    # Place each column where a row-by-row walk would have: at its position
+    # in the first record that has it.
+    ranks: dict[int, dict[str, int]] = {}
+    for name, values in columns.values.items():
+        row = next(i for i, value in enumerate(values) if value is not _MISSING)
+        if row not in ranks:
+            flattened = _Columns()
+            flattened.add(records[row], flatten=True)
+            ranks[row] = {key: rank for rank, key in enumerate(flattened.values)}
+        columns.first_seen[name] = (row, ranks[row][name])
+    return columns
+
+
+def _object_array(values: "list[Any] | np.ndarray") -> "np.ndarray":
+    """A 1-d object array of ``values``, even when they are lists themselves."""
+    import numpy as np
+
+    if isinstance(values, np.ndarray):
+        return values
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Exporting results to Arrow needs pyarrow (pip install rapidata[arrow])."
+        ) from None
+    return pyarrow
+
+
+def _json_field(pa: Any, name: str) -> "pa.Field":
+    """A column stored as JSON text, for values that do not share a type."""
+    return pa.field(name, pa.string(), metadata={"encoding": "json"})
+
+
+def _arrow_column(
+    pa: Any, name: str, values: "list[Any] | np.ndarray"
+) -> tuple["pa.Field", "pa.Array"]:
+    """A column converted to Arrow once, with its type inferred from all of its values.
+
+    A column whose values do not share a type, such as a field that is a
+    number in some results and text in others, is stored as JSON text.
+    """
+    try:
+        array = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        field = _json_field(pa, name)
+        return field, _arrow_array(pa, values, field)
+    return pa.field(name, array.type), array
+
+
+def _arrow_field(
+    pa: Any, name: str, values: "list[Any] | np.ndarray", chunk_size: int
+) -> "pa.Field":
+    """The Arrow field of a column, typed one ``chunk_size`` slice at a time.
+
+    Each slice's type is inferred without converting its values, and the
+    types of all slices are unified, widening e.g. integers to floats. Slices
+    without a common type make it a JSON column.
+    """
+    try:
+        chunk_schemas = [
+            pa.schema(
+                [
+                    pa.field(
+                        name,
+                        pa.infer_type(
+                            values[start : start + chunk_size], from_pandas=True
+                        ),
+                    )
+                ]
+            )
+            for start in range(0, len(values), chunk_size)
+        ]
+        unified = pa.unify_schemas(chunk_schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _json_field(pa, name)
+    field = unified.field(name)
+    # Parquet cannot store a struct without fields, e.g. from ``{}`` values.
+    if _has_empty_struct(pa, field.type):
+        return _json_field(pa, name)
+    return field
+
+
+def _has_empty_struct(pa: Any, data_type: "pa.DataType") -> bool:
+    """Whether ``data_type`` is, or nests, a struct with no fields."""
+    if pa.types.is_struct(data_type):
+        return data_type.num_fields == 0 or any(
+            _has_empty_struct(pa, data_type.field(i).type)
+            for i in range(data_type.num_fields)
+        )
+    if pa.types.is_map(data_type):
+        return _has_empty_struct(pa, data_type.key_type) or _has_empty_struct(
+            pa, data_type.item_type
+        )
+    if (
+        pa.types.is_list(data_type)
+        or pa.types.is_large_list(data_type)
+        or pa.types.is_fixed_size_list(data_type)
+    ):
+        return _has_empty_struct(pa, data_type.value_type)
+    return False
+
+
+def _arrow_array(
+    pa: Any, values: "list[Any] | np.ndarray", field: "pa.Field"
+) -> "pa.Array":
+    """Converts a column, or a slice of one, to an array of ``field``'s type.
+
+    Missing values become nulls.
+    """
+    if field.metadata and field.metadata.get(b"encoding") == b"json":
+        values = [
+            None if value is None or value is _MISSING else json.dumps(value)
+            for value in values
+        ]
+    return pa.array(values, type=field.type, from_pandas=True)
+
+
+def _write_row_groups(
+    pa: Any,
+    path: str,
+    columns: Sequence["list[Any] | np.ndarray"],
+    fields: list["pa.Field"],
+    rows: int,
+    row_group_size: int,
+) -> int | None:
+    """Write ``columns`` as Parquet, or return the index of one that doesn't fit its field."""
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(fields)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, rows, row_group_size):
+            stop = start + row_group_size
+            arrays = []
+            for index, (column, field) in enumerate(zip(columns, fields)):
+                try:
+                    arrays.append(_arrow_array(pa, column[start:stop], field))
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    return index
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+    return None
 
 
 class RapidataResults(dict):
@@ -37,11 +284,139 @@ class RapidataResults(dict):
             ValueError: If split_details is True but no detailed results are found
         """
         import pandas as pd
-        from pandas.core.indexes.base import Index
 
         if "results" not in self or not self["results"]:
             return pd.DataFrame()
 
+        names, columns, rows = self._table_columns(split_details)
+        # Object arrays are quicker for pandas to take in than lists;
+        # ``infer_objects`` then gives each column the dtype it would get from
+        # a list of rows.
+        return pd.DataFrame(
+            dict(zip(names, map(_object_array, columns))),
+            index=pd.RangeIndex(rows),
+        ).infer_objects()
+
+    def to_arrow(self, split_details: bool = False) -> "pa.Table":
+        """
+        Converts the results to a pyarrow Table.
+
+        Has the columns of ``to_pandas`` (including the ``A_``/``B_`` and
+        per-asset columns of Compare and Ranking results), built straight from
+        the results without going through pandas. Each column is typed from
+        its values: missing values are nulls rather than NaN, so integer
+        columns stay integers, and nested lists and dicts become list and
+        struct columns. A column whose values do not share a type is stored as
+        JSON text, marked with ``{"encoding": "json"}`` field metadata.
+
+        Needs pyarrow (``pip install rapidata[arrow]``).
+
+        Args:
+            split_details: If True, splits each datapoint by its detailed results,
+                          creating a row for each response with global metrics copied.
+
+        Returns:
+            pa.Table: A Table containing the processed results
+
+        Raises:
+            ValueError: If split_details is True but no detailed results are found
+        """
+        pa = _import_pyarrow()
+
+        names, columns, _ = self._export_columns(split_details)
+        fields, arrays = [], []
+        for name, column in zip(names, columns):
+            field, array = _arrow_column(pa, name, column)
+            fields.append(field)
+            arrays.append(array)
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    def to_parquet(
+        self,
+        path: str = "./results.parquet",
+        split_details: bool = False,
+        row_group_size: int = 100_000,
+    ) -> None:
+        """
+        Saves the results to a Parquet file.
+
+        Writes the table of ``to_arrow`` one row group at a time, so only one
+        group's worth of Arrow data is held in memory besides the results
+        themselves. Column types are inferred group by group, without
+        converting the values, and unified before the first group is written.
+
+        Needs pyarrow (``pip install rapidata[arrow]``).
+
+        Args:
+            path: The file path where the Parquet file should be saved. Defaults to "./results.parquet".
+            split_details: If True, splits each datapoint by its detailed results,
+                          creating a row for each response with global metrics copied.
+            row_group_size: The number of rows converted and written at a time.
+
+        Raises:
+            ValueError: If split_details is True but no detailed results are found
+        """
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+        pa = _import_pyarrow()
+
+        names, columns, rows = self._export_columns(split_details)
+        # The types are settled before writing, so that every row group is
+        # written with the same schema.
+        fields = [
+            _arrow_field(pa, name, column, row_group_size)
+            for name, column in zip(names, columns)
+        ]
+        # Inference is more lenient than conversion (it types ["a", 1] as
+        # strings), so a column can still fail to convert; it is then stored
+        # as JSON and the file written again.
+        while (
+            mixed := _write_row_groups(pa, path, columns, fields, rows, row_group_size)
+        ) is not None:
+            fields[mixed] = _json_field(pa, names[mixed])
+
+    def to_polars(self, split_details: bool = False) -> "pl.DataFrame":
+        """
+        Converts the results to a polars DataFrame.
+
+        Has the columns and types of ``to_arrow``, which it is built from.
+
+        Needs polars and pyarrow (``pip install rapidata[polars]``).
+
+        Args:
+            split_details: If True, splits each datapoint by its detailed results,
+                          creating a row for each response with global metrics copied.
+
+        Returns:
+            pl.DataFrame: A DataFrame containing the processed results
+
+        Raises:
+            ValueError: If split_details is True but no detailed results are found
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "Exporting results to polars needs polars (pip install rapidata[polars])."
+            ) from None
+
+        return pl.from_arrow(self.to_arrow(split_details=split_details))  # type: ignore[return-value]
+
+    def _export_columns(
+        self, split_details: bool
+    ) -> tuple[list[str], Sequence["list[Any] | np.ndarray"], int]:
+        """``_table_columns``, or no columns at all when there are no results."""
+        if "results" not in self or not self["results"]:
+            return [], [], 0
+        return self._table_columns(split_details)
+
+    def _table_columns(
+        self, split_details: bool
+    ) -> tuple[list[str], Sequence["list[Any] | np.ndarray"], int]:
+        """Collects the tabular form of the results one column at a time.
+
+        Returns the column names, the columns' values and the number of rows.
+        """
         task_type = self._task_type()
         if task_type is None:
             managed_print(
@@ -55,29 +430,12 @@ class RapidataResults(dict):
         # compare-specific path even when split_details=True so we keep the
         # A_/B_ (or per-asset) column splitting.
         if task_type in ("Compare", "Ranking"):
-            return self._compare_to_pandas(split_details=split_details)
+            return self._compare_columns(split_details=split_details)
 
         if split_details:
-            return self._to_pandas_with_detailed_results()
-
-        # Get the structure from first item
-        first_item = self["results"][0]
-        columns = []
-        path_map = {}  # Maps flattened column names to paths to reach the values
+            return self._detailed_results_columns()
 
-        # Build the column structure once
-        self._build_column_structure(first_item, columns, path_map)
-
-        # Extract data using the known structure
-        data = []
-        for item in self["results"]:
-            row = []
-            for path in path_map.values():
-                value = self._get_value_from_path(item, path)
-                row.append(value)
-            data.append(row)
-
-        return pd.DataFrame(data, columns=Index(columns))
+        return self._flat_columns()
 
     def _task_type(self) -> str | None:
         """Return the task type from ``info``, tolerant of the field rename.
@@ -104,33 +462,101 @@ class RapidataResults(dict):
             first_result["detailedResults"], list
         )
 
-    def _to_pandas_with_detailed_results(self) -> "pd.DataFrame":
+    def _flat_columns(self) -> tuple[list[str], list[list[Any]], int]:
         """
-        Converts results to a pandas DataFrame with detailed results split into separate rows.
-
-        Returns:
-            pd.DataFrame: A DataFrame with one row per detailed result
+        One row per result, with the columns laid out after the first result's
+        nested structure and missing values as ``None``.
         """
-        import pandas as pd
-
-        rows = []
+        results = self["results"]
+        columns: list[str] = []
+        path_map: dict[str, list[str]] = {}
+        self._build_column_structure(results[0], columns, path_map)
+
+        # Each nesting level is looked up once for all rows and shared by the
+        # columns below it.
+        levels: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        values = []
+        for path in path_map.values():
+            level = results
+            for depth, key in enumerate(path[:-1], start=1):
+                prefix = tuple(path[:depth])
+                cached = levels.get(prefix)
+                if cached is None:
+                    cached = levels[prefix] = [
+                        value if isinstance(value := d.get(key), dict) else {}
+                        for d in level
+                    ]
+                level = cached
+            last = path[-1]
+            values.append([d.get(last) for d in level])
+
+        return list(path_map), values, len(results)
+
+    def _detailed_results_columns(self) -> tuple[list[str], list["np.ndarray"], int]:
+        """
+        One row per detailed result, with the flattened response next to its
+        result's other fields.
+        """
+        base = _Columns()
+        records: list[Any] = []
+        counts = []
 
         for result in self["results"]:
-            # Get all non-detailed results fields
-            base_data = {k: v for k, v in result.items() if k != "detailedResults"}
+            detailed_results = result.get("detailedResults") or []
+            if not detailed_results:
+                continue
+            base.add({k: v for k, v in result.items() if k != "detailedResults"})
+            records.extend(detailed_results)
+            counts.append(len(detailed_results))
 
-            # Process each detailed result
-            for detailed_result in result["detailedResults"]:
-                row = base_data.copy()  # Copy base data for each detailed result
+        return self._explode(base, _flatten_columns(records), counts)
 
-                # Add flattened detailed result data
-                flattened = self._flatten_dict(detailed_result)
-                for key, value in flattened.items():
-                    row[key] = value
+    @staticmethod
+    def _explode(
+        base: _Columns, details: _Columns, counts: list[int]
+    ) -> tuple[list[str], list["np.ndarray"], int]:
+        """Joins per-result columns with per-response columns.
+
+        Result ``i`` spans the next ``counts[i]`` rows of ``details``; its base
+        values are repeated over them by index rather than copied into a row
+        dict per response. A key present in both takes the response's value.
+        Columns are ordered as ``pd.DataFrame`` orders the keys of the rows
+        ``{**base_row, **response}``.
+        """
+        import numpy as np
+
+        owner = np.repeat(np.arange(len(counts)), counts)
+        starts = np.cumsum([0, *counts[:-1]]).tolist()
+        base_values = base.finish()
+        detail_values = details.finish()
 
-                rows.append(row)
+        first_seen: dict[str, tuple[int, int, int]] = {}
+        for name, (row, rank) in base.first_seen.items():
+            first_seen[name] = (starts[row], 0, rank)
+        for name, (row, rank) in details.first_seen.items():
+            first_seen[name] = min(first_seen.get(name, (row, 1, rank)), (row, 1, rank))
+        names = sorted(first_seen, key=first_seen.__getitem__)
 
-        return pd.DataFrame(rows)
+        columns = []
+        for name in names:
+            column = base_values.get(name)
+            detail = detail_values.get(name)
+            if column is None:
+                # Every name comes from base or details, so detail is set here.
+                assert detail is not None
+                column = _object_array(detail)
+            else:
+                column = _object_array(column)[owner]
+                if detail is not None:
+                    detail = _object_array(detail)
+                    present = np.fromiter(
+                        (value is not _MISSING for value in detail),
+                        dtype=bool,
+                        count=len(detail),
+                    )
+                    column[present] = detail[present]
+            columns.append(column)
+        return names, columns, len(owner)
 
     def _flatten_dict(self, d: dict[str, Any], parent_key: str = "") -> dict[str, Any]:
         """
@@ -188,21 +614,6 @@ class RapidataResults(dict):
                 columns.append(new_key)
                 path_map[new_key] = new_path
 
-    def _get_value_from_path(self, d: dict[str, Any], path: list[str]) -> Any:
-        """
-        Retrieves a value from a nested dictionary using a path list.
-
-        Args:
-            d: The dictionary to retrieve the value from
-            path: List of keys forming the path to the desired value
-
-        Returns:
-            The value at the specified path, or None if the path doesn't exist
-        """
-        for key in path[:-1]:
-            d = d.get(key, {})
-        return d.get(path[-1])
-
     @staticmethod
     def _extract_compare_assets(result: dict[str, Any]) -> list[str]:
         """Return the ordered list of asset identifiers for a compare/ranking row.
@@ -224,8 +635,10 @@ class RapidataResults(dict):
 
         return []
 
-    def _compare_to_pandas(self, split_details: bool = False) -> "pd.DataFrame":
-        """Convert Compare/Ranking results to a pandas DataFrame.
+    def _compare_columns(
+        self, split_details: bool = False
+    ) -> tuple[list[str], list["np.ndarray"], int]:
+        """Collect Compare/Ranking results as columns.
 
         For Compare (exactly 2 assets), produces ``A_<metric>`` / ``B_<metric>``
         columns (plus ``Both_<metric>`` / ``Neither_<metric>`` when those
@@ -236,70 +649,74 @@ class RapidataResults(dict):
         ``detailedResults`` entry, with the asset/metric columns copied across
         and the per-response fields flattened in.
         """
-        import pandas as pd
+        base = _Columns()
+        records: list[Any] = []
+        counts = []
 
-        if not self.get("results"):
-            return pd.DataFrame()
-
-        rows = []
         for result in self["results"]:
             assets = self._extract_compare_assets(result)
             if len(assets) < 2:
                 continue
 
-            is_compare = len(assets) == 2
-
-            # Non-comparative fields. Skip dicts (asset metrics, handled below)
-            # and lists (e.g. detailedResults — handled separately when
-            # split_details=True, otherwise omitted from the tabular export).
-            base_row: dict[str, Any] = {
-                key: value
-                for key, value in result.items()
-                if not isinstance(value, (dict, list))
-            }
-
-            if is_compare:
-                base_row["assetA"] = assets[0]
-                base_row["assetB"] = assets[1]
-            else:
-                for i, asset in enumerate(assets):
-                    base_row[f"asset_{i + 1}"] = asset
-
-            # Per-metric asset columns. Dicts keyed by asset names are
-            # treated as comparative metrics and split into A_/B_ (compare) or
-            # per-asset (ranking) columns. Other dicts (e.g. ``privateMetadata``
-            # whose keys are arbitrary user data, not asset identifiers) are
-            # flattened with their field name as the prefix so their values
-            # still make it into the dataframe.
-            asset_set = set(assets)
-            for key, values in result.items():
-                if not isinstance(values, dict) or not values:
-                    continue
-                if asset_set.intersection(values.keys()):
-                    if is_compare:
-                        base_row[f"A_{key}"] = values.get(assets[0])
-                        base_row[f"B_{key}"] = values.get(assets[1])
-                        if "Both" in values:
-                            base_row[f"Both_{key}"] = values["Both"]
-                        if "Neither" in values:
-                            base_row[f"Neither_{key}"] = values["Neither"]
-                    else:
-                        for asset in assets:
-                            base_row[f"{asset}_{key}"] = values.get(asset)
-                else:
-                    base_row.update(self._flatten_dict(values, parent_key=key))
+            base.add(self._compare_base_row(result, assets))
 
             detailed = result.get("detailedResults")
             if split_details and isinstance(detailed, list) and detailed:
-                for detailed_result in detailed:
-                    row = base_row.copy()
-                    if isinstance(detailed_result, dict):
-                        row.update(self._flatten_dict(detailed_result))
-                    rows.append(row)
+                records.extend(detailed)
+                counts.append(len(detailed))
+            else:
+                records.append(None)
+                counts.append(1)
+
+        return self._explode(base, _flatten_columns(records), counts)
+
+    def _compare_base_row(
+        self, result: dict[str, Any], assets: list[str]
+    ) -> dict[str, Any]:
+        """The columns of one Compare/Ranking result shared by all of its responses."""
+        is_compare = len(assets) == 2
+
+        # Non-comparative fields. Skip dicts (asset metrics, handled below)
+        # and lists (e.g. detailedResults — handled separately when
+        # split_details=True, otherwise omitted from the tabular export).
+        base_row: dict[str, Any] = {
+            key: value
+            for key, value in result.items()
+            if not isinstance(value, (dict, list))
+        }
+
+        if is_compare:
+            base_row["assetA"] = assets[0]
+            base_row["assetB"] = assets[1]
+        else:
+            for i, asset in enumerate(assets):
+                base_row[f"asset_{i + 1}"] = asset
+
+        # Per-metric asset columns. Dicts keyed by asset names are
+        # treated as comparative metrics and split into A_/B_ (compare) or
+        # per-asset (ranking) columns. Other dicts (e.g. ``privateMetadata``
+        # whose keys are arbitrary user data, not asset identifiers) are
+        # flattened with their field name as the prefix so their values
+        # still make it into the dataframe.
+        asset_set = set(assets)
+        for key, values in result.items():
+            if not isinstance(values, dict) or not values:
+                continue
+            if asset_set.intersection(values.keys()):
+                if is_compare:
+                    base_row[f"A_{key}"] = values.get(assets[0])
+                    base_row[f"B_{key}"] = values.get(assets[1])
+                    if "Both" in values:
+                        base_row[f"Both_{key}"] = values["Both"]
+                    if "Neither" in values:
+                        base_row[f"Neither_{key}"] = values["Neither"]
+                else:
+                    for asset in assets:
+                        base_row[f"{asset}_{key}"] = values.get(asset)
             else:
-                rows.append(base_row)
+                base_row.update(self._flatten_dict(values, parent_key=key))
 
-        return pd.DataFrame(rows)
+        return base_row
 
     def to_json(self, path: str = "./results.json") -> None:
         """
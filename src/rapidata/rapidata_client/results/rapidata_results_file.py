@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+from rapidata.api_client.rest import json_loads
+from rapidata.rapidata_client.results._json_stream import iter_array, read_members
+
+if TYPE_CHECKING:
+    from rapidata.rapidata_client.results.rapidata_results import RapidataResults
+
+
+class RapidataResultsFile:
+    """
+    Job results downloaded to a file, read one result at a time.
+
+    Returned by ``RapidataJob.download_results``. Iterating yields the entries
+    of the file's ``results`` array as dictionaries, parsed one at a time, so
+    memory stays proportional to a single result however large the job is.
+
+    Args:
+        path: The path of the results file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._info: dict[str, Any] | None = None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        with open(self.path, "rb") as fp:
+            yield from iter_array(fp, "results")
+
+    @property
+    def info(self) -> dict[str, Any]:
+        """The file's ``info`` section (task type, name, instruction, ...)."""
+        info = self._info
+        if info is None:
+            with open(self.path, "rb") as fp:
+                info = read_members(fp, skip="results").get("info", {})
+            self._info = info
+        return info
+
+    def load(self) -> RapidataResults:
+        """Reads the whole file into a ``RapidataResults``, e.g. for ``to_pandas``."""
+        from rapidata.rapidata_client.results.rapidata_results import (
+            RapidataResults,
+        )
+
+        return RapidataResults(json_loads(self.path.read_bytes()))
+
+    def __str__(self) -> str:
+        return f"RapidataResultsFile(path='{self.path}')"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -28,7 +28,6 @@ from rapidata.rapidata_client.config import (
     rapidata_config,
     tracer,
 )
-from tqdm.auto import tqdm
 from rapidata.rapidata_client.validation.rapids.rapids import Rapid
 
 if TYPE_CHECKING:
@@ -608,6 +607,8 @@ class ValidationSetManager:
             logger.debug("Adding rapids to validation set")
             failed_rapids = []
 
+            from tqdm.auto import tqdm
+
             progress_bar = tqdm(
                 total=len(rapids),
                 desc="Uploading validation tasks",
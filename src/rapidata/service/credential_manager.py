@@ -8,7 +8,6 @@ from pathlib import Path
 from socket import gethostname
 from typing import Dict, List, Optional, Tuple
 
-import requests
 from colorama import Fore
 from pydantic import BaseModel
 from rapidata.rapidata_client.config import logger, managed_print
@@ -175,6 +174,8 @@ class CredentialManager:
 
     def _get_bridge_tokens(self) -> Optional[BridgeToken]:
         """Get bridge tokens from the identity endpoint."""
+        import requests  # only needed for the interactive browser login
+
         logger.debug("Getting bridge tokens")
         try:
             bridge_endpoint = (
@@ -210,6 +211,8 @@ class CredentialManager:
 
     def _poll_read_key(self, read_key: str) -> Optional[str]:
         """Poll the read key endpoint until we get an access token."""
+        import requests
+
         read_endpoint = f"{self.endpoint}/identity/bridge-token"
         start_time = time.time()
 
@@ -242,6 +245,8 @@ class CredentialManager:
 
     def _create_client(self, access_token: str) -> Optional[Tuple[str, str, str]]:
         """Create a new client using the access token."""
+        import requests
+
         try:
             # set the display name to the hostname
             display_name = f"{gethostname()} - Python API Client"
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 from rapidata.api_client.configuration import Configuration
 from rapidata.service.credential_manager import CredentialManager
 from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
-from rapidata.rapidata_client.config import logger, managed_print
+from rapidata.rapidata_client.config import logger, managed_print, rapidata_config
 from authlib.integrations.httpx_client import OAuthError
 
 if TYPE_CHECKING:
@@ -59,6 +59,8 @@ class OpenAPIService:
 
         logger.debug("Initializing RapidataApiClient")
         client_configuration = Configuration(host=endpoint, ssl_ca_cert=cert_path)
+        client_configuration.http2 = rapidata_config.upload.http2
+        client_configuration.bulk_pool_maxsize = rapidata_config.upload.bulkPoolSize
         logger.debug("Client configuration: %s", client_configuration)
         self.api_client = RapidataApiClient(
             configuration=client_configuration,
@@ -144,6 +146,10 @@ class OpenAPIService:
         self.credential_manager.reset_credentials()
         logger.info("Credentials reset in OpenAPIService")
 
+    def close(self) -> None:
+        """Close the connection pools kept for bulk uploads."""
+        self.api_client.close()
+
     @property
     def asset(self) -> AssetService:
         if self._asset is None:
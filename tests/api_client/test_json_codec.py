@@ -0,0 +1,107 @@
+"""Tests for the JSON codec used to send request bodies and parse responses.
+
+Results files, paged listings and batch statuses are large enough for JSON
+handling to show up in profiles, so orjson is used when it is installed and
+responses are parsed straight from their bytes. Either codec has to give the
+same models, and error responses must still carry their body as text.
+"""
+
+from __future__ import annotations
+
+import math
+
+import httpx
+import pytest
+
+from rapidata.api_client import rest
+from rapidata.api_client.api_client import ApiClient
+from rapidata.api_client.exceptions import ApiException
+from rapidata.api_client.models.batch_upload_url_status import BatchUploadUrlStatus
+from rapidata.api_client.models.get_batch_upload_result_endpoint_output import (
+    GetBatchUploadResultEndpointOutput,
+)
+
+_BODY = {
+    "batchUploadId": "batch-1",
+    "status": "Completed",
+    "totalCount": 2,
+    "completedCount": 1,
+    "failedCount": 1,
+    "items": [
+        {"url": "https://example.com/ä.jpg", "fileName": "a.jpg", "status": "Completed"},
+        {"url": "https://example.com/b.jpg", "status": "Failed", "errorMessage": "404"},
+    ],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(rest, "orjson", None)
+    return request.param
+
+
+def _response(status: int, content: bytes, content_type: str) -> rest.RESTResponse:
+    response = rest.RESTResponse(
+        httpx.Response(status, content=content, headers={"Content-Type": content_type})
+    )
+    response.read()
+    return response
+
+
+@pytest.mark.parametrize(
+    "content_type", ["application/json", "application/json; charset=utf-8"]
+)
+def test_response_is_parsed_from_bytes(codec, content_type):
+    body = rest.json_dumps(_BODY)
+    result = ApiClient().response_deserialize(
+        _response(200, body, content_type),
+        {"200": "GetBatchUploadResultEndpointOutput"},
+    ).data
+
+    assert isinstance(result, GetBatchUploadResultEndpointOutput)
+    assert result.items[0].url == "https://example.com/ä.jpg"
+    assert result.items[1].status == BatchUploadUrlStatus.FAILED
+
+
+def test_error_body_is_kept_as_text(codec):
+    with pytest.raises(ApiException) as raised:
+        ApiClient().response_deserialize(
+            _response(400, b'{"message": "bad"}', "application/json"),
+            {"400": "object"},
+        )
+    assert raised.value.body == '{"message": "bad"}'
+
+
+def test_request_body_roundtrips(codec):
+    body = {"a": [1, 2.5, None, True], "text": "ä", 1: "non-string key"}
+    encoded = rest.json_dumps(body)
+
+    assert isinstance(encoded, bytes)
+    assert rest.json_loads(encoded) == {"a": [1, 2.5, None, True], "text": "ä", "1": "non-string key"}
+
+
+def test_values_orjson_rejects_fall_back_to_the_standard_library(codec):
+    assert rest.json_loads(rest.json_dumps({"big": 2**70})) == {"big": 2**70}
+
+
+
+@pytest.mark.parametrize(
+    "document", [b'{"big": 123456789012345678901234567}', '{"big": 123456789012345678901234567}']
+)
+def test_integers_beyond_64_bits_stay_exact(codec, document):
+    assert rest.json_loads(document)["big"] == 123456789012345678901234567
+
+
+def test_nan_and_infinity_are_decoded(codec):
+    decoded = rest.json_loads(b'{"score": NaN, "max": Infinity}')
+
+    assert math.isnan(decoded["score"])
+    assert decoded["max"] == math.inf
+
+
+def test_malformed_documents_still_raise(codec):
+    with pytest.raises(ValueError):
+        rest.json_loads(b'{"a": [1')
@@ -0,0 +1,55 @@
+"""Tests for the field-access guard of ``LazyValidatedModel``.
+
+Every field read of every generated model used to pass through a Python-level
+guard, which made loops over large result or prompt pages many times slower
+than plain attribute access. Models that always validated must read fields
+natively, while a field that failed validation must still raise when read.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import pytest
+from pydantic import StrictInt, StrictStr, ValidationError
+
+from rapidata.api_client.lazy_model import LazyValidatedModel
+
+
+def _make_model() -> type:
+    class Row(LazyValidatedModel):
+        name: StrictStr
+        count: StrictInt
+
+        @classmethod
+        def from_dict(cls, obj: Dict[str, Any]) -> "Row":
+            try:
+                return cls.model_validate(obj)
+            except ValidationError as error:
+                return cls._lazy_construct(obj, error)
+
+    return Row
+
+
+def test_clean_models_read_fields_without_a_guard():
+    row_type = _make_model()
+    row = row_type.from_dict({"name": "a", "count": 1})
+
+    assert (row.name, row.count) == ("a", 1)
+    assert row_type.__getattribute__ is object.__getattribute__
+    assert LazyValidatedModel.__getattribute__ is object.__getattribute__
+
+
+def test_failed_field_raises_only_when_read():
+    row_type = _make_model()
+    clean = row_type.from_dict({"name": "a", "count": 1})
+    broken = row_type.from_dict({"name": "b", "count": "many"})
+
+    assert broken.name == "b"
+    with pytest.raises(TypeError, match="Field 'count' on Row"):
+        broken.count
+    assert clean.count == 1
+    assert type(row_type.__lazy_error_fields__) is frozenset
+    assert row_type.__lazy_error_fields__ == {"count"}
+    # Other models keep native attribute access.
+    assert _make_model().__getattribute__ is object.__getattribute__
@@ -0,0 +1,48 @@
+"""Tests for the static model index.
+
+``rapidata.api_client.models`` used to read and regex-scan all of its ~1,800
+model files on import to learn which class lives where, a cost paid by every
+CLI invocation and every worker process. The index is now written at codegen
+time and has to agree with the files on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import rapidata.api_client.models as models
+
+
+def _in_fresh_interpreter(code: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_index_lists_every_model_file():
+    discovered = models._discover_models()
+    assert discovered.keys() == models._MODEL_IMPORTS.keys()
+    mismatched = {
+        name
+        for name, module in models._MODEL_IMPORTS.items()
+        if discovered[name] != module
+    }
+    # Only a class defined in two files may resolve differently.
+    assert mismatched <= {"OutputDatapoint"}
+
+
+def test_models_resolve_without_scanning_files():
+    result = _in_fresh_interpreter(
+        "import json, rapidata.api_client.models as m\n"
+        "cls = m.IAssetInput\n"
+        "print(json.dumps({'name': cls.__name__, 'scanned': m._DISCOVERED is not None}))"
+    )
+    assert result == {"name": "IAssetInput", "scanned": False}
+
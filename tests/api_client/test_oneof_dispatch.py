@@ -0,0 +1,69 @@
+"""Tests for the `_t` discriminator fast path of generated oneOf models.
+
+Trial-deserializing a payload into every variant of a union, at every level
+of nesting, made large listings slow to parse. Reading `_t` must pick the same
+variant trial matching would, without touching the others, and payloads that
+`_t` does not settle must still go through trial matching.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from rapidata.api_client import oneof_dispatch
+from rapidata.api_client.models.i_asset import IAsset
+from rapidata.api_client.models.i_asset_file_asset import IAssetFileAsset
+from rapidata.api_client.models.i_asset_multi_asset import IAssetMultiAsset
+from rapidata.api_client.models.i_asset_text_asset import IAssetTextAsset
+from rapidata.api_client.oneof_dispatch import discriminated_variant
+
+_MULTI_ASSET = {
+    "_t": "MultiAsset",
+    "identifier": "pair",
+    "metadata": {},
+    "assets": [
+        {
+            "_t": "FileAsset",
+            "fileName": "a.jpg",
+            "identifier": "a",
+            "metadata": {"size": {"_t": "ImageDimensionMetadata", "width": 4, "height": 3}},
+        },
+        {"_t": "TextAsset", "text": "hello", "identifier": "b", "metadata": {}},
+    ],
+}
+
+
+def test_variant_is_looked_up_by_discriminator():
+    assert discriminated_variant(IAsset, {"_t": "FileAsset"}) is IAssetFileAsset
+    assert discriminated_variant(IAsset, {"_t": "MultiAsset"}) is IAssetMultiAsset
+
+
+@pytest.mark.parametrize("obj", [{"_t": "Unknown"}, {"fileName": "a.jpg"}, {"_t": 1}, "text"])
+def test_unsettled_payloads_fall_back_to_trial_matching(obj):
+    assert discriminated_variant(IAsset, obj) is None
+
+
+def test_only_the_selected_variant_is_deserialized():
+    with patch.object(
+        IAssetTextAsset, "from_json", side_effect=AssertionError("trial matched")
+    ):
+        asset = IAsset.from_dict({"_t": "TextAsset", "text": "hi", "identifier": "x", "metadata": {}})
+    assert isinstance(asset.actual_instance, IAssetTextAsset)
+
+
+def test_dispatch_matches_trial_deserialization():
+    dispatched = IAsset.from_dict(_MULTI_ASSET)
+    with patch.object(oneof_dispatch, "_resolve", lambda wrapper, value: None), patch.object(
+        oneof_dispatch, "_variants_by_discriminator", {}
+    ):
+        trial = IAsset.from_dict(_MULTI_ASSET)
+
+    assert isinstance(dispatched.actual_instance, IAssetMultiAsset)
+    assert dispatched.to_dict() == trial.to_dict() == _MULTI_ASSET
+
+
+def test_unknown_discriminator_still_reports_no_match():
+    with pytest.raises(ValueError, match="No match found"):
+        IAsset.from_dict({"_t": "Unknown", "identifier": "x", "metadata": {}})
@@ -0,0 +1,120 @@
+"""Tests for encoding request models straight to JSON bytes.
+
+Every request body was turned into a dict by the model's ``to_dict()``, walked
+again by ``sanitize_for_serialization`` and only then encoded, and
+``to_dict()`` itself dumped each nested asset several times over. Datapoint
+uploads send hundreds of thousands of such bodies. The direct path must send
+exactly the bytes the old path did, explicit ``null``s and all.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from rapidata.api_client import rest
+from rapidata.api_client.api_client import ApiClient
+from rapidata.api_client.models.bulk_close_billing_periods_endpoint_input import (
+    BulkCloseBillingPeriodsEndpointInput,
+)
+from rapidata.api_client.models.create_datapoint_endpoint_input import (
+    CreateDatapointEndpointInput,
+)
+from rapidata.api_client.models.create_job_share_endpoint_input import (
+    CreateJobShareEndpointInput,
+)
+from rapidata.api_client.models.i_asset_input import IAssetInput
+from rapidata.api_client.models.job_share_level import JobShareLevel
+
+_JSON = {"Content-Type": "application/json"}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(rest, "orjson", None)
+    return request.param
+
+
+def _datapoint(assets: list) -> CreateDatapointEndpointInput:
+    return CreateDatapointEndpointInput(
+        asset=IAssetInput.from_dict({"_t": "MultiAssetInput", "assets": assets}),
+        context=None,
+        sortIndex=0,
+        privateMetadata={"row": "1"},
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        _datapoint([{"_t": "ExistingAssetInput", "name": "a.jpg"}]),
+        _datapoint([]),
+        BulkCloseBillingPeriodsEndpointInput(
+            endedBefore=datetime(2026, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            reason="written off",
+        ),
+        CreateJobShareEndpointInput(email="a@example.com", level=JobShareLevel.EDITOR),
+    ],
+    ids=["datapoint", "empty-assets", "datetime", "enum"],
+)
+def test_model_bodies_encode_like_sanitized_bodies(codec, body):
+    client = ApiClient()
+
+    encoded = client._serialize_body(body, _JSON)
+
+    assert isinstance(encoded, bytes)
+    assert encoded == rest.json_dumps(client.sanitize_for_serialization(body))
+
+
+def test_nested_models_keep_their_wire_form():
+    body = _datapoint([]).to_dict()
+
+    assert body == {
+        "asset": {
+            "_t": "MultiAssetInput",
+            "assets": [],
+            "metadata": None,
+            "identifier": None,
+        },
+        "context": None,
+        "sortIndex": 0,
+        "privateMetadata": {"row": "1"},
+    }
+    assert next(iter(body["asset"])) == "_t"
+
+
+def test_param_serialize_hands_bytes_to_the_transport():
+    body = _datapoint([{"_t": "ExistingAssetInput", "name": "a.jpg"}])
+
+    _, _, _, serialized, _ = ApiClient().param_serialize(
+        "POST", "/dataset/1/datapoint", header_params=dict(_JSON), body=body
+    )
+
+    assert isinstance(serialized, bytes)
+    assert rest.json_loads(serialized)["asset"]["assets"][0]["name"] == "a.jpg"
+
+
+def test_non_json_bodies_are_sanitized():
+    body = CreateJobShareEndpointInput(email="a@example.com", level=JobShareLevel.VIEWER)
+
+    serialized = ApiClient()._serialize_body(body, {"Content-Type": "text/plain"})
+
+    assert serialized == {"email": "a@example.com", "level": "Viewer"}
+
+
+def test_encoded_bodies_are_sent_unchanged():
+    sent = {}
+
+    class _Session:
+        def request(self, method, url, content=None, **kwargs):
+            sent["content"] = content
+
+    rest.RESTClientObject._send_body_request(
+        _Session(), "POST", "https://api/x", dict(_JSON), b'{"a":1}', None, None
+    )
+
+    assert sent["content"] == b'{"a":1}'
@@ -0,0 +1,180 @@
+"""Tests for the REST client's asyncio request path.
+
+``request_async`` has to behave exactly like ``request`` — same retry policy,
+same bearer token — while living on an ``httpx.AsyncClient`` that is bound to
+the event loop it was created on. Reusing that client on another loop fails
+deep inside httpx, so the client must be rebuilt per loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from authlib.oauth2.rfc6749 import OAuth2Token
+
+from rapidata.api_client import rest
+from rapidata.api_client.exceptions import ApiException
+from rapidata.api_client.rest import RESTClientObject
+
+
+class _Configuration:
+    ssl_ca_cert = None
+    verify_ssl = True
+    proxy = None
+    proxy_headers = None
+    retries = None
+
+
+def _rest_client(handler) -> RESTClientObject:
+    client = RESTClientObject(_Configuration())
+    client.session = SimpleNamespace(  # type: ignore[assignment]
+        token=OAuth2Token(
+            {
+                "access_token": "abc",
+                "token_type": "Bearer",
+                "expires_at": int(time.time()) + 3600,
+            }
+        )
+    )
+    transport = httpx.MockTransport(handler)
+    client._get_async_session = lambda: httpx.AsyncClient(transport=transport)  # type: ignore[method-assign]
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(rest, "_backoff_delay", lambda attempt: 0.0)
+
+
+def test_sends_bearer_token_and_returns_response():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["auth"] = request.headers["Authorization"]
+        return httpx.Response(200, json={"ok": True})
+
+    client = _rest_client(handler)
+    response = asyncio.run(client.request_async("GET", "https://api.test/x"))
+
+    assert response.status == 200
+    assert response.read() == b'{"ok":true}'
+    assert seen["auth"] == "Bearer abc"
+
+
+def test_retries_transient_status_then_succeeds():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+    client = _rest_client(handler)
+    response = asyncio.run(
+        client.request_async("POST", "https://api.test/x", body={"a": 1})
+    )
+
+    assert response.status == 200
+    assert len(calls) == 3
+
+
+def test_permanent_transport_error_is_not_retried():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.UnsupportedProtocol("nope")
+
+    client = _rest_client(handler)
+    with pytest.raises(ApiException):
+        asyncio.run(client.request_async("GET", "https://api.test/x"))
+    assert len(calls) == 1
+
+
+def test_async_session_is_rebuilt_per_event_loop():
+    client = RESTClientObject(_Configuration())
+
+    async def get_session():
+        session = client._get_async_session()
+        assert client._get_async_session() is session
+        return session
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+    assert first is not second
+
+    asyncio.run(client.close_async_session())  # different loop: a no-op
+    assert client._async_session is second
+
+
+def test_session_of_a_replaced_loop_is_closed_on_that_loop():
+    client = RESTClientObject(_Configuration())
+    owner = asyncio.new_event_loop()
+    thread = threading.Thread(target=owner.run_forever, daemon=True)
+    thread.start()
+    try:
+
+        async def get_session():
+            return client._get_async_session()
+
+        first = asyncio.run_coroutine_threadsafe(get_session(), owner).result(5)
+        asyncio.run(get_session())
+
+        deadline = time.monotonic() + 5
+        while not first.is_closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert first.is_closed
+    finally:
+        owner.call_soon_threadsafe(owner.stop)
+        thread.join(5)
+        owner.close()
+
+
+def test_async_sessions_close_when_the_last_block_exits():
+    client = RESTClientObject(_Configuration())
+
+    async def upload(started: asyncio.Event, release: asyncio.Event):
+        async with client.async_sessions():
+            client._get_async_session()
+            started.set()
+            await release.wait()
+
+    async def main():
+        first_started, second_started = asyncio.Event(), asyncio.Event()
+        first_release, second_release = asyncio.Event(), asyncio.Event()
+        first = asyncio.create_task(upload(first_started, first_release))
+        second = asyncio.create_task(upload(second_started, second_release))
+        await first_started.wait()
+        await second_started.wait()
+        session = client._async_session
+        first_release.set()
+        await first
+        assert session is not None and not session.is_closed
+        second_release.set()
+        await second
+        assert session.is_closed
+        assert client._async_session is None
+
+    asyncio.run(main())
+
+
+def test_request_observer_sees_every_attempt():
+    statuses = iter([503, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={})
+
+    seen = []
+
+    async def observed_request():
+        rest.request_observer.set(lambda status, seconds: seen.append(status))
+        return await _rest_client(handler).request_async("GET", "https://api.test/x")
+
+    asyncio.run(observed_request())
+    assert seen == [503, 429, 200]
@@ -0,0 +1,115 @@
+"""Tests for routing bulk uploads through their own connection pool.
+
+A large upload keeps every connection of a pool busy. If status polls, job
+creation and token refreshes shared that pool they would queue behind the
+uploads, so requests made inside ``bulk_requests()`` must use a separate
+client, authenticated with the OAuth session's token, and everything else must
+keep using the OAuth session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+
+import httpx
+from authlib.integrations.httpx_client import AsyncOAuth2Client, OAuth2Client
+
+from rapidata.api_client.rest import RESTClientObject, bulk_requests, bulk_traffic
+
+
+class _Configuration:
+    ssl_ca_cert = None
+    verify_ssl = True
+    proxy = None
+    proxy_headers = None
+    retries = None
+    bulk_pool_maxsize = 7
+
+
+_TOKEN = {"access_token": "secret", "token_type": "Bearer", "expires_at": 2**31}
+
+
+def _recorder(seen: list, name: str) -> httpx.MockTransport:
+    def handle(request: httpx.Request) -> httpx.Response:
+        seen.append((name, request.url.path, request.headers.get("Authorization")))
+        return httpx.Response(200, json={})
+
+    return httpx.MockTransport(handle)
+
+
+def _client(seen: list) -> RESTClientObject:
+    client = RESTClientObject(_Configuration())
+    client.session = OAuth2Client(token=_TOKEN, transport=_recorder(seen, "control"))
+    client._bulk_session = httpx.Client(transport=_recorder(seen, "bulk"))
+    return client
+
+
+def test_bulk_requests_use_the_bulk_pool_with_the_session_token():
+    seen: list = []
+    client = _client(seen)
+
+    client.request("GET", "https://api.rapidata.ai/asset/batch-upload/status")
+    with bulk_requests():
+        client.request("POST", "https://api.rapidata.ai/asset/url", body={})
+    client.request("POST", "https://api.rapidata.ai/order", body={})
+
+    assert seen == [
+        ("control", "/asset/batch-upload/status", "Bearer secret"),
+        ("bulk", "/asset/url", "Bearer secret"),
+        ("control", "/order", "Bearer secret"),
+    ]
+    assert bulk_traffic.get() is False
+
+
+def test_async_bulk_requests_use_the_bulk_pool():
+    seen: list = []
+    client = RESTClientObject(_Configuration())
+    client.session = OAuth2Client(token=_TOKEN)
+
+    async def main() -> None:
+        control = AsyncOAuth2Client(token=_TOKEN, transport=_recorder(seen, "control"))
+        bulk = httpx.AsyncClient(transport=_recorder(seen, "bulk"))
+        client._get_async_session = lambda: control  # type: ignore[method-assign]
+        client._get_async_bulk_session = lambda: bulk  # type: ignore[method-assign]
+        with bulk_requests():
+            await client.request_async("POST", "https://api.rapidata.ai/asset/file", body={})
+        await client.request_async("GET", "https://api.rapidata.ai/order/1")
+
+    asyncio.run(main())
+
+    assert [(name, path) for name, path, _ in seen] == [
+        ("bulk", "/asset/file"),
+        ("control", "/order/1"),
+    ]
+    assert seen[0][2] == "Bearer secret"
+
+
+def test_bulk_pool_has_its_own_limits_and_longer_timeouts():
+    client = RESTClientObject(_Configuration())
+    control = client._get_session_defaults()
+    bulk = client._get_session_defaults(bulk=True)
+
+    assert bulk["limits"].max_connections == 7
+    assert bulk["timeout"].pool > control["timeout"].pool
+    assert bulk["timeout"].write > control["timeout"].write
+
+
+def test_bulk_pool_is_closed_with_the_client():
+    client = RESTClientObject(_Configuration())
+    bulk = client._get_bulk_session()
+
+    client.close()
+
+    assert bulk.is_closed
+    assert client._get_bulk_session() is not bulk
+
+
+def test_bulk_pool_is_closed_when_the_client_is_collected():
+    client = RESTClientObject(_Configuration())
+    bulk = client._get_bulk_session()
+
+    del client
+    gc.collect()
+
+    assert bulk.is_closed
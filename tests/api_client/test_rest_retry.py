@@ -9,6 +9,7 @@ family, so an aborted upload was never retried.
 from __future__ import annotations
 
 import logging
+import sys
 
 import httpx
 import pytest
@@ -61,6 +62,34 @@ class TestSessionDefaults:
             timeout.pool,
         ), "every phase needs a bound, or a stalled request hangs forever"
 
+    def test_http1_by_default(self):
+        client = _rest_client()
+        assert client._get_session_defaults(asynchronous=True)["http2"] is False
+
+    def test_http2_is_offered_to_the_async_client_when_enabled(self):
+        pytest.importorskip("h2")
+        client = _rest_client()
+        client.configuration.http2 = True  # type: ignore[attr-defined]
+        client.configuration.retries = 2  # type: ignore[attr-defined]
+        defaults = client._get_session_defaults(asynchronous=True)
+        assert defaults["http2"] is True
+        # An explicit transport ignores the client's http2 flag, so it needs its own.
+        assert defaults["transport"]._pool._http2 is True
+
+    def test_blocking_client_stays_on_http1(self):
+        """Threads sharing httpcore's blocking HTTP/2 connection can send stream ids out of order."""
+        client = _rest_client()
+        client.configuration.http2 = True  # type: ignore[attr-defined]
+        assert client._get_session_defaults()["http2"] is False
+
+    def test_http2_falls_back_without_h2(self, monkeypatch, caplog):
+        monkeypatch.setitem(sys.modules, "h2", None)
+        client = _rest_client()
+        client.configuration.http2 = True  # type: ignore[attr-defined]
+        with caplog.at_level(logging.WARNING, logger="rapidata.api_client"):
+            assert client._get_session_defaults(asynchronous=True)["http2"] is False
+        assert "rapidata[http2]" in caplog.text
+
 
 class TestRetryableErrors:
     @pytest.mark.parametrize(
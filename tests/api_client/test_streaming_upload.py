@@ -0,0 +1,105 @@
+"""Tests for streaming local files into multipart uploads.
+
+``files_parameters`` used to ``read()`` every file before posting it, so
+``maxWorkers`` concurrent video uploads held that many whole videos in memory.
+Files are now opened by the REST client only while the request is sent and
+streamed from disk, which must keep peak memory flat, still send an exact
+``Content-Length``, and re-send the full file when a request is retried.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import httpx
+import pytest
+
+from rapidata.api_client import rest
+from rapidata.api_client.api_client import ApiClient
+from rapidata.api_client.rest import LocalFile, RESTClientObject
+
+FILE_SIZE = 16 * 1024 * 1024
+
+
+class _Configuration:
+    ssl_ca_cert = None
+    verify_ssl = True
+    proxy = None
+    proxy_headers = None
+    retries = None
+
+
+class _DrainingTransport(httpx.BaseTransport):
+    """Consumes request bodies chunk by chunk, unlike MockTransport which reads them whole."""
+
+    def __init__(self, statuses: list[int]) -> None:
+        self.statuses = statuses
+        self.requests: list[tuple[httpx.Headers, int]] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        received = sum(len(chunk) for chunk in request.stream)
+        self.requests.append((request.headers, received))
+        return httpx.Response(self.statuses.pop(0), json={})
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "clip.mp4"
+    with open(path, "wb") as f:
+        for _ in range(FILE_SIZE // (1024 * 1024)):
+            f.write(b"\0" * (1024 * 1024))
+    return path
+
+
+def _upload(transport: _DrainingTransport, path) -> rest.RESTResponse:
+    client = RESTClientObject(_Configuration())
+    client.session = httpx.Client(transport=transport)  # type: ignore[assignment]
+    post_params = ApiClient.files_parameters(
+        ApiClient.__new__(ApiClient), {"file": str(path)}
+    )
+    return client.request(
+        "POST",
+        "https://api.test/asset/file",
+        headers={"Content-Type": "multipart/form-data"},
+        post_params=post_params,
+    )
+
+
+def test_files_parameters_does_not_read_the_file(big_file):
+    params = ApiClient.files_parameters(
+        ApiClient.__new__(ApiClient), {"file": str(big_file)}
+    )
+
+    [(key, (filename, data, mimetype))] = params
+    assert (key, filename, mimetype) == ("file", "clip.mp4", "video/mp4")
+    assert isinstance(data, LocalFile)
+    assert data.path == str(big_file)
+
+
+def test_upload_streams_with_exact_content_length(big_file):
+    transport = _DrainingTransport([200])
+
+    tracemalloc.start()
+    try:
+        _upload(transport, big_file)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    [(headers, received)] = transport.requests
+    assert "transfer-encoding" not in headers
+    assert int(headers["content-length"]) == received
+    assert received > FILE_SIZE
+    assert peak < FILE_SIZE / 4, f"peak {peak} bytes suggests the file was buffered"
+
+
+def test_retry_resends_the_whole_file(big_file, monkeypatch):
+    monkeypatch.setattr(rest, "_backoff_delay", lambda attempt: 0.0)
+    transport = _DrainingTransport([503, 200])
+
+    response = _upload(transport, big_file)
+
+    assert response.status == 200
+    assert [received for _, received in transport.requests] == [
+        transport.requests[0][1]
+    ] * 2
@@ -0,0 +1,98 @@
+"""Tests for ``rapidata_config.logging.tracing_level``.
+
+Two linked spans per API request made tracing a large share of the cost of
+big uploads, and most of the export volume. Lower levels must create fewer
+spans, yet every request must still send a ``traceparent`` that ties the
+backend's trace to the SDK operation it belongs to.
+"""
+
+from __future__ import annotations
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import format_span_id, format_trace_id
+from pydantic import ValidationError
+
+from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
+from rapidata.rapidata_client.config import rapidata_config, tracer
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracer, "_real_tracer", provider.get_tracer(__name__))
+    monkeypatch.setattr(tracer, "_otlp_initialized", True)
+    logging_config = rapidata_config.logging
+    previous = (
+        logging_config.enable_otlp,
+        logging_config.tracing_level,
+        logging_config.tracing_sample_rate,
+    )
+    logging_config.enable_otlp = True
+    try:
+        yield exporter
+    finally:
+        (
+            logging_config.enable_otlp,
+            logging_config.tracing_level,
+            logging_config.tracing_sample_rate,
+        ) = previous
+
+
+def _send(count: int = 1) -> tuple[list[str], trace.SpanContext]:
+    client = RapidataApiClient()
+    traceparents = []
+    with tracer.start_as_current_span("RapidataDataset.add_datapoints") as stage:
+        for _ in range(count):
+            with client._backend_trace("POST", "/datapoint", None) as headers:
+                traceparents.append(headers["traceparent"])
+    return traceparents, stage.get_span_context()
+
+
+def test_full_level_traces_every_request(exporter):
+    rapidata_config.logging.tracing_level = "full"
+
+    traceparents, stage = _send(3)
+
+    assert len(exporter.get_finished_spans()) == 1 + 3 * 2
+    # Each request starts a backend trace of its own.
+    assert all(format_trace_id(stage.trace_id) not in tp for tp in traceparents)
+
+
+def test_stage_level_propagates_the_stage_span(exporter):
+    rapidata_config.logging.tracing_level = "stage"
+
+    traceparents, stage = _send(3)
+
+    assert [span.name for span in exporter.get_finished_spans()] == [
+        "RapidataDataset.add_datapoints"
+    ]
+    expected = (
+        f"00-{format_trace_id(stage.trace_id)}-{format_span_id(stage.span_id)}"
+        f"-{stage.trace_flags:02x}"
+    )
+    assert traceparents == [expected] * 3
+
+
+@pytest.mark.parametrize("rate, request_spans", [(0.0, 0), (1.0, 4 * 2)])
+def test_sampled_level_traces_a_share_of_requests(exporter, rate, request_spans):
+    rapidata_config.logging.tracing_level = "sampled"
+    rapidata_config.logging.tracing_sample_rate = rate
+
+    traceparents, _ = _send(4)
+
+    assert len(exporter.get_finished_spans()) == 1 + request_spans
+    assert len(traceparents) == 4
+
+
+@pytest.mark.parametrize(
+    "field, value", [("tracing_level", "verbose"), ("tracing_sample_rate", 1.5)]
+)
+def test_invalid_values_are_rejected(field, value):
+    with pytest.raises(ValidationError):
+        setattr(rapidata_config.logging, field, value)
@@ -0,0 +1,173 @@
+"""Tests for the AIMD upload concurrency limiter.
+
+The limit must grow slowly while the backend is healthy and fall fast when it
+pushes back (throttling, gateway errors, timeouts, latency spikes), without
+one burst of failures from many concurrent requests collapsing it to the
+minimum. It must also actually bound the work in flight, and learn from every
+HTTP attempt made inside a slot, retried ones included.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from rapidata.api_client import rest
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.config.upload_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    file_traffic_class,
+    upload_limiter,
+    upload_workers,
+)
+
+
+def test_grows_by_one_per_window_of_healthy_responses():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=4)
+
+    for _ in range(2):
+        limiter.observe(200, 0.1)
+    assert limiter.limit == 3
+    for _ in range(3):
+        limiter.observe(200, 0.1)
+    assert limiter.limit == 4
+    for _ in range(10):
+        limiter.observe(200, 0.1)
+    assert limiter.limit == 4
+    assert [(d.previous, d.limit, d.reason) for d in limiter.decisions] == [
+        (2, 3, "healthy"),
+        (3, 4, "healthy"),
+    ]
+
+
+@pytest.mark.parametrize("status_code", [429, 502, 503, 504, None])
+def test_congestion_halves_the_limit_once_per_cooldown(status_code):
+    limiter = AdaptiveConcurrencyLimiter(initial=16, cooldown=60.0)
+
+    for _ in range(5):
+        limiter.observe(status_code, 0.1)
+
+    assert limiter.limit == 8
+    assert len(limiter.decisions) == 1
+
+
+def test_never_drops_below_minimum():
+    limiter = AdaptiveConcurrencyLimiter(initial=3, minimum=2, cooldown=0.0)
+    for _ in range(5):
+        limiter.observe(429, 0.1)
+    assert limiter.limit == 2
+
+
+def test_latency_spike_counts_as_congestion():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8, latency_tolerance=3.0)
+    for _ in range(20):
+        limiter.observe(200, 0.1)
+    assert limiter.limit == 8
+
+    for _ in range(20):
+        limiter.observe(200, 2.0)
+    assert limiter.limit == 4
+    assert limiter.decisions[-1].reason == "latency"
+
+
+def test_slots_bound_the_work_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(initial=3, maximum=3)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def work() -> None:
+        nonlocal running, peak
+        with limiter.slot():
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+def test_attempts_inside_a_slot_feed_the_limiter():
+    limiter = AdaptiveConcurrencyLimiter(initial=10, cooldown=60.0)
+
+    rest._observe_attempt(429, time.monotonic())  # outside any slot: ignored
+    with limiter.slot():
+        with limiter.slot():  # re-entrant, does not take a second slot
+            assert limiter.in_flight == 1
+        rest._observe_attempt(429, time.monotonic())
+
+    assert limiter.limit == 5
+    assert rest.request_observer.get() is None
+
+
+def test_process_wide_limiter_follows_config():
+    previous = (
+        rapidata_config.upload.adaptiveConcurrency,
+        rapidata_config.upload.adaptiveMaxWorkers,
+    )
+    try:
+        rapidata_config.upload.adaptiveConcurrency = False
+        assert upload_limiter() is None
+        assert upload_workers() == rapidata_config.upload.maxWorkers
+
+        rapidata_config.upload.adaptiveConcurrency = True
+        rapidata_config.upload.adaptiveMaxWorkers = 80
+        limiter = upload_limiter()
+        assert limiter is upload_limiter()
+        assert limiter.limit == rapidata_config.upload.maxWorkers
+        assert upload_workers() == 80
+    finally:
+        (
+            rapidata_config.upload.adaptiveConcurrency,
+            rapidata_config.upload.adaptiveMaxWorkers,
+        ) = previous
+
+
+def test_latency_is_compared_within_its_traffic_class():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8, latency_tolerance=3.0)
+    for _ in range(20):
+        limiter.observe(200, 0.05)
+        limiter.observe(200, 2.0, traffic_class="file/24")
+
+    assert limiter.limit == 8
+    assert limiter.decisions == []
+
+
+def test_slot_is_released_during_retry_back_off():
+    limiter = AdaptiveConcurrencyLimiter(initial=1, maximum=1)
+    entered = threading.Event()
+
+    def other() -> None:
+        with limiter.slot():
+            entered.set()
+
+    with limiter.slot():
+        thread = threading.Thread(target=other)
+        thread.start()
+        # Stands in for a retried request waiting out its back-off.
+        rest._backoff_sleep(0.2)
+        assert entered.is_set()
+        assert limiter.in_flight == 1
+    thread.join()
+    assert limiter.in_flight == 0
+    assert rest.request_backoff.get() is None
+
+
+def test_file_traffic_class_groups_files_by_size(tmp_path):
+    small, large = tmp_path / "small.jpg", tmp_path / "large.mp4"
+    small.write_bytes(b"x" * 1_000)
+    large.write_bytes(b"x" * 1_000_000)
+
+    assert file_traffic_class(str(small)) != file_traffic_class(str(large))
+    assert file_traffic_class("https://example.com/a.jpg") == "request"
+    assert file_traffic_class(None) == "request"
@@ -0,0 +1,164 @@
+"""Tests for concurrent submission and adaptive polling in ``BatchAssetUploader``.
+
+Large URL ingests are thousands of batches: submitting them one at a time, or
+fetching completed results one at a time, delays datapoint creation by minutes.
+Polling has to stay cheap while the backend is busy yet pick up finished
+batches quickly, and a batch that cannot even be submitted must still be
+reported as failed rather than silently dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from rapidata.api_client.models.batch_upload_url_status import BatchUploadUrlStatus
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.datapoints._batch_asset_uploader import BatchAssetUploader
+
+
+@pytest.fixture(autouse=True)
+def fast_batches():
+    config = rapidata_config.upload
+    previous = (
+        config.batchSize,
+        config.batchPollInterval,
+        config.batchPollMaxInterval,
+        config.batchConcurrency,
+    )
+    config.batchSize = 100
+    config.batchPollInterval = 0.01
+    config.batchPollMaxInterval = 0.08
+    config.batchConcurrency = 4
+    try:
+        yield
+    finally:
+        (
+            config.batchSize,
+            config.batchPollInterval,
+            config.batchPollMaxInterval,
+            config.batchConcurrency,
+        ) = previous
+
+
+class _FakeBatchApi:
+    """Completes every batch after ``complete_after`` status polls."""
+
+    def __init__(self, complete_after: int = 1, delay: float = 0.02) -> None:
+        self.complete_after = complete_after
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.batches: dict[str, list[str]] = {}
+        self.polls: list[float] = []
+        self.active = {"peak_posts": 0, "peak_fetches": 0}
+        self.peak_posts = 0
+        self.peak_fetches = 0
+        self.reject: set[int] = set()
+
+    def _enter(self, attribute: str) -> None:
+        with self.lock:
+            self.active[attribute] += 1
+            setattr(self, attribute, max(getattr(self, attribute), self.active[attribute]))
+
+    def _leave(self, attribute: str) -> None:
+        with self.lock:
+            self.active[attribute] -= 1
+
+    def asset_batch_upload_post(self, create_batch_upload_endpoint_input):
+        self._enter("peak_posts")
+        try:
+            time.sleep(self.delay)
+            urls = create_batch_upload_endpoint_input.urls
+            if int(urls[0].rsplit("/", 1)[1]) // 100 in self.reject:
+                raise ValueError("batch rejected")
+            with self.lock:
+                batch_id = f"batch-{len(self.batches)}"
+                self.batches[batch_id] = urls
+            return MagicMock(batch_upload_id=batch_id)
+        finally:
+            self._leave("peak_posts")
+
+    def asset_batch_upload_status_get(self, correlation_id):
+        with self.lock:
+            self.polls.append(time.monotonic())
+            done = list(self.batches) if len(self.polls) >= self.complete_after else []
+            count = sum(len(self.batches[b]) for b in done)
+        return MagicMock(completed_batches=done, completed_count=count, failed_count=0)
+
+    def asset_batch_upload_batch_upload_id_get(self, batch_upload_id):
+        self._enter("peak_fetches")
+        try:
+            time.sleep(self.delay)
+            items = [
+                MagicMock(
+                    url=url,
+                    status=BatchUploadUrlStatus.COMPLETED,
+                    file_name=f"{url}.bin",
+                    warnings=None,
+                )
+                for url in self.batches[batch_upload_id]
+            ]
+            return MagicMock(items=items)
+        finally:
+            self._leave("peak_fetches")
+
+
+def _uploader(api: _FakeBatchApi) -> BatchAssetUploader:
+    openapi_service = MagicMock()
+    openapi_service.environment = "rapidata.ai"
+    openapi_service.asset.batch_upload_api = api
+    uploader = BatchAssetUploader(openapi_service)
+    uploader.url_cache = MagicMock()
+    return uploader
+
+
+def _urls(n: int) -> list[str]:
+    return [f"https://example.com/{i}" for i in range(n)]
+
+
+def test_batches_are_submitted_and_fetched_concurrently():
+    api = _FakeBatchApi()
+    completed: list[str] = []
+    progress: list[int] = []
+
+    failures = _uploader(api).batch_upload_urls(
+        _urls(1000),
+        progress_callback=progress.append,
+        completion_callback=completed.extend,
+    )
+
+    assert failures == []
+    assert sorted(completed) == sorted(_urls(1000))
+    assert sum(progress) == 1000
+    assert api.peak_posts > 1
+    assert api.peak_fetches > 1
+    assert max(api.peak_posts, api.peak_fetches) <= 4
+
+
+def test_polling_backs_off_while_nothing_completes():
+    api = _FakeBatchApi(complete_after=6, delay=0.0)
+
+    _uploader(api).batch_upload_urls(_urls(100))
+
+    gaps = [later - earlier for earlier, later in zip(api.polls, api.polls[1:])]
+    assert len(api.polls) == 6
+    # 0.02, 0.04, 0.08, 0.08, ... rather than a constant 0.01.
+    assert gaps[-1] >= 0.06
+    assert gaps[-1] > 3 * gaps[0]
+
+
+def test_rejected_batches_are_reported_as_failures():
+    api = _FakeBatchApi()
+    api.reject = {1}
+    completed: list[str] = []
+
+    failures = _uploader(api).batch_upload_urls(
+        _urls(300), completion_callback=completed.extend
+    )
+
+    assert sorted(f.item for f in failures) == sorted(_urls(300)[100:200])
+    assert all("batch rejected" in f.error_message for f in failures)
+    assert len(completed) == 200
@@ -0,0 +1,193 @@
+"""Tests for the pluggable upload-cache backends.
+
+Workers of a distributed job upload the same files at the same moment. With a
+shared backend only one process may upload a given file while the others
+wait for and reuse its result, and a custom backend named in the config must
+be used as the file cache's storage. The in-memory URL cache of a long-lived
+process must stay within its configured size and age, and say how it is doing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
+from rapidata.rapidata_client.datapoints._single_flight_cache import SingleFlightCache
+from rapidata.rapidata_client.datapoints.cache_backends import (
+    CacheBackend,
+    CacheStats,
+    DiskCacheBackend,
+    FileLockCacheBackend,
+    LRUCacheBackend,
+    SharedCacheBackend,
+    SQLiteCacheBackend,
+)
+
+
+def _backend(kind: str, directory: Path) -> SharedCacheBackend:
+    if kind == "sqlite":
+        return SQLiteCacheBackend(directory / "cache.sqlite")
+    return FileLockCacheBackend(directory)
+
+
+def _upload_once(kind: str, directory: str, log: str) -> str:
+    """Run in a child process: fetch one key through a shared cache."""
+    cache = SingleFlightCache("test", storage=_backend(kind, Path(directory)))
+
+    def upload() -> str:
+        with open(log, "a") as f:
+            f.write("upload\n")
+        time.sleep(0.5)
+        return "stored.jpg"
+
+    return cache.get_or_fetch("file-key", upload)
+
+
+@pytest.mark.parametrize("kind", ["sqlite", "filelock"])
+def test_backend_roundtrip(kind, tmp_path):
+    backend = _backend(kind, tmp_path)
+    assert isinstance(backend, SharedCacheBackend)
+    assert backend.get("a") is None and "a" not in backend
+
+    backend["a"] = "1"
+    backend["a"] = "2"
+    assert backend.get("a") == "2" and "a" in backend
+
+    backend.clear()
+    assert backend.get("a") is None
+
+
+@pytest.mark.parametrize("kind", ["sqlite", "filelock"])
+def test_processes_share_one_upload(kind, tmp_path):
+    log = tmp_path / "uploads.log"
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(3) as pool:
+        results = pool.starmap(
+            _upload_once, [(kind, str(tmp_path / "cache"), str(log))] * 3
+        )
+
+    assert results == ["stored.jpg"] * 3
+    assert log.read_text().count("upload") == 1
+
+
+@pytest.mark.parametrize("kind", ["sqlite", "filelock"])
+def test_async_fetch_reuses_result_from_another_holder(kind, tmp_path):
+    backend = _backend(kind, tmp_path)
+    cache = SingleFlightCache("test", storage=backend)
+
+    async def upload() -> str:
+        raise AssertionError("already uploaded by the lock holder")
+
+    async def main() -> str:
+        with backend.lock("key"):
+            # Another process finishes its upload while we wait for the lock.
+            waiter = asyncio.create_task(cache.get_or_fetch_async("key", upload))
+            await asyncio.sleep(0.1)
+            assert not waiter.done()
+            backend["key"] = "stored.jpg"
+        return await waiter
+
+    assert asyncio.run(main()) == "stored.jpg"
+
+
+class _DictBackend(dict):
+    pass
+
+
+def make_backend(directory: Path) -> CacheBackend:
+    return _DictBackend(location=str(directory))
+
+
+def test_custom_backend_is_plugged_in_from_config():
+    config = rapidata_config.upload
+    previous = config.cacheBackend
+    config.cacheBackend = f"{__name__}:make_backend"
+    try:
+        with patch.object(AssetUploader, "_file_cache", None):
+            storage = AssetUploader._get_file_cache().get_storage()
+    finally:
+        config.cacheBackend = previous
+
+    assert isinstance(storage, _DictBackend)
+    assert storage["location"] == str(config.cacheLocation)
+
+
+def test_invalid_backend_name_is_rejected():
+    with pytest.raises(ValueError, match="cacheBackend"):
+        rapidata_config.upload.cacheBackend = "redis"
+
+
+def test_lru_evicts_least_recently_used():
+    cache = SingleFlightCache("test", storage=LRUCacheBackend(max_entries=2))
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get_or_fetch("a", lambda: "unused") == "1"
+    cache.set("c", "3")
+
+    assert "b" not in cache.get_storage()
+    assert cache.get_or_fetch("b", lambda: "2 again") == "2 again"
+    assert cache.stats() == CacheStats(
+        hits=1, misses=1, evictions=2, expirations=0, size=2
+    )
+
+
+def test_lru_expires_entries_after_ttl():
+    storage = LRUCacheBackend(max_entries=10, ttl=60)
+    with patch("time.monotonic", return_value=1000.0):
+        storage["a"] = "1"
+    with patch("time.monotonic", return_value=1059.0):
+        assert storage.get("a") == "1"
+    with patch("time.monotonic", return_value=1061.0):
+        assert "a" not in storage
+        assert storage.get("a") is None
+    assert storage.expirations == 1 and len(storage) == 0
+
+
+def test_url_cache_follows_upload_config():
+    storage = LRUCacheBackend.from_upload_config()
+    config = rapidata_config.upload
+    previous = config.urlCacheMaxEntries
+    config.urlCacheMaxEntries = 3
+    try:
+        for i in range(5):
+            storage[str(i)] = str(i)
+    finally:
+        config.urlCacheMaxEntries = previous
+
+    assert len(storage) == 3 and storage.evictions == 2
+    assert isinstance(AssetUploader._url_cache.get_storage(), LRUCacheBackend)
+
+
+def test_sqlite_lease_is_renewed_while_held(tmp_path):
+    holder = SQLiteCacheBackend(tmp_path / "cache.sqlite", lease_seconds=0.3)
+    other = SQLiteCacheBackend(tmp_path / "cache.sqlite", lease_seconds=0.3)
+    try:
+        with holder.lock("key"):
+            time.sleep(1.0)
+            assert not other._try_lease("key", "other")
+        assert other._try_lease("key", "other")
+    finally:
+        holder.close()
+        other.close()
+
+
+def test_diskcache_backend_reads_only_strings(tmp_path):
+    from diskcache import FanoutCache
+
+    backend = DiskCacheBackend(FanoutCache(tmp_path))
+    try:
+        assert isinstance(backend, CacheBackend)
+        backend["a"] = "stored.jpg"
+        backend._cache["b"] = 1
+        assert backend.get("a") == "stored.jpg" and "a" in backend
+        assert backend.get("b") is None
+        assert len(backend) == 2
+    finally:
+        backend.close()
@@ -0,0 +1,103 @@
+"""Tests for content-addressed file cache keys.
+
+By default the file cache is keyed on ``path:size:mtime``, so the same image
+copied elsewhere is uploaded again. With ``contentAddressedCache`` the key is a
+digest of the bytes instead, and each file version must be hashed only once.
+"""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
+from rapidata.rapidata_client.datapoints._file_digester import FileDigester
+
+
+@pytest.fixture
+def content_addressed():
+    previous = rapidata_config.upload.contentAddressedCache
+    rapidata_config.upload.contentAddressedCache = True
+    try:
+        yield
+    finally:
+        rapidata_config.upload.contentAddressedCache = previous
+
+
+@pytest.fixture
+def uploader():
+    openapi_service = MagicMock()
+    openapi_service.environment = "rapidata.ai"
+    with patch.object(AssetUploader, "_file_digester", FileDigester()):
+        yield AssetUploader(openapi_service)
+
+
+def _write(path, content: bytes) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_copies_under_different_paths_share_a_key(tmp_path, uploader, content_addressed):
+    original = _write(tmp_path / "a" / "cat.jpg", b"meow")
+    copy = _write(tmp_path / "b" / "renamed.jpg", b"meow")
+    other = _write(tmp_path / "c" / "dog.jpg", b"woof")
+
+    assert uploader.get_file_cache_key(original) == uploader.get_file_cache_key(copy)
+    assert uploader.get_file_cache_key(original) != uploader.get_file_cache_key(other)
+    assert "cat.jpg" not in uploader.get_file_cache_key(original)
+
+
+def test_default_mode_keeps_path_based_keys(tmp_path, uploader):
+    original = _write(tmp_path / "a" / "cat.jpg", b"meow")
+    copy = _write(tmp_path / "b" / "cat.jpg", b"meow")
+
+    assert uploader.get_file_cache_key(original) != uploader.get_file_cache_key(copy)
+
+
+def test_unchanged_file_is_hashed_once(tmp_path, uploader, content_addressed):
+    path = _write(tmp_path / "cat.jpg", b"meow")
+
+    with patch.object(
+        FileDigester, "_hash_file", wraps=FileDigester._hash_file
+    ) as hash_file:
+        first = uploader.get_file_cache_key(path)
+        assert uploader.get_file_cache_key(path) == first
+        assert hash_file.call_count == 1
+
+        _write(tmp_path / "cat.jpg", b"purr")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert uploader.get_file_cache_key(path) != first
+        assert hash_file.call_count == 2
+
+
+def test_prefetch_warms_the_memo(tmp_path, uploader, content_addressed):
+    paths = [_write(tmp_path / f"{i}.jpg", bytes([i]) * 10) for i in range(8)]
+
+    uploader.prefetch_file_digests(paths + [str(tmp_path / "missing.jpg")])
+
+    with patch.object(FileDigester, "_hash_file") as hash_file:
+        for path in paths:
+            uploader.get_file_cache_key(path)
+    hash_file.assert_not_called()
+
+
+def test_missing_file_still_reports_file_not_found(tmp_path, uploader, content_addressed):
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        uploader.get_file_cache_key(str(tmp_path / "missing.jpg"))
+
+
+def test_digest_memo_is_bounded(tmp_path):
+    digester = FileDigester(max_entries=2)
+    paths = [_write(tmp_path / f"{i}.jpg", bytes([i])) for i in range(3)]
+
+    with patch.object(FileDigester, "_hash_file", wraps=FileDigester._hash_file) as hash_file:
+        for path in paths:
+            digester.digest(path)
+        digester.digest(paths[0])
+
+    assert hash_file.call_count == 4
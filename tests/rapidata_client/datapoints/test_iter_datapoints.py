@@ -0,0 +1,89 @@
+"""Tests for the lazy ``DatapointsValidator.iter_datapoints``.
+
+Streaming ingestion can't hand ``map_datapoints`` a list, so the lazy variant
+must build the same datapoints from plain iterators, consume them one row at a
+time, and still reject inputs whose lengths or groups don't line up.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from rapidata.rapidata_client.datapoints._datapoints_validator import (
+    DatapointsValidator,
+)
+
+
+def test_matches_map_datapoints_for_lists():
+    kwargs = dict(
+        datapoints=["a.jpg", "b.jpg"],
+        contexts=["ctx a", "ctx b"],
+        media_contexts=[["m.jpg"], ["n.jpg"]],
+        private_metadata=[{"k": "1"}, {"k": "2"}],
+        groups=["g1", "g2"],
+    )
+
+    assert list(DatapointsValidator.iter_datapoints(**kwargs)) == (
+        DatapointsValidator.map_datapoints(**kwargs)
+    )
+
+
+def test_consumes_generators_lazily():
+    pulled: list[int] = []
+
+    def assets():
+        for i in range(1_000_000):
+            pulled.append(i)
+            yield f"{i}.jpg"
+
+    iterator = DatapointsValidator.iter_datapoints(
+        assets(), contexts=(f"ctx {i}" for i in range(1_000_000))
+    )
+    first = next(iterator)
+
+    assert first.asset == "0.jpg" and first.context == "ctx 0"
+    assert pulled == [0]
+
+
+def test_empty_list_column_means_not_provided():
+    [datapoint] = DatapointsValidator.iter_datapoints(["a.jpg"], contexts=[])
+    assert datapoint.context is None
+
+
+def test_empty_media_contexts_are_checked_like_map_datapoints():
+    with pytest.raises(ValueError, match="Number of media contexts"):
+        DatapointsValidator.map_datapoints(["a.jpg"], media_contexts=[])
+    with pytest.raises(ValueError, match="Number of media contexts"):
+        list(DatapointsValidator.iter_datapoints(["a.jpg"], media_contexts=[]))
+
+
+def test_group_check_only_remembers_recent_groups():
+    with patch(
+        "rapidata.rapidata_client.datapoints._datapoints_validator._GROUP_CHECK_LIMIT",
+        2,
+    ):
+        datapoints = DatapointsValidator.iter_datapoints(
+            iter(["a.jpg", "b.jpg", "c.jpg", "d.jpg"]),
+            groups=iter(["g1", "g2", "g3", "g1"]),
+        )
+        assert [dp.group for dp in datapoints] == ["g1", "g2", "g3", "g1"]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        (dict(contexts=iter(["only one"])), "Number of contexts"),
+        (dict(sentences=iter(["a b", "c d", "e f"])), "Number of sentences"),
+        (dict(groups=iter(["g", "g"])), "must be unique"),
+    ],
+)
+def test_mismatched_inputs_raise(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        list(DatapointsValidator.iter_datapoints(iter(["a.jpg", "b.jpg"]), **kwargs))
+
+
+def test_multi_asset_shape_is_checked():
+    with pytest.raises(ValueError, match="list of lists"):
+        list(DatapointsValidator.iter_datapoints(iter(["a.jpg"]), multi_asset=True))
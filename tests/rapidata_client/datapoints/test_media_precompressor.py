@@ -0,0 +1,158 @@
+"""Tests for client-side image compression before upload.
+
+With ``CompressionConfig(local=True)`` a large local image must be sent as a
+downscaled WebP, cached under the digest of those compressed bytes, and only
+compressed once. Anything that can't be compressed (no Pillow, not an image,
+no size gain) must still upload, unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rapidata.api_client.api_client import ApiClient
+from rapidata.api_client.rest import LocalFile
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.config.upload_config import CompressionConfig
+from rapidata.rapidata_client.datapoints import _media_precompressor
+from rapidata.rapidata_client.datapoints._asset_uploader import AssetUploader
+from rapidata.rapidata_client.datapoints._file_digester import FileDigester
+from rapidata.rapidata_client.datapoints._media_precompressor import (
+    MediaPrecompressor,
+)
+
+LOCAL = CompressionConfig(local=True, quality=70, max_dimension=256)
+
+
+@pytest.fixture
+def local_compression():
+    previous = rapidata_config.upload.compression
+    rapidata_config.upload.compression = LOCAL
+    try:
+        yield
+    finally:
+        rapidata_config.upload.compression = previous
+
+
+@pytest.fixture
+def uploader(tmp_path):
+    openapi_service = MagicMock()
+    openapi_service.environment = "rapidata.ai"
+    response = MagicMock(file_name="remote.webp", warnings=None)
+    openapi_service.asset.asset_api.asset_file_post.return_value = response
+    openapi_service.asset.asset_api.api_client.call_endpoint.return_value = response
+    with (
+        patch.object(AssetUploader, "_file_digester", FileDigester()),
+        patch.object(
+            AssetUploader, "_precompressor", MediaPrecompressor(tmp_path / "compressed")
+        ),
+        patch.object(AssetUploader, "_file_cache", None),
+        patch.object(rapidata_config.upload, "cacheToDisk", False),
+    ):
+        yield AssetUploader(openapi_service)
+
+
+def _photo(path, size=(1600, 1200)) -> str:
+    from PIL import Image
+
+    # Noise compresses badly as JPEG at high quality, like a real photo.
+    Image.effect_noise(size, 64).convert("RGB").save(path, quality=95)
+    return str(path)
+
+
+def test_uploads_downscaled_webp(tmp_path, uploader, local_compression):
+    pytest.importorskip("PIL")
+    from PIL import Image
+
+    photo = _photo(tmp_path / "photo.jpg")
+
+    uploader.upload_asset(photo)
+
+    asset_api = uploader.openapi_service.asset.asset_api
+    asset_api.asset_file_post.assert_not_called()
+    name, part = asset_api._asset_file_post_serialize.call_args.kwargs["file"]
+    # Sent under the original name, not that of the compressed copy.
+    assert name == "photo.webp"
+    assert ApiClient().files_parameters({"file": (name, part)})[0][1][0] == name
+    assert isinstance(part, LocalFile) and part.path.endswith(".webp")
+    with Image.open(part.path) as image:
+        assert max(image.size) == 256
+    assert uploader.get_file_cache_key(photo).startswith("rapidata.ai@blake2b:")
+
+
+def test_async_upload_sends_the_original_name(tmp_path, uploader, local_compression):
+    pytest.importorskip("PIL")
+    photo = _photo(tmp_path / "photo.jpg")
+    asset_api = uploader.openapi_service.asset.asset_api
+    asset_api.api_client.call_endpoint_async = AsyncMock(
+        return_value=MagicMock(file_name="remote.webp", warnings=None)
+    )
+
+    assert asyncio.run(uploader.upload_asset_async(photo)) == "remote.webp"
+
+    name, part = asset_api._asset_file_post_serialize.call_args.kwargs["file"]
+    assert name == "photo.webp" and isinstance(part, LocalFile)
+
+
+def test_prepare_compresses_in_a_thread_pool_once(tmp_path, uploader, local_compression):
+    pytest.importorskip("PIL")
+    photos = [_photo(tmp_path / f"photo{i}.jpg", (600, 400)) for i in range(3)]
+
+    uploader.precompress_files(photos)
+    compressed = sorted((tmp_path / "compressed").iterdir())
+    assert len(compressed) == 3
+
+    # A new process (fresh precompressor) reuses the copies on disk.
+    fresh = MediaPrecompressor(tmp_path / "compressed")
+    with patch.object(_media_precompressor, "_compress_to_webp") as compress:
+        fresh.prepare(photos, LOCAL)
+    compress.assert_not_called()
+    assert sorted(fresh.resolve(p, LOCAL) for p in photos) == [str(c) for c in compressed]
+
+
+def test_least_recently_used_copies_are_evicted(tmp_path):
+    pytest.importorskip("PIL")
+    photos = [_photo(tmp_path / f"photo{i}.jpg", (600, 400)) for i in range(3)]
+    directory = tmp_path / "compressed"
+    MediaPrecompressor(directory).prepare(photos, LOCAL)
+    copies = sorted(directory.iterdir(), key=lambda c: c.stat().st_mtime_ns)
+    limit = sum(c.stat().st_size for c in copies[1:])
+
+    # A later run reuses the oldest copy, then compresses one more image.
+    precompressor = MediaPrecompressor(directory, max_bytes=limit)
+    reused = next(p for p in photos if precompressor.resolve(p, LOCAL) == str(copies[0]))
+    new_photo = _photo(tmp_path / "photo3.jpg", (600, 400))
+    resolved = precompressor.resolve(new_photo, LOCAL)
+
+    # Only the copies handed out by this run survive; the others are evicted.
+    assert set(directory.iterdir()) == {copies[0], Path(resolved)}
+    assert precompressor.resolve(reused, LOCAL) == str(copies[0])
+
+
+def test_non_images_are_uploaded_unchanged(tmp_path, uploader, local_compression):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"not an image")
+
+    uploader.upload_asset(str(clip))
+
+    sent = uploader.openapi_service.asset.asset_api.asset_file_post.call_args.kwargs["file"]
+    assert sent == str(clip)
+
+
+def test_without_pillow_images_are_uploaded_unchanged(
+    tmp_path, uploader, local_compression, monkeypatch
+):
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    photo = tmp_path / "photo.jpg"
+    photo.write_bytes(b"jpeg bytes")
+
+    uploader.upload_asset(str(photo))
+
+    sent = uploader.openapi_service.asset.asset_api.asset_file_post.call_args.kwargs["file"]
+    assert sent == str(photo)
+    assert "blake2b" not in uploader.get_file_cache_key(str(photo))
@@ -0,0 +1,83 @@
+"""Tests for the async path of the single-flight upload cache.
+
+The asyncio upload engine and the threaded one share the same class-level
+caches, so an asset requested by many coroutines at once — or by a coroutine
+and a worker thread — must still be uploaded exactly once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from rapidata.rapidata_client.datapoints._single_flight_cache import SingleFlightCache
+
+
+def test_concurrent_coroutines_share_one_fetch():
+    cache = SingleFlightCache("test", storage={})
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "uploaded.jpg"
+
+    async def main() -> list[str]:
+        return await asyncio.gather(
+            *(cache.get_or_fetch_async("key", fetch) for _ in range(20))
+        )
+
+    assert asyncio.run(main()) == ["uploaded.jpg"] * 20
+    assert calls == 1
+    assert cache.get_storage() == {"key": "uploaded.jpg"}
+
+
+def test_coroutine_waits_for_fetch_started_by_a_thread():
+    cache = SingleFlightCache("test", storage={})
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "from-thread"
+
+    async def must_not_run() -> str:
+        raise AssertionError("in-flight fetch should have been reused")
+
+    async def main() -> str:
+        worker = asyncio.create_task(
+            asyncio.to_thread(cache.get_or_fetch, "key", slow_fetch)
+        )
+        await asyncio.to_thread(started.wait, 5)
+        waiter = asyncio.create_task(cache.get_or_fetch_async("key", must_not_run))
+        await asyncio.sleep(0)
+        release.set()
+        assert await worker == "from-thread"
+        return await waiter
+
+    assert asyncio.run(main()) == "from-thread"
+
+
+def test_failed_fetch_is_not_cached_and_propagates_to_waiters():
+    cache = SingleFlightCache("test", storage={})
+
+    async def failing_fetch() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            cache.get_or_fetch_async("key", failing_fetch),
+            cache.get_or_fetch_async("key", failing_fetch),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get_storage() == {}
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get_or_fetch_async("key", failing_fetch))
@@ -0,0 +1,179 @@
+"""Tests for the asyncio upload engine behind ``RapidataDataset.add_datapoints``.
+
+With ``asyncUpload`` enabled the public call stays synchronous but must return
+the same successes/failures as the threaded engine: datapoints are created as
+soon as their assets land, a failed asset fails every datapoint that needs it,
+and the call also works when the caller already runs an event loop (Jupyter).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rapidata.api_client.rest import RESTClientObject
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.dataset._rapidata_dataset import RapidataDataset
+from rapidata.rapidata_client.datapoints._datapoint import Datapoint
+from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
+
+
+@pytest.fixture
+def async_upload():
+    previous = rapidata_config.upload.asyncUpload
+    rapidata_config.upload.asyncUpload = True
+    try:
+        yield
+    finally:
+        rapidata_config.upload.asyncUpload = previous
+
+
+def _dataset() -> tuple[RapidataDataset, list[int]]:
+    openapi_service = MagicMock()
+    openapi_service.environment = "rapidata.ai"
+    rest_client = RESTClientObject(MagicMock())
+    rest_client.close_async_session = AsyncMock()  # type: ignore[method-assign]
+    openapi_service.api_client.rest_client = rest_client
+    dataset = RapidataDataset("ds-1", openapi_service)
+
+    async def upload_all_assets_async(assets, asset_completion_callback=None, **_):
+        # Report completions one by one, the way file uploads finish.
+        failures = []
+        for asset in sorted(assets):
+            await asyncio.sleep(0)
+            if "broken" in asset:
+                failures.append(
+                    FailedUpload(item=asset, error_type="X", error_message="corrupt")
+                )
+            elif asset_completion_callback:
+                asset_completion_callback([asset])
+        return failures
+
+    created: list[int] = []
+
+    async def upload_datapoint_async(datapoint, dataset_id, index):
+        await asyncio.sleep(0)
+        if datapoint.context == "reject":
+            raise ValueError("rejected")
+        created.append(index)
+
+    dataset.asset_orchestrator.upload_all_assets_async = upload_all_assets_async  # type: ignore[method-assign]
+    dataset.datapoint_uploader.upload_datapoint_async = upload_datapoint_async  # type: ignore[method-assign]
+    return dataset, created
+
+
+def _datapoints() -> list[Datapoint]:
+    return [
+        Datapoint(asset="a.jpg", data_type="media"),
+        Datapoint(asset=["a.jpg", "b.jpg"], data_type="media"),
+        Datapoint(asset="broken.jpg", data_type="media"),
+        Datapoint(asset="hello", data_type="text"),
+        Datapoint(asset="c.jpg", data_type="media", context="reject"),
+    ]
+
+
+def test_async_engine_reports_successes_and_failures(async_upload):
+    dataset, created = _dataset()
+    datapoints = _datapoints()
+
+    successful, failed = dataset.add_datapoints(datapoints)
+
+    assert sorted(created) == [0, 1, 3]
+    assert {id(dp) for dp in successful} == {id(datapoints[i]) for i in (0, 1, 3)}
+    failed_by_item = {datapoints.index(f.item): f for f in failed}
+    assert set(failed_by_item) == {2, 4}
+    assert failed_by_item[2].error_message == "Asset upload failed: corrupt"
+    assert "rejected" in failed_by_item[4].error_message
+    dataset.openapi_service.api_client.rest_client.close_async_session.assert_awaited_once()
+
+
+def test_async_engine_runs_from_inside_a_running_loop(async_upload):
+    dataset, created = _dataset()
+
+    async def notebook_cell():
+        return dataset.add_datapoints(_datapoints())
+
+    successful, failed = asyncio.run(notebook_cell())
+    assert len(successful) == 3
+    assert len(failed) == 2
+
+
+def test_async_call_on_the_callers_loop_closes_its_http_clients():
+    dataset, created = _dataset()
+
+    successful, failed = asyncio.run(dataset.add_datapoints_async(_datapoints()))
+
+    assert (len(successful), len(failed)) == (3, 2)
+    dataset.openapi_service.api_client.rest_client.close_async_session.assert_awaited_once()
+
+
+def test_cancelled_creation_is_reported_as_failed():
+    dataset, _ = _dataset()
+    datapoints = _datapoints()
+
+    async def upload_datapoint_async(datapoint, dataset_id, index):
+        if index == 0:
+            asyncio.current_task().cancel()
+        await asyncio.sleep(0)
+
+    dataset.datapoint_uploader.upload_datapoint_async = upload_datapoint_async  # type: ignore[method-assign]
+
+    successful, failed = asyncio.run(dataset.add_datapoints_async(datapoints))
+
+    assert {id(dp) for dp in successful} == {id(datapoints[i]) for i in (1, 3, 4)}
+    cancelled = [f for f in failed if f.error_type == "CancelledError"]
+    assert [f.item for f in cancelled] == [datapoints[0]]
+
+
+def test_threaded_engine_is_used_by_default():
+    dataset, created = _dataset()
+    dataset.asset_orchestrator.upload_all_assets = MagicMock(return_value=[])  # type: ignore[method-assign]
+    dataset.datapoint_uploader.upload_datapoint = MagicMock()  # type: ignore[method-assign]
+
+    successful, failed = dataset.add_datapoints(
+        [Datapoint(asset="hello", data_type="text")]
+    )
+
+    assert len(successful) == 1 and not failed
+    assert created == []
+
+
+def test_async_streaming_shares_one_semaphore_across_slices(async_upload):
+    dataset, created = _dataset()
+    semaphores: set[int] = set()
+    original_add_window_async = dataset._add_window_async
+
+    async def add_window_async(window, *args, semaphore=None, **kwargs):
+        semaphores.add(id(semaphore))
+        return await original_add_window_async(
+            window, *args, semaphore=semaphore, **kwargs
+        )
+
+    dataset._add_window_async = add_window_async  # type: ignore[method-assign]
+
+    succeeded, failed = dataset.add_datapoints_streaming(
+        iter(_datapoints()), window_size=4
+    )
+
+    assert (succeeded, failed) == (3, 2)
+    assert sorted(created) == [0, 1, 3]
+    assert len(semaphores) == 1 and id(None) not in semaphores
+
+
+def test_async_streaming_creates_a_group_spanning_slices_once(async_upload):
+    dataset, _ = _dataset()
+    datapoints = [
+        Datapoint(asset=f"{i}.jpg", data_type="media", group=str(i // 3))
+        for i in range(6)
+    ]
+
+    assert dataset.add_datapoints_streaming(datapoints, window_size=8) == (6, 0)
+
+    group_api = dataset.openapi_service.dataset.dataset_group_api
+    groups = [
+        call.kwargs["create_dataset_group_endpoint_input"].group
+        for call in group_api.dataset_dataset_id_group_post.call_args_list
+    ]
+    assert sorted(groups) == ["0", "1"]
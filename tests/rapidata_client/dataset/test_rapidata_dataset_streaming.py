@@ -0,0 +1,142 @@
+"""Tests for bounded-memory streaming ingestion into a dataset.
+
+``add_datapoints_streaming`` must never read further ahead of the upload than
+one window, keep sort indices global across slices, keep uploading while one
+slice is slow, and hand every failure to the caller as soon as its slice
+completes.
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from rapidata.rapidata_client.dataset._rapidata_dataset import RapidataDataset
+from rapidata.rapidata_client.datapoints._datapoint import Datapoint
+
+
+def _dataset() -> tuple[RapidataDataset, list[int]]:
+    openapi_service = MagicMock()
+    openapi_service.environment = "rapidata.ai"
+    dataset = RapidataDataset("ds-1", openapi_service)
+
+    def upload_all_assets(assets, asset_completion_callback=None, **_):
+        if asset_completion_callback:
+            asset_completion_callback(sorted(assets))
+        return []
+
+    created: list[int] = []
+
+    def upload_datapoint(datapoint, dataset_id, index):
+        if datapoint.context == "reject":
+            raise ValueError("rejected")
+        created.append(index)
+
+    dataset.asset_orchestrator.upload_all_assets = upload_all_assets  # type: ignore[method-assign]
+    dataset.datapoint_uploader.upload_datapoint = upload_datapoint  # type: ignore[method-assign]
+    return dataset, created
+
+
+def test_streams_in_windows_with_global_sort_indices():
+    dataset, created = _dataset()
+    pulled: list[int] = []
+    completed: list[int] = []
+    slices_started: list[int] = []
+    original_add_window = dataset._add_window
+
+    def add_window(window, index_offset=0, *args, **kwargs):
+        slices_started.append(index_offset)
+        try:
+            return original_add_window(window, index_offset, *args, **kwargs)
+        finally:
+            completed.extend(range(index_offset, index_offset + len(window)))
+
+    dataset._add_window = add_window  # type: ignore[method-assign]
+
+    def source():
+        for i in range(7):
+            # Nothing beyond the window in flight may be read ahead.
+            assert len(pulled) - len(completed) < 4
+            pulled.append(i)
+            yield Datapoint(
+                asset=f"{i}.jpg",
+                data_type="media",
+                context="reject" if i == 4 else None,
+            )
+
+    failures = []
+    succeeded, failed = dataset.add_datapoints_streaming(
+        source(), on_failure=failures.append, window_size=4
+    )
+
+    assert (succeeded, failed) == (6, 1)
+    assert sorted(slices_started) == list(range(7))
+    assert sorted(created) == [0, 1, 2, 3, 5, 6]
+    assert [f.item.asset for f in failures] == ["4.jpg"]
+
+
+def test_slow_slice_does_not_stall_the_next_ones():
+    dataset, _ = _dataset()
+    later_slices_done = threading.Event()
+    original_add_window = dataset._add_window
+    finished: list[int] = []
+
+    def add_window(window, index_offset=0, *args, **kwargs):
+        if index_offset == 0:
+            # The first slice only finishes once the others have.
+            assert later_slices_done.wait(timeout=5)
+        result = original_add_window(window, index_offset, *args, **kwargs)
+        finished.append(index_offset)
+        if len(finished) == 3:
+            later_slices_done.set()
+        return result
+
+    dataset._add_window = add_window  # type: ignore[method-assign]
+    datapoints = [Datapoint(asset=f"{i}.jpg", data_type="media") for i in range(4)]
+
+    assert dataset.add_datapoints_streaming(datapoints, window_size=4) == (4, 0)
+    assert finished[-1] == 0
+
+
+def test_group_spanning_slices_is_created_once():
+    dataset, _ = _dataset()
+    datapoints = [
+        Datapoint(asset=f"{i}.jpg", data_type="media", group=str(i // 3))
+        for i in range(6)
+    ]
+
+    assert dataset.add_datapoints_streaming(datapoints, window_size=8) == (6, 0)
+
+    group_api = dataset.openapi_service.dataset.dataset_group_api
+    groups = [
+        call.kwargs["create_dataset_group_endpoint_input"].group
+        for call in group_api.dataset_dataset_id_group_post.call_args_list
+    ]
+    assert sorted(groups) == ["0", "1"]
+
+
+def test_completed_assets_are_evicted_from_the_mapping():
+    dataset, _ = _dataset()
+    datapoints = [
+        Datapoint(asset="shared.jpg", data_type="media"),
+        Datapoint(asset=["shared.jpg", "own.jpg"], data_type="media"),
+    ]
+    asset_to_datapoints, pending = dataset._build_asset_to_datapoint_mapping(
+        datapoints
+    )
+
+    ready = dataset._find_ready_datapoints(
+        ["shared.jpg"], asset_to_datapoints, pending, MagicMock()
+    )
+
+    assert ready == [0]
+    assert "shared.jpg" not in asset_to_datapoints
+    assert asset_to_datapoints == {"own.jpg": {1}}
+
+
+def test_invalid_window_size_is_rejected():
+    dataset, _ = _dataset()
+    with pytest.raises(ValueError):
+        dataset.add_datapoints_streaming([], window_size=-1)
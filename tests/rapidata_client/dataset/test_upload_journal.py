@@ -0,0 +1,247 @@
+"""Tests for resuming uploads from an on-disk ``UploadJournal``.
+
+The journal is what lets an upload survive the process dying: whatever it
+records as created must never be uploaded again, under its original sort index,
+while everything else (never attempted, failed locally, or failed later on the
+backend) must be. Resuming with different datapoints has to fail loudly rather
+than silently skipping the wrong rows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rapidata.api_client.rest import RESTClientObject
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.dataset._rapidata_dataset import RapidataDataset
+from rapidata.rapidata_client.dataset._upload_journal import UploadJournal
+from rapidata.rapidata_client.datapoints._datapoint import Datapoint
+from rapidata.rapidata_client.exceptions.failed_upload_exception import (
+    FailedUploadException,
+)
+from rapidata.rapidata_client.job._job_creation_state_machine import (
+    JobDefinitionCreationMachine,
+)
+
+
+def _datapoints(n: int = 5) -> list[Datapoint]:
+    return [Datapoint(asset=f"text {i}", data_type="text") for i in range(n)]
+
+
+def _dataset(
+    fail_indices: set[int] = frozenset(),
+    backend_failed: list[int] | None = None,
+    backend_total: int = 0,
+) -> tuple[RapidataDataset, list[int]]:
+    openapi_service = MagicMock()
+    openapi_service.environment = "rapidata.ai"
+    datapoints_api = openapi_service.dataset.datapoints_api
+    datapoints_api.dataset_dataset_id_datapoints_failed_get.return_value = MagicMock(
+        datapoints=[MagicMock(sort_index=i) for i in backend_failed or []]
+    )
+    datapoints_api.dataset_dataset_id_datapoints_get.return_value = MagicMock(
+        total=backend_total
+    )
+    dataset = RapidataDataset("ds-1", openapi_service)
+
+    uploaded: list[int] = []
+
+    def upload_datapoint(dataset_id, datapoint, index):
+        if index in fail_indices:
+            raise ValueError("rejected")
+        uploaded.append(index)
+        return MagicMock(datapoint_id=f"dp-{index}")
+
+    dataset.datapoint_uploader.upload_datapoint = upload_datapoint  # type: ignore[method-assign]
+    dataset.asset_orchestrator.upload_all_assets = lambda assets, **_: []  # type: ignore[method-assign]
+    return dataset, uploaded
+
+
+def test_resume_uploads_only_missing_datapoints(tmp_path):
+    path = tmp_path / "upload.sqlite"
+    datapoints = _datapoints()
+
+    with UploadJournal(path) as journal:
+        dataset, uploaded = _dataset(fail_indices={3, 4})
+        successful, failed = dataset.add_datapoints(datapoints, journal=journal)
+        assert len(successful) == 3 and len(failed) == 2
+        assert journal.counts() == (3, 2)
+
+    # A new process: fresh objects, same journal file.
+    with UploadJournal(path) as journal:
+        assert journal.dataset_id == "ds-1"
+        dataset, uploaded = _dataset(backend_total=3)
+        successful, failed = dataset.add_datapoints(datapoints, journal=journal)
+
+    assert sorted(uploaded) == [3, 4]
+    assert len(successful) == 5 and failed == []
+
+
+def test_backend_failures_are_uploaded_again(tmp_path):
+    datapoints = _datapoints(3)
+    with UploadJournal(tmp_path / "upload.sqlite") as journal:
+        _dataset()[0].add_datapoints(datapoints, journal=journal)
+
+        dataset, uploaded = _dataset(backend_failed=[1], backend_total=3)
+        dataset.add_datapoints(datapoints, journal=journal)
+
+    assert uploaded == [1]
+
+
+def test_resuming_with_different_datapoints_is_rejected(tmp_path):
+    with UploadJournal(tmp_path / "upload.sqlite") as journal:
+        _dataset()[0].add_datapoints(_datapoints(3), journal=journal)
+
+        changed = _datapoints(3)
+        changed[1] = Datapoint(asset="something else", data_type="text")
+        dataset, uploaded = _dataset(backend_total=3)
+        with pytest.raises(ValueError, match="sort index 1"):
+            dataset.add_datapoints(changed, journal=journal)
+    assert uploaded == []
+
+
+def test_journal_is_bound_to_one_dataset(tmp_path):
+    with UploadJournal(tmp_path / "upload.sqlite") as journal:
+        journal.bind_dataset("ds-1")
+        journal.bind_dataset("ds-1")
+        with pytest.raises(ValueError, match="belongs to dataset ds-1"):
+            journal.bind_dataset("ds-2")
+
+
+def test_streaming_resume_keeps_global_sort_indices(tmp_path):
+    datapoints = _datapoints(7)
+    with UploadJournal(tmp_path / "upload.sqlite") as journal:
+        dataset, _ = _dataset(fail_indices={2, 5})
+        assert dataset.add_datapoints_streaming(
+            iter(datapoints), window_size=3, journal=journal
+        ) == (5, 2)
+
+        dataset, uploaded = _dataset(backend_total=5)
+        assert dataset.add_datapoints_streaming(
+            iter(datapoints), window_size=3, journal=journal
+        ) == (7, 0)
+
+    assert sorted(uploaded) == [2, 5]
+
+
+def test_async_engine_writes_the_journal_off_the_loop(tmp_path):
+    dataset, _ = _dataset(fail_indices={1})
+    rest_client = RESTClientObject(MagicMock())
+    rest_client.close_async_session = AsyncMock()  # type: ignore[method-assign]
+    dataset.openapi_service.api_client.rest_client = rest_client
+
+    async def upload_datapoint_async(dataset_id, datapoint, index):
+        if index == 1:
+            raise ValueError("rejected")
+        return MagicMock(datapoint_id=f"dp-{index}")
+
+    async def upload_all_assets_async(assets, **_):
+        return []
+
+    dataset.datapoint_uploader.upload_datapoint_async = upload_datapoint_async  # type: ignore[method-assign]
+    dataset.asset_orchestrator.upload_all_assets_async = upload_all_assets_async  # type: ignore[method-assign]
+    writer_threads: set[int] = set()
+
+    with UploadJournal(tmp_path / "upload.sqlite") as journal:
+        original_record = journal._record
+
+        def record(*args, **kwargs):
+            writer_threads.add(threading.get_ident())
+            return original_record(*args, **kwargs)
+
+        journal._record = record  # type: ignore[method-assign]
+
+        async def main() -> int:
+            await dataset.add_datapoints_async(_datapoints(3), journal=journal)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(main())
+        assert journal.counts() == (2, 1)
+
+    assert writer_threads and loop_thread not in writer_threads
+
+
+@pytest.fixture
+def journal_directory(tmp_path):
+    previous = rapidata_config.upload.journalDirectory
+    rapidata_config.upload.journalDirectory = tmp_path
+    try:
+        yield tmp_path
+    finally:
+        rapidata_config.upload.journalDirectory = previous
+
+
+def test_job_machine_resumes_into_journaled_dataset(journal_directory):
+    svc = MagicMock()
+    svc.environment = "rapidata.ai"
+    svc.dataset.dataset_api.dataset_post.return_value = MagicMock(dataset_id="ds-1")
+    svc.order.job_api.job_definition_post.return_value = MagicMock(
+        definition_id="def-1"
+    )
+    datapoints = [
+        Datapoint(asset="a.jpg", data_type="media"),
+        Datapoint(asset="b.jpg", data_type="media"),
+    ]
+
+    def build_machine() -> JobDefinitionCreationMachine:
+        return JobDefinitionCreationMachine(
+            openapi_service=svc,
+            name="My Job",
+            workflow=MagicMock(),
+            datapoints=datapoints,
+            referee=MagicMock(),
+            failure_tolerance=0.0,
+        )
+
+    module = "rapidata.rapidata_client.job._job_creation_state_machine"
+    with (
+        patch(f"{module}.RapidataDataset") as dataset_cls,
+        patch(f"{module}.print_job_definition_preview_link"),
+        patch(
+            "rapidata.api_client.models.create_job_definition_endpoint_input."
+            "CreateJobDefinitionEndpointInput"
+        ),
+    ):
+        dataset_cls.return_value.id = "ds-1"
+        dataset_cls.return_value.add_datapoints.return_value = (
+            datapoints[:1],
+            [MagicMock(item=datapoints[1])],
+        )
+        with pytest.raises(FailedUploadException):
+            build_machine().run()
+
+        # Second process: the dataset comes from the journal, not a new POST.
+        dataset_cls.reset_mock()
+        dataset_cls.return_value.add_datapoints.return_value = (datapoints, [])
+        job_definition = build_machine().run()
+
+    assert job_definition.id == "def-1"
+    svc.dataset.dataset_api.dataset_post.assert_called_once()
+    dataset_cls.assert_called_once_with("ds-1", svc)
+    _, kwargs = dataset_cls.return_value.add_datapoints.call_args
+    assert isinstance(kwargs["journal"], UploadJournal)
+    assert list(journal_directory.iterdir()) == []
+
+
+def test_journal_name_depends_on_the_datapoints():
+    svc = MagicMock()
+    svc.environment = "rapidata.ai"
+
+    def file_name(assets: list[str]) -> str:
+        machine = JobDefinitionCreationMachine(
+            openapi_service=svc,
+            name="My Job",
+            workflow=MagicMock(),
+            datapoints=[Datapoint(asset=a, data_type="media") for a in assets],
+            referee=MagicMock(),
+            failure_tolerance=0.0,
+        )
+        return machine._journal_file_name()
+
+    assert file_name(["a.jpg", "b.jpg"]) == file_name(["a.jpg", "b.jpg"])
+    assert file_name(["a.jpg", "b.jpg"]) != file_name(["a.jpg", "c.jpg"])
+    assert file_name(["a.jpg"]).startswith("My_Job-")
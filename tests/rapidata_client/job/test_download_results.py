@@ -0,0 +1,119 @@
+"""Tests for ``RapidataJob.download_results``.
+
+The results body is written to disk while it arrives instead of being held
+in memory, so it has to travel through the API client's streaming path with
+the same retries and error handling as every other request, and a failed
+download must never leave a truncated file where the results should be.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from rapidata.api_client import rest
+from rapidata.api_client.api.job_api import JobApi
+from rapidata.api_client.models.audience_job_state import AudienceJobState
+from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
+from rapidata.rapidata_client.exceptions.rapidata_error import RapidataError
+from rapidata.rapidata_client.job.rapidata_job import RapidataJob
+
+_RESULTS = {
+    "info": {"type": "Classify"},
+    "results": [{"aggregatedResults": {"cat": i, "dog": 3 - i}} for i in range(3)],
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(rest, "_backoff_delay", lambda attempt: 0.0)
+
+
+def _make_job(handler) -> RapidataJob:
+    api_client = RapidataApiClient()
+    api_client.rest_client.session = httpx.Client(  # type: ignore[assignment]
+        transport=httpx.MockTransport(handler)
+    )
+    openapi_service = MagicMock()
+    openapi_service.order.job_api = JobApi(api_client)
+    openapi_service.order.job_api.job_job_id_get = MagicMock(
+        return_value=MagicMock(state=AudienceJobState.COMPLETED)
+    )
+    openapi_service.audience.audience_api.audience_audience_id_user_metrics_get.return_value.users_per_state = {
+        "Graduated": 5
+    }
+    return RapidataJob(
+        job_id="job-1",
+        name="My Job",
+        audience_id="aud-1",
+        created_at=MagicMock(),
+        definition_id="def-1",
+        openapi_service=openapi_service,
+    )
+
+
+def _chunked(body: bytes, size: int = 7):
+    return iter([body[i : i + size] for i in range(0, len(body), size)])
+
+
+def test_results_are_written_to_disk_and_iterated(tmp_path):
+    body = json.dumps(_RESULTS).encode()
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, content=_chunked(body))
+
+    results_file = _make_job(handler).download_results(tmp_path / "results.json")
+
+    assert paths == ["/job/job-1/download-results"]
+    assert results_file.path.read_bytes() == body
+    assert list(results_file) == _RESULTS["results"]
+    assert results_file.info == {"type": "Classify"}
+    assert [p.name for p in tmp_path.iterdir()] == ["results.json"]
+
+
+def test_transient_errors_are_retried(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, content=json.dumps(_RESULTS).encode())
+
+    results_file = _make_job(handler).download_results(tmp_path / "results.json")
+
+    assert len(calls) == 3
+    assert results_file.load() == _RESULTS
+
+
+def test_failed_download_leaves_no_file(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"message": "Job not found"})
+
+    with pytest.raises(RapidataError, match="Job not found"):
+        _make_job(handler).download_results(tmp_path / "results.json")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_interrupted_download_keeps_the_previous_file(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text("previous")
+
+    def broken_body():
+        yield b'{"info": {}, "results": ['
+        raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=broken_body())
+
+    with pytest.raises(httpx.ReadError):
+        _make_job(handler).download_results(path)
+
+    assert path.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["results.json"]
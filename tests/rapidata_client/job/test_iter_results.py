@@ -0,0 +1,186 @@
+"""Tests for ``RapidataJob.iter_results``.
+
+Reading a job's results page by page lets callers process partial results
+without the full results file. Pages after the first are fetched ahead
+concurrently, so the items must still arrive in page order. At most the
+requested number of pages may be in flight at once, and a caller that stops
+early must not keep the fetching going.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from rapidata.api_client.api.job_api import JobApi
+from rapidata.api_client.models.rapid_state import RapidState
+from rapidata.api_client.models.ranking_datapoint import RankingDatapoint
+from rapidata.rapidata_client.api.rapidata_api_client import RapidataApiClient
+from rapidata.rapidata_client.exceptions.rapidata_error import RapidataError
+from rapidata.rapidata_client.job.rapidata_job import RapidataJob
+
+
+class _Server:
+    """Serves ``total`` ranking datapoints, ``page_size`` per page."""
+
+    def __init__(self, total: int, page_size: int | None = None, delay: float = 0):
+        self.total = total
+        self.page_size = page_size
+        self.delay = delay
+        self.requests: list[dict[str, list[str]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_page: int | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        query = parse_qs(request.url.query.decode())
+        with self._lock:
+            self.requests.append(query)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            page = int(query["page"][0])
+            if page == self.fail_page:
+                return httpx.Response(404, json={"title": "Not found"})
+            page_size = self.page_size or int(query["page_size"][0])
+            first = (page - 1) * page_size
+            items = [
+                {
+                    "datapointId": f"dp-{i}",
+                    "asset": {
+                        "_t": "TextAsset",
+                        "text": str(i),
+                        "metadata": {},
+                        "identifier": str(i),
+                    },
+                    "elo": 1000 + i,
+                }
+                for i in range(first, min(first + page_size, self.total))
+            ]
+            body = {
+                "_t": "RankingResults",
+                "total": self.total,
+                "page": page,
+                "pageSize": page_size,
+                "totalVotes": 0,
+                "items": items,
+            }
+            return httpx.Response(200, content=json.dumps(body).encode())
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _make_job(server: _Server) -> RapidataJob:
+    api_client = RapidataApiClient()
+    api_client.rest_client.session = httpx.Client(  # type: ignore[assignment]
+        transport=httpx.MockTransport(server)
+    )
+    openapi_service = MagicMock()
+    openapi_service.order.job_api = JobApi(api_client)
+    return RapidataJob(
+        job_id="job-1",
+        name="My Job",
+        audience_id="aud-1",
+        created_at=MagicMock(),
+        definition_id="def-1",
+        openapi_service=openapi_service,
+    )
+
+
+def _ids(items) -> list[str]:
+    return [item.datapoint_id for item in items]
+
+
+def test_items_of_all_pages_arrive_in_order():
+    server = _Server(total=7, delay=0.01)
+
+    items = list(_make_job(server).iter_results(page_size=2))
+
+    assert all(isinstance(item, RankingDatapoint) for item in items)
+    assert _ids(items) == [f"dp-{i}" for i in range(7)]
+    assert sorted(int(r["page"][0]) for r in server.requests) == [1, 2, 3, 4]
+
+
+def test_pages_are_fetched_concurrently_within_the_window():
+    server = _Server(total=20, delay=0.05)
+
+    items = list(_make_job(server).iter_results(page_size=2, max_concurrent_pages=3))
+
+    assert len(items) == 20
+    assert server.max_in_flight == 3
+
+
+def test_pages_follow_the_page_size_the_server_used():
+    server = _Server(total=5, page_size=2)
+
+    items = list(_make_job(server).iter_results(page_size=100))
+
+    assert _ids(items) == [f"dp-{i}" for i in range(5)]
+    assert len(server.requests) == 3
+
+
+def test_pages_added_by_a_growing_total_are_fetched():
+    server = _Server(total=4)
+    serve = server.__call__
+
+    def growing(request: httpx.Request) -> httpx.Response:
+        response = serve(request)
+        server.total = 7
+        return response
+
+    job = _make_job(server)
+    job._openapi_service.order.job_api.api_client.rest_client.session = httpx.Client(
+        transport=httpx.MockTransport(growing)
+    )
+
+    items = list(job.iter_results(page_size=2, max_concurrent_pages=1))
+
+    assert _ids(items) == [f"dp-{i}" for i in range(7)]
+
+
+def test_states_filter_is_sent_with_every_page():
+    server = _Server(total=4)
+
+    list(_make_job(server).iter_results(states=[RapidState.DONE], page_size=2))
+
+    assert [r["states"] for r in server.requests] == [["Done"], ["Done"]]
+
+
+def test_breaking_off_stops_fetching_ahead():
+    server = _Server(total=100, delay=0.02)
+
+    results = _make_job(server).iter_results(page_size=2, max_concurrent_pages=2)
+    next(results)
+    results.close()
+    time.sleep(0.1)
+
+    assert len(server.requests) <= 1 + 2
+
+
+def test_failed_page_raises_while_iterating():
+    server = _Server(total=6)
+    server.fail_page = 2
+
+    results = _make_job(server).iter_results(page_size=2)
+
+    assert _ids([next(results), next(results)]) == ["dp-0", "dp-1"]
+    with pytest.raises(RapidataError):
+        next(results)
+
+
+@pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"max_concurrent_pages": 0}])
+def test_invalid_arguments_raise_before_any_request(kwargs):
+    server = _Server(total=1)
+
+    with pytest.raises(ValueError):
+        _make_job(server).iter_results(**kwargs)
+    assert server.requests == []
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from rapidata.rapidata_client.config import rapidata_config
 from rapidata.rapidata_client.exceptions.failed_upload import FailedUpload
 from rapidata.rapidata_client.exceptions.failed_upload_exception import (
     FailedUploadException,
@@ -188,3 +189,36 @@ def test_all_fail_never_creates_definition_even_at_full_tolerance():
             machine.run()
 
     svc.order.job_api.job_definition_post.assert_not_called()
+
+
+def test_large_upload_is_streamed():
+    svc = _make_openapi_service()
+    dps = ["a", "b", "c"]
+
+    def stream(datapoints, on_failure, journal):
+        on_failure(_failed("c"))
+        return 2, 1
+
+    dataset = MagicMock()
+    dataset.id = "ds-1"
+    dataset.add_datapoints_streaming.side_effect = stream
+    machine = JobDefinitionCreationMachine(
+        openapi_service=svc,
+        name="My Job",
+        workflow=MagicMock(),
+        datapoints=dps,
+        referee=MagicMock(),
+        failure_tolerance=0.5,
+    )
+
+    with (
+        patch.object(rapidata_config.upload, "streamingWindowSize", 2),
+        patch(f"{MODULE}.RapidataDataset", return_value=dataset),
+        patch(f"{MODULE}.print_job_definition_preview_link"),
+        patch(JOB_INPUT),
+    ):
+        job_def = machine.run()
+
+    assert job_def.id == "def-1"
+    dataset.add_datapoints.assert_not_called()
+    assert [f.item for f in machine.failed_uploads] == ["c"]
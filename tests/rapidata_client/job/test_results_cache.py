@@ -0,0 +1,157 @@
+"""Tests for the on-disk cache of job results.
+
+Dashboards fetch the results of the same completed jobs over and over, so with
+``rapidata_config.results.cacheResultsToDisk`` a completed job's results must
+come from disk after the first download. They must never outlive the completion
+they belong to: a job that completes again, or whose results went stale and
+were regenerated, has to be downloaded afresh.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from rapidata.api_client.models.audience_job_state import AudienceJobState
+from rapidata.rapidata_client.config import rapidata_config
+from rapidata.rapidata_client.job.rapidata_job import RapidataJob
+from rapidata.rapidata_client.results import _results_cache
+
+_RESULTS = {
+    "info": {"type": "Classify"},
+    "results": [{"aggregatedResults": {"cat": 3}}],
+}
+_COMPLETED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _results_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(rapidata_config.results, "cacheResultsToDisk", True)
+    monkeypatch.setattr(
+        rapidata_config.results, "resultsCacheLocation", tmp_path / "results"
+    )
+    yield
+    for cache in _results_cache._caches.values():
+        cache.close()
+    _results_cache._caches.clear()
+    _results_cache._size_limits.clear()
+
+
+def _job_get(state: str = "Completed", completed_at: datetime | None = _COMPLETED_AT):
+    job = MagicMock()
+    job.state = AudienceJobState(state)
+    job.completed_at = completed_at
+    return job
+
+
+def _make_job(
+    body: bytes = json.dumps(_RESULTS).encode(),
+) -> tuple[RapidataJob, MagicMock]:
+    openapi_service = MagicMock()
+    job_api = openapi_service.order.job_api
+    job_api.job_job_id_get.return_value = _job_get()
+    job_api.job_job_id_download_results_get.return_value = body
+    openapi_service.audience.audience_api.audience_audience_id_user_metrics_get.return_value.users_per_state = {
+        "Graduated": 5
+    }
+    job = RapidataJob(
+        job_id="job-1",
+        name="My Job",
+        audience_id="aud-1",
+        created_at=MagicMock(),
+        definition_id="def-1",
+        openapi_service=openapi_service,
+    )
+    return job, job_api
+
+
+def test_second_call_returns_cached_results_without_downloading():
+    job, job_api = _make_job()
+
+    first = job.get_results()
+    second = job.get_results()
+
+    assert first == second == _RESULTS
+    assert job_api.job_job_id_download_results_get.call_count == 1
+
+
+def test_cache_is_shared_between_job_instances():
+    job, _ = _make_job()
+    job.get_results()
+    other, other_api = _make_job()
+
+    assert other.get_results() == _RESULTS
+    other_api.job_job_id_download_results_get.assert_not_called()
+
+
+def test_new_completion_is_downloaded_and_replaces_the_old_one():
+    job, job_api = _make_job()
+    job.get_results()
+
+    job_api.job_job_id_get.return_value = _job_get(
+        completed_at=datetime(2026, 2, 1, tzinfo=timezone.utc)
+    )
+    job.get_results()
+
+    assert job_api.job_job_id_download_results_get.call_count == 2
+    assert len(_results_cache._cache()) == 1
+
+
+def test_stale_results_are_dropped_on_regeneration():
+    job, job_api = _make_job()
+    job.get_results()
+    job_api.job_job_id_get.side_effect = [_job_get("StaleResults"), _job_get()]
+
+    job.get_results()
+
+    job_api.job_job_id_retry_post.assert_called_once_with("job-1")
+    assert job_api.job_job_id_download_results_get.call_count == 2
+
+
+def test_results_larger_than_the_size_limit_are_not_cached(monkeypatch):
+    monkeypatch.setattr(rapidata_config.results, "resultsCacheSizeLimit", 10)
+    job, job_api = _make_job()
+
+    job.get_results()
+    job.get_results()
+
+    assert job_api.job_job_id_download_results_get.call_count == 2
+
+
+def test_failed_jobs_are_not_cached():
+    job, job_api = _make_job()
+    job_api.job_job_id_get.return_value = _job_get("Failed", completed_at=None)
+
+    job.get_results()
+    job.get_results()
+
+    assert job_api.job_job_id_download_results_get.call_count == 2
+
+
+def test_corrupt_entry_is_downloaded_again():
+    job, job_api = _make_job()
+    _results_cache.put("job-1", _COMPLETED_AT, b'{"results": [')
+
+    assert job.get_results() == _RESULTS
+    assert job_api.job_job_id_download_results_get.call_count == 1
+
+
+def test_disabled_cache_leaves_no_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(rapidata_config.results, "cacheResultsToDisk", False)
+    job, job_api = _make_job()
+
+    job.get_results()
+    job.get_results()
+
+    assert job_api.job_job_id_download_results_get.call_count == 2
+    assert not (tmp_path / "results").exists()
+
+
+def test_changed_size_limit_applies_to_the_open_cache(monkeypatch):
+    _results_cache._cache()
+    monkeypatch.setattr(rapidata_config.results, "resultsCacheSizeLimit", 1024**2)
+
+    assert _results_cache._cache().reset("size_limit") == 1024**2
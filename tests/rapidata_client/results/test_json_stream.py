@@ -0,0 +1,105 @@
+"""Tests for reading a results file one row at a time.
+
+Large jobs produce results files of several GB, which ``get_results`` loads
+and parses whole. The streaming reader must return exactly what ``json.loads``
+would, whatever the file's layout and wherever a read chunk happens to end,
+while holding no more than one row in memory.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from rapidata.rapidata_client.results import RapidataResultsFile
+from rapidata.rapidata_client.results._json_stream import iter_array, read_members
+
+_DOCUMENT = {
+    "info": {"type": "Compare", "name": 'quoted "name" with ] and }'},
+    "results": [
+        {
+            "context": "escaped \\\" quote, backslash \\\\ and [brackets]",
+            "aggregatedResults": {"a.jpg": 2, "b.jpg": 0},
+            "detailedResults": [
+                {"votedFor": "a.jpg", "userDetails": {"userScores": {"global": 0.8}}},
+                {"votedFor": "a.jpg", "userDetails": {"country": "CH"}},
+            ],
+        },
+        {"context": "ünïcödé ✓", "winner": None, "flags": [True, False, -1.5e3]},
+        [],
+        "",
+    ],
+    "summary": {"A_wins_total": 1, "B_wins_total": 0},
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_items_match_a_full_parse(indent, chunk_size):
+    raw = json.dumps(_DOCUMENT, indent=indent, ensure_ascii=False).encode()
+    members: dict = {}
+
+    items = list(iter_array(io.BytesIO(raw), "results", members, chunk_size))
+
+    assert items == _DOCUMENT["results"]
+    assert members == {"info": _DOCUMENT["info"], "summary": _DOCUMENT["summary"]}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_read_members_passes_over_the_array(chunk_size):
+    raw = json.dumps(_DOCUMENT).encode()
+
+    members = read_members(io.BytesIO(raw), "results", chunk_size)
+
+    assert members == {"info": _DOCUMENT["info"], "summary": _DOCUMENT["summary"]}
+
+
+@pytest.mark.parametrize(
+    "raw", [b'{"results": []}', b"{}", b'{"info": {}}', b' {\n"results" : [ ] }\n']
+)
+def test_empty_or_missing_array_yields_nothing(raw):
+    assert list(iter_array(io.BytesIO(raw), "results")) == []
+
+
+@pytest.mark.parametrize(
+    "raw", [b'{"results": [{"a": 1}', b'{"results": {"a": 1}}', b"[]"]
+)
+def test_malformed_documents_raise(raw):
+    with pytest.raises(ValueError):
+        list(iter_array(io.BytesIO(raw), "results", chunk_size=4))
+
+
+def test_memory_stays_proportional_to_one_row(tmp_path):
+    row = {
+        "context": "x" * 10_000,
+        "detailedResults": [{"votedFor": "a.jpg", "country": "CH"}] * 5,
+    }
+    path = tmp_path / "results.json"
+    with open(path, "w") as file:
+        file.write('{"info": {"type": "Compare"}, "results": [')
+        file.write(",".join([json.dumps(row)] * 2_000))
+        file.write("]}")
+    assert path.stat().st_size > 20_000_000
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in RapidataResultsFile(path))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 2_000
+    assert peak < 5_000_000
+
+
+def test_results_file_reads_info_and_loads_whole(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(_DOCUMENT))
+    results_file = RapidataResultsFile(path)
+
+    assert results_file.info == _DOCUMENT["info"]
+    assert list(results_file) == _DOCUMENT["results"]
+    assert results_file.load() == _DOCUMENT
@@ -0,0 +1,199 @@
+"""Tests for converting results to a DataFrame.
+
+``to_pandas`` collects the table column by column rather than building a dict
+per row, so splitting a large job by its detailed results stays fast. Users
+rely on the exact frame that came out of building it row by row: the same
+columns in the same order, NaN for a key a row lacks, and a response's value
+winning over its datapoint's where both have the same field.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pandas as pd
+import pytest
+
+from rapidata.rapidata_client.results import RapidataResults
+
+
+def _details(voted_for, country, **extra):
+    return {"votedFor": voted_for, "userDetails": {"country": country}, **extra}
+
+
+_COMPARE = {
+    "info": {"type": "Compare"},
+    "results": [
+        {
+            "context": "first",
+            "winner": "a.jpg",
+            "assetUrls": {"a.jpg": "https://a", "b.jpg": "https://b"},
+            "aggregatedResults": {"a.jpg": 2, "b.jpg": 0, "Both": 1},
+            "privateMetadata": {"source": "x"},
+            "detailedResults": [
+                _details("a.jpg", "CH"),
+                _details("a.jpg", "DE", context="overridden"),
+            ],
+        },
+        {
+            "context": "second",
+            "winner": "d.jpg",
+            "assetUrls": {"c.jpg": "https://c", "d.jpg": "https://d"},
+            "aggregatedResults": {"c.jpg": 0, "d.jpg": 1},
+            "detailedResults": [_details("d.jpg", "US", late=True)],
+        },
+    ],
+}
+
+
+def test_flat_columns_follow_the_first_result():
+    results = RapidataResults(
+        {
+            "info": {"type": "Classify"},
+            "results": [
+                {"name": "x", "agg": {"cat": 1, "dog": 2}, "n": 1},
+                {"name": "y", "agg": {"cat": 3}, "extra": 5},
+            ],
+        }
+    )
+
+    frame = results.to_pandas()
+
+    expected = pd.DataFrame(
+        {
+            "name": ["x", "y"],
+            "agg_cat": [1, 3],
+            "agg_dog": [2, None],
+            "n": [1, None],
+        }
+    )
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_split_details_repeats_the_result_for_each_response():
+    results = RapidataResults(
+        {
+            "info": {"type": "Classify"},
+            "results": [
+                {
+                    "name": "x",
+                    "detailedResults": [
+                        _details("cat", "CH"),
+                        {"votedFor": "dog", "name": "response"},
+                    ],
+                },
+                {"name": "skipped", "detailedResults": []},
+                {"name": "y", "extra": 1, "detailedResults": [_details("dog", "US")]},
+            ],
+        }
+    )
+
+    frame = results.to_pandas(split_details=True)
+
+    assert list(frame.columns) == [
+        "name",
+        "votedFor",
+        "userDetails_country",
+        "extra",
+    ]
+    assert frame["name"].tolist() == ["x", "response", "y"]
+    assert frame["votedFor"].tolist() == ["cat", "dog", "dog"]
+    assert frame["userDetails_country"].tolist()[::2] == ["CH", "US"]
+    assert math.isnan(frame["userDetails_country"][1])
+    assert math.isnan(frame["extra"][0])
+    assert frame["extra"][2] == 1
+
+
+def test_compare_splits_asset_metrics_into_a_and_b():
+    frame = RapidataResults(_COMPARE).to_pandas()
+
+    assert list(frame.columns) == [
+        "context",
+        "winner",
+        "assetA",
+        "assetB",
+        "A_assetUrls",
+        "B_assetUrls",
+        "A_aggregatedResults",
+        "B_aggregatedResults",
+        "Both_aggregatedResults",
+        "privateMetadata_source",
+    ]
+    assert frame["assetA"].tolist() == ["a.jpg", "c.jpg"]
+    assert frame["A_aggregatedResults"].tolist() == [2, 0]
+    assert frame["B_aggregatedResults"].tolist() == [0, 1]
+    assert frame["Both_aggregatedResults"][0] == 1
+    assert math.isnan(frame["Both_aggregatedResults"][1])
+
+
+def test_compare_split_details_keeps_asset_columns_and_response_overrides():
+    frame = RapidataResults(_COMPARE).to_pandas(split_details=True)
+
+    assert len(frame) == 3
+    assert list(frame.columns)[-3:] == ["votedFor", "userDetails_country", "late"]
+    assert frame["context"].tolist() == ["first", "overridden", "second"]
+    assert frame["A_aggregatedResults"].tolist() == [2, 2, 0]
+    assert frame["userDetails_country"].tolist() == ["CH", "DE", "US"]
+    assert frame["late"].tolist()[2] is True
+    assert frame["late"][:2].isna().all()
+
+
+def test_ranking_has_a_column_per_asset():
+    results = RapidataResults(
+        {
+            "info": {"type": "Ranking"},
+            "results": [
+                {
+                    "assetUrls": {"m1": "u1", "m2": "u2", "m3": "u3"},
+                    "aggregatedResults": {"m1": 3, "m2": 2, "m3": 1},
+                    "detailedResults": [{"votedFor": "m1"}, {"votedFor": "m3"}],
+                }
+            ],
+        }
+    )
+
+    frame = results.to_pandas(split_details=True)
+
+    assert list(frame.columns) == [
+        "asset_1",
+        "asset_2",
+        "asset_3",
+        "m1_assetUrls",
+        "m2_assetUrls",
+        "m3_assetUrls",
+        "m1_aggregatedResults",
+        "m2_aggregatedResults",
+        "m3_aggregatedResults",
+        "votedFor",
+    ]
+    assert frame["m2_aggregatedResults"].tolist() == [2, 2]
+    assert frame["votedFor"].tolist() == ["m1", "m3"]
+
+
+def test_colliding_flattened_names_keep_the_last_value():
+    results = RapidataResults(
+        {
+            "info": {"type": "Classify"},
+            "results": [
+                {
+                    "detailedResults": [
+                        {"user_id": 1, "user": {"id": 2}},
+                        {"user": {"id": 3}, "other": [1, 2]},
+                    ]
+                }
+            ],
+        }
+    )
+
+    frame = results.to_pandas(split_details=True)
+
+    assert list(frame.columns) == ["user_id", "other"]
+    assert frame["user_id"].tolist() == [2, 3]
+    assert frame["other"][1] == [1, 2]
+
+
+def test_split_details_without_detailed_results_raises():
+    results = RapidataResults({"info": {"type": "Classify"}, "results": [{"a": 1}]})
+
+    with pytest.raises(ValueError, match="No detailed results"):
+        results.to_pandas(split_details=True)
@@ -0,0 +1,146 @@
+"""Tests for exporting results to Arrow, Parquet and polars.
+
+Analytics pipelines read these tables without going through pandas, so the
+columns must match ``to_pandas`` while keeping proper types: nulls instead of
+NaN for missing values, integers that stay integers, and every row group of a
+Parquet file written with the same schema.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from rapidata.rapidata_client.results import RapidataResults
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+_COMPARE = {
+    "info": {"type": "Compare"},
+    "results": [
+        {
+            "context": "first",
+            "assetUrls": {"a.jpg": "https://a", "b.jpg": "https://b"},
+            "aggregatedResults": {"a.jpg": 2, "b.jpg": 0},
+            "label": 1,
+            "detailedResults": [
+                {"votedFor": "a.jpg", "userDetails": {"country": "CH"}},
+                {"votedFor": "a.jpg", "tags": ["fast"]},
+            ],
+        },
+        {
+            "context": "second",
+            "assetUrls": {"c.jpg": "https://c", "d.jpg": "https://d"},
+            "aggregatedResults": {"c.jpg": 0, "d.jpg": 1},
+            "label": "text",
+            "detailedResults": [{"votedFor": "d.jpg", "userDetails": {"country": "US"}}],
+        },
+    ],
+}
+
+
+def test_arrow_has_the_pandas_columns_with_types():
+    results = RapidataResults(_COMPARE)
+
+    table = results.to_arrow(split_details=True)
+
+    assert table.column_names == list(results.to_pandas(split_details=True).columns)
+    assert table.schema.field("A_aggregatedResults").type == pa.int64()
+    assert table.column("A_aggregatedResults").to_pylist() == [2, 2, 0]
+    assert table.column("userDetails_country").to_pylist() == ["CH", None, "US"]
+    assert table.column("tags").to_pylist() == [None, ["fast"], None]
+
+
+def test_mixed_type_column_is_stored_as_json_text():
+    table = RapidataResults(_COMPARE).to_arrow()
+
+    field = table.schema.field("label")
+    assert field.type == pa.string()
+    assert field.metadata == {b"encoding": b"json"}
+    assert [json.loads(v) for v in table.column("label").to_pylist()] == [1, "text"]
+
+
+def test_parquet_is_written_in_row_groups(tmp_path):
+    results = RapidataResults(
+        {
+            "info": {"type": "Classify"},
+            "results": [
+                {"name": str(i), "detailedResults": [{"votedFor": "cat"}] * 3}
+                for i in range(5)
+            ]
+            + [{"name": "5", "detailedResults": [{"votedFor": None, "score": 0.5}]}],
+        }
+    )
+    path = tmp_path / "results.parquet"
+
+    results.to_parquet(str(path), split_details=True, row_group_size=4)
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 4
+    assert parquet.read().equals(results.to_arrow(split_details=True))
+    # Typed from the whole column, not from the first row group alone.
+    assert parquet.schema_arrow.field("score").type == pa.float64()
+
+
+def test_parquet_widens_and_falls_back_across_row_groups(tmp_path):
+    labels: list = ["a", 1, "b", "c", "d", "e"]
+    results = RapidataResults(
+        {
+            "info": {"type": "Classify"},
+            "results": [
+                {"name": str(i), "score": score, "label": label}
+                for i, (score, label) in enumerate(zip([1, 2, 3, 4, 5, 0.5], labels))
+            ],
+        }
+    )
+    path = tmp_path / "results.parquet"
+
+    results.to_parquet(str(path), row_group_size=2)
+
+    schema = pq.ParquetFile(path).schema_arrow
+    assert schema.field("score").type == pa.float64()
+    # A group whose values only fail on conversion still gets the JSON column.
+    assert schema.field("label").metadata == {b"encoding": b"json"}
+    table = pq.read_table(path)
+    assert [json.loads(v) for v in table.column("label").to_pylist()] == labels
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        {"name": "x", "detailedResults": [{"votedFor": "cat", "userDetails": {}}]},
+        {"name": "x", "tags": [{}]},
+    ],
+)
+def test_parquet_stores_empty_objects_as_json_text(tmp_path, result):
+    results = RapidataResults({"info": {"type": "Classify"}, "results": [result]})
+    path = tmp_path / "results.parquet"
+
+    results.to_parquet(str(path))
+
+    table = pq.read_table(path)
+    name = "detailedResults" if "detailedResults" in result else "tags"
+    assert table.schema.field(name).metadata == {b"encoding": b"json"}
+    assert json.loads(table.column(name)[0].as_py()) == result[name]
+
+
+def test_empty_results_give_an_empty_table(tmp_path):
+    results = RapidataResults({"info": {"type": "Classify"}, "results": []})
+
+    assert results.to_arrow().num_rows == 0
+    results.to_parquet(str(tmp_path / "results.parquet"))
+    assert pq.read_table(tmp_path / "results.parquet").num_columns == 0
+
+
+def test_polars_matches_arrow():
+    pl = pytest.importorskip("polars")
+    results = RapidataResults(_COMPARE)
+
+    frame = results.to_polars(split_details=True)
+
+    table = results.to_arrow(split_details=True)
+    assert isinstance(frame, pl.DataFrame)
+    assert frame.schema["A_aggregatedResults"] == pl.Int64
+    assert frame.to_dict(as_series=False) == table.to_pydict()
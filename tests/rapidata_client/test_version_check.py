@@ -0,0 +1,110 @@
+"""Tests for the cached, non-blocking SDK version check.
+
+Every ``RapidataClient()`` used to wait on a request for the latest release,
+adding seconds to the start of every worker on slow or air-gapped networks.
+The check must never block the caller, and the answer, including a failed
+lookup, must be reused for a day instead of asked for again.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rapidata.rapidata_client import _version_check
+from rapidata.rapidata_client.api import rapidata_api_client
+
+
+@pytest.fixture(autouse=True)
+def version_cache(tmp_path, monkeypatch):
+    path = tmp_path / "version_check.json"
+    monkeypatch.setattr(_version_check, "_CACHE_PATH", path)
+    monkeypatch.setattr(_version_check, "_refresh_thread", None)
+    monkeypatch.setattr(rapidata_api_client, "_sdk_outdated_info", None)
+    return path
+
+
+def _release(tag: str) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {"tag_name": tag}
+    return response
+
+
+def _wait_for_refresh() -> None:
+    thread = _version_check._refresh_thread
+    assert thread is not None
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_check_does_not_wait_for_the_network(version_cache):
+    released = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        released.wait(timeout=5)
+        return _release("v999.0.0")
+
+    with patch("requests.get", side_effect=slow_get):
+        started = time.perf_counter()
+        _version_check.check_for_update()
+        assert time.perf_counter() - started < 0.5
+        released.set()
+        _wait_for_refresh()
+
+    assert json.loads(version_cache.read_text())["latest_version"] == "999.0.0"
+    assert rapidata_api_client.format_outdated_sdk_note() is not None
+
+
+def test_fresh_cache_skips_the_request(version_cache):
+    version_cache.write_text(
+        json.dumps({"checked_at": time.time(), "latest_version": "999.0.0"})
+    )
+
+    with patch("requests.get") as get:
+        _version_check.check_for_update()
+
+    get.assert_not_called()
+    assert _version_check._refresh_thread is None
+    assert rapidata_api_client.format_outdated_sdk_note() is not None
+
+
+def test_failed_lookup_is_not_retried_until_the_cache_expires(version_cache):
+    with patch("requests.get", side_effect=OSError("unreachable")) as get:
+        _version_check.check_for_update()
+        _wait_for_refresh()
+        _version_check.check_for_update()
+
+    assert get.call_count == 1
+    assert json.loads(version_cache.read_text())["latest_version"] is None
+
+
+def test_stale_cache_is_refreshed_once_per_process(version_cache):
+    version_cache.write_text(
+        json.dumps({"checked_at": time.time() - 2 * 24 * 60 * 60, "latest_version": "1.0.0"})
+    )
+
+    with patch("requests.get", return_value=_release("v1.0.1")) as get:
+        _version_check.check_for_update()
+        _version_check.check_for_update()
+        _wait_for_refresh()
+
+    assert get.call_count == 1
+    assert json.loads(version_cache.read_text())["latest_version"] == "1.0.1"
+
+
+def test_cache_expiring_again_in_the_same_process_is_refreshed(version_cache):
+    stale = json.dumps({"checked_at": time.time() - 2 * 24 * 60 * 60, "latest_version": None})
+    version_cache.write_text(stale)
+
+    with patch("requests.get", return_value=_release("v1.0.1")) as get:
+        _version_check.check_for_update()
+        _wait_for_refresh()
+        version_cache.write_text(stale)
+        _version_check.check_for_update()
+        _wait_for_refresh()
+
+    assert get.call_count == 2
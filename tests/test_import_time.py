@@ -0,0 +1,96 @@
+"""Tests for the lazy public surface of ``rapidata``.
+
+``import rapidata`` used to load the whole client, the generated API, progress
+bars and the OpenTelemetry SDK and exporters, close to a second before a CLI
+command or worker process could do anything. Names are now resolved on first
+access, and heavy dependencies are imported where they are used. Every public
+name must still resolve, and the import has to stay within its budget.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+
+import pytest
+
+import rapidata
+import rapidata.rapidata_client as rapidata_client
+
+# Cumulative ``-X importtime`` budgets in microseconds. `import rapidata` only
+# defines the lazy surface; resolving the client loads the generated API too.
+_IMPORT_BUDGET_US = 100_000
+_CLIENT_IMPORT_BUDGET_US = 2_500_000
+
+_DEFERRED = ("tqdm", "opentelemetry.sdk", "opentelemetry.exporter", "requests")
+
+_IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$", re.M)
+
+
+def _import_time(statement: str) -> tuple[int, list[str]]:
+    """Cumulative import time of ``statement`` and the deferred modules it loaded."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-W",
+            "ignore",
+            "-c",
+            f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    total = sum(
+        int(cumulative)
+        for cumulative, module in _IMPORT_TIME.findall(result.stderr)
+        if module.split(".")[0] == "rapidata"
+    )
+    modules = json.loads(result.stdout.strip().splitlines()[-1])
+    loaded = [
+        name
+        for name in _DEFERRED
+        if any(module == name or module.startswith(name + ".") for module in modules)
+    ]
+    return total, loaded
+
+
+def test_import_rapidata_stays_within_budget():
+    total, loaded = _import_time("import rapidata")
+    assert total < _IMPORT_BUDGET_US
+    assert loaded == []
+
+
+def test_client_import_defers_heavy_dependencies():
+    total, loaded = _import_time("import rapidata\nrapidata.RapidataClient")
+    assert total < _CLIENT_IMPORT_BUDGET_US
+    assert loaded == []
+
+
+@pytest.mark.parametrize("module", [rapidata, rapidata_client], ids=lambda m: m.__name__)
+def test_every_public_name_resolves(module):
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_client_package_exports_its_lazy_names():
+    assert rapidata_client.__all__ == list(rapidata_client._LAZY_IMPORTS)
+
+
+def test_names_match_the_client_package():
+    for name in rapidata.__all__:
+        assert getattr(rapidata, name) is getattr(rapidata_client, name)
+    assert rapidata.types.RapidataSettings is rapidata.RapidataSettings
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError, match="NoSuchThing"):
+        rapidata.NoSuchThing
+    with pytest.raises(ImportError, match="NoSuchThing"):
+        from rapidata.rapidata_client import NoSuchThing  # noqa: F401